@@ -2,7 +2,7 @@
 API router configuration with comprehensive safety features.
 
 Features:
-- Circuit breaker and rate limiting
+- Circuit breaker (rate limiting lives in app.api.v1.rate_limit)
 - Maintenance mode checking
 - Health and metrics endpoints
 - Lazy registration of v1 endpoint routers
@@ -10,16 +10,20 @@ Features:
 
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from app.core.logging.logger import get_logger
+from app.core.logging.logger import get_logger, get_logging_stats
 from app.core.config import settings
 from app.core.errors.handlers import handle_api_error
 from app.core.errors.base import ServiceError, RateLimitError
+from app.api.v1.rate_limit import rate_limiter
+from app.services.webhook.forwarder import webhook_forwarder
+from app.services.webhook.ingestion import signal_ingestor
+from app.services.invalidation import invalidation_bus
 
 logger = get_logger(__name__)
 
@@ -88,32 +92,6 @@ class CircuitBreaker:
             "threshold": self.failure_threshold
         }
 
-# -------------------------------------------------------------------
-# Rate Limiter Implementation
-# -------------------------------------------------------------------
-class RateLimiter:
-    def __init__(self, limit: int, window: int) -> None:
-        self.limit = limit
-        self.window = window
-        self.requests: Dict[str, List[float]] = {}
-
-    async def check_rate_limit(self, client_id: str, context: Dict[str, Any]) -> bool:
-        now = time.time()
-        self.requests.setdefault(client_id, [])
-        # Purge expired requests
-        self.requests[client_id] = [t for t in self.requests[client_id] if now - t < self.window]
-        if len(self.requests[client_id]) >= self.limit:
-            logger.warning("Rate limit exceeded", extra={
-                "client_id": client_id,
-                "limit": self.limit,
-                "window": self.window,
-                "request_count": len(self.requests[client_id]),
-                "context": context
-            })
-            return False
-        self.requests[client_id].append(now)
-        return True
-
 # -------------------------------------------------------------------
 # Helper functions to add common headers
 # -------------------------------------------------------------------
@@ -127,14 +105,6 @@ def add_security_headers(response: Response) -> None:
         "Referrer-Policy": "strict-origin-when-cross-origin"
     })
 
-def add_rate_limit_headers(response: Response, rate_limiter: RateLimiter, client_id: str) -> None:
-    remaining = rate_limiter.limit - len(rate_limiter.requests.get(client_id, []))
-    reset_time = int(time.time() + rate_limiter.window)
-    response.headers.update({
-        "X-Rate-Limit-Remaining": str(remaining),
-        "X-Rate-Limit-Reset": str(reset_time)
-    })
-
 # -------------------------------------------------------------------
 # Initialize API Router and dependencies
 # -------------------------------------------------------------------
@@ -148,15 +118,6 @@ circuit_breakers: Dict[str, CircuitBreaker] = {
     ) for path in critical_paths
 }
 
-standard_rate_limiter = RateLimiter(
-    limit=settings.rate_limiting.RATE_LIMIT_TRADES_PER_MINUTE,
-    window=60
-)
-webhook_rate_limiter = RateLimiter(
-    limit=settings.rate_limiting.RATE_LIMIT_ORDERS_PER_SECOND,
-    window=1
-)
-
 def get_critical_breaker(path: str) -> Optional[CircuitBreaker]:
     for critical in critical_paths:
         if path.startswith(critical):
@@ -203,10 +164,11 @@ async def health_check(request: Request) -> Dict[str, Any]:
 async def metrics(request: Request) -> Dict[str, Any]:
     return {
         "circuit_breakers": {path: breaker.get_state() for path, breaker in circuit_breakers.items()},
-        "rate_limits": {
-            "standard": {"limit": settings.rate_limiting.RATE_LIMIT_TRADES_PER_MINUTE, "window": 60},
-            "webhook": {"limit": settings.rate_limiting.RATE_LIMIT_ORDERS_PER_SECOND, "window": 1}
-        },
+        "rate_limits": rate_limiter.get_stats(),
+        "webhook_forwarding": webhook_forwarder.get_stats(),
+        "signal_ingestion": signal_ingestor.get_stats(),
+        "cache_invalidation": invalidation_bus.get_stats(),
+        "logging": get_logging_stats(),
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -216,6 +178,7 @@ async def metrics(request: Request) -> Dict[str, Any]:
 def get_routers():
     from app.api.v1.endpoints import (
         auth,
+        debug,
         trading,
         bots,
         accounts,
@@ -232,7 +195,8 @@ def get_routers():
         (groups.router, "/groups", ["Group Management"]),
         (users.router, "/users", ["User Management"]),
         (webhook.router, "/webhook", ["Webhooks"]),
-        (ws.router, "/ws", ["WebSocket"])
+        (ws.router, "/ws", ["WebSocket"]),
+        (debug.router, "/debug", ["Debug"])
     ]
 
 for router_item, prefix, tags in get_routers():
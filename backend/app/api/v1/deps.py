@@ -9,8 +9,9 @@ Features:
 - Reference checking
 """
 
+import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, FrozenSet, Tuple
 
 from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
@@ -102,9 +103,10 @@ async def get_current_active_user(
         token_id=token_data.get("token_id"),
         request_context=user.get("request_context"),
     )
-    logger.debug(
+    logger.lazy(
+        logging.DEBUG,
         "Validated active user",
-        extra={"user_id": str(user.get("id")), "path": request.url.path},
+        lambda: {"user_id": str(user.get("id")), "path": request.url.path},
     )
     return user_context
 
@@ -135,43 +137,19 @@ async def get_admin_user(
 # ---------------------------
 async def get_accessible_accounts(
     current_user: Dict = Depends(get_current_user),
-) -> List[str]:
-    """Retrieve account IDs accessible by the current user."""
-    if current_user.get("role") == UserRole.ADMIN:
-        accounts = await reference_manager.get_references(
-            source_type="User", reference_id=current_user.get("id")
-        )
-    else:
-        accounts = await reference_manager.get_references(
-            source_type="User",
-            reference_id=current_user.get("id"),
-            filter_params={"is_active": True},
-        )
-    return [str(acc.get("id")) for acc in accounts]
-
-async def get_accessible_bots(current_user: Dict) -> List[str]:
-    """Retrieve bot IDs accessible by the current user."""
-    if current_user.get("role") == UserRole.ADMIN:
-        bots = await reference_manager.get_all_references("Bot")
-    else:
-        bots = await reference_manager.get_references(
-            source_type="User",
-            reference_id=current_user.get("id"),
-            filter_params={"resource_type": "Bot"},
-        )
-    return [str(bot.get("id")) for bot in bots]
-
-async def get_accessible_groups(user: Dict) -> List[str]:
-    """Retrieve group IDs accessible by the given user."""
-    if user.get("role") == UserRole.ADMIN:
-        groups = await reference_manager.get_all_references("Group")
-    else:
-        groups = await reference_manager.get_references(
-            source_type="User",
-            reference_id=str(user.get("id")),
-            filter_params={"resource_type": "Group"},
-        )
-    return [str(group.get("id")) for group in groups]
+) -> FrozenSet[str]:
+    """Retrieve account IDs accessible by the current user (served from the access index)."""
+    return await access_index.accessible_accounts(current_user)
+
+async def get_accessible_bots(
+    current_user: Dict = Depends(get_current_user),
+) -> FrozenSet[str]:
+    """Retrieve bot IDs accessible by the current user (served from the access index)."""
+    return await access_index.accessible_bots(current_user)
+
+async def get_accessible_groups(user: Dict) -> FrozenSet[str]:
+    """Retrieve group IDs accessible by the given user (served from the access index)."""
+    return await access_index.accessible_groups(user)
 
 # ---------------------------
 # Service Dependencies
@@ -212,9 +190,10 @@ async def get_admin_deps(
 ) -> Dict[str, Any]:
     """Provide dependencies needed for admin-level operations."""
     deps = await get_service_deps()
-    deps["all_accounts"] = await reference_manager.get_all_references("Account")
-    deps["all_groups"] = await reference_manager.get_all_references("Group")
-    deps["all_bots"] = await reference_manager.get_all_references("Bot")
+    # ID sets only; callers fetch the documents they actually need
+    deps["all_accounts"] = await access_index.all_ids("Account")
+    deps["all_groups"] = await access_index.all_ids("Group")
+    deps["all_bots"] = await access_index.all_ids("Bot")
     return deps
 
 # ---------------------------
@@ -227,3 +206,4 @@ from app.services.exchange.factory import exchange_factory, symbol_validator
 from app.services.websocket.manager import ws_manager
 from app.services.performance.service import performance_service
 from app.services.reference.manager import reference_manager
+from app.services.reference.access import access_index
@@ -9,6 +9,7 @@ Routers:
 - groups_router: Manages account groups (create, list, performance metrics, export trade history).
 - webhook_router: Processes incoming webhooks (e.g., from TradingView) for executing trades.
 - ws_router: Handles WebSocket connections for real-time UI communication.
+- debug_router: Admin-only diagnostics such as the per-signal trace waterfall.
 
 By listing these routers in `__all__`, we provide a straightforward way for the main API router to include all v1 endpoints.
 """
@@ -22,6 +23,7 @@ from app.api.v1.endpoints.accounts import router as accounts_router
 from app.api.v1.endpoints.groups import router as groups_router
 from app.api.v1.endpoints.webhook import router as webhook_router
 from app.api.v1.endpoints.ws import router as ws_router
+from app.api.v1.endpoints.debug import router as debug_router
 
 __all__ = (
     'auth_router',
@@ -30,5 +32,6 @@ __all__ = (
     'accounts_router',
     'groups_router',
     'webhook_router',
-    'ws_router'
+    'ws_router',
+    'debug_router'
 )
\ No newline at end of file
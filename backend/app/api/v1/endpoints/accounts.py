@@ -10,7 +10,7 @@ Features:
 
 from datetime import datetime, timedelta
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import FrozenSet, List, Dict, Any, Optional
 
 from fastapi import APIRouter, Depends, Query, Request, Path, status
 from fastapi.responses import JSONResponse
@@ -23,6 +23,7 @@ from app.core.logging.logger import get_logger
 from app.api.v1.deps import get_admin_user, get_current_user, get_accessible_accounts
 from app.api.v1.references import ServiceResponse
 from app.crud.crud_account import account as account_crud, AccountCreate, AccountUpdate
+from app.models.views import ACCOUNT_LIST_VIEW
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -53,7 +54,7 @@ class AccountAssignGroupRequest(BaseModel):
 
 
 # --- Helper function ---
-def check_account_access(account_id: str, allowed_accounts: List[str]) -> None:
+def check_account_access(account_id: str, allowed_accounts: FrozenSet[str]) -> None:
     """Verify that the user has access to the specified account."""
     if account_id not in allowed_accounts:
         raise AuthorizationError(
@@ -116,17 +117,15 @@ async def list_accounts(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_user: Dict = Depends(get_current_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
     List accounts accessible to the current user.
     """
-    # Convert string IDs to ObjectIDs for query
-    account_ids = [PydanticObjectId(id) for id in allowed_accounts]
-    
-    # Get accounts with id in allowed_accounts
-    query = {"_id": {"$in": account_ids}}
-    accounts = await account_crud.get_multi(skip=skip, limit=limit, query=query)
+    # Projected read of the accessible accounts (no credentials, no validation)
+    accounts = await account_crud.get_view(
+        ACCOUNT_LIST_VIEW, ids=allowed_accounts, sort=[("_id", 1)], skip=skip, limit=limit
+    )
     total = len(allowed_accounts)
     
     # Prepare enriched accounts with additional data
@@ -137,7 +136,7 @@ async def list_accounts(
         yesterday = now - timedelta(days=1)
         try:
             metrics = await account_crud.get_performance(
-                account_id=acc.id,
+                account_id=PydanticObjectId(acc["account_info"]["id"]),
                 start_date=yesterday,
                 end_date=now
             )
@@ -146,7 +145,7 @@ async def list_accounts(
         
         # Add enriched account data
         enriched_accounts.append({
-            "account": acc.to_dict(),
+            "account": acc,
             "performance": metrics
         })
     
@@ -168,7 +167,7 @@ async def get_account(
     request: Request,
     account_id: str = Path(..., description="Account ID"),
     current_user: Dict = Depends(get_current_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
     Get detailed account information.
@@ -305,7 +304,7 @@ async def get_performance(
     start_date: datetime = Query(None, description="Start date"),
     end_date: datetime = Query(None, description="End date"),
     current_user: Dict = Depends(get_current_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
     Get account performance metrics.
@@ -542,7 +541,7 @@ async def check_trade_limits(
     request: Request,
     account_id: str = Path(..., description="Account ID"),
     current_user: Dict = Depends(get_current_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
     Check trading limits for an account.
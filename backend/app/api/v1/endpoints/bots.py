@@ -11,7 +11,7 @@ service integration. The endpoints focus solely on:
 
 from fastapi import APIRouter, Depends, Query, Path, Request, status, HTTPException
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, Optional, Any
 from beanie import PydanticObjectId
 
 # Import user dependencies
@@ -25,13 +25,14 @@ from app.core.errors.base import ValidationError, NotFoundError, AuthorizationEr
 from app.core.logging.logger import get_logger
 from app.core.references import BotStatus, BotType, TimeFrame
 from app.models.entities.user import User
+from app.models.views import BOT_LIST_VIEW
 from app.api.v1.references import ServiceResponse
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 
-async def verify_bot_access(bot_id: str, current_user: User, viewable_bots: List[str]) -> None:
+async def verify_bot_access(bot_id: str, current_user: User, viewable_bots: FrozenSet[str]) -> None:
     """
     Verify that the given bot_id is within the list of viewable bots.
     Raises an AuthorizationError if access is not allowed.
@@ -98,22 +99,13 @@ async def create_manual_bot(
 async def list_bots(
     request: Request,
     current_user: User = Depends(get_current_active_user),
-    viewable_bots: List[str] = Depends(get_accessible_bots)
+    viewable_bots: FrozenSet[str] = Depends(get_accessible_bots)
 ) -> ServiceResponse:
     """
     List bots accessible to the current user.
     """
-    # Get bots via CRUD layer
-    bots = []
-    for bot_id in viewable_bots:
-        try:
-            bot = await bot_crud.get(PydanticObjectId(bot_id))
-            bots.append(bot.to_dict())
-        except Exception as e:
-            logger.warning(
-                f"Error retrieving bot {bot_id}",
-                extra={"error": str(e), "bot_id": bot_id}
-            )
+    # One projected read for all viewable bots
+    bots = await bot_crud.get_view(BOT_LIST_VIEW, ids=viewable_bots, sort=[("name", 1)])
     
     logger.info("Listed bots", extra={
         "user_id": str(current_user.id),
@@ -180,7 +172,7 @@ async def get_bot(
     request: Request,
     bot_id: str = Path(..., description="Bot ID"),
     current_user: User = Depends(get_current_active_user),
-    viewable_bots: List[str] = Depends(get_accessible_bots)
+    viewable_bots: FrozenSet[str] = Depends(get_accessible_bots)
 ) -> ServiceResponse:
     """
     Get detailed bot information.
@@ -365,7 +357,7 @@ async def get_connected_accounts(
     request: Request,
     bot_id: str = Path(..., description="Bot ID"),
     current_user: User = Depends(get_current_active_user),
-    viewable_bots: List[str] = Depends(get_accessible_bots)
+    viewable_bots: FrozenSet[str] = Depends(get_accessible_bots)
 ) -> ServiceResponse:
     """
     Get accounts connected to a bot.
@@ -396,7 +388,7 @@ async def get_bot_performance(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     current_user: User = Depends(get_current_active_user),
-    viewable_bots: List[str] = Depends(get_accessible_bots)
+    viewable_bots: FrozenSet[str] = Depends(get_accessible_bots)
 ) -> ServiceResponse:
     """
     Get bot performance metrics.
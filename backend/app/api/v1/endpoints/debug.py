@@ -0,0 +1,79 @@
+"""
+Debug endpoints for inspecting the signal path and the index plan.
+
+Admin only. Traces are served from the in-memory buffer of recent traces, so
+only signals received by this worker since startup are available.
+"""
+
+from typing import Dict
+
+from fastapi import APIRouter, Depends, Path, Query
+
+from app.api.v1.deps import get_admin_user
+from app.api.v1.references import ServiceResponse
+from app.core.errors.base import NotFoundError
+from app.core.logging.logger import get_logger
+from app.core.tracing import tracer
+from app.db.indexes import index_manager
+from app.services.webhook.ingestion import signal_ingestor
+
+router = APIRouter()
+logger = get_logger(__name__)
+
+
+@router.get("/signals/{correlation_id}", response_model=ServiceResponse)
+async def get_signal_trace(
+    correlation_id: str = Path(..., description="correlation_id returned by the webhook"),
+    current_user: Dict = Depends(get_admin_user)
+) -> ServiceResponse:
+    """
+    Waterfall view of one signal: every span from webhook arrival to order
+    fill, with its offset from the start of the trace and duration.
+    """
+    waterfall = tracer.waterfall(correlation_id)
+    if waterfall is None:
+        raise NotFoundError(
+            "Trace not found",
+            context={"correlation_id": correlation_id, "buffered_traces": tracer.get_stats()["traces"]}
+        )
+    return ServiceResponse(success=True, data=waterfall)
+
+
+@router.get("/signals/{correlation_id}/outcome", response_model=ServiceResponse)
+async def get_signal_outcome(
+    correlation_id: str = Path(..., description="correlation_id returned by the webhook"),
+    current_user: Dict = Depends(get_admin_user)
+) -> ServiceResponse:
+    """Execution status and per-account results of a queued signal."""
+    outcome = signal_ingestor.get_outcome(correlation_id)
+    if outcome is None:
+        raise NotFoundError("Signal not found", context={"correlation_id": correlation_id})
+    return ServiceResponse(success=True, data=outcome.to_dict())
+
+
+@router.get("/tracing", response_model=ServiceResponse)
+async def get_tracing_stats(current_user: Dict = Depends(get_admin_user)) -> ServiceResponse:
+    """Tracer counters: recorded, exported and dropped spans."""
+    return ServiceResponse(success=True, data=tracer.get_stats())
+
+
+@router.get("/indexes", response_model=ServiceResponse)
+async def get_index_report(
+    explain: bool = Query(False, description="Also explain every planned query shape"),
+    current_user: Dict = Depends(get_admin_user)
+) -> ServiceResponse:
+    """
+    Index plan status: missing, conflicting and unplanned indexes per
+    collection and, with ``explain``, the winning plan of every query shape
+    (``failures`` lists shapes that scan the collection or sort in memory).
+    """
+    data = {
+        "build": index_manager.get_stats(),
+        "diff": {
+            collection: (await index_manager.diff(collection)).to_dict()
+            for collection in index_manager.plan
+        }
+    }
+    if explain:
+        data["query_shapes"] = await index_manager.verify_query_shapes()
+    return ServiceResponse(success=True, data=data)
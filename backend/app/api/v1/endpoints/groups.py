@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 import io
 from fastapi import APIRouter, Depends, Query, Path, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from beanie import PydanticObjectId
 
 from app.crud.crud_group import group as group_crud, GroupCreate, GroupUpdate
@@ -22,6 +22,9 @@ from app.core.errors.base import ValidationError, NotFoundError, AuthorizationEr
 from app.core.logging.logger import get_logger
 from app.api.v1.deps import get_admin_user, get_current_user
 from app.api.v1.references import ServiceResponse
+from app.services.reporting.jobs import RangeNotSatisfiableError, export_jobs
+from app.services.reporting.columnar import export_media_type, is_columnar_format, normalize_columnar_format
+from app.services.reporting.streaming import normalize_export_format
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -648,7 +651,7 @@ async def export_group_data(
 async def export_group_trades(
     request: Request,
     group_id: str = Path(..., description="Group ID"),
-    format: str = Query("csv", description="Export format (csv or xlsx)"),
+    format: str = Query("csv", description="Export format (csv, xlsx, parquet or arrow)"),
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     current_user: Dict = Depends(get_current_user)
@@ -676,7 +679,7 @@ async def export_group_trades(
     group = await group_crud.get(obj_id)
     
     # Generate export file using group CRUD service
-    buffer, filename = await group_crud.export_group_trades(
+    stream, filename = await group_crud.export_group_trades(
         group_id=obj_id,
         format=format,
         start_date=start_date,
@@ -694,10 +697,10 @@ async def export_group_trades(
         }
     )
     
-    # Return as downloadable file
-    media_type = "text/csv" if format == "csv" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    # Stream the file as it is produced
+    media_type = export_media_type(filename.rsplit(".", 1)[-1])
     return StreamingResponse(
-        buffer,
+        stream,
         media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -736,7 +739,7 @@ async def export_group_performance(
     group = await group_crud.get(obj_id)
     
     # Generate export file using group CRUD service
-    buffer, filename = await group_crud.export_group_performance(
+    stream, filename = await group_crud.export_group_performance(
         group_id=obj_id,
         period=period,
         format=format,
@@ -756,10 +759,115 @@ async def export_group_performance(
         }
     )
     
-    # Return as downloadable file
-    media_type = "text/csv" if format == "csv" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    # Stream the file as it is produced
+    media_type = export_media_type(filename.rsplit(".", 1)[-1])
     return StreamingResponse(
-        buffer,
+        stream,
         media_type=media_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
\ No newline at end of file
+    )
+
+async def _verify_export_access(current_user: Dict, group_id: str) -> None:
+    """Apply the EXPORTER role and group access checks shared by export jobs."""
+    if current_user.get("role") != UserRole.ADMIN.value and current_user.get("role") != UserRole.EXPORTER.value:
+        raise AuthorizationError(
+            "Export operations require EXPORTER role",
+            context={"user_id": str(current_user.get("id")), "role": current_user.get("role")}
+        )
+
+    if not await user_crud.check_group_access(str(current_user.get("id")), group_id):
+        raise AuthorizationError(
+            "Not authorized to access this group",
+            context={"user_id": str(current_user.get("id")), "group_id": group_id}
+        )
+
+
+@router.post("/{group_id}/export-jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_group_export_job(
+    group_id: str = Path(..., description="Group ID"),
+    kind: str = Query("trades", description="Export kind (trades or performance)"),
+    format: str = Query("csv", description="Export format (csv or xlsx; parquet or arrow for trades)"),
+    period: str = Query("daily", description="Performance period (daily, weekly, monthly)"),
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    current_user: Dict = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """
+    Queue a group export to run in the background.
+    Identical requests share a single job. Poll the returned job for progress
+    and download the artifact once it has completed.
+    """
+    await _verify_export_access(current_user, group_id)
+
+    if not await group_crud.get(PydanticObjectId(group_id)):
+        raise NotFoundError("Group not found", context={"group_id": group_id})
+
+    columnar = kind == "trades" and is_columnar_format(format)
+    params: Dict[str, Any] = {
+        "group_id": group_id,
+        "format": normalize_columnar_format(format) if columnar else normalize_export_format(format),
+        "start_date": start_date,
+        "end_date": end_date
+    }
+    if kind == "performance":
+        params["period"] = period
+    elif kind != "trades":
+        raise ValidationError(
+            "Invalid export kind",
+            context={"kind": kind, "valid_kinds": ["trades", "performance"]}
+        )
+
+    job = await export_jobs.submit(f"group_{kind}", params)
+
+    logger.info(
+        "Submitted group export job",
+        extra={
+            "user_id": str(current_user.get("id")),
+            "group_id": group_id,
+            "job_id": job.job_id,
+            "kind": kind
+        }
+    )
+
+    return job.to_dict()
+
+
+@router.get("/export-jobs/{job_id}")
+async def get_group_export_job(
+    job_id: str = Path(..., description="Export job ID"),
+    current_user: Dict = Depends(get_current_user)
+) -> Dict[str, Any]:
+    """Get status and progress of a background group export."""
+    job = export_jobs.get_job(job_id)
+    await _verify_export_access(current_user, job.params["group_id"])
+    return job.to_dict()
+
+
+@router.get("/export-jobs/{job_id}/download", response_class=StreamingResponse)
+async def download_group_export_job(
+    request: Request,
+    job_id: str = Path(..., description="Export job ID"),
+    current_user: Dict = Depends(get_current_user)
+) -> Response:
+    """
+    Download a completed export artifact.
+    Supports single-range ``Range`` requests so interrupted downloads can resume;
+    a range past the end of the artifact gets 416, a malformed one is ignored.
+    """
+    job = export_jobs.get_job(job_id)
+    await _verify_export_access(current_user, job.params["group_id"])
+
+    try:
+        stream, headers, partial = export_jobs.open_artifact(job_id, request.headers.get("range"))
+    except RangeNotSatisfiableError as e:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{e.size}", "Accept-Ranges": "bytes"}
+        )
+
+    return StreamingResponse(
+        stream,
+        status_code=status.HTTP_206_PARTIAL_CONTENT if partial else status.HTTP_200_OK,
+        media_type=job.media_type,
+        headers=headers
+    )
@@ -10,8 +10,9 @@ Features:
 """
 
 from fastapi import APIRouter, Depends, Request, Path, Query, HTTPException, status
+from fastapi.responses import StreamingResponse
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, Optional, Any, Union
 from beanie import PydanticObjectId
 from pydantic import BaseModel, Field, validator
 
@@ -25,6 +26,7 @@ from app.crud.crud_bot import bot as bot_crud
 from app.models.entities.trade import Trade
 from app.models.entities.bot import Bot
 from app.services.trading.service import trading_service
+from app.services.reporting.columnar import export_media_type
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -77,7 +79,7 @@ def get_request_context(request: Request, **extras) -> Dict[str, Any]:
     return context
 
 
-async def verify_account_access(account_id: str, current_user: Any, allowed_accounts: List[str]) -> None:
+async def verify_account_access(account_id: str, current_user: Any, allowed_accounts: FrozenSet[str]) -> None:
     """Verify the user has access to the specified account."""
     if account_id not in allowed_accounts:
         raise AuthorizationError(
@@ -245,12 +247,14 @@ async def get_positions(
     status: Optional[TradeStatus] = Query(None, description="Filter by trade status"),
     symbol: Optional[str] = Query(None, description="Filter by symbol"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of trades to return"),
+    cursor: Optional[str] = Query(None, description="Continuation token from a previous page's next_cursor"),
     current_user: Any = Depends(get_current_active_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
-    Retrieve recent trades/positions for the given account.
-    User must have access to the account.
+    Retrieve trades/positions for the given account, newest first.
+    User must have access to the account. Results are paginated: pass
+    ``next_cursor`` back as ``cursor`` to get the next page.
     """
     context = get_request_context(
         request, 
@@ -263,28 +267,30 @@ async def get_positions(
     await verify_account_access(account_id, current_user, allowed_accounts)
     
     # Get trades/positions from CRUD layer
-    trades = await trade_crud.get_account_trades(
+    page = await trade_crud.get_account_trades(
         account_id=account_id,
         status=status,
         symbol=symbol,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
     
     # Format response
-    formatted_trades = [trade.get_trade_info() for trade in trades]
+    formatted_trades = [trade.get_trade_info() for trade in page.items]
     
     logger.info(
         "Retrieved account positions",
-        extra={**context, "count": len(trades)}
+        extra={**context, "count": len(page.items), "has_more": page.has_more}
     )
     
     return ServiceResponse(
         success=True,
-        message=f"Retrieved {len(trades)} positions",
+        message=f"Retrieved {len(page.items)} positions",
         data={
             "account_id": account_id,
-            "count": len(trades),
-            "positions": formatted_trades
+            "count": len(page.items),
+            "positions": formatted_trades,
+            "next_cursor": page.next_cursor
         }
     )
 
@@ -467,7 +473,7 @@ async def get_account_performance(
     start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
     current_user: Any = Depends(get_current_active_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
 ) -> ServiceResponse:
     """
     Get performance metrics for an account.
@@ -537,19 +543,21 @@ async def get_account_performance(
     )
 
 
-@router.get("/account/{account_id}/export")
+@router.get("/account/{account_id}/export", response_model=None)
 async def export_trade_history(
     request: Request,
     account_id: str = Path(..., description="Account ID"),
     start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
-    format: str = Query("csv", description="Export format (csv or json)"),
+    format: str = Query("csv", description="Export format (csv, xlsx, parquet, arrow or json)"),
     current_user: Any = Depends(get_current_active_user),
-    allowed_accounts: List[str] = Depends(get_accessible_accounts)
-) -> ServiceResponse:
+    allowed_accounts: FrozenSet[str] = Depends(get_accessible_accounts)
+) -> Union[ServiceResponse, StreamingResponse]:
     """
     Export trade history for an account.
     User must have access to the account.
+
+    CSV, XLSX, Parquet and Arrow exports are streamed as a file download; JSON returns the records inline.
     """
     context = get_request_context(
         request, 
@@ -585,6 +593,14 @@ async def export_trade_history(
         end_date=end,
         format=format
     )
+
+    if "stream" in export_data:
+        logger.info("Streaming trade history export", extra=context)
+        return StreamingResponse(
+            export_data["stream"],
+            media_type=export_media_type(export_data["format"]),
+            headers={"Content-Disposition": f"attachment; filename={export_data['filename']}"}
+        )
     
     logger.info(
         "Exported trade history",
@@ -4,9 +4,10 @@ Webhook endpoints for handling TradingView signals with comprehensive error hand
 Features:
 - Webhook signature verification
 - Signal validation and processing  
-- Multi-account trade execution
-- Signal forwarding
+- Signal de-duplication and ordered per-bot execution (see app.services.webhook.ingestion)
+- Background signal forwarding (see app.services.webhook.forwarder)
 - Performance monitoring
+- Span tracing keyed by correlation_id (see app.core.tracing)
 """
 
 import uuid
@@ -15,16 +16,17 @@ import hashlib
 from datetime import datetime
 from typing import Dict, Optional, Any
 
-import aiohttp
 from fastapi import APIRouter, Request, Header
 from pydantic import BaseModel, Field, validator, model_validator
 
 from app.core.config import settings
 from app.core.errors.base import ValidationError, ExchangeError, NotFoundError, AuthenticationError
 from app.core.logging.logger import get_logger
+from app.core.tracing import tracer
 from app.core.references import OrderType, TradeSource, PositionSide, SignalOrderType
 from app.api.v1.endpoints.trading import get_request_context
 from app.api.v1.references import ServiceResponse
+from app.services.webhook.forwarder import webhook_forwarder
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -124,81 +126,83 @@ async def tradingview_webhook(
     )
     logger.info("Received webhook request", extra=context)
 
-    # Verify signature.
-    body = await request.body()
-    if not await verify_webhook_signature(x_tradingview_signature, body, context):
-        raise AuthenticationError("Invalid webhook signature", context={**context, "signature": x_tradingview_signature})
-    
-    # Parse JSON payload.
-    try:
-        data = await request.json()
-    except Exception as e:
-        raise ValidationError("Invalid JSON payload", context={**context, "error": str(e)})
-    
-    # Parse and validate signal.
-    try:
-        signal = TradeSignal(**data)
-    except Exception as e:
-        raise ValidationError("Invalid signal data", context={**context, "errors": str(e), "data": data})
-    
-    # Validate bot reference.
-    bot = await reference_manager.get_reference(
-        reference_type="Bot",
-        reference_id=signal.botname,
-        filter_params={"name": signal.botname}
-    )
-    if not bot:
-        raise NotFoundError("Bot not found", context={**context, "botname": signal.botname})
-    
-    # Check bot status.
-    # Import here to avoid circular dependency.
-    from app.models.entities.bot import BotStatus
-    if bot.get("status") != BotStatus.ACTIVE:
-        logger.info("Signal ignored - inactive bot", extra={**context, "bot_id": str(bot.get("id")), "status": bot.get("status")})
-        return ServiceResponse(
-            success=False,
-            message=f"Bot {signal.botname} is not active",
-            data={
-                "bot": signal.botname,
-                "status": bot.get("status"),
-                "correlation_id": correlation_id
-            }
+    with tracer.start_trace(correlation_id, "webhook.tradingview", path=request.url.path) as root:
+        # Verify signature.
+        body = await request.body()
+        with tracer.span("webhook.verify_signature", body_bytes=len(body)):
+            if not await verify_webhook_signature(x_tradingview_signature, body, context):
+                raise AuthenticationError("Invalid webhook signature", context={**context, "signature": x_tradingview_signature})
+
+        # Parse JSON payload.
+        try:
+            data = await request.json()
+        except Exception as e:
+            raise ValidationError("Invalid JSON payload", context={**context, "error": str(e)})
+
+        # Parse and validate signal.
+        try:
+            signal = TradeSignal(**data)
+        except Exception as e:
+            raise ValidationError("Invalid signal data", context={**context, "errors": str(e), "data": data})
+        root.set(bot=signal.botname, symbol=signal.symbol, signal_type=signal.order_type)
+
+        # Validate bot reference.
+        with tracer.span("webhook.bot_lookup", bot=signal.botname) as lookup:
+            bot = await reference_manager.get_reference(
+                reference_type="Bot",
+                reference_id=signal.botname,
+                filter_params={"name": signal.botname}
+            )
+            lookup.set(found=bool(bot))
+        if not bot:
+            raise NotFoundError("Bot not found", context={**context, "botname": signal.botname})
+
+        # Check bot status.
+        # Import here to avoid circular dependency.
+        from app.models.entities.bot import BotStatus
+        if bot.get("status") != BotStatus.ACTIVE:
+            logger.info("Signal ignored - inactive bot", extra={**context, "bot_id": str(bot.get("id")), "status": bot.get("status")})
+            root.set(outcome="inactive_bot")
+            return ServiceResponse(
+                success=False,
+                message=f"Bot {signal.botname} is not active",
+                data={
+                    "bot": signal.botname,
+                    "status": bot.get("status"),
+                    "correlation_id": correlation_id
+                }
+            )
+
+        # Queue for ordered execution by the bot's consumer; the webhook is acked immediately.
+        ingestion = signal_ingestor.submit(
+            correlation_id=correlation_id,
+            bot_id=str(bot.get("id")),
+            signal_data={
+                "symbol": signal.symbol,
+                "side": signal.side,
+                "signal_type": signal.order_type,
+                "risk_percentage": signal.risk_percentage,
+                "leverage": signal.leverage,
+                "take_profit": signal.takeprofit,
+                "source": TradeSource.BOT
+            },
+            context=context
         )
-    
-    # Forward webhook if configured.
-    await forward_webhook(signal.dict(), context)
-    
-    # Process signal via trading service
-    trading_service_instance = await reference_manager.get_service(service_type="TradingService")
-    results = await trading_service_instance.process_signal(
-        bot_id=str(bot.get("id")),
-        signal_data={
-            "symbol": signal.symbol,
-            "side": signal.side,
-            "signal_type": signal.order_type,
-            "risk_percentage": signal.risk_percentage,
-            "leverage": signal.leverage,
-            "take_profit": signal.takeprofit,
-            "source": TradeSource.BOT
-        },
-        context=context
-    )
-    
-    # Update performance metrics.
-    await performance_service.update_signal_metrics(
-        bot_id=str(bot.get("id")),
-        metrics={
-            "total_signals": results["total_signals"],
-            "successful_signals": results["successful_signals"],
-            "failed_signals": results["failed_signals"],
-            "timestamp": datetime.utcnow().isoformat()
-        }
-    )
-    
+        root.set(outcome=ingestion["status"])
+        if ingestion["status"] == "duplicate":
+            return ServiceResponse(
+                success=True,
+                message="Duplicate signal ignored",
+                data={**ingestion, "bot": signal.botname, "correlation_id": correlation_id}
+            )
+
+        # Forward webhook if configured; delivery happens in the background.
+        root.set(forwarded=webhook_forwarder.enqueue(signal.dict(), correlation_id))
+
     return ServiceResponse(
         success=True,
-        message="Signal processed successfully",
-        data={**results, "correlation_id": correlation_id}
+        message="Signal accepted",
+        data={**ingestion, "bot": signal.botname, "correlation_id": correlation_id}
     )
 
 
@@ -238,25 +242,6 @@ async def verify_webhook_signature(signature: str, body: bytes, context: Dict) -
         raise AuthenticationError("Signature verification failed", context={**context, "error": str(e)})
 
 
-async def forward_webhook(data: Dict, context: Dict) -> None:
-    """
-    Forward webhook data if a forward URL is configured.
-    """
-    if not settings.webhook.WEBHOOK_FORWARD_URL:
-        return
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                settings.webhook.WEBHOOK_FORWARD_URL,
-                json=data,
-                timeout=settings.webhook.WEBHOOK_TIMEOUT
-            ) as response:
-                response.raise_for_status()
-        logger.info("Webhook forwarded successfully", extra={**context, "forward_url": settings.webhook.WEBHOOK_FORWARD_URL})
-    except Exception as e:
-        logger.error("Failed to forward webhook", extra={**context, "error": str(e), "forward_url": settings.webhook.WEBHOOK_FORWARD_URL})
-
-
 # ---- Circular Dependency Imports ----
 from app.services.reference.manager import reference_manager
-from app.services.performance.service import performance_service
\ No newline at end of file
+from app.services.webhook.ingestion import signal_ingestor
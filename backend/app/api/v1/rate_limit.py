@@ -0,0 +1,279 @@
+"""
+API rate limiting with the Generic Cell Rate Algorithm (GCRA).
+
+Each (policy, client) key stores a single float, the theoretical arrival time
+(TAT), so memory per key is constant and a check is O(1):
+  - emission interval T = period / limit
+  - a request is allowed when now >= TAT + T - period; the new TAT is
+    max(TAT, now) + T
+This admits ``limit`` requests per ``period`` with bursts up to ``limit``.
+
+Keys live in an LRU bounded by RATE_LIMIT_MAX_KEYS. A key whose TAT is in the
+past is equivalent to a fresh one, so evicting idle keys loses nothing.
+
+With RATE_LIMIT_USE_REDIS the same algorithm runs as a Lua script against
+RATE_LIMIT_REDIS_URL so limits hold across workers; if Redis is unavailable
+the limiter falls back to the local state.
+
+Clients are keyed by peer IP, or by X-Forwarded-For when the peer is one of
+RATE_LIMIT_TRUSTED_PROXIES. The TradingView webhook is exempt: alerts arrive
+from a few shared TradingView addresses in bursts at candle close, and the
+route is already authenticated by its signature and de-duplicated per bot.
+"""
+
+import ipaddress
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# KEYS[1] = key; ARGV = now_ms, emission_interval_ms, period_ms
+_GCRA_SCRIPT = """
+local tat = tonumber(redis.call('GET', KEYS[1]) or ARGV[1])
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local new_tat = math.max(tat, now) + interval
+if new_tat - period > now then
+    return {0, tostring(tat)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, tostring(new_tat)}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """A named limit applied to routes under a path prefix."""
+    name: str
+    limit: int
+    period: float
+    prefix: str = ""
+    methods: Optional[FrozenSet[str]] = None
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period / self.limit
+
+    def matches(self, path: str, method: str) -> bool:
+        return path.startswith(self.prefix) and (self.methods is None or method in self.methods)
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check, with everything needed for the headers."""
+    allowed: bool
+    policy: RateLimitPolicy
+    remaining: int
+    reset_after: float
+    retry_after: float = 0.0
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.policy.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(math.ceil(self.reset_after)),
+            "X-RateLimit-Policy": self.policy.name,
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
+        return headers
+
+
+def _decide(policy: RateLimitPolicy, tat: float, now: float, allowed: bool) -> RateLimitDecision:
+    """Build a decision from the key's TAT after the check (before it when denied)."""
+    interval = policy.emission_interval
+    if allowed:
+        remaining = int((policy.period - (tat - now)) / interval)
+        return RateLimitDecision(True, policy, max(0, remaining), max(0.0, tat - now))
+    retry_after = tat + interval - policy.period - now
+    return RateLimitDecision(False, policy, 0, max(0.0, tat - now), max(0.0, retry_after))
+
+
+class RateLimiter:
+    """GCRA limiter with per-route policies, an LRU key store and optional Redis."""
+
+    def __init__(
+        self,
+        policies: Tuple[RateLimitPolicy, ...],
+        default_policy: RateLimitPolicy,
+        max_keys: int,
+        exempt_prefixes: Tuple[str, ...] = (),
+        use_redis: bool = False
+    ) -> None:
+        # Most specific prefix first
+        self.policies = tuple(sorted(policies, key=lambda policy: len(policy.prefix), reverse=True))
+        self.default_policy = default_policy
+        self.max_keys = max_keys
+        self.exempt_prefixes = exempt_prefixes
+        self.use_redis = use_redis
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._redis = None
+        self._script = None
+        self._redis_failed_at: Optional[float] = None
+        self.stats = {"allowed": 0, "limited": 0, "evictions": 0, "redis_errors": 0}
+
+    def policy_for(self, path: str, method: str) -> Optional[RateLimitPolicy]:
+        """Return the policy for a route, or None when the route is exempt."""
+        if path.startswith(self.exempt_prefixes):
+            return None
+        for policy in self.policies:
+            if policy.matches(path, method):
+                return policy
+        return self.default_policy
+
+    def _check_local(self, key: str, policy: RateLimitPolicy, now: float) -> RateLimitDecision:
+        tat = self._tats.get(key, now)
+        new_tat = max(tat, now) + policy.emission_interval
+        if new_tat - policy.period > now:
+            return _decide(policy, tat, now, allowed=False)
+
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        if len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+            self.stats["evictions"] += 1
+        return _decide(policy, new_tat, now, allowed=True)
+
+    async def _check_redis(self, key: str, policy: RateLimitPolicy, now: float) -> RateLimitDecision:
+        if self._script is None:
+            from redis.asyncio import Redis
+            self._redis = Redis.from_url(
+                str(settings.redis.RATE_LIMIT_REDIS_URL),
+                socket_timeout=settings.redis.REDIS_TIMEOUT
+            )
+            self._script = self._redis.register_script(_GCRA_SCRIPT)
+        allowed, tat_ms = await self._script(
+            keys=[f"rate_limit:{key}"],
+            args=[int(now * 1000), int(policy.emission_interval * 1000), int(policy.period * 1000)]
+        )
+        return _decide(policy, float(tat_ms) / 1000, now, allowed=bool(allowed))
+
+    async def check(self, client_id: str, path: str, method: str) -> Optional[RateLimitDecision]:
+        """
+        Count a request against its route policy.
+
+        Returns:
+            The decision, or None when the route is exempt
+        """
+        policy = self.policy_for(path, method)
+        if policy is None:
+            return None
+
+        key = f"{policy.name}:{client_id}"
+        now = time.time()
+        decision = None
+        # After a Redis failure, use local state for a short cool-down
+        if self.use_redis and (self._redis_failed_at is None or now - self._redis_failed_at > 30):
+            try:
+                decision = await self._check_redis(key, policy, now)
+                self._redis_failed_at = None
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                self._redis_failed_at = now
+                logger.warning("Rate limit Redis backend unavailable; using local limits", extra={"error": str(e)})
+        if decision is None:
+            decision = self._check_local(key, policy, now)
+
+        if decision.allowed:
+            self.stats["allowed"] += 1
+        else:
+            self.stats["limited"] += 1
+            logger.warning("Rate limit exceeded", extra={
+                "client_id": client_id,
+                "policy": policy.name,
+                "limit": policy.limit,
+                "period": policy.period,
+                "path": path
+            })
+        return decision
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tracked_keys": len(self._tats),
+            "max_keys": self.max_keys,
+            "backend": "redis" if self.use_redis and self._redis_failed_at is None else "local",
+            "policies": {
+                policy.name: {"limit": policy.limit, "period": policy.period, "prefix": policy.prefix}
+                for policy in self.policies + (self.default_policy,)
+            }
+        }
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+            self._script = None
+
+
+_TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(proxy, strict=False) for proxy in settings.rate_limiting.RATE_LIMIT_TRUSTED_PROXIES
+)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _TRUSTED_PROXIES)
+
+
+def client_id_for(request: Request) -> str:
+    """
+    Identify the client by peer address. When the peer is a trusted proxy,
+    the right-most X-Forwarded-For address not added by a trusted proxy is
+    used instead, so clients behind the proxy do not share one key.
+    """
+    host = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(host):
+        return host
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for address in reversed([part.strip() for part in forwarded.split(",") if part.strip()]):
+        host = address
+        if not _is_trusted_proxy(address):
+            break
+    return host
+
+
+def add_rate_limit_headers(response: Response, decision: Optional[RateLimitDecision]) -> None:
+    if decision is not None:
+        response.headers.update(decision.headers())
+
+
+_API = settings.app.API_V1_STR
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+rate_limiter = RateLimiter(
+    policies=(
+        RateLimitPolicy("auth", settings.rate_limiting.RATE_LIMIT_AUTH_PER_MINUTE, 60, f"{_API}/auth/login"),
+        RateLimitPolicy("auth", settings.rate_limiting.RATE_LIMIT_AUTH_PER_MINUTE, 60, f"{_API}/auth/register"),
+        RateLimitPolicy(
+            "trading", settings.rate_limiting.RATE_LIMIT_TRADES_PER_MINUTE, 60, f"{_API}/trading", _WRITE_METHODS
+        ),
+    ),
+    default_policy=RateLimitPolicy("standard", settings.rate_limiting.RATE_LIMIT_DEFAULT_PER_MINUTE, 60),
+    max_keys=settings.rate_limiting.RATE_LIMIT_MAX_KEYS,
+    exempt_prefixes=(
+        "/health", "/metrics", f"{_API}/health", f"{_API}/metrics", "/docs", f"{_API}/openapi.json", f"{_API}/webhook"
+    ),
+    use_redis=settings.rate_limiting.RATE_LIMIT_USE_REDIS,
+)
+
+__all__ = [
+    "RateLimitPolicy",
+    "RateLimitDecision",
+    "RateLimiter",
+    "rate_limiter",
+    "client_id_for",
+    "add_rate_limit_headers",
+]
@@ -34,7 +34,7 @@ def _lazy_import(module_name: str, names: list):
         if module_name not in _lazy_modules:
             # Actually import the module
             _lazy_modules[module_name] = __import__(
-                module_name, globals(), locals(), names, 1
+                module_name, globals(), locals(), names, 0
             )
         return _lazy_modules[module_name]
     
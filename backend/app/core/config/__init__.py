@@ -37,6 +37,10 @@ else:
         def __getitem__(self, key):
             return _get_settings()[key]
     
+    # Load the submodule before binding the proxy: the first import of
+    # app.core.config.settings (many modules import it directly) rebinds the
+    # package attribute ``settings`` to the submodule.
+    _get_settings()
     settings = _LazySettings()
     
     # Import constants
@@ -3,6 +3,7 @@ Refactored settings module for FastAPI using Pydantic v2.
 Optimized for performance, security, and maintainability.
 """
 
+import ipaddress
 import json
 import os
 import secrets
@@ -136,6 +137,55 @@ class SecuritySettings(BaseModel):
         gt=0,
         le=60,
     )
+    # Password hashing pool
+    PASSWORD_BCRYPT_ROUNDS: int = Field(
+        default=12,
+        description="bcrypt cost; hashes with a different cost are upgraded on the next login",
+        ge=4,
+        le=31,
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2,
+        description="Dedicated workers for password hashing and verification",
+        gt=0,
+        le=32,
+    )
+    PASSWORD_HASH_USE_PROCESSES: bool = Field(
+        default=True,
+        description="Run password hashing in a process pool (False uses a dedicated thread pool)",
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=64,
+        description="Maximum queued plus running hash operations before new ones are rejected",
+        gt=0,
+    )
+    PASSWORD_HASH_QUEUE_TIMEOUT: float = Field(
+        default=5.0,
+        description="Seconds an operation may wait for a hashing worker before it is rejected",
+        gt=0,
+    )
+    # Token verification cache and blacklist filter
+    TOKEN_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Maximum verified tokens kept in the in-process cache",
+        gt=0,
+    )
+    TOKEN_BLACKLIST_BLOOM_CAPACITY: int = Field(
+        default=100_000,
+        description="Expected number of blacklisted token IDs the local Bloom filter is sized for",
+        gt=0,
+    )
+    TOKEN_BLACKLIST_BLOOM_ERROR_RATE: float = Field(
+        default=0.001,
+        description="Target false-positive rate of the blacklist Bloom filter",
+        gt=0,
+        lt=1,
+    )
+    TOKEN_BLACKLIST_REBUILD_SECONDS: int = Field(
+        default=3600,
+        description="Interval for rebuilding the blacklist Bloom filter from Redis (drops expired IDs)",
+        gt=0,
+    )
 
 
 class DatabaseSettings(BaseModel):
@@ -165,6 +215,10 @@ class DatabaseSettings(BaseModel):
         gt=0,
         le=30000,
     )
+    INDEX_SYNC_ON_STARTUP: bool = Field(
+        default=True,
+        description="Build missing indexes of the index plan (app.db.indexes) in the background at startup",
+    )
 
     @model_validator(mode="after")
     def check_connections(cls, values):
@@ -218,6 +272,10 @@ class RedisSettings(BaseModel):
         default="token_blacklist:",
         description="Redis key prefix for token blacklist",
     )
+    TOKEN_BLACKLIST_CHANNEL: str = Field(
+        default="token_blacklist:events",
+        description="Redis pub/sub channel announcing newly blacklisted token IDs",
+    )
     LOGIN_ATTEMPT_PREFIX: str = Field(
         default="login_attempt:",
         description="Redis key prefix for login attempts",
@@ -228,6 +286,53 @@ class RedisSettings(BaseModel):
     )
 
 
+class ReferenceCacheSettings(BaseModel):
+    """In-process reference (entity) cache configuration."""
+    REFERENCE_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Maximum cached reference entries (LRU)",
+        gt=0,
+    )
+    REFERENCE_CACHE_TTL: int = Field(
+        default=300,
+        description="Seconds a cached entity is served before reloading",
+        gt=0,
+    )
+    REFERENCE_LIST_CACHE_TTL: int = Field(
+        default=30,
+        description="Seconds a cached reference list/query result is served",
+        gt=0,
+    )
+    REFERENCE_NEGATIVE_CACHE_TTL: int = Field(
+        default=10,
+        description="Seconds a missing reference is remembered",
+        gt=0,
+    )
+
+
+class InvalidationSettings(BaseModel):
+    """Change-stream driven invalidation of in-process caches."""
+    INVALIDATION_BUS_ENABLED: bool = Field(
+        default=True,
+        description="Watch accounts, bots, symbol_data, users and account_groups and invalidate caches on change (needs a replica set)",
+    )
+    INVALIDATION_TOKEN_SAVE_SECONDS: float = Field(
+        default=5.0,
+        description="How often the change stream resume token is persisted",
+        gt=0,
+    )
+    INVALIDATION_RETRY_SECONDS: float = Field(
+        default=5.0,
+        description="Delay before reopening an interrupted change stream",
+        gt=0,
+    )
+    INVALIDATION_RECONCILE_SECONDS: int = Field(
+        default=300,
+        description="Full reconciliation interval of event-driven caches while the change stream is live",
+        gt=0,
+    )
+
+
 class CorsSettings(BaseModel):
     """CORS configuration."""
     BACKEND_CORS_ORIGINS: List[str] = Field(
@@ -300,12 +405,17 @@ class ErrorHandlingSettings(BaseModel):
     # Batch processing settings
     ERROR_BATCH_SIZE: int = Field(
         default=10,
-        description="Number of errors to process in batch",
+        description="Distinct error fingerprints processed per batch interval; the rest carry over",
         gt=0,
     )
     ERROR_BATCH_INTERVAL: int = Field(
-        default=1,  # 1 second
-        description="Interval for batch processing (seconds)",
+        default=5,
+        description="Aggregation window: identical errors within it are processed once (seconds)",
+        gt=0,
+    )
+    ERROR_BATCH_MAX_FINGERPRINTS: int = Field(
+        default=1000,
+        description="Max distinct error fingerprints held between batches; further new ones are dropped",
         gt=0,
     )
 
@@ -353,8 +463,32 @@ class LoggingSettings(BaseModel):
         default=True,
         description="Use colors in text log format"
     )
+    LOG_BUFFER_SIZE: int = Field(
+        default=50000,
+        description="Records buffered for the log writer before lower-priority records are dropped",
+        gt=0,
+    )
+    LOG_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Maximum records formatted and written per batch",
+        gt=0,
+    )
+    LOG_FLUSH_INTERVAL: float = Field(
+        default=0.1,
+        description="Log writer poll interval (seconds) while idle",
+        gt=0,
+    )
+    LOG_LOSSLESS_LEVEL: LogLevel = Field(
+        default=LogLevel.WARNING,
+        description="Records at or above this level are never dropped or sampled",
+    )
+    LOG_SAMPLE_RATES: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Logger-name prefix -> fraction of records below LOG_LOSSLESS_LEVEL kept, "
+                    "e.g. {\"app.services.websocket\": 0.1}",
+    )
 
-    @validator("LOG_LEVEL", pre=True)
+    @validator("LOG_LEVEL", "LOG_LOSSLESS_LEVEL", pre=True)
     def validate_log_level(cls, v: Union[str, LogLevel]) -> LogLevel:
         """Convert string log levels to enum values."""
         if isinstance(v, str):
@@ -374,6 +508,42 @@ class RateLimitingSettings(BaseModel):
     RATE_LIMIT_ORDERS_PER_SECOND: int = Field(
         default=5, description="Maximum orders per second", gt=0
     )
+    RATE_LIMIT_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Enforce per-client API rate limits in the HTTP middleware. Clients are keyed by IP; "
+            "behind a reverse proxy set RATE_LIMIT_TRUSTED_PROXIES first"
+        ),
+    )
+    RATE_LIMIT_TRUSTED_PROXIES: List[str] = Field(
+        default=[],
+        description="Proxy addresses/CIDRs whose X-Forwarded-For header identifies the client",
+    )
+    RATE_LIMIT_DEFAULT_PER_MINUTE: int = Field(
+        default=300, description="Default API requests per minute per client", gt=0
+    )
+    RATE_LIMIT_AUTH_PER_MINUTE: int = Field(
+        default=10, description="Login/registration attempts per minute per client", gt=0
+    )
+    RATE_LIMIT_MAX_KEYS: int = Field(
+        default=100_000, description="Maximum client keys tracked in memory (LRU-evicted)", gt=0
+    )
+    RATE_LIMIT_USE_REDIS: bool = Field(
+        default=False, description="Share rate limit state across workers via RATE_LIMIT_REDIS_URL"
+    )
+
+    @validator("RATE_LIMIT_TRUSTED_PROXIES", pre=True)
+    def parse_trusted_proxies(cls, v: Union[str, List[str]]) -> List[str]:
+        """Accept a comma-separated string or a list; every entry must be an IP or CIDR."""
+        if isinstance(v, str):
+            v = json.loads(v) if v.strip().startswith("[") else v.split(",")
+        proxies = [str(item).strip() for item in v if str(item).strip()]
+        for proxy in proxies:
+            try:
+                ipaddress.ip_network(proxy, strict=False)
+            except ValueError:
+                raise ConfigValidationError(f"Invalid trusted proxy address: {proxy}")
+        return proxies
 
 
 class WebhookSettings(BaseModel):
@@ -390,6 +560,66 @@ class WebhookSettings(BaseModel):
         gt=0,
         le=300,
     )
+    WEBHOOK_FORWARD_QUEUE_SIZE: int = Field(
+        default=1000,
+        description="Forward deliveries held in memory before spilling to disk",
+        gt=0,
+    )
+    WEBHOOK_FORWARD_WORKERS: int = Field(
+        default=2, description="Concurrent forward deliveries", gt=0
+    )
+    WEBHOOK_FORWARD_MAX_ATTEMPTS: int = Field(
+        default=5,
+        description="Delivery attempts before a forward is spilled to disk",
+        gt=0,
+    )
+    WEBHOOK_FORWARD_BACKOFF_BASE: float = Field(
+        default=1.0,
+        description="Initial retry delay in seconds (doubles per attempt)",
+        gt=0,
+    )
+    WEBHOOK_FORWARD_BACKOFF_MAX: float = Field(
+        default=60.0, description="Maximum retry delay in seconds", gt=0
+    )
+    WEBHOOK_FORWARD_SPILL_PATH: Path = Field(
+        default=Path("data/webhook_forward_spill.jsonl"),
+        description="File holding forwards that could not be delivered",
+    )
+    WEBHOOK_FORWARD_SPILL_MAX_BYTES: int = Field(
+        default=50 * 1024 * 1024,
+        description="Maximum size of the spill file; further forwards are dropped",
+        gt=0,
+    )
+    WEBHOOK_FORWARD_REPLAY_INTERVAL: int = Field(
+        default=60,
+        description="Seconds between attempts to replay spilled forwards",
+        gt=0,
+    )
+    SIGNAL_DEDUPE_WINDOW_SECONDS: float = Field(
+        default=10.0,
+        description="Identical signals for a bot within this window are dropped as duplicates",
+        ge=0,
+    )
+    SIGNAL_QUEUE_SIZE_PER_BOT: int = Field(
+        default=100,
+        description="Pending signals held per bot before new ones are rejected",
+        gt=0,
+    )
+    SIGNAL_CONSUMER_IDLE_SECONDS: int = Field(
+        default=300,
+        description="Seconds an idle per-bot consumer lives before it is stopped",
+        gt=0,
+    )
+    SIGNAL_OUTCOME_HISTORY: int = Field(
+        default=1000,
+        description="Recent signal outcomes kept for status lookups",
+        gt=0,
+    )
+    SIGNAL_SHUTDOWN_TIMEOUT: float = Field(
+        default=10.0,
+        description="Seconds to wait on shutdown for queued signals to finish",
+        gt=0,
+    )
 
     @validator("TRADINGVIEW_WEBHOOK_SECRET", pre=True)
     def validate_webhook_secret(cls, v: Union[str, SecretStr]) -> SecretStr:
@@ -409,6 +639,20 @@ class TelegramSettings(BaseModel):
     TELEGRAM_RETRY_DELAY: int = Field(
         default=5, description="Retry delay for failed messages (in seconds)", gt=0
     )
+    TELEGRAM_MAX_SEND_ATTEMPTS: int = Field(
+        default=3, description="Attempts per message before a failing send is dropped", gt=0
+    )
+    TELEGRAM_DIGEST_WINDOW: float = Field(
+        default=2.0,
+        description="Non-critical messages queued within this window are sent as one digest (seconds)",
+        ge=0,
+    )
+    TELEGRAM_MESSAGES_PER_SECOND: float = Field(
+        default=1.0, description="Send rate limit for the chat", gt=0
+    )
+    TELEGRAM_GROUP_MESSAGES_PER_MINUTE: int = Field(
+        default=20, description="Additional per-minute limit when the chat is a group", gt=0
+    )
 
     @validator("TELEGRAM_BOT_TOKEN", pre=True)
     def validate_telegram_token(cls, v: Union[str, SecretStr]) -> SecretStr:
@@ -438,6 +682,27 @@ class CronSettings(BaseModel):
     SYMBOL_VERIFICATION_CRON: str = Field(
         default="0 0 * * 0", description="Cron schedule for symbol verification"
     )
+    DAILY_SUMMARY_CRON: str = Field(
+        default="30 0 * * *",
+        description="Cron schedule for the daily Telegram summary; runs after DAILY_PERFORMANCE_CRON has stored the day"
+    )
+    CRON_LOCK_TTL: int = Field(
+        default=600,
+        description=(
+            "Lease on a job's distributed lock (seconds); renewed while the job runs and kept this long "
+            "after a successful run. Must be shorter than the interval between a job's runs"
+        ),
+        gt=0,
+    )
+    CRON_MISFIRE_GRACE_TIME: int = Field(
+        default=300, description="How late a missed run may still start (seconds)", gt=0
+    )
+    CRON_ACCOUNT_CONCURRENCY: int = Field(
+        default=10, description="Accounts processed concurrently by a job", gt=0
+    )
+    CRON_EXCHANGE_CONCURRENCY: int = Field(
+        default=4, description="Concurrent exchange calls per exchange within a job", gt=0
+    )
 
 
 class BalanceSyncSettings(BaseModel):
@@ -574,6 +839,54 @@ class PerformanceSettings(BaseModel):
     )
 
 
+class RetentionSettings(BaseModel):
+    """Retention of historical collections (run by the cron cleanup job)."""
+    TRADE_RETENTION_DAYS: Optional[int] = Field(
+        default=None, description="Days to keep closed trades; None keeps them forever", gt=0
+    )
+    POSITION_HISTORY_RETENTION_DAYS: Optional[int] = Field(
+        default=None, description="Days to keep closed positions; None keeps them forever", gt=0
+    )
+    RETENTION_ARCHIVE_ENABLED: bool = Field(
+        default=True,
+        description=(
+            "Archive expired trades and positions to compressed files before deleting them; "
+            "when disabled, MongoDB TTL indexes expire them instead"
+        )
+    )
+    RETENTION_ARCHIVE_DIR: Path = Field(
+        default=Path("archives"), description="Directory for gzip-compressed JSON lines archives"
+    )
+    RETENTION_CHUNK_DAYS: int = Field(
+        default=1, description="Days of data removed by one delete_many", gt=0
+    )
+    RETENTION_MAX_CHUNKS_PER_RUN: int = Field(
+        default=30, description="Chunks removed per collection per cleanup run; the rest waits for the next run", gt=0
+    )
+    RETENTION_CHUNK_PAUSE_SECONDS: float = Field(
+        default=1.0, description="Pause between chunk deletions to spread the write load", ge=0
+    )
+
+
+class ExportSettings(BaseModel):
+    """Background export job configuration."""
+    EXPORT_DIR: Path = Field(
+        default=Path("exports"), description="Directory for generated export artifacts"
+    )
+    EXPORT_WORKERS: int = Field(
+        default=2, description="Number of concurrent export workers (per API process)", gt=0, le=16
+    )
+    EXPORT_QUEUE_SIZE: int = Field(
+        default=100, description="Maximum queued export jobs", gt=0
+    )
+    EXPORT_JOB_TTL_HOURS: int = Field(
+        default=24, description="Hours a finished export artifact is kept", gt=0
+    )
+    EXPORT_ROW_GROUP_SIZE: int = Field(
+        default=100_000, description="Rows per Parquet row group / Arrow record batch", gt=0
+    )
+
+
 class MonitoringSettings(BaseModel):
     """System monitoring configuration."""
     ENABLE_METRICS: bool = Field(
@@ -581,10 +894,17 @@ class MonitoringSettings(BaseModel):
     )
     METRICS_PORT: int = Field(
         default=9090,
-        description="Port for Prometheus metrics",
+        description="First port for Prometheus metrics; each API worker binds its own",
         gt=0,
         le=65535,
     )
+    METRICS_PORT_RANGE: int = Field(
+        default=1,
+        description="Consecutive ports from METRICS_PORT the workers may bind; set to the worker count "
+                    "and scrape every port",
+        ge=1,
+        le=256,
+    )
     ENABLE_PERFORMANCE_MONITORING: bool = Field(
         default=True, description="Enable performance monitoring"
     )
@@ -598,6 +918,38 @@ class MonitoringSettings(BaseModel):
         description="Health check interval (seconds)",
         gt=0,
     )
+    TRACING_ENABLED: bool = Field(
+        default=True, description="Record spans for the webhook-to-fill signal path"
+    )
+    TRACE_BUFFER_SIZE: int = Field(
+        default=1000,
+        description="Number of recent traces kept in memory for the debug view",
+        gt=0,
+    )
+    TRACE_EXPORT_PATH: Optional[Path] = Field(
+        default=None,
+        description="File receiving OTLP/JSON span batches, e.g. logs/traces.jsonl (unset to disable)",
+    )
+    TRACE_EXPORT_MAX_BYTES: int = Field(
+        default=10485760,  # 10MB
+        description="Size at which TRACE_EXPORT_PATH is rotated",
+        gt=0,
+    )
+    TRACE_EXPORT_BACKUPS: int = Field(
+        default=3,
+        description="Rotated trace export files to retain",
+        gt=0,
+    )
+    TRACE_OTLP_ENDPOINT: Optional[str] = Field(
+        default=None,
+        description="OTLP/HTTP JSON traces endpoint, e.g. http://localhost:4318/v1/traces; "
+                    "takes precedence over TRACE_EXPORT_PATH",
+    )
+    TRACE_EXPORT_INTERVAL: float = Field(
+        default=2.0,
+        description="Seconds between span export batches",
+        gt=0,
+    )
 
 
 class DevelopmentSettings(BaseModel):
@@ -624,6 +976,8 @@ class Settings(BaseSettings):
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     database: DatabaseSettings
     redis: RedisSettings = Field(default_factory=RedisSettings)
+    reference_cache: ReferenceCacheSettings = Field(default_factory=ReferenceCacheSettings)
+    invalidation: InvalidationSettings = Field(default_factory=InvalidationSettings)
     cors: CorsSettings = Field(default_factory=CorsSettings)
     error: ErrorHandlingSettings = Field(default_factory=ErrorHandlingSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
@@ -636,6 +990,8 @@ class Settings(BaseSettings):
     websocket: WebsocketSettings = Field(default_factory=WebsocketSettings)
     exchange: ExchangeSettings = Field(default_factory=ExchangeSettings)
     performance: PerformanceSettings = Field(default_factory=PerformanceSettings)
+    retention: RetentionSettings = Field(default_factory=RetentionSettings)
+    export: ExportSettings = Field(default_factory=ExportSettings)
     monitoring: MonitoringSettings = Field(default_factory=MonitoringSettings)
     development: DevelopmentSettings = Field(default_factory=DevelopmentSettings)
 
@@ -92,6 +92,32 @@ class PerformanceTimeFrame(str, Enum):
     QUARTERLY = "quarterly"
     YEARLY = "yearly"
 
+# ---- Cache Invalidation Enums ----
+
+class InvalidationKind(str, Enum):
+    """Cache invalidation events published from database changes."""
+    ACCOUNT_UPDATED = "account_updated"
+    ACCOUNT_DELETED = "account_deleted"
+    BOT_STATUS_CHANGED = "bot_status_changed"
+    BOT_UPDATED = "bot_updated"
+    BOT_DELETED = "bot_deleted"
+    SYMBOL_UPDATED = "symbol_updated"
+    SYMBOL_DISABLED = "symbol_disabled"
+    USER_UPDATED = "user_updated"
+    USER_DELETED = "user_deleted"
+    GROUP_UPDATED = "group_updated"
+    GROUP_DELETED = "group_deleted"
+    RESYNC = "resync"
+
+# ---- Export Enums ----
+
+class ExportJobStatus(str, Enum):
+    """Background export job states."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 # ---- Websocket Enums ----
 
 class WebSocketType(str, Enum):
@@ -129,6 +155,14 @@ class ErrorCategory(str, Enum):
     RATELIMIT = "ratelimit"
     SYSTEM = "system"
 
+# ---- Notification Enums ----
+
+class NotificationPriority(str, Enum):
+    """Delivery priority of outgoing notifications, highest first."""
+    CRITICAL = "critical"
+    HIGH = "high"
+    NORMAL = "normal"
+
 # ---- Recovery Enums ----
 
 class RecoveryStrategy(str, Enum):
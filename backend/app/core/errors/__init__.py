@@ -37,6 +37,7 @@ if TYPE_CHECKING:
         ErrorContext,
         DEFAULT_STRATEGIES,
         BatchError,
+        ErrorAggregate,
         CircuitBreakerState,
         ErrorStackFrame,
         ErrorStack,
@@ -96,6 +97,10 @@ else:
     def BatchError():
         return _get_types_module().BatchError
     
+    @property
+    def ErrorAggregate():
+        return _get_types_module().ErrorAggregate
+    
     @property
     def CircuitBreakerState():
         return _get_types_module().CircuitBreakerState
@@ -148,6 +153,7 @@ __all__ = [
     "ErrorContext",
     "DEFAULT_STRATEGIES",
     "BatchError",
+    "ErrorAggregate",
     "CircuitBreakerState",
     "ErrorStackFrame",
     "ErrorStack",
@@ -1,105 +1,69 @@
 """
-Core logging functionality with structured error handling.
+Decorator wrapping service methods with uniform error handling.
 
-This module provides logging services with:
-- Structured JSON logging
-- Error context enrichment
-- Performance tracking
-- Request tracing
-- Optimized for performance with async handling
+Errors are passed to ``handle_api_error`` (aggregation, recovery,
+notification, logging) with context extracted from the call's arguments,
+then re-raised unchanged so callers keep their own control flow.
 """
 
-import importlib
-from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING
+import asyncio
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
 
-# Type checking imports
-if TYPE_CHECKING:
-    from .logger import (
-        get_logger, 
-        init_logging, 
-        cleanup_logging,
-        configure_log_levels,
-        LoggerProtocol,
-        AsyncLogger
-    )
-    from .formatters import (
-        create_formatter,
-        JSONFormatter,
-        TextFormatter,
-        CompactFormatter,
-        BaseLogFormatter
-    )
-else:
-    # Lazy loading to prevent circular imports
-    _logger_module = None
-    _formatters_module = None
-    
-    def _get_logger_module():
-        global _logger_module
-        if _logger_module is None:
-            _logger_module = importlib.import_module('.logger', package='app.core.logging')
-        return _logger_module
-    
-    def _get_formatters_module():
-        global _formatters_module
-        if _formatters_module is None:
-            _formatters_module = importlib.import_module('.formatters', package='app.core.logging')
-        return _formatters_module
-    
-    # Function to get the logger with lazy loading
-    def get_logger(name: str):
-        return _get_logger_module().get_logger(name)
-    
-    # Other module functions
-    def init_logging():
-        return _get_logger_module().init_logging()
-    
-    def cleanup_logging():
-        return _get_logger_module().cleanup_logging()
-    
-    def configure_log_levels(levels: Dict[str, Union[str, int]]):
-        return _get_logger_module().configure_log_levels(levels)
-    
-    def create_formatter(fmt_type: str = "json", use_colors: bool = True, fmt_string: Optional[str] = None):
-        return _get_formatters_module().create_formatter(fmt_type, use_colors, fmt_string)
-    
-    # Classes from the modules
-    @property
-    def LoggerProtocol():
-        return _get_logger_module().LoggerProtocol
-    
-    @property
-    def AsyncLogger():
-        return _get_logger_module().AsyncLogger
-    
-    @property
-    def BaseLogFormatter():
-        return _get_formatters_module().BaseLogFormatter
-    
-    @property
-    def JSONFormatter():
-        return _get_formatters_module().JSONFormatter
-    
-    @property
-    def TextFormatter():
-        return _get_formatters_module().TextFormatter
-    
-    @property
-    def CompactFormatter():
-        return _get_formatters_module().CompactFormatter
 
-__all__ = [
-    # Main logging functions
-    'get_logger',
-    'init_logging', 
-    'cleanup_logging',
-    'configure_log_levels',
-    'create_formatter',
-    # Classes
-    'LoggerProtocol',
-    'AsyncLogger',
-    'BaseLogFormatter',
-    'JSONFormatter',
-    'TextFormatter',
-    'CompactFormatter'
-]
\ No newline at end of file
+def _extract_context(
+    context_extractor: Optional[Callable[..., Dict[str, Any]]],
+    args: tuple,
+    kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    if context_extractor is None:
+        return {}
+    try:
+        return dict(context_extractor(*args, **kwargs) or {})
+    except Exception:
+        # An extractor whose signature does not match the call must not mask the error
+        return {}
+
+
+def error_handler(
+    context_extractor: Optional[Callable[..., Dict[str, Any]]] = None,
+    log_message: Optional[str] = None
+):
+    """
+    Decorator reporting exceptions of the wrapped function through
+    ``handle_api_error`` and re-raising them.
+
+    Args:
+        context_extractor: Builds the error context from the function's arguments.
+        log_message: Message logged with the error.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    from app.core.errors.handlers import handle_api_error
+                    await handle_api_error(
+                        e, context=_extract_context(context_extractor, args, kwargs), log_message=log_message
+                    )
+                    raise
+            return async_wrapper
+
+        @wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                from app.core.logging.logger import get_logger
+                get_logger(func.__module__).error(
+                    log_message or f"Error in {func.__qualname__}",
+                    extra={"error": str(e), "context": _extract_context(context_extractor, args, kwargs)}
+                )
+                raise
+        return sync_wrapper
+    return decorator
+
+
+__all__ = ["error_handler"]
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import random
 import time
 from datetime import datetime
@@ -6,13 +7,34 @@ from typing import Optional, Dict, Any, Type, Callable, Awaitable, Set, List
 from weakref import WeakValueDictionary
 
 from .base import BaseError
-from .types import RECOVERY_CONFIG, NOTIFICATION_CONFIG, DEFAULT_STRATEGIES, ErrorContext, BatchError
-from app.core.enums import ErrorLevel, ErrorCategory, RecoveryStrategy
+from .types import RECOVERY_CONFIG, NOTIFICATION_CONFIG, DEFAULT_STRATEGIES, ErrorContext, BatchError, ErrorAggregate
+from app.core.enums import ErrorLevel, ErrorCategory, NotificationPriority, RecoveryStrategy
 from app.core.logging.logger import get_logger
 from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# Context keys naming where an error came from, in order of preference
+_SOURCE_KEYS = ("source", "service", "operation", "exchange", "path", "log_message")
+# Context keys that vary per occurrence or are written by the handler itself
+_VOLATILE_KEYS = frozenset({"timestamp", "error_count", "environment", "recovery_attempts", "occurrences"})
+_VOLATILE_PREFIXES = ("retry_", "reconnect_", "cancel_", "reset_")
+
+
+def error_fingerprint(error: BaseError, context: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Identify "the same error": type, source and the set of context keys.
+    Context values (order IDs, amounts, ...) are ignored so that a storm of
+    otherwise identical errors collapses into one fingerprint.
+    """
+    merged = {**(error.context or {}), **(context or {})}
+    source = next((str(merged[key])[:100] for key in _SOURCE_KEYS if merged.get(key)), "")
+    keys = sorted(
+        key for key in merged
+        if key not in _VOLATILE_KEYS and not key.startswith(_VOLATILE_PREFIXES)
+    )
+    return f"{error.__class__.__name__}|{source}|{','.join(keys)}"
+
 
 class ErrorHandler:
     """
@@ -24,6 +46,8 @@ class ErrorHandler:
         """Initialize the error handler with optimized data structures."""
         self.error_counts: Dict[str, int] = {}
         self.last_notification: Dict[str, datetime] = {}
+        # Occurrences held back by the notification cooldown, reported with the next alert
+        self.suppressed_notifications: Dict[str, int] = {}
         
         # Use WeakValueDictionary to automatically cleanup locks when they're no longer referenced
         self.recovery_locks: WeakValueDictionary = WeakValueDictionary()
@@ -31,17 +55,34 @@ class ErrorHandler:
         # Timestamp-based lock tracking for manual cleanup
         self.lock_timestamps: Dict[str, float] = {}
         
-        # Batch processing for similar errors
-        self.error_batches: Dict[str, List[BatchError]] = {}
+        # Errors aggregated by fingerprint until the next batch interval
+        self.error_batches: Dict[str, ErrorAggregate] = {}
         self.batch_processing_lock = asyncio.Lock()
+        self.aggregation_stats = {"received": 0, "processed": 0, "overflow": 0}
         
-        # Start the cleanup task for stale locks
-        self._start_lock_cleanup()
-        
-        # Start the batch processing task
-        self._start_batch_processor()
+        # Lock cleanup and batch processing tasks, started with the event loop
+        self._background_tasks: List[asyncio.Task] = []
+        self._background_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ensure_background_tasks()
 
-    def _start_lock_cleanup(self) -> None:
+    def _ensure_background_tasks(self) -> None:
+        """
+        Start the lock cleanup and batch processing tasks once an event loop is
+        running. The handler is created at import time, possibly before the
+        loop exists, so handle_error calls this on every error.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._background_loop is loop and not any(task.done() for task in self._background_tasks):
+            return
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_loop = loop
+        self._background_tasks = [self._start_lock_cleanup(), self._start_batch_processor()]
+
+    def _start_lock_cleanup(self) -> asyncio.Task:
         """Start a background task to clean up stale locks."""
         async def cleanup_locks() -> None:
             while True:
@@ -52,9 +93,9 @@ class ErrorHandler:
                     logger.error(f"Error in lock cleanup task: {e}")
 
         # Schedule the cleanup task but don't wait for it
-        asyncio.create_task(cleanup_locks())
+        return asyncio.create_task(cleanup_locks())
 
-    def _start_batch_processor(self) -> None:
+    def _start_batch_processor(self) -> asyncio.Task:
         """Start a background task to process error batches."""
         async def process_batches() -> None:
             while True:
@@ -65,7 +106,7 @@ class ErrorHandler:
                     logger.error(f"Error in batch processing task: {e}")
 
         # Schedule the batch processing task
-        asyncio.create_task(process_batches())
+        return asyncio.create_task(process_batches())
 
     async def _cleanup_stale_locks(self) -> None:
         """Remove locks that have been active for too long."""
@@ -87,31 +128,42 @@ class ErrorHandler:
             logger.info(f"Cleaned up {len(keys_to_remove)} stale error recovery locks")
 
     async def _process_error_batches(self) -> None:
-        """Process batched errors together for efficiency."""
+        """
+        Process the aggregated errors of one window. Each fingerprint is
+        recovered, notified and logged once, carrying its occurrence count, so
+        an error storm costs O(distinct errors) rather than O(errors).
+        """
         async with self.batch_processing_lock:
-            for error_type, batch in self.error_batches.items():
-                if not batch:
-                    continue
-                
+            if self.aggregation_stats["overflow"]:
+                logger.warning(
+                    "Error aggregation full; dropped errors with new fingerprints",
+                    extra={"dropped": self.aggregation_stats["overflow"], "fingerprints": len(self.error_batches)}
+                )
+                self.aggregation_stats["overflow"] = 0
+            if not self.error_batches:
+                return
+
+            # Take up to batch_size fingerprints, oldest first; the rest carry over.
+            # No await between the swap and the put-back, so concurrent handle_error
+            # calls always land in the live dict.
+            aggregates = list(self.error_batches.values())
+            batch_size = settings.error.ERROR_BATCH_SIZE
+            to_process = aggregates[:batch_size]
+            self.error_batches = {aggregate.fingerprint: aggregate for aggregate in aggregates[batch_size:]}
+
+            for aggregate in to_process:
+                first = aggregate.first
                 try:
-                    # Process up to batch_size errors of this type
-                    batch_size = settings.error.ERROR_BATCH_SIZE
-                    to_process = batch[:batch_size]
-                    
-                    # Log as a group
-                    logger.info(f"Processing batch of {len(to_process)} {error_type} errors")
-                    
-                    # Process each error
-                    for batch_error in to_process:
-                        await self._process_single_error(batch_error.error, 
-                                                       batch_error.context, 
-                                                       batch_error.error_class, 
-                                                       batch_error.notification_override)
-                    
-                    # Remove processed errors from the batch
-                    self.error_batches[error_type] = batch[batch_size:]
+                    await self._process_single_error(
+                        first.error,
+                        first.context,
+                        first.error_class,
+                        first.notification_override,
+                        aggregate=aggregate
+                    )
+                    self.aggregation_stats["processed"] += aggregate.count
                 except Exception as e:
-                    logger.error(f"Error processing batch of {error_type}: {e}")
+                    logger.error(f"Error processing batch of {aggregate.fingerprint}: {e}")
 
     async def handle_error(
         self,
@@ -133,28 +185,37 @@ class ErrorHandler:
             batch_mode: Whether to process this error in a batch (default: True)
         """
         try:
+            self._ensure_background_tasks()
+
             # Convert error to a BaseError if needed
             if not isinstance(error, BaseError):
                 error = error_class(str(error), context) if error_class else BaseError(str(error), context)
             
             error_type = error.__class__.__name__
             
-            # If batch mode is enabled, add to batch for later processing
+            # If batch mode is enabled, aggregate for later processing
             if batch_mode and not self._is_critical_error(error):
-                if error_type not in self.error_batches:
-                    self.error_batches[error_type] = []
-                
-                # Add to batch queue
-                batch_error = BatchError(
-                    error=error,
-                    context=context,
-                    error_class=error_class,
-                    notification_override=notification_override
+                self.aggregation_stats["received"] += 1
+                fingerprint = error_fingerprint(error, context)
+                aggregate = self.error_batches.get(fingerprint)
+                if aggregate is not None:
+                    aggregate.add(str(error))
+                    return
+                if len(self.error_batches) >= settings.error.ERROR_BATCH_MAX_FINGERPRINTS:
+                    self.aggregation_stats["overflow"] += 1
+                    return
+
+                self.error_batches[fingerprint] = ErrorAggregate(
+                    fingerprint=fingerprint,
+                    first=BatchError(
+                        error=error,
+                        context=context,
+                        error_class=error_class,
+                        notification_override=notification_override
+                    ),
+                    samples=[str(error)]
                 )
-                self.error_batches[error_type].append(batch_error)
-                
-                # Log that error was batched but don't process yet
-                logger.debug(f"Batched {error_type} error: {str(error)}")
+                logger.lazy(logging.DEBUG, f"Batched {error_type} error", lambda: {"fingerprint": fingerprint})
                 return
             
             # Process immediately for critical errors or when batch_mode=False
@@ -172,23 +233,30 @@ class ErrorHandler:
         context: Optional[Dict[str, Any]] = None,
         error_class: Optional[Type[BaseError]] = None,
         notification_override: Optional[bool] = None,
+        aggregate: Optional[ErrorAggregate] = None,
     ) -> None:
-        """Process a single error (internal method)."""
+        """
+        Process a single error (internal method). With ``aggregate``, the error
+        stands for all occurrences of its fingerprint in the window.
+        """
+        occurrences = aggregate.count if aggregate else 1
         try:
-            self._enrich_error_context(error)
-            self._track_error(error)
+            self._enrich_error_context(error, aggregate)
+            self._track_error(error, occurrences)
 
             strategy = self._get_recovery_strategy(error)
             if strategy:
-                await self._execute_recovery(error, strategy)
+                await self._execute_recovery(
+                    error, strategy, lock_key=aggregate.fingerprint if aggregate else None
+                )
 
             should_notify = (
                 notification_override
                 if notification_override is not None
-                else self._should_notify(error)
+                else self._should_notify(error, occurrences)
             )
             if should_notify:
-                await self._send_notification(error)
+                await self._send_notification(error, aggregate)
 
             logger.error(
                 str(error),
@@ -196,6 +264,8 @@ class ErrorHandler:
                     "error_type": error.__class__.__name__,
                     "error_context": error.context,
                     "recovery_strategy": strategy.value if strategy else None,
+                    "occurrences": occurrences,
+                    "fingerprint": aggregate.fingerprint if aggregate else None,
                 },
             )
         except Exception as e:
@@ -208,21 +278,27 @@ class ErrorHandler:
         """Determine if an error is critical and should be processed immediately."""
         return error.level == ErrorLevel.CRITICAL
 
-    def _enrich_error_context(self, error: BaseError) -> None:
-        """Enrich the error context with a timestamp and error count."""
+    def _enrich_error_context(self, error: BaseError, aggregate: Optional[ErrorAggregate] = None) -> None:
+        """Enrich the error context with a timestamp, error count and window occurrences."""
         error.context = error.context or {}
         error.context.update({
             "timestamp": datetime.utcnow().isoformat(),
             "error_count": self.error_counts.get(error.__class__.__name__, 0),
             "environment": settings.app.ENVIRONMENT.value,
         })
+        if aggregate is not None:
+            error.context.update({
+                "occurrences": aggregate.count,
+                "first_seen": aggregate.first_seen.isoformat(),
+                "last_seen": aggregate.last_seen.isoformat(),
+            })
         if hasattr(error, "recovery_attempts"):
             error.context["recovery_attempts"] = error.recovery_attempts
 
-    def _track_error(self, error: BaseError) -> None:
+    def _track_error(self, error: BaseError, occurrences: int = 1) -> None:
         """Increment the error count for the given error type."""
         error_type = error.__class__.__name__
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + occurrences
 
     def _get_recovery_strategy(self, error: BaseError) -> Optional[RecoveryStrategy]:
         """
@@ -251,7 +327,8 @@ class ErrorHandler:
 
     async def _execute_recovery(
         self, error: BaseError, strategy: RecoveryStrategy, 
-        lock_timeout: int = 30
+        lock_timeout: int = 30,
+        lock_key: Optional[str] = None
     ) -> None:
         """
         Execute the given recovery strategy using a lock to avoid
@@ -261,16 +338,17 @@ class ErrorHandler:
             error: The error to recover from
             strategy: The recovery strategy to apply
             lock_timeout: Maximum time to wait for lock acquisition (seconds)
+            lock_key: Lock identity, e.g. the error fingerprint; defaults to the error instance
         """
-        error_key = f"{error.__class__.__name__}_{id(error)}"
+        error_key = lock_key or f"{error.__class__.__name__}_{id(error)}"
         
-        # Create a new lock if needed
-        if error_key not in self.recovery_locks:
-            self.recovery_locks[error_key] = asyncio.Lock()
+        # Create a new lock if needed; hold a strong reference, the dict is weak
+        lock = self.recovery_locks.get(error_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.recovery_locks[error_key] = lock
             self.lock_timestamps[error_key] = time.time()
         
-        lock = self.recovery_locks[error_key]
-        
         # Try to acquire the lock with timeout
         try:
             async with asyncio.timeout(lock_timeout):
@@ -401,10 +479,11 @@ class ErrorHandler:
                 error.context["reset_error"] = str(e)
                 raise
 
-    def _should_notify(self, error: BaseError) -> bool:
+    def _should_notify(self, error: BaseError, occurrences: int = 1) -> bool:
         """
         Determine if a notification should be sent based on the error's level and
-        the time elapsed since the last notification.
+        the time elapsed since the last notification. Occurrences held back by
+        the cooldown are counted and reported with the next notification.
         """
         # First check if this level should be notified at all
         notify_levels = settings.get_notification_config().get("levels", 
@@ -418,13 +497,16 @@ class ErrorHandler:
         cooldown = settings.error.ERROR_NOTIFICATION_COOLDOWN or NOTIFICATION_CONFIG.cooldown_period
         
         if last_time and (datetime.utcnow() - last_time).total_seconds() < cooldown:
+            self.suppressed_notifications[error_type] = (
+                self.suppressed_notifications.get(error_type, 0) + occurrences
+            )
             return False
 
         # Update last notification time
         self.last_notification[error_type] = datetime.utcnow()
         return True
 
-    async def _send_notification(self, error: BaseError) -> None:
+    async def _send_notification(self, error: BaseError, aggregate: Optional[ErrorAggregate] = None) -> None:
         """Send an error notification (e.g. via a Telegram bot)."""
         try:
             from app.services.telegram.service import telegram_bot
@@ -439,6 +521,16 @@ class ErrorHandler:
                 f"Time: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}\n"
                 f"Environment: {settings.app.ENVIRONMENT.value}\n"
             )
+
+            # Occurrence counts: this window plus any held back by the cooldown
+            suppressed = self.suppressed_notifications.pop(error.__class__.__name__, 0)
+            if aggregate is not None and aggregate.count > 1:
+                window = (aggregate.last_seen - aggregate.first_seen).total_seconds()
+                message += f"Occurrences: {aggregate.count} in {window:.0f}s\n"
+                if len(aggregate.samples) > 1:
+                    message += "Variants:\n" + "\n".join(f"- {sample[:200]}" for sample in aggregate.samples) + "\n"
+            if suppressed:
+                message += f"Suppressed since last alert: {suppressed}\n"
             
             # Add context information
             if error.context:
@@ -451,7 +543,10 @@ class ErrorHandler:
                 )
                 message += f"\nContext:\n{context_str}"
             
-            await telegram_bot.send_error_notification(message)
+            priority = (
+                NotificationPriority.CRITICAL if error.level == ErrorLevel.CRITICAL else NotificationPriority.HIGH
+            )
+            await telegram_bot.send_error_notification(message, priority=priority)
         except Exception as e:
             logger.error(
                 "Failed to send error notification",
@@ -467,16 +562,22 @@ async def handle_api_error(
     error: Exception,
     context: Optional[Dict[str, Any]] = None,
     log_message: Optional[str] = None,
-    batch_mode: bool = False,
+    batch_mode: bool = True,
+    notification_override: Optional[bool] = None,
 ) -> None:
     """
     Handle API errors by processing them and logging additional details if provided.
+
+    Non-critical errors are aggregated by fingerprint and recovered/notified
+    once per batch interval; critical errors are processed immediately.
+    Notifications follow the level filter and cooldown unless overridden.
     
     Args:
         error: The error to process.
         context: Additional context for the error.
         log_message: An optional message to accompany the error log.
-        batch_mode: Whether to process errors in batch mode.
+        batch_mode: Whether to aggregate non-critical errors (default: True).
+        notification_override: Force notification on/off instead of the cooldown rules.
     """
     # Add request path to context if available
     if context and 'request' in context and hasattr(context['request'], 'url'):
@@ -491,7 +592,7 @@ async def handle_api_error(
     await error_handler.handle_error(
         error=error, 
         context=context, 
-        notification_override=True,
+        notification_override=notification_override,
         batch_mode=batch_mode
     )
     
@@ -70,6 +70,24 @@ class BatchError(NamedTuple):
     error_class: Optional[Type] = None
     notification_override: Optional[bool] = None
 
+@dataclass
+class ErrorAggregate:
+    """Occurrences of one error fingerprint within an aggregation window."""
+    fingerprint: str
+    first: BatchError
+    count: int = 1
+    first_seen: datetime = field(default_factory=datetime.utcnow)
+    last_seen: datetime = field(default_factory=datetime.utcnow)
+    # A few distinct messages seen under this fingerprint, for notifications
+    samples: List[str] = field(default_factory=list)
+
+    def add(self, message: str, max_samples: int = 3) -> None:
+        """Count another occurrence."""
+        self.count += 1
+        self.last_seen = datetime.utcnow()
+        if len(self.samples) < max_samples and message not in self.samples:
+            self.samples.append(message)
+
 # Circuit Breaker state tracking
 @dataclass
 class CircuitBreakerState:
@@ -158,6 +176,7 @@ __all__ = [
     "ErrorType",
     "HandlerType",
     "BatchError",
+    "ErrorAggregate",
     "CircuitBreakerState",
     "ErrorStackFrame",
     "ErrorStack",
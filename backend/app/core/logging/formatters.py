@@ -7,7 +7,7 @@ Features:
 - Performance metrics
 - Request tracking
 - Rich metadata formatting
-- Optimized for performance
+- Optimized for performance (orjson when installed)
 """
 
 import logging
@@ -20,6 +20,14 @@ from datetime import datetime
 from typing import Any, Optional, Dict, List, Set, Union
 from enum import Enum
 
+# orjson encodes straight to bytes and handles datetime/Enum natively; stdlib json otherwise
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    orjson = None
+    ORJSON_SUPPORT = False
+
 # Define the set of standard LogRecord attributes so we can merge extra fields.
 STANDARD_LOG_ATTRS: Set[str] = {
     "name", "msg", "args", "levelname", "levelno", "pathname", "filename",
@@ -268,16 +276,7 @@ class JSONFormatter(BaseLogFormatter):
         except Exception:
             return None
 
-    def format(self, record: logging.LogRecord) -> str:
-        """
-        Format a log record as a JSON string.
-        
-        Args:
-            record: The log record to format
-            
-        Returns:
-            JSON string representation of the log record
-        """
+    def _log_data(self, record: logging.LogRecord) -> Dict[str, Any]:
         log_data = self._base_log_data(record)
         
         # Only process what's needed
@@ -292,10 +291,23 @@ class JSONFormatter(BaseLogFormatter):
             
         # Add extra fields
         log_data.update(self.get_extra_fields(record, log_data))
-        
-        # Serialize to JSON
+        return log_data
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """
+        Format a log record as UTF-8 encoded JSON.
+
+        Used by the log writer so lines are encoded once, without a str round trip.
+        """
         try:
-            return json.dumps(log_data, default=self._json_serializer)
+            log_data = self._log_data(record)
+            if ORJSON_SUPPORT:
+                try:
+                    return orjson.dumps(log_data, default=self._json_serializer, option=orjson.OPT_NON_STR_KEYS)
+                except TypeError:
+                    # e.g. integers beyond 64 bits; fall through to the stdlib encoder
+                    pass
+            return json.dumps(log_data, default=self._json_serializer).encode("utf-8")
         except Exception as e:
             # Fallback for serialization errors
             return json.dumps({
@@ -304,7 +316,19 @@ class JSONFormatter(BaseLogFormatter):
                 "logger": "JSONFormatter",
                 "message": f"Failed to serialize log: {e}",
                 "original_message": record.getMessage()
-            })
+            }).encode("utf-8")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as a JSON string.
+        
+        Args:
+            record: The log record to format
+            
+        Returns:
+            JSON string representation of the log record
+        """
+        return self.format_bytes(record).decode("utf-8")
 
 
 class TextFormatter(BaseLogFormatter):
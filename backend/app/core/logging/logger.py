@@ -1,15 +1,16 @@
 import sys
 import os
 import logging
-import logging.handlers
+import random
+import time
 import traceback
 import threading
-import queue
 import atexit
+from collections import deque
 from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, Protocol, List, Union
+from typing import Optional, Dict, Any, Protocol, List, Union, Callable
 
 from app.core.errors.base import BaseError
 from app.core.config import settings
@@ -43,81 +44,246 @@ class LogProtocol(Protocol):
         ...
 
 
+class _Sink:
+    """
+    One log destination. Records are encoded to bytes on the worker thread and
+    written once per batch.
+    """
+    def __init__(self, formatter: logging.Formatter, level: int) -> None:
+        self.formatter = formatter
+        self.level = level
+        # JSONFormatter produces bytes directly (orjson); others are encoded here
+        self._format_bytes = getattr(formatter, "format_bytes", None)
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        if self._format_bytes is not None:
+            return self._format_bytes(record) + b"\n"
+        return (self.formatter.format(record) + "\n").encode("utf-8", "replace")
+
+    def write(self, lines: List[bytes]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class RotatingFileSink(_Sink):
+    """Size-rotated log file (``path``, ``path.1`` ... ``path.N``) written in batches."""
+    def __init__(
+        self,
+        path: Union[str, Path],
+        formatter: logging.Formatter,
+        level: int,
+        max_bytes: int,
+        backups: int
+    ) -> None:
+        super().__init__(formatter, level)
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._stream = open(self.path, "ab")
+        self._size = self._stream.tell()
+
+    def _rollover(self) -> None:
+        self._stream.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self._stream = open(self.path, "ab")
+        self._size = 0
+
+    def write(self, lines: List[bytes]) -> None:
+        data = b"".join(lines)
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self._rollover()
+        self._stream.write(data)
+        self._stream.flush()
+        self._size += len(data)
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class StreamSink(_Sink):
+    """Console output written in batches."""
+    def __init__(self, stream: Any, formatter: logging.Formatter, level: int) -> None:
+        super().__init__(formatter, level)
+        self._stream = stream
+        self._buffer = getattr(stream, "buffer", None)
+
+    def write(self, lines: List[bytes]) -> None:
+        data = b"".join(lines)
+        if self._buffer is not None:
+            self._buffer.write(data)
+        else:
+            self._stream.write(data.decode("utf-8", "replace"))
+        self._stream.flush()
+
+
 class AsyncLogHandler(logging.Handler):
     """
-    A handler that dispatches log records to a separate thread
-    to avoid blocking the asyncio event loop.
+    Non-blocking handler: emit() appends the record to an in-memory ring buffer
+    and returns; a worker thread formats records in batches and hands each sink
+    one pre-encoded write per batch.
+
+    The buffer is a deque, whose append/popleft are atomic, so producers take no
+    lock (handle() skips the Handler lock as well). Nothing is ever processed on
+    the calling thread:
+      - records below ``lossless_level`` are subject to per-logger sampling
+        (``sample_rates`` maps logger-name prefixes to the fraction kept) and
+        are dropped when the buffer is full
+      - records at or above ``lossless_level`` are always buffered, up to twice
+        the capacity as a hard memory bound
+    Dropped and sampled-out records are counted and reported periodically.
     """
-    def __init__(self, capacity: int = 10000):
+    def __init__(
+        self,
+        capacity: int = 10000,
+        batch_size: int = 1000,
+        flush_interval: float = 0.1,
+        lossless_level: int = logging.WARNING,
+        sample_rates: Optional[Dict[str, float]] = None
+    ):
         """
-        Initialize with a queue to hold log records.
-        
+        Initialize the buffer and start the worker thread.
+
         Args:
-            capacity: Maximum number of records to queue before blocking
+            capacity: Records buffered before lower-priority records are dropped
+            batch_size: Maximum records formatted and written per batch
+            flush_interval: Worker poll interval (seconds) while the buffer is empty
+            lossless_level: Records at or above this level are never dropped for capacity
+            sample_rates: Logger-name prefix -> fraction of records below lossless_level kept
         """
         super().__init__()
-        self.queue = queue.Queue(capacity)
-        self.handlers: List[logging.Handler] = []
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.lossless_level = lossless_level
+        # Longest prefix first
+        self._sample_rules = sorted((sample_rates or {}).items(), key=lambda rule: len(rule[0]), reverse=True)
+        self._sample_cache: Dict[str, float] = {}
+        self._buffer: deque = deque()
+        self.sinks: List[_Sink] = []
+        self.stats = {"written": 0, "dropped": 0, "sampled_out": 0, "write_errors": 0}
+        self._reported_drops = 0
+        self._last_drop_report = time.monotonic()
         self._stop_event = threading.Event()
-        self._worker = threading.Thread(target=self._process_logs, daemon=True)
+        self._worker = threading.Thread(target=self._process_logs, name="log-writer", daemon=True)
         self._worker.start()
         atexit.register(self.close)
-    
+
+    def _sample_rate(self, name: str) -> float:
+        rate = self._sample_cache.get(name)
+        if rate is None:
+            rate = next((rate for prefix, rate in self._sample_rules if name.startswith(prefix)), 1.0)
+            self._sample_cache[name] = rate
+        return rate
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Emit without taking the Handler lock; the buffer is thread-safe."""
+        self.emit(record)
+        return True
+
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Add the record to the queue for asynchronous processing.
-        
+        Buffer the record, or drop it according to the sampling and overflow policy.
+
         Args:
             record: The log record to process
         """
-        try:
-            self.queue.put_nowait(record)
-        except queue.Full:
-            # If queue is full, fall back to immediate processing
-            self._process_record(record)
-    
+        if record.levelno < self.lossless_level:
+            if self._sample_rules:
+                rate = self._sample_rate(record.name)
+                if rate < 1.0 and random.random() >= rate:
+                    self.stats["sampled_out"] += 1
+                    return
+            if len(self._buffer) >= self.capacity:
+                self.stats["dropped"] += 1
+                return
+        elif len(self._buffer) >= self.capacity * 2:
+            self.stats["dropped"] += 1
+            return
+        self._buffer.append(record)
+
     def _process_logs(self) -> None:
-        """Worker thread that processes logs from the queue."""
-        while not self._stop_event.is_set() or not self.queue.empty():
+        """Worker thread: drain the buffer in batches until stopped and empty."""
+        while True:
+            if not self._buffer:
+                if self._stop_event.is_set():
+                    break
+                self._stop_event.wait(self.flush_interval)
+                self._report_drops()
+                continue
+            batch = []
             try:
-                record = self.queue.get(block=True, timeout=0.2)
-                self._process_record(record)
-                self.queue.task_done()
-            except queue.Empty:
+                while len(batch) < self.batch_size:
+                    batch.append(self._buffer.popleft())
+            except IndexError:
+                pass
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[logging.LogRecord]) -> None:
+        """Format the batch once per sink and write it in a single call."""
+        for sink in self.sinks:
+            lines = []
+            for record in batch:
+                if record.levelno < sink.level:
+                    continue
+                try:
+                    lines.append(sink.encode(record))
+                except Exception:
+                    self.stats["write_errors"] += 1
+            if not lines:
                 continue
+            try:
+                sink.write(lines)
             except Exception:
-                # Ensure the thread doesn't die on exception
-                continue
-    
-    def _process_record(self, record: logging.LogRecord) -> None:
-        """Process a single log record by dispatching to handlers."""
-        for handler in self.handlers:
-            if record.levelno >= handler.level:
-                handler.handle(record)
-    
+                # Never let a failing destination kill the worker
+                self.stats["write_errors"] += 1
+        self.stats["written"] += len(batch)
+
+    def _report_drops(self) -> None:
+        """Log a summary of dropped records at most once every 10 seconds."""
+        lost = self.stats["dropped"]
+        if lost == self._reported_drops or time.monotonic() - self._last_drop_report < 10:
+            return
+        record = logging.LogRecord(
+            "app.core.logging", logging.WARNING, __file__, 0,
+            "Dropped %d log records under load", (lost - self._reported_drops,), None
+        )
+        self._reported_drops = lost
+        self._last_drop_report = time.monotonic()
+        self._write_batch([record])
+
     def close(self) -> None:
         """
         Clean up resources when shutting down.
-        Ensures all queued messages are processed.
+        Ensures all buffered records are written.
         """
         self._stop_event.set()
         if self._worker.is_alive():
             self._worker.join(timeout=5.0)  # Wait up to 5 seconds
         
-        # Close all handlers
-        for handler in self.handlers:
-            handler.close()
+        # Close all sinks
+        for sink in self.sinks:
+            sink.close()
+        self.sinks = []
         
         super().close()
     
-    def add_handler(self, handler: logging.Handler) -> None:
+    def add_sink(self, sink: _Sink) -> None:
         """
-        Add a handler to receive log records.
+        Add a destination for log records.
         
         Args:
-            handler: The handler to add
+            sink: The sink to add
         """
-        self.handlers.append(handler)
+        self.sinks.append(sink)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "buffered": len(self._buffer), "capacity": self.capacity}
 
 
 class AsyncLogger(LogProtocol):
@@ -142,6 +308,9 @@ class AsyncLogger(LogProtocol):
         """
         self.name = name
         self.logger = logging.getLogger(name)
+        # Throttle state for every_n / every_interval
+        self._counts: Dict[str, int] = {}
+        self._intervals: Dict[str, List[Any]] = {}
         
         # Configure the logger only on first initialization
         with self._init_lock:
@@ -159,7 +328,13 @@ class AsyncLogger(LogProtocol):
     def _configure_async_handler(cls) -> None:
         """Configure the shared async handler and all output handlers."""
         # Create async handler with sufficient capacity
-        cls._async_handler = AsyncLogHandler(capacity=50000)
+        cls._async_handler = AsyncLogHandler(
+            capacity=settings.logging.LOG_BUFFER_SIZE,
+            batch_size=settings.logging.LOG_BATCH_SIZE,
+            flush_interval=settings.logging.LOG_FLUSH_INTERVAL,
+            lossless_level=getattr(logging, settings.logging.LOG_LOSSLESS_LEVEL.value),
+            sample_rates=settings.logging.LOG_SAMPLE_RATES
+        )
         
         # Ensure logs directory exists
         log_dir = Path(os.path.dirname(settings.logging.LOG_FILE_PATH))
@@ -170,41 +345,27 @@ class AsyncLogger(LogProtocol):
         use_colors = settings.logging.USE_COLORS
         formatter = create_formatter(fmt_type=log_format, use_colors=use_colors)
         
-        # Create handlers based on configuration
-        handlers = []
-        
-        # File handler for main logs with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Main log file with rotation
+        cls._async_handler.add_sink(RotatingFileSink(
             settings.logging.LOG_FILE_PATH,
-            maxBytes=settings.logging.MAX_LOG_SIZE,
-            backupCount=settings.logging.MAX_LOG_BACKUPS,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(cls._get_log_level())
-        handlers.append(file_handler)
+            formatter,
+            cls._get_log_level(),
+            max_bytes=settings.logging.MAX_LOG_SIZE,
+            backups=settings.logging.MAX_LOG_BACKUPS
+        ))
         
-        # File handler for errors with rotation
-        error_handler = logging.handlers.RotatingFileHandler(
+        # Error log file with rotation
+        cls._async_handler.add_sink(RotatingFileSink(
             settings.logging.ERROR_LOG_FILE_PATH,
-            maxBytes=settings.logging.MAX_LOG_SIZE,
-            backupCount=settings.logging.MAX_LOG_BACKUPS,
-            encoding='utf-8'
-        )
-        error_handler.setFormatter(formatter)
-        error_handler.setLevel(logging.ERROR)
-        handlers.append(error_handler)
+            formatter,
+            logging.ERROR,
+            max_bytes=settings.logging.MAX_LOG_SIZE,
+            backups=settings.logging.MAX_LOG_BACKUPS
+        ))
         
-        # Console handler if enabled
+        # Console output if enabled
         if settings.logging.CONSOLE_LOGGING:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(formatter)
-            console_handler.setLevel(cls._get_log_level())
-            handlers.append(console_handler)
-        
-        # Add all handlers to the async handler
-        for handler in handlers:
-            cls._async_handler.add_handler(handler)
+            cls._async_handler.add_sink(StreamSink(sys.stdout, formatter, cls._get_log_level()))
 
     @staticmethod
     def _get_log_level() -> int:
@@ -314,25 +475,103 @@ class AsyncLogger(LogProtocol):
         }
         self.logger.info(f"Performance: {operation}", extra={"performance": performance_data})
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Cheap level check for guarding expensive log arguments."""
+        return self.logger.isEnabledFor(level)
+
+    @property
+    def debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    # ---------------------------
+    # Hot-path helpers
+    # ---------------------------
+    # Fields are passed as a zero-argument callable so that filtered-out calls
+    # cost one level check and never build the extra dict. Throttle state is
+    # per logger and keyed by a caller-chosen string; keep keys low-cardinality
+    # (a call site, optionally plus a symbol or connection id).
+
+    def lazy(
+        self,
+        level: int,
+        message: str,
+        fields: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> None:
+        """Log ``message`` with ``fields()`` as extra, evaluated only if ``level`` is enabled."""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, message, extra={"extra": fields() if fields else {}}, stacklevel=2)
+
+    def every_n(
+        self,
+        key: str,
+        n: int,
+        level: int,
+        message: str,
+        fields: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> bool:
+        """
+        Log the first and then every ``n``-th call for ``key``.
+
+        The emitted record carries ``occurrences``, the total number of calls
+        so far. Returns True when a record was emitted.
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        if (count - 1) % n:
+            return False
+        extra = fields() if fields else {}
+        extra["occurrences"] = count
+        self.logger.log(level, message, extra={"extra": extra}, stacklevel=2)
+        return True
+
+    def every_interval(
+        self,
+        key: str,
+        seconds: float,
+        level: int,
+        message: str,
+        fields: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> bool:
+        """
+        Log at most once per ``seconds`` for ``key``.
+
+        The emitted record carries ``suppressed``, the number of calls dropped
+        since the previous record. Returns True when a record was emitted.
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+        now = time.monotonic()
+        state = self._intervals.get(key)
+        if state is not None and now - state[0] < seconds:
+            state[1] += 1
+            return False
+        extra = fields() if fields else {}
+        extra["suppressed"] = state[1] if state is not None else 0
+        self._intervals[key] = [now, 0]
+        self.logger.log(level, message, extra={"extra": extra}, stacklevel=2)
+        return True
+
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log a debug message."""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, extra=kwargs, stacklevel=2)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log an info message."""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, extra=kwargs, stacklevel=2)
 
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log a warning message."""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, extra=kwargs, stacklevel=2)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log an error message."""
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, extra=kwargs, stacklevel=2)
 
     def critical(self, message: str, **kwargs: Any) -> None:
         """Log a critical message."""
-        self.logger.critical(message, extra=kwargs)
+        self.logger.critical(message, extra=kwargs, stacklevel=2)
 
 
 @lru_cache(maxsize=100)
@@ -365,6 +604,13 @@ def init_logging() -> None:
     get_logger("app")
 
 
+def get_logging_stats() -> Dict[str, Any]:
+    """Buffer and drop counters of the shared log handler."""
+    if AsyncLogger._async_handler is None:
+        return {}
+    return AsyncLogger._async_handler.get_stats()
+
+
 def cleanup_logging() -> None:
     """
     Clean up logging resources.
@@ -0,0 +1,361 @@
+"""
+In-process Prometheus metrics.
+
+Counters, gauges and histograms are plain Python containers updated without
+locks: all hot-path updates happen on the event loop, so an observation is a
+couple of dict/list operations. The one exception is the MongoDB command
+listener, which runs on driver threads; there a racing update may in rare
+cases be lost, which is acceptable for monitoring data.
+
+Metrics are rendered in the Prometheus text exposition format (0.0.4) and
+served by MetricsServer on MonitoringSettings.METRICS_PORT, separate from the
+API port. Label values are passed positionally in ``labelnames`` order.
+
+Metrics are per process. With several API workers each one binds the first
+free port of METRICS_PORT .. METRICS_PORT + METRICS_PORT_RANGE - 1, so
+METRICS_PORT_RANGE should be at least the worker count and Prometheus should
+scrape every port in the range; a worker that finds no free port serves no
+metrics.
+"""
+
+import asyncio
+import math
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SLOW_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """Common metric state: name, help text and label names."""
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _labels(self, values: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples()
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{self._labels(labels)} {_format_value(value)}" for labels, value in list(self._values.items())]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down per label set."""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}{self._labels(labels)} {_format_value(value)}" for labels, value in list(self._values.items())]
+
+
+class Histogram(_Metric):
+    """
+    Fixed-bucket histogram per label set.
+
+    Per-bucket counts are stored non-cumulatively so an observation is one
+    bisect plus three increments; they are accumulated at render time.
+    """
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [bucket counts (len(buckets) + 1 for +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe the duration of the block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total, count) in list(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{self._labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ---------------------------
+# Application metrics
+# ---------------------------
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "API request latency by route template",
+    ("method", "route", "status")
+)
+exchange_request_duration = registry.histogram(
+    "exchange_request_duration_seconds", "Exchange REST call latency",
+    ("exchange", "endpoint", "status")
+)
+websocket_messages = registry.counter(
+    "websocket_messages_total", "Exchange WebSocket messages processed", ("exchange",)
+)
+websocket_message_lag = registry.histogram(
+    "websocket_message_lag_seconds", "Delay between the exchange message timestamp and processing",
+    ("exchange",)
+)
+order_fill_duration = registry.histogram(
+    "order_fill_duration_seconds", "Time from order placement until it is filled or monitoring gives up",
+    ("exchange", "outcome"), buckets=SLOW_BUCKETS
+)
+signal_fanout_duration = registry.histogram(
+    "signal_fanout_duration_seconds", "Time to fan a bot signal out to all connected accounts",
+    ("signal_type",), buckets=SLOW_BUCKETS
+)
+signal_account_results = registry.counter(
+    "signal_account_results_total", "Per-account signal execution outcomes", ("outcome",)
+)
+signal_queue_wait = registry.histogram(
+    "signal_queue_wait_seconds", "Time a signal waits in its bot queue before execution"
+)
+signal_ingested = registry.counter(
+    "signal_ingested_total", "Webhook signals by ingestion outcome", ("outcome",)
+)
+db_operation_duration = registry.histogram(
+    "db_operation_duration_seconds", "MongoDB command latency", ("command", "status")
+)
+cron_job_duration = registry.histogram(
+    "cron_job_duration_seconds", "Scheduled job run time", ("job", "status"), buckets=SLOW_BUCKETS
+)
+cron_job_runs = registry.counter(
+    "cron_job_runs_total", "Scheduled job runs by outcome (success, failed, skipped)", ("job", "outcome")
+)
+cron_job_items = registry.counter(
+    "cron_job_items_total", "Items (accounts, symbols) processed by scheduled jobs", ("job", "outcome")
+)
+retention_documents = registry.counter(
+    "retention_documents_total", "Expired documents removed by retention cleanup", ("collection", "action")
+)
+cache_invalidation_events = registry.counter(
+    "cache_invalidation_events_total", "Cache invalidation events published from change streams", ("kind",)
+)
+invalidation_stream_live = registry.gauge(
+    "invalidation_stream_live", "1 while the cache invalidation change stream is open"
+)
+telegram_queue_depth = registry.gauge(
+    "telegram_queue_depth", "Telegram notifications waiting to be sent", ("priority",)
+)
+telegram_send_latency = registry.histogram(
+    "telegram_send_latency_seconds", "Time from queueing a Telegram notification until it is sent",
+    ("priority",), buckets=SLOW_BUCKETS
+)
+telegram_messages = registry.counter(
+    "telegram_messages_total", "Telegram notifications by outcome", ("outcome",)
+)
+telegram_api_sends = registry.counter(
+    "telegram_api_sends_total", "Telegram sendMessage calls, each carrying one or more notifications",
+    ("status",)
+)
+
+
+class MetricsServer:
+    """Minimal HTTP server exposing ``GET /metrics`` on a dedicated port."""
+
+    def __init__(self, metrics_registry: MetricsRegistry) -> None:
+        self.registry = metrics_registry
+        self.port: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Drain headers; the request body (if any) is ignored
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?", 1)[0] == "/metrics":
+                status, body = "200 OK", self.registry.render().encode()
+            else:
+                status, body = "404 Not Found", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.debug("Metrics request failed", extra={"error": str(e)})
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        if not settings.monitoring.ENABLE_METRICS or self._server is not None:
+            return
+        first = settings.monitoring.METRICS_PORT
+        ports = range(first, min(first + settings.monitoring.METRICS_PORT_RANGE, 65536))
+        error: Optional[OSError] = None
+        for port in ports:
+            try:
+                self._server = await asyncio.start_server(self._handle, host="0.0.0.0", port=port)
+            except OSError as e:
+                # Taken by another worker; try the next port
+                error = e
+                continue
+            self.port = port
+            logger.info("Metrics server listening", extra={"port": port})
+            return
+        logger.warning(
+            "Metrics server not started; no free port",
+            extra={"ports": f"{ports.start}-{ports.stop - 1}", "error": str(error)}
+        )
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            self.port = None
+
+
+metrics_server = MetricsServer(registry)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "MetricsServer",
+    "registry",
+    "metrics_server",
+    "http_request_duration",
+    "exchange_request_duration",
+    "websocket_messages",
+    "websocket_message_lag",
+    "order_fill_duration",
+    "signal_fanout_duration",
+    "signal_account_results",
+    "signal_queue_wait",
+    "signal_ingested",
+    "db_operation_duration",
+    "cron_job_duration",
+    "cron_job_runs",
+    "cron_job_items",
+    "retention_documents",
+    "cache_invalidation_events",
+    "invalidation_stream_live",
+    "telegram_queue_depth",
+    "telegram_send_latency",
+    "telegram_messages",
+    "telegram_api_sends",
+]
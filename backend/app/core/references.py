@@ -56,12 +56,27 @@ if TYPE_CHECKING:
         LogLevel,
     )
 else:
-    # Minimal imports for runtime
+    # app.core.enums has no internal imports, so re-exporting it cannot cycle
     from app.core.enums import (
+        Environment,
+        ExchangeType,
         UserRole,
+        SignalOrderType,
+        TimeFrame,
         OrderType,
         TradeSource,
+        TradeStatus,
         PositionSide,
+        BotStatus,
+        BotType,
+        PositionStatus,
+        PerformanceTimeFrame,
+        WebSocketType,
+        ConnectionState,
+        ErrorLevel,
+        ErrorCategory,
+        RecoveryStrategy,
+        LogLevel,
     )
 
 # =============================================================================
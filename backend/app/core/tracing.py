@@ -0,0 +1,344 @@
+"""
+Span tracing for the signal path.
+
+A trace follows one webhook signal from arrival to order fill. Its trace ID is
+the request's ``correlation_id``, so a trace can be looked up with the ID
+returned to the caller and found in the logs. Spans nest through a ContextVar:
+``span()`` parents itself on whatever span is current in the calling task, and
+tasks created inside a span inherit it.
+
+Finished spans are:
+  - kept in memory, grouped by trace, for the last TRACE_BUFFER_SIZE traces
+    (served by the ``/debug/signals/{correlation_id}`` waterfall view)
+  - exported in batches as OTLP/JSON ``ExportTraceServiceRequest`` payloads,
+    POSTed to TRACE_OTLP_ENDPOINT when set, otherwise appended as one JSON
+    line per batch to TRACE_EXPORT_PATH, size-rotated like the log files
+    (TRACE_EXPORT_MAX_BYTES, TRACE_EXPORT_BACKUPS); with neither set,
+    nothing is exported
+
+Export runs in a background task and never blocks the traced code; when the
+export backlog is full, new spans are dropped from export (they still appear
+in the in-memory view).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.logging.logger import RotatingFileSink, get_logger
+
+logger = get_logger(__name__)
+
+# Max spans recorded per trace; protects memory against runaway loops
+MAX_SPANS_PER_TRACE = 512
+# Width of the text bar rendered per span in the waterfall view
+WATERFALL_WIDTH = 60
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """OTLP trace IDs are 16 bytes hex; UUIDs map directly, anything else is hashed."""
+    try:
+        return uuid.UUID(trace_id).hex
+    except ValueError:
+        return hashlib.sha256(trace_id.encode()).hexdigest()[:32]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(getattr(value, "value", value))}
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+    trace_id: str
+    name: str
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes, e.g. results only known after the call."""
+        self.attributes.update(attributes)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": _otlp_trace_id(self.trace_id),
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in {"correlation_id": self.trace_id, **self.attributes}.items()
+                if value is not None
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Returned by ``span()`` outside of a trace or when tracing is disabled."""
+    span_id = None
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Records spans, keeps recent traces in memory and exports them in batches."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        buffer_size: int,
+        export_path: Optional[str] = None,
+        otlp_endpoint: Optional[str] = None,
+        export_interval: float = 2.0,
+        max_pending: int = 10_000,
+        export_max_bytes: int = 10485760,
+        export_backups: int = 3
+    ) -> None:
+        self.enabled = enabled
+        self.buffer_size = buffer_size
+        self.export_path = export_path
+        self.export_max_bytes = export_max_bytes
+        self.export_backups = export_backups
+        self._export_file: Optional[RotatingFileSink] = None
+        self.otlp_endpoint = otlp_endpoint
+        self.export_interval = export_interval
+        self.max_pending = max_pending
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._pending: List[Span] = []
+        self._export_task: Optional[asyncio.Task] = None
+        self._session = None
+        self.stats = {"spans": 0, "exported": 0, "dropped": 0, "export_errors": 0}
+
+    # ---------------------------
+    # Recording
+    # ---------------------------
+    @contextmanager
+    def start_trace(self, correlation_id: str, name: str, **attributes: Any) -> Iterator[Any]:
+        """Open the root span of a trace identified by ``correlation_id``."""
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+        with self._record(Span(trace_id=correlation_id, name=name, attributes=attributes)) as root:
+            yield root
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """Open a child of the current span; a no-op outside of a trace."""
+        parent = _current_span.get()
+        if parent is None or not self.enabled:
+            yield _NOOP_SPAN
+            return
+        with self._record(Span(
+            trace_id=parent.trace_id, name=name, parent_id=parent.span_id, attributes=attributes
+        )) as child:
+            yield child
+
+    @contextmanager
+    def _record(self, span: Span) -> Iterator[Span]:
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        self.stats["spans"] += 1
+        spans = self._traces.get(span.trace_id)
+        if spans is None:
+            spans = self._traces[span.trace_id] = []
+            if len(self._traces) > self.buffer_size:
+                self._traces.popitem(last=False)
+        if len(spans) < MAX_SPANS_PER_TRACE:
+            spans.append(span)
+
+        if self.export_path or self.otlp_endpoint:
+            if len(self._pending) < self.max_pending:
+                self._pending.append(span)
+            else:
+                self.stats["dropped"] += 1
+
+    def current_correlation_id(self) -> Optional[str]:
+        current = _current_span.get()
+        return current.trace_id if current else None
+
+    # ---------------------------
+    # Inspection
+    # ---------------------------
+    def get_trace(self, correlation_id: str) -> List[Span]:
+        return sorted(self._traces.get(correlation_id, ()), key=lambda span: span.start_ns)
+
+    def waterfall(self, correlation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Render a trace as a waterfall: spans in start order with depth, offset
+        from the trace start and a proportional text bar.
+        """
+        spans = self.get_trace(correlation_id)
+        if not spans:
+            return None
+
+        trace_start = spans[0].start_ns
+        trace_end = max(span.end_ns or span.start_ns for span in spans)
+        total_ns = max(trace_end - trace_start, 1)
+        depths: Dict[str, int] = {}
+        rows = []
+        for span in spans:
+            depth = depths[span.span_id] = depths.get(span.parent_id, -1) + 1
+            offset = int((span.start_ns - trace_start) / total_ns * WATERFALL_WIDTH)
+            width = max(1, int(((span.end_ns or trace_end) - span.start_ns) / total_ns * WATERFALL_WIDTH))
+            rows.append({
+                "name": span.name,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "depth": depth,
+                "offset_ms": round((span.start_ns - trace_start) / 1e6, 3),
+                "duration_ms": round(span.duration_ms, 3),
+                "status": "error" if span.error else "ok",
+                "error": span.error,
+                "attributes": {key: str(getattr(value, "value", value)) for key, value in span.attributes.items()},
+                "bar": " " * offset + "#" * min(width, WATERFALL_WIDTH - offset),
+            })
+        return {
+            "correlation_id": correlation_id,
+            "trace_id": _otlp_trace_id(correlation_id),
+            "started_at": trace_start / 1e9,
+            "duration_ms": round(total_ns / 1e6, 3),
+            "span_count": len(spans),
+            "spans": rows,
+        }
+
+    # ---------------------------
+    # Export
+    # ---------------------------
+    def _export_payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": settings.app.PROJECT_NAME}},
+                    {"key": "service.version", "value": {"stringValue": settings.app.VERSION}},
+                    {"key": "deployment.environment", "value": _otlp_value(settings.app.ENVIRONMENT)},
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.core.tracing"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+    def _append_file(self, line: str) -> None:
+        if self._export_file is None:
+            os.makedirs(os.path.dirname(self.export_path) or ".", exist_ok=True)
+            self._export_file = RotatingFileSink(
+                self.export_path,
+                logging.Formatter(),
+                logging.NOTSET,
+                max_bytes=self.export_max_bytes,
+                backups=self.export_backups
+            )
+        self._export_file.write([line.encode("utf-8") + b"\n"])
+
+    async def flush(self) -> None:
+        """Export all pending spans."""
+        if not self._pending:
+            return
+        spans, self._pending = self._pending, []
+        payload = self._export_payload(spans)
+        try:
+            if self.otlp_endpoint:
+                if self._session is None:
+                    import aiohttp
+                    self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+                async with self._session.post(self.otlp_endpoint, json=payload) as response:
+                    response.raise_for_status()
+            else:
+                await asyncio.to_thread(self._append_file, json.dumps(payload, separators=(",", ":")))
+            self.stats["exported"] += len(spans)
+        except Exception as e:
+            self.stats["export_errors"] += 1
+            self.stats["dropped"] += len(spans)
+            logger.warning("Trace export failed", extra={"spans": len(spans), "error": str(e)})
+
+    async def _export_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.export_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        if not self.enabled or not (self.export_path or self.otlp_endpoint) or self._export_task is not None:
+            return
+        self._export_task = asyncio.create_task(self._export_loop())
+        logger.info("Trace exporter started", extra={
+            "target": self.otlp_endpoint or self.export_path
+        })
+
+    async def close(self) -> None:
+        if self._export_task is not None:
+            self._export_task.cancel()
+            try:
+                await self._export_task
+            except asyncio.CancelledError:
+                pass
+            self._export_task = None
+        await self.flush()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._export_file is not None:
+            self._export_file.close()
+            self._export_file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "traces": len(self._traces), "pending": len(self._pending)}
+
+
+tracer = Tracer(
+    enabled=settings.monitoring.TRACING_ENABLED,
+    buffer_size=settings.monitoring.TRACE_BUFFER_SIZE,
+    export_path=str(settings.monitoring.TRACE_EXPORT_PATH) if settings.monitoring.TRACE_EXPORT_PATH else None,
+    otlp_endpoint=settings.monitoring.TRACE_OTLP_ENDPOINT,
+    export_interval=settings.monitoring.TRACE_EXPORT_INTERVAL,
+    export_max_bytes=settings.monitoring.TRACE_EXPORT_MAX_BYTES,
+    export_backups=settings.monitoring.TRACE_EXPORT_BACKUPS,
+)
+
+__all__ = ["Span", "Tracer", "tracer"]
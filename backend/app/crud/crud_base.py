@@ -1,11 +1,16 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import logging
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from datetime import datetime
 from pydantic import BaseModel
 from beanie import Document, PydanticObjectId
 from beanie.operators import In
+from bson import ObjectId
+from bson.errors import InvalidId
 
 from app.core.logging.logger import get_logger
 from app.core.errors.base import DatabaseError, ValidationError, NotFoundError
+from app.crud.pagination import Page, build_page, keyset_sort, seek_filter
+from app.models.views import ProjectionView
 
 ModelType = TypeVar("ModelType", bound=Document)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -29,10 +34,26 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def _log_info(self, message: str, extra: Dict[str, Any]) -> None:
         """Helper to log messages with a standard timestamp and model name."""
+        if not self.logger.is_enabled_for(logging.INFO):
+            return
         extra.setdefault("timestamp", datetime.utcnow().isoformat())
         extra.setdefault("model", self.model.__name__)
         self.logger.info(message, extra=extra)
 
+    def _invalidate_references(self, ids: Optional[List[Any]] = None) -> None:
+        """
+        Drop cached references after writes that bypass Beanie document events
+        (query-level updates/deletes and raw Motor calls).
+        """
+        from app.services.reference.manager import REFERENCE_MODELS, reference_manager
+        if self.model.__name__ not in REFERENCE_MODELS:
+            return
+        if ids is None:
+            reference_manager.invalidate(self.model.__name__)
+        else:
+            for _id in ids:
+                reference_manager.invalidate(self.model.__name__, _id)
+
     def _raise_db_error(self, operation: str, context: Dict[str, Any], error: Exception):
         """
         Helper to wrap exceptions (other than NotFound/Validation errors) into a DatabaseError.
@@ -85,7 +106,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         sort_desc: bool = False
     ) -> List[ModelType]:
         """
-        Get multiple documents with pagination and sorting.
+        Get multiple documents with offset pagination and sorting.
+        ``skip`` rows are still scanned; use ``get_page`` for deep pages.
         """
         try:
             if skip < 0:
@@ -99,9 +121,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 find_query = find_query.sort(sort_field)
             documents = await find_query.skip(skip).limit(limit).to_list()
 
-            self._log_info(
-                f"Retrieved {len(documents)} {self.model.__name__} documents",
-                {"skip": skip, "limit": limit, "sort_by": sort_by, "sort_desc": sort_desc, "query": query}
+            # Per-query log: debug only, fields built only when enabled
+            self.logger.lazy(
+                logging.DEBUG,
+                f"Retrieved {self.model.__name__} documents",
+                lambda: {
+                    "model": self.model.__name__, "count": len(documents), "skip": skip,
+                    "limit": limit, "sort_by": sort_by, "sort_desc": sort_desc, "query": query
+                }
             )
             return documents
         except Exception as e:
@@ -113,6 +140,89 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 e
             )
 
+    async def get_page(
+        self,
+        limit: int = 100,
+        query: Optional[Dict] = None,
+        sort_by: str = "_id",
+        sort_desc: bool = False,
+        cursor: Optional[str] = None
+    ) -> Page[ModelType]:
+        """
+        Get one page of documents with keyset pagination on ``(sort_by, _id)``.
+        Pass the previous page's ``next_cursor`` to continue; unlike
+        ``get_multi`` with ``skip``, deep pages cost the same as the first
+        when an index ends in ``(sort_by, _id)``.
+        """
+        try:
+            if limit < 1:
+                raise ValidationError("Limit value must be positive", context={"limit": limit})
+
+            base_query = dict(query or {})
+            filters = seek_filter(base_query, sort_by, sort_desc, cursor)
+            documents = await self.model.find(filters).sort(
+                keyset_sort(sort_by, sort_desc)
+            ).limit(limit + 1).to_list()
+            page = build_page(
+                documents, limit, base_query, sort_by, sort_desc,
+                key=lambda doc: (getattr(doc, sort_by, None) if sort_by != "_id" else doc.id, doc.id)
+            )
+
+            self.logger.lazy(
+                logging.DEBUG,
+                f"Retrieved {self.model.__name__} page",
+                lambda: {
+                    "model": self.model.__name__, "count": len(page.items), "limit": limit,
+                    "sort_by": sort_by, "sort_desc": sort_desc, "has_more": page.has_more
+                }
+            )
+            return page
+        except Exception as e:
+            if isinstance(e, (NotFoundError, ValidationError)):
+                raise
+            self._raise_db_error(
+                "retrieving page of",
+                {"limit": limit, "query": query, "sort_by": sort_by},
+                e
+            )
+
+    async def get_view(
+        self,
+        view: ProjectionView,
+        ids: Optional[Iterable[Any]] = None,
+        query: Optional[Dict] = None,
+        sort: Optional[Sequence[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Read compact dicts through a projection view (app.models.views)
+        instead of full documents; nothing is validated or turned into a
+        Beanie document. ``ids`` restricts the read to those documents
+        (invalid IDs are ignored).
+        """
+        try:
+            filters = dict(query or {})
+            if ids is not None:
+                object_ids = []
+                for _id in ids:
+                    try:
+                        object_ids.append(ObjectId(str(_id)))
+                    except (InvalidId, TypeError):
+                        continue
+                filters["_id"] = {"$in": object_ids}
+            documents = await view.find(
+                self.model.get_motor_collection(), filters, sort=sort, skip=skip, limit=limit
+            )
+            self.logger.lazy(
+                logging.DEBUG,
+                f"Retrieved {self.model.__name__} {view.name} view",
+                lambda: {"model": self.model.__name__, "view": view.name, "count": len(documents)}
+            )
+            return documents
+        except Exception as e:
+            self._raise_db_error("retrieving view of", {"view": view.name, "query": query}, e)
+
     async def create(self, obj_in: CreateSchemaType) -> ModelType:
         """
         Create a new document.
@@ -231,6 +341,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
             result = await self.model.find({"_id": {"$in": ids}}).update({"$set": update_data})
             updated_count = result.modified_count
+            self._invalidate_references(ids)
 
             self._log_info(
                 f"Bulk updated {self.model.__name__} documents",
@@ -259,6 +370,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
             result = await self.model.find({"_id": {"$in": ids}}).delete()
             deleted_count = result.deleted_count
+            self._invalidate_references(ids)
 
             self._log_info(
                 f"Bulk deleted {self.model.__name__} documents",
@@ -14,6 +14,7 @@ endpoints focused on their respective concerns.
 
 from typing import List, Optional, Dict, Any, Union
 import asyncio
+import time
 from datetime import datetime
 
 from beanie import PydanticObjectId
@@ -26,10 +27,12 @@ from app.models.entities.daily_performance import DailyPerformance
 from app.core.errors.base import DatabaseError, ValidationError, NotFoundError, WebSocketError
 from app.core.references import BotStatus, BotType, TimeFrame, TradeSource
 from app.core.logging.logger import get_logger
+from app.core.metrics import signal_account_results, signal_fanout_duration
 from app.crud.decorators import handle_db_error
 
 # Import services for centralized integration
 from app.services.reference.manager import reference_manager
+from app.services.reference.loader import get_reference_loader
 from app.services.websocket.manager import ws_manager
 from app.services.exchange.factory import exchange_factory
 from app.services.telegram.service import telegram_bot
@@ -546,9 +549,11 @@ class CRUDBot(CRUDBase[Bot, BotCreate, BotUpdate]):
             bot: Bot instance
         """
         # Create WebSocket connections for each account
+        loader = get_reference_loader()
+        await loader.load_many("Account", bot.connected_accounts)  # prefetch in one batch
         for account_id in bot.connected_accounts:
             try:
-                account = await reference_manager.get_reference(account_id, "Account")
+                account = await loader.load("Account", account_id)
                 if not account:
                     logger.warning(
                         "Account not found during bot activation",
@@ -665,6 +670,7 @@ class CRUDBot(CRUDBase[Bot, BotCreate, BotUpdate]):
                 }
         
         # Execute trades in parallel
+        fanout_started = time.perf_counter()
         results = await asyncio.gather(
             *(process_trade(account_id) for account_id in bot.connected_accounts)
         )
@@ -672,6 +678,12 @@ class CRUDBot(CRUDBase[Bot, BotCreate, BotUpdate]):
         # Process results
         success_count = sum(1 for r in results if r.get("success"))
         error_count = len(results) - success_count
+        order_type = signal_data.get("order_type")
+        signal_fanout_duration.observe(
+            time.perf_counter() - fanout_started, str(getattr(order_type, "value", order_type))
+        )
+        signal_account_results.inc("success", amount=success_count)
+        signal_account_results.inc("error", amount=error_count)
         
         # Update bot metrics
         bot.record_signal_result(success_count, error_count)
@@ -753,9 +765,11 @@ class CRUDBot(CRUDBase[Bot, BotCreate, BotUpdate]):
         
         # Get account-specific performance
         account_performance = {}
+        loader = get_reference_loader()
+        await loader.load_many("Account", bot.connected_accounts)  # prefetch in one batch
         for account_id in bot.connected_accounts:
             try:
-                account = await reference_manager.get_reference(account_id, "Account")
+                account = await loader.load("Account", account_id)
                 account_metrics = await DailyPerformance.get_account_performance(
                     account_id=account_id,
                     start_date=start_date,
@@ -848,9 +862,11 @@ class CRUDBot(CRUDBase[Bot, BotCreate, BotUpdate]):
         
         # Get detailed account information
         accounts = []
+        loader = get_reference_loader()
+        await loader.load_many("Account", bot.connected_accounts)  # prefetch in one batch
         for account_id in bot.connected_accounts:
             try:
-                account = await reference_manager.get_reference(account_id, "Account")
+                account = await loader.load("Account", account_id)
                 if account:
                     # Get WebSocket status
                     try:
@@ -7,7 +7,7 @@ including group creation, account management, performance tracking, and exports.
 
 import io
 import csv
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, AsyncIterator
 import asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -18,9 +18,12 @@ from pydantic import BaseModel, Field, field_validator
 from app.crud.crud_base import CRUDBase
 from app.models.entities.group import AccountGroup
 from app.models.entities.daily_performance import DailyPerformance
+from app.models.views import ACCOUNT_SUMMARY_VIEW
 from app.core.errors.base import DatabaseError, ValidationError, NotFoundError
 from app.core.logging.logger import get_logger
 from app.crud.decorators import handle_db_error
+from app.services.reporting.columnar import is_columnar_format, normalize_columnar_format
+from app.services.reporting.streaming import normalize_export_format, stream_export
 
 # Try to import xlsxwriter for Excel exports, with fallback to csv-only if not available
 try:
@@ -433,22 +436,19 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         group_id: PydanticObjectId
     ) -> List[Dict[str, Any]]:
         """
-        Get all accounts in a group with detailed information.
+        Get compact summaries (ACCOUNT_SUMMARY_VIEW) of the accounts in a group.
+
+        Only the group's account list is read, and the accounts are read
+        through a projection; credentials are never included.
         """
-        # Get group
-        group = await self.get(group_id)
-        
-        # Return empty list if no accounts
-        if not group.accounts:
+        group = await AccountGroup.get_motor_collection().find_one({"_id": group_id}, {"accounts": 1})
+        if not group:
+            raise NotFoundError("AccountGroup not found", context={"id": str(group_id)})
+        if not group.get("accounts"):
             return []
-        
-        # Get detailed account information
-        accounts = await reference_manager.get_references_by_ids(
-            reference_type="Account",
-            reference_ids=group.accounts
-        )
-        
-        return accounts
+
+        from app.crud.crud_account import account as account_crud
+        return await account_crud.get_view(ACCOUNT_SUMMARY_VIEW, ids=group["accounts"], sort=[("name", 1)])
 
     @handle_db_error("Failed to sync group balances", lambda self, group_id: {"group_id": str(group_id)})
     async def sync_balances(
@@ -457,69 +457,55 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
     ) -> Dict[str, Any]:
         """
         Synchronize account balances for all accounts in a group.
+
+        Accounts are fetched concurrently (bounded per exchange, with retries) and
+        the fetched balances and group totals are each written back in one update.
         """
         # Get group
         group = await self.get(group_id)
         
-        # Process each account
-        results = []
-        total_balance = Decimal("0")
-        total_equity = Decimal("0")
-        active_accounts = 0
-        error_count = 0
-        
-        # Get trading service
-        trading_service = await reference_manager.get_service("TradingService")
-        
-        # Process each account
-        for account_id in group.accounts:
-            try:
-                # Get account balance
-                balance_info = await trading_service.get_account_balance(account_id=account_id)
-                
-                # Update totals
-                total_balance += Decimal(str(balance_info["balance"]))
-                total_equity += Decimal(str(balance_info["equity"]))
-                
-                if balance_info.get("is_active", False):
-                    active_accounts += 1
-                
-                # Add result
-                results.append({
-                    "account_id": account_id,
-                    "success": True,
-                    "balance": float(balance_info["balance"]),
-                    "equity": float(balance_info["equity"])
-                })
-            except Exception as e:
-                error_count += 1
-                results.append({
-                    "account_id": account_id,
-                    "success": False,
-                    "error": str(e)
-                })
-        
-        # Update group information
-        group.total_balance = float(total_balance)
-        group.total_equity = float(total_equity)
-        group.active_accounts = active_accounts
-        group.last_sync = datetime.utcnow()
-        
-        # Update error tracking
+        async def fetch_balance(account_id: str) -> Dict[str, Any]:
+            account = await reference_manager.get_reference(account_id, reference_type="Account")
+            if not account:
+                raise NotFoundError("Account not found", context={"account_id": account_id})
+            exchange = await exchange_factory.get_instance(account_id, reference_manager)
+            balance_info = await exchange.get_balance()
+            return {
+                "balance": balance_info["balance"],
+                "equity": balance_info["equity"],
+                "is_active": account.get("is_active", False)
+            }
+
+        sync_results = await balance_sync_engine.sync_accounts(group.accounts, fetch_balance)
+        await balance_sync_engine.write_account_balances(sync_results)
+
+        successful = [result for result in sync_results if result.success]
+        total_balance = sum((result.balance for result in successful), Decimal("0"))
+        total_equity = sum((result.equity for result in successful), Decimal("0"))
+        active_accounts = sum(1 for result in successful if result.is_active)
+        error_count = len(sync_results) - len(successful)
+        
+        # Update group totals and error tracking in a single write
+        now = datetime.utcnow()
+        update: Dict[str, Any] = {
+            "$set": {
+                "total_balance": float(total_balance),
+                "total_equity": float(total_equity),
+                "active_accounts": active_accounts,
+                "last_sync": now,
+                "modified_at": now
+            }
+        }
         if error_count > 0:
-            group.error_count += 1
-            if len(group.error_timestamps) >= 10:
-                group.error_timestamps.pop(0)  # Keep only last 10
-            group.error_timestamps.append(datetime.utcnow())
-            group.last_error = f"Failed to sync {error_count} accounts"
+            update["$inc"] = {"error_count": 1}
+            update["$set"]["last_error"] = f"Failed to sync {error_count} accounts"
+            # Keep only the last 10 error timestamps
+            update["$push"] = {"error_timestamps": {"$each": [now], "$slice": -10}}
         else:
-            group.error_count = 0
-            group.error_timestamps = []
-            group.last_error = None
-        
-        # Save group changes
-        group.modified_at = datetime.utcnow()
-        await group.save()
+            update["$set"].update({"error_count": 0, "error_timestamps": [], "last_error": None})
+
+        await AccountGroup.get_motor_collection().update_one({"_id": group.id}, update)
+        self._invalidate_references([group.id])
         
         return {
             "success": error_count == 0,
@@ -527,7 +513,7 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
             "total_equity": float(total_equity),
             "active_accounts": active_accounts,
             "error_count": error_count,
-            "results": results
+            "results": [result.to_dict() for result in sync_results]
         }
 
     @handle_db_error("Failed to verify WebSocket health", lambda self, group_id: {"group_id": str(group_id)})
@@ -607,25 +593,36 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         # Get group
         group = await self.get(group_id)
         
-        # Get performance service
-        performance_service = await reference_manager.get_service("PerformanceService")
-        
-        # Get risk metrics
-        risk_metrics = await performance_service.get_risk_metrics(
-            account_ids=group.accounts,
-            group_id=str(group_id)
-        )
-        
-        # Get today's date
+        # Exposure from the positions recorded at the accounts' last sync
+        from app.crud.crud_account import account as account_crud
+        accounts = await account_crud.get_view(ACCOUNT_SUMMARY_VIEW, ids=group.accounts)
+        total_equity = sum((account["current_equity"] for account in accounts), Decimal("0"))
+        position_value = sum((account["position_value"] for account in accounts), Decimal("0"))
+        risk_metrics = {
+            "open_positions": sum(account["open_positions"] for account in accounts),
+            "position_value": float(position_value),
+            "exposure": float(position_value / total_equity) if total_equity else 0.0,
+            "accounts_with_errors": sum(1 for account in accounts if account["error_count"])
+        }
+
+        # Today's closed-trade performance across the group's accounts
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        
-        # Get today's performance
-        today_performance = await DailyPerformance.get_aggregated_performance(
-            account_ids=group.accounts,
-            start_date=datetime.strptime(today, "%Y-%m-%d"),
-            end_date=datetime.strptime(today, "%Y-%m-%d") + timedelta(days=1),
-            period="daily"
-        )
+        records = await DailyPerformance.find(
+            {"account_id": {"$in": group.accounts}, "date": today}
+        ).to_list()
+        today_performance: Dict[str, Any] = {"no_data": True}
+        if records:
+            trades = sum(record.closed_trades for record in records)
+            winning_trades = sum(record.winning_trades for record in records)
+            today_performance = {
+                "date": today,
+                "trades": trades,
+                "winning_trades": winning_trades,
+                "pnl": float(sum((record.daily_pnl for record in records), Decimal("0"))),
+                "trading_fees": float(sum((record.trading_fees for record in records), Decimal("0"))),
+                "funding_fees": float(sum((record.funding_fees for record in records), Decimal("0"))),
+                "win_rate": (winning_trades / trades * 100) if trades else 0
+            }
         
         # Build response
         return {
@@ -636,7 +633,7 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
                 "last_sync": group.last_sync.isoformat() if group.last_sync else None
             },
             "risk": risk_metrics,
-            "today": today_performance[0] if today_performance else {"no_data": True},
+            "today": today_performance,
             "websocket": {
                 "active_connections": group.ws_connections,
                 "last_check": group.last_ws_check.isoformat() if group.last_ws_check else None
@@ -700,21 +697,15 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
         end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.utcnow()
         
-        # Get account data
-        accounts_data = []
-        for account_id in group.accounts:
-            try:
-                account = await reference_manager.get_reference(
-                    reference_id=account_id,
-                    reference_type="Account"
-                )
-                if account:
-                    accounts_data.append(account)
-            except Exception as e:
-                logger.warning(
-                    f"Error getting account data for export",
-                    extra={"account_id": account_id, "error": str(e)}
-                )
+        # Get account data in a single batch
+        try:
+            accounts_data = await get_reference_loader().load_many("Account", group.accounts)
+        except Exception as e:
+            logger.warning(
+                "Error getting account data for export",
+                extra={"group_id": str(group_id), "error": str(e)}
+            )
+            accounts_data = []
         
         # Create export file
         buffer = io.BytesIO()
@@ -775,114 +766,51 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         
         return buffer, filename
 
-    @handle_db_error("Failed to export group trades", lambda self, group_id, format: {"group_id": str(group_id), "format": format})
+    @handle_db_error("Failed to export group trades", lambda self, group_id, format="csv", start_date=None, end_date=None: {"group_id": str(group_id), "format": format})
     async def export_group_trades(
         self,
         group_id: PydanticObjectId,
         format: str = "csv",
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> Tuple[io.BytesIO, str]:
+    ) -> Tuple[AsyncIterator[bytes], str]:
         """
         Export trade history for all accounts in a group.
+
+        Trades for every account are read through a single cursor and encoded
+        incrementally, so the first bytes are available immediately and memory
+        use does not grow with the number of trades.
         
         Args:
             group_id: Group ID
-            format: Export format ("csv" or "xlsx")
+            format: Export format ("csv", "xlsx", "parquet" or "arrow")
             start_date: Optional start date filter
             end_date: Optional end date filter
             
         Returns:
-            Tuple containing (file buffer, filename)
+            Tuple containing (async byte stream, filename)
         """
         group = await self.get(group_id)
         
         # Parse date filters if provided
         start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.utcnow()
-        
-        # Get trades for all accounts in the group
-        all_trades = []
-        for account_id in group.accounts:
-            try:
-                account_trades = await trade_crud.get_account_trades(
-                    account_id=account_id,
-                    start_date=start,
-                    end_date=end
-                )
-                all_trades.extend(account_trades)
-            except Exception as e:
-                logger.warning(
-                    f"Error getting account trades for export",
-                    extra={"account_id": account_id, "error": str(e)}
-                )
-        
-        # Create export file
-        buffer = io.BytesIO()
-        
-        if format == "csv" or not EXCEL_SUPPORT:
-            # Generate CSV file
-            writer = csv.writer(buffer)
-            
-            # Write header
-            writer.writerow([
-                "Account ID", "Symbol", "Side", "Size", "Entry Price", "Exit Price",
-                "P&L", "P&L %", "Executed At", "Closed At", "Duration"
-            ])
-            
-            # Write trade data
-            for trade in all_trades:
-                writer.writerow([
-                    trade.get("account_id"),
-                    trade.get("symbol"),
-                    trade.get("side"),
-                    trade.get("size"),
-                    trade.get("entry_price"),
-                    trade.get("exit_price"),
-                    trade.get("pnl"),
-                    trade.get("pnl_percentage"),
-                    trade.get("executed_at"),
-                    trade.get("closed_at"),
-                    trade.get("duration")
-                ])
-            
-            filename = f"{group.name}_trades_{datetime.utcnow().strftime('%Y%m%d')}.csv"
-        else:
-            # Generate Excel file
-            workbook = xlsxwriter.Workbook(buffer)
-            worksheet = workbook.add_worksheet("Trades")
-            
-            # Write header
-            header = [
-                "Account ID", "Symbol", "Side", "Size", "Entry Price", "Exit Price",
-                "P&L", "P&L %", "Executed At", "Closed At", "Duration"
-            ]
-            for col, header_text in enumerate(header):
-                worksheet.write(0, col, header_text)
-            
-            # Write trade data
-            for row, trade in enumerate(all_trades, start=1):
-                worksheet.write(row, 0, trade.get("account_id"))
-                worksheet.write(row, 1, trade.get("symbol"))
-                worksheet.write(row, 2, trade.get("side"))
-                worksheet.write(row, 3, trade.get("size"))
-                worksheet.write(row, 4, trade.get("entry_price"))
-                worksheet.write(row, 5, trade.get("exit_price"))
-                worksheet.write(row, 6, trade.get("pnl"))
-                worksheet.write(row, 7, trade.get("pnl_percentage"))
-                worksheet.write(row, 8, trade.get("executed_at"))
-                worksheet.write(row, 9, trade.get("closed_at"))
-                worksheet.write(row, 10, trade.get("duration"))
-            
-            workbook.close()
-            filename = f"{group.name}_trades_{datetime.utcnow().strftime('%Y%m%d')}.xlsx"
+        end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1) if end_date else datetime.utcnow()
         
-        # Reset buffer position
-        buffer.seek(0)
+        export_format = (
+            normalize_columnar_format(format) if is_columnar_format(format)
+            else normalize_export_format(format)
+        )
+        stream = await trade_crud.stream_trade_history(
+            account_ids=group.accounts,
+            start_date=start,
+            end_date=end,
+            format=export_format
+        )
+        filename = f"{group.name}_trades_{datetime.utcnow().strftime('%Y%m%d')}.{export_format}"
         
-        return buffer, filename
+        return stream, filename
 
-    @handle_db_error("Failed to export group performance", lambda self, group_id, period, format: {"group_id": str(group_id), "period": period, "format": format})
+    @handle_db_error("Failed to export group performance", lambda self, group_id, period="daily", format="csv", start_date=None, end_date=None: {"group_id": str(group_id), "period": period, "format": format})
     async def export_group_performance(
         self,
         group_id: PydanticObjectId,
@@ -890,7 +818,7 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         format: str = "csv",
         start_date: Optional[str] = None,
         end_date: Optional[str] = None
-    ) -> Tuple[io.BytesIO, str]:
+    ) -> Tuple[AsyncIterator[bytes], str]:
         """
         Export performance metrics for a group.
         
@@ -902,7 +830,7 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
             end_date: Optional end date filter
             
         Returns:
-            Tuple containing (file buffer, filename)
+            Tuple containing (async byte stream, filename)
         """
         group = await self.get(group_id)
         
@@ -910,30 +838,22 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
         start = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
         end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.utcnow()
         
-        # Get performance data
+        # Get performance data (one row per period, already aggregated in MongoDB)
         performance_data = await DailyPerformance.get_aggregated_performance(
             account_ids=group.accounts,
             start_date=start,
             end_date=end,
             period=period
         )
-        
-        # Create export file
-        buffer = io.BytesIO()
-        
-        if format == "csv" or not EXCEL_SUPPORT:
-            # Generate CSV file
-            writer = csv.writer(buffer)
-            
-            # Write header
-            writer.writerow([
-                "Date", "Starting Balance", "Closing Balance", "Starting Equity", "Closing Equity",
-                "Trades", "Winning Trades", "PnL", "Win Rate", "ROI"
-            ])
-            
-            # Write performance data
+
+        header = [
+            "Date", "Starting Balance", "Closing Balance", "Starting Equity", "Closing Equity",
+            "Trades", "Winning Trades", "PnL", "Win Rate", "ROI"
+        ]
+
+        async def rows() -> AsyncIterator[List[Any]]:
             for perf in performance_data:
-                writer.writerow([
+                yield [
                     perf.get("date"),
                     perf.get("starting_balance"),
                     perf.get("closing_balance"),
@@ -944,48 +864,22 @@ class CRUDGroup(CRUDBase[AccountGroup, GroupCreate, GroupUpdate]):
                     perf.get("pnl"),
                     perf.get("win_rate"),
                     perf.get("roi")
-                ])
-            
-            filename = f"{group.name}_performance_{period}_{datetime.utcnow().strftime('%Y%m%d')}.csv"
-        else:
-            # Generate Excel file
-            workbook = xlsxwriter.Workbook(buffer)
-            worksheet = workbook.add_worksheet("Performance")
-            
-            # Write header
-            header = [
-                "Date", "Starting Balance", "Closing Balance", "Starting Equity", "Closing Equity",
-                "Trades", "Winning Trades", "PnL", "Win Rate", "ROI"
-            ]
-            for col, header_text in enumerate(header):
-                worksheet.write(0, col, header_text)
-            
-            # Write performance data
-            for row, perf in enumerate(performance_data, start=1):
-                worksheet.write(row, 0, perf.get("date"))
-                worksheet.write(row, 1, perf.get("starting_balance"))
-                worksheet.write(row, 2, perf.get("closing_balance"))
-                worksheet.write(row, 3, perf.get("starting_equity"))
-                worksheet.write(row, 4, perf.get("closing_equity"))
-                worksheet.write(row, 5, perf.get("trades"))
-                worksheet.write(row, 6, perf.get("winning_trades"))
-                worksheet.write(row, 7, perf.get("pnl"))
-                worksheet.write(row, 8, perf.get("win_rate"))
-                worksheet.write(row, 9, perf.get("roi"))
-            
-            workbook.close()
-            filename = f"{group.name}_performance_{period}_{datetime.utcnow().strftime('%Y%m%d')}.xlsx"
-        
-        # Reset buffer position
-        buffer.seek(0)
+                ]
+
+        export_format = normalize_export_format(format)
+        stream = stream_export(header, rows(), export_format, sheet_name="Performance")
+        filename = f"{group.name}_performance_{period}_{datetime.utcnow().strftime('%Y%m%d')}.{export_format}"
         
-        return buffer, filename
+        return stream, filename
 
 
 # Import dependencies at the bottom to avoid circular imports
 from app.services.reference.manager import reference_manager
+from app.services.reference.loader import get_reference_loader
 from app.services.websocket.manager import ws_manager
 from app.crud.crud_trade import trade as trade_crud
+from app.services.exchange.balance_sync import balance_sync_engine
+from app.services.exchange.factory import exchange_factory
 
 # Create a singleton instance
 group = CRUDGroup(AccountGroup)
\ No newline at end of file
@@ -26,7 +26,10 @@ from app.crud.decorators import handle_db_error
 # Import services for centralized integration
 from app.services.exchange.factory import exchange_factory, symbol_validator
 from app.services.reference.manager import reference_manager
-from app.services.cache.service import cache_service
+from app.services.reference.cache import ReferenceCache
+
+# Symbol specifications keyed by "symbol:<exchange>:<symbol>" (1 hour TTL)
+_symbol_cache = ReferenceCache(max_size=5000, ttl=3600, negative_ttl=60)
 
 logger = get_logger(__name__)
 
@@ -153,11 +156,7 @@ class CRUDSymbol(CRUDBase[SymbolData, SymbolDataCreate, SymbolDataUpdate]):
         await symbol_data.save()
         
         # Cache the symbol data
-        await cache_service.set(
-            f"symbol:{obj_in.exchange}:{obj_in.symbol}",
-            symbol_data.to_dict(),
-            ttl=3600  # 1 hour cache
-        )
+        _symbol_cache.set(f"symbol:{obj_in.exchange}:{obj_in.symbol}", symbol_data.to_dict())
         
         logger.info(
             "Created new symbol",
@@ -238,11 +237,7 @@ class CRUDSymbol(CRUDBase[SymbolData, SymbolDataCreate, SymbolDataUpdate]):
                 symbol_data = await self.update(symbol_data.id, updates)
         
         # Cache the result
-        await cache_service.set(
-            f"symbol:{exchange}:{symbol}",
-            symbol_data.to_dict(),
-            ttl=3600  # 1 hour cache
-        )
+        _symbol_cache.set(f"symbol:{exchange}:{symbol}", symbol_data.to_dict())
         
         logger.info(
             "Verified symbol with exchange",
@@ -287,7 +282,7 @@ class CRUDSymbol(CRUDBase[SymbolData, SymbolDataCreate, SymbolDataUpdate]):
         
         # Try to get from cache first
         cache_key = f"symbol:{exchange}:{normalized_symbol}"
-        cached_data = await cache_service.get(cache_key)
+        cached_data = _symbol_cache.peek(cache_key)
         
         if cached_data:
             logger.debug(
@@ -314,11 +309,7 @@ class CRUDSymbol(CRUDBase[SymbolData, SymbolDataCreate, SymbolDataUpdate]):
                 )
             
             # Cache the result
-            await cache_service.set(
-                cache_key,
-                symbol_data.to_dict(),
-                ttl=3600  # 1 hour cache
-            )
+            _symbol_cache.set(cache_key, symbol_data.to_dict())
             
             return symbol_data.to_dict()
             
@@ -515,7 +506,7 @@ class CRUDSymbol(CRUDBase[SymbolData, SymbolDataCreate, SymbolDataUpdate]):
                 
                 # Invalidate cache
                 cache_key = f"symbol:{symbol.exchange}:{symbol.symbol}"
-                await cache_service.delete(cache_key)
+                _symbol_cache.invalidate(cache_key)
                 
                 disabled_count += 1
             except Exception as e:
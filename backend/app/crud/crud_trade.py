@@ -8,19 +8,29 @@ This module centralizes all service integration for trade operations:
 - Export functionality
 """
 
+import logging
 from decimal import Decimal, DecimalException
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Union, Type, TypeVar
+from typing import List, Optional, Dict, Any, Union, Type, TypeVar, Tuple, AsyncIterator
 from beanie import PydanticObjectId
+from bson import Decimal128
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.crud.crud_base import CRUDBase, ModelType
+from app.crud.pagination import Page
 from app.models.entities.trade import Trade
 from app.core.references import TradeStatus, OrderType, TradeSource, PositionSide
 from app.core.errors.base import DatabaseError, ValidationError, NotFoundError, ExchangeError
 from app.core.logging.logger import get_logger
 from app.crud.decorators import handle_db_error
+from app.services.reporting.columnar import is_columnar_format, normalize_columnar_format, stream_columnar
+from app.services.reporting.streaming import (
+    export_cell,
+    iter_rows,
+    normalize_export_format,
+    stream_export
+)
 
 # Import service dependencies
 from app.services.reference.manager import reference_manager
@@ -29,6 +39,13 @@ from app.services.performance.service import performance_service
 logger = get_logger(__name__)
 
 
+def _total(value: Any) -> Decimal:
+    """Read an aggregation total: $sum over Decimal128 fields returns Decimal128."""
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    return Decimal(str(value or 0))
+
+
 class TradeCreate(BaseModel):
     """
     Schema for creating a new trade record with comprehensive validation.
@@ -118,6 +135,60 @@ class TradeSummary(BaseModel):
     by_symbol: Dict[str, Dict[str, Any]]
 
 
+# Export columns as (document field, column title) pairs
+TRADE_EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("trade_id", "Trade ID"),
+    ("account_id", "Account ID"),
+    ("symbol", "Symbol"),
+    ("side", "Side"),
+    ("order_type", "Order Type"),
+    ("size", "Size"),
+    ("order_size", "Order Size"),
+    ("entry_price", "Entry Price"),
+    ("exit_price", "Exit Price"),
+    ("pnl", "P&L"),
+    ("pnl_percentage", "P&L %"),
+    ("trading_fees", "Trading Fees"),
+    ("funding_fees", "Funding Fees"),
+    ("risk_percentage", "Risk %"),
+    ("leverage", "Leverage"),
+    ("executed_at", "Executed At"),
+    ("closed_at", "Closed At"),
+    ("holding_time", "Holding Time"),
+    ("source", "Source")
+]
+
+# Raw document fields needed to build an export row
+_TRADE_EXPORT_PROJECTION: Dict[str, int] = {
+    field: 1 for field, _ in TRADE_EXPORT_COLUMNS
+    if field not in ("trade_id", "holding_time")
+}
+
+
+def _trade_export_record(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a raw trade document into an export record."""
+    executed_at = doc.get("executed_at")
+    closed_at = doc.get("closed_at")
+    record = {field: export_cell(doc.get(field)) for field in _TRADE_EXPORT_PROJECTION}
+    record["trade_id"] = str(doc["_id"])
+    record["holding_time"] = str(closed_at - executed_at) if closed_at and executed_at else ""
+    return record
+
+
+def _trade_json_record(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a raw trade document into a JSON-safe export record."""
+    return {
+        field: (str(value) if isinstance(value, Decimal) else (None if value == "" else value))
+        for field, value in _trade_export_record(doc).items()
+    }
+
+
+def _trade_export_row(doc: Dict[str, Any]) -> List[Any]:
+    """Format a raw trade document into an export row ordered like TRADE_EXPORT_COLUMNS."""
+    record = _trade_export_record(doc)
+    return [record[field] for field, _ in TRADE_EXPORT_COLUMNS]
+
+
 class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
     """
     Comprehensive CRUD operations for the Trade model with centralized service integration.
@@ -456,11 +527,14 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
         status: Optional[TradeStatus] = None,
         symbol: Optional[str] = None,
         limit: int = 100,
-        skip: int = 0,
+        cursor: Optional[str] = None,
         sort_desc: bool = True
-    ) -> List[Trade]:
+    ) -> Page[Trade]:
         """
-        Get trades for an account with filtering, pagination and sorting.
+        Get one page of an account's trades, newest first by default.
+
+        Pages are keyset-paginated on ``(executed_at, _id)``; pass the
+        previous page's ``next_cursor`` to continue.
         """
         # Build query
         query = {"account_id": account_id}
@@ -469,20 +543,26 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
         if symbol:
             query["symbol"] = symbol.upper()
         
-        # Execute query with sort
-        sort_field = [("executed_at", -1 if sort_desc else 1)]
-        trades = await self.model.find(query).sort(sort_field).skip(skip).limit(limit).to_list()
+        page = await self.get_page(
+            limit=limit,
+            query=query,
+            sort_by="executed_at",
+            sort_desc=sort_desc,
+            cursor=cursor
+        )
         
-        logger.info(
+        logger.lazy(
+            logging.DEBUG,
             "Retrieved account trades",
-            extra={
+            lambda: {
                 "account_id": account_id,
-                "trade_count": len(trades),
+                "trade_count": len(page.items),
+                "has_more": page.has_more,
                 "filters": {"status": status.value if status else None, "symbol": symbol}
             }
         )
         
-        return trades
+        return page
     
     @handle_db_error("Failed to get open positions", lambda self, account_id, symbol=None: {"account_id": account_id, "symbol": symbol})
     async def get_open_positions(
@@ -499,9 +579,10 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
         
         positions = await self.model.find(query).to_list()
         
-        logger.info(
+        logger.lazy(
+            logging.DEBUG,
             "Retrieved open positions",
-            extra={
+            lambda: {
                 "account_id": account_id,
                 "symbol": symbol,
                 "position_count": len(positions)
@@ -748,18 +829,21 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
             trades = result["trades"]
             winning_trades = result["winning_trades"]
             win_rate = (winning_trades / trades * 100) if trades > 0 else 0
-            net_pnl = result["pnl"] - result["trading_fees"] - result["funding_fees"]
+            pnl = _total(result["pnl"])
+            trading_fees = _total(result["trading_fees"])
+            funding_fees = _total(result["funding_fees"])
+            net_pnl = pnl - trading_fees - funding_fees
             
             daily_stats.append({
                 "date": date,
                 "trades": trades,
                 "winning_trades": winning_trades,
                 "win_rate": win_rate,
-                "pnl": float(result["pnl"]),
-                "trading_fees": float(result["trading_fees"]),
-                "funding_fees": float(result["funding_fees"]),
+                "pnl": float(pnl),
+                "trading_fees": float(trading_fees),
+                "funding_fees": float(funding_fees),
                 "net_pnl": float(net_pnl),
-                "volume": float(result["order_size"])
+                "volume": float(_total(result["order_size"]))
             })
         
         logger.info(
@@ -777,7 +861,73 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
     # EXPORT FUNCTIONALITY 
     # -------------------------------------------------------------
     
-    @handle_db_error("Failed to export trade history", lambda self, account_id, start_date, end_date: {"account_id": account_id, "date_range": f"{start_date} to {end_date}"})
+    def iter_closed_trades(
+        self,
+        account_ids: List[str],
+        start_date: Optional[datetime],
+        end_date: datetime,
+        formatter=_trade_export_row
+    ) -> AsyncIterator[Any]:
+        """
+        Stream closed trades for one or more accounts straight from the cursor.
+
+        Uses a raw Motor cursor with a projection, so documents are neither
+        validated into Trade models nor collected into a list. Rows are sorted
+        by close time and served by the (account_id, status, closed_at) index.
+
+        Args:
+            account_ids: Accounts to export
+            start_date: Optional start of the closing-time range
+            end_date: End of the closing-time range
+            formatter: Maps a raw document to an output row
+        """
+        closed_range: Dict[str, datetime] = {"$lte": end_date}
+        if start_date:
+            closed_range["$gte"] = start_date
+
+        cursor = self.model.get_motor_collection().find(
+            {
+                "account_id": {"$in": account_ids},
+                "status": TradeStatus.CLOSED.value,
+                "closed_at": closed_range
+            },
+            _TRADE_EXPORT_PROJECTION
+        ).sort("closed_at", 1)
+
+        return iter_rows(cursor, formatter)
+
+    @handle_db_error("Failed to stream trade history", lambda self, account_ids, start_date, end_date, format="csv", sheet_name="Trades": {"account_ids": account_ids, "date_range": f"{start_date} to {end_date}", "format": format})
+    async def stream_trade_history(
+        self,
+        account_ids: List[str],
+        start_date: Optional[datetime],
+        end_date: datetime,
+        format: str = "csv",
+        sheet_name: str = "Trades"
+    ) -> AsyncIterator[bytes]:
+        """
+        Build a CSV/XLSX/Parquet/Arrow byte stream of closed trades for the given accounts.
+
+        Args:
+            account_ids: Accounts to export
+            start_date: Optional start date
+            end_date: End date
+            format: Export format ("csv", "xlsx", "parquet" or "arrow")
+            sheet_name: Worksheet name for XLSX output
+
+        Returns:
+            Async byte iterator suitable for a StreamingResponse
+        """
+        if is_columnar_format(format):
+            return stream_columnar(
+                "trades", account_ids, start_date, end_date, normalize_columnar_format(format)
+            )
+
+        header = [title for _, title in TRADE_EXPORT_COLUMNS]
+        rows = self.iter_closed_trades(account_ids, start_date, end_date)
+        return stream_export(header, rows, normalize_export_format(format), sheet_name=sheet_name)
+
+    @handle_db_error("Failed to export trade history", lambda self, account_id, start_date, end_date, format="csv": {"account_id": account_id, "date_range": f"{start_date} to {end_date}"})
     async def export_trade_history(
         self, 
         account_id: str,
@@ -787,46 +937,51 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
     ) -> Dict[str, Any]:
         """
         Export trade history for an account in the specified format.
+
+        CSV, XLSX, Parquet and Arrow exports are streamed: ``stream`` holds an async
+        byte iterator and no rows are loaded up front. JSON exports collect the
+        records into ``data``.
         
         Args:
             account_id: Account ID
             start_date: Start date
             end_date: End date
-            format: Export format ("csv" or "json")
+            format: Export format ("csv", "xlsx", "parquet", "arrow" or "json")
             
         Returns:
             Dict with export data and metadata
         """
-        # Get closed trades
-        trades = await self.model.find({
+        result = {
+            "format": format,
             "account_id": account_id,
-            "status": TradeStatus.CLOSED,
-            "closed_at": {"$gte": start_date, "$lte": end_date}
-        }).sort("closed_at", 1).to_list()
-        
-        # Format for export
-        export_data = []
-        for trade in trades:
-            export_data.append({
-                "trade_id": str(trade.id),
-                "symbol": trade.symbol,
-                "side": trade.side.value,
-                "order_type": trade.order_type.value,
-                "size": str(trade.size),
-                "order_size": str(trade.order_size),
-                "entry_price": str(trade.entry_price) if trade.entry_price else None,
-                "exit_price": str(trade.exit_price) if trade.exit_price else None,
-                "pnl": str(trade.pnl) if trade.pnl else None,
-                "pnl_percentage": trade.pnl_percentage,
-                "trading_fees": str(trade.trading_fees),
-                "funding_fees": str(trade.funding_fees),
-                "risk_percentage": str(trade.risk_percentage),
-                "leverage": trade.leverage,
-                "executed_at": trade.executed_at.isoformat(),
-                "closed_at": trade.closed_at.isoformat() if trade.closed_at else None,
-                "holding_time": str(trade.closed_at - trade.executed_at) if trade.closed_at else None,
-                "source": trade.source.value
-            })
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "filename": f"trades_{account_id}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.{format}"
+        }
+
+        if format != "json":
+            export_format = (
+                normalize_columnar_format(format) if is_columnar_format(format)
+                else normalize_export_format(format)
+            )
+            result["format"] = export_format
+            result["filename"] = f"trades_{account_id}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.{export_format}"
+            result["stream"] = await self.stream_trade_history([account_id], start_date, end_date, export_format)
+            logger.info(
+                "Streaming trade history export",
+                extra={
+                    "account_id": account_id,
+                    "format": export_format,
+                    "date_range": f"{start_date} to {end_date}"
+                }
+            )
+            return result
+
+        export_data = [
+            record async for record in self.iter_closed_trades(
+                [account_id], start_date, end_date, formatter=_trade_json_record
+            )
+        ]
         
         logger.info(
             "Exported trade history",
@@ -839,15 +994,9 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
         )
         
         # Return data with metadata
-        return {
-            "format": format,
-            "account_id": account_id,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "trade_count": len(export_data),
-            "data": export_data,
-            "filename": f"trades_{account_id}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.{format}"
-        }
+        result["trade_count"] = len(export_data)
+        result["data"] = export_data
+        return result
 
     # -------------------------------------------------------------
     # HELPER METHODS
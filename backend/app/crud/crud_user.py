@@ -299,8 +299,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         # Get the user by username
         user = await self.get_by_username(username)
         
-        # Verify the password
-        is_valid = await password_manager.verify_password(password, user.hashed_password)
+        # Verify the password (new_hash is set when the stored hash is outdated)
+        is_valid, new_hash = await password_manager.verify_and_update(password, user.hashed_password)
         
         if not is_valid:
             # Record failed login attempt
@@ -317,6 +317,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
                 context={"username": username, "attempts": user.login_attempts}
             )
         
+        if new_hash:
+            user.hashed_password = new_hash
+            await user.save()
+            logger.info("Upgraded password hash", extra={"user_id": str(user.id)})
+
         # Record successful login
         await self.record_login_attempt(user.id, success=True)
         
@@ -473,36 +478,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             return []
         
         # Get all accounts in the user's assigned groups
-        # Both VIEWER and EXPORTER roles can access accounts in their groups
-        accessible_accounts = []
-        
-        # For each group, get its accounts
-        for group_id in user.assigned_groups:
-            group = await reference_manager.get_reference(
-                reference_id=group_id,
-                reference_type="Group"
-            )
-            
-            if group and "accounts" in group:
-                # Get detailed account information for each account in this group
-                group_accounts = await reference_manager.get_references_by_ids(
-                    reference_type="Account",
-                    reference_ids=group["accounts"]
-                )
-                
-                accessible_accounts.extend(group_accounts)
+        # Both VIEWER and EXPORTER roles can access accounts in their groups.
+        # Groups and then accounts are each resolved in a single batch.
+        loader = get_reference_loader()
+        groups = await loader.load_many("Group", user.assigned_groups)
         
-        # Remove duplicates by ID
-        seen_ids = set()
-        unique_accounts = []
+        # Remove duplicates by ID, keeping group order
+        account_ids = list(dict.fromkeys(
+            str(account_id) for group in groups for account_id in group.get("accounts", [])
+        ))
         
-        for account in accessible_accounts:
-            account_id = str(account.get("id"))
-            if account_id not in seen_ids:
-                seen_ids.add(account_id)
-                unique_accounts.append(account)
-        
-        return unique_accounts
+        return await loader.load_many("Account", account_ids)
 
     @handle_db_error("Failed to check account access", lambda self, user_id, account_id: {"user_id": user_id, "account_id": account_id})
     async def check_account_access(
@@ -511,7 +497,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         account_id: str
     ) -> bool:
         """
-        Check if a user has access to a specific account through group membership.
+        Check if a user has access to a specific account through group membership
+        (or ownership), using the precomputed access index.
         
         Both VIEWER and EXPORTER roles can access accounts in their assigned groups.
         
@@ -522,30 +509,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         Returns:
             Boolean indicating if the user has access to the account
         """
-        # Get the user
-        user = await self.get(PydanticObjectId(user_id))
-        
-        # Admin users can access all accounts
-        if user.role == UserRole.ADMIN:
-            return True
-        
-        # Both VIEWER and EXPORTER roles can access accounts in their groups
-        # If no assigned groups, no access
-        if not user.assigned_groups:
-            return False
-        
-        # Check if the account is in any of the user's assigned groups
-        for group_id in user.assigned_groups:
-            group = await reference_manager.get_reference(
-                reference_id=group_id,
-                reference_type="Group"
-            )
-            
-            if group and "accounts" in group and account_id in group["accounts"]:
-                return True
-        
-        # Account not found in any of the user's groups
-        return False
+        # Ensure the user exists
+        await self.get(PydanticObjectId(user_id))
+
+        # Admins pass; others are checked against their precomputed access set
+        return await access_index.can_access_account(user_id, account_id)
 
     @handle_db_error("Failed to check group access", lambda self, user_id, group_id: {"user_id": user_id, "group_id": group_id})
     async def check_group_access(
@@ -613,6 +581,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
 # Import service dependencies at the end to avoid circular imports
 from app.services.reference.manager import reference_manager
+from app.services.reference.loader import get_reference_loader
+from app.services.reference.access import access_index
 from app.services.auth.password import password_manager
 
 # Create a singleton instance for use throughout the application
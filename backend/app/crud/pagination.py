@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination for the CRUD layer.
+
+A page is read by seeking past the last row of the previous page on
+``(sort_key, _id)`` instead of skipping over earlier rows, so with an index
+ending in ``(sort_key, _id)`` every page costs the same however deep it is.
+The position is handed to clients as an opaque continuation token:
+urlsafe base64 of extended JSON (so dates and ObjectIds round-trip) holding
+the last row's sort value and ``_id`` and a fingerprint of the filter and
+sort. A token presented with a different filter or sort is rejected.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from bson import json_util
+from bson.errors import InvalidId
+
+from app.core.errors.base import ValidationError
+
+T = TypeVar("T")
+
+_CURSOR_VERSION = 1
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the token for the next one (None on the last page)."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _fingerprint(query: Dict[str, Any], sort_key: str, descending: bool) -> str:
+    payload = json.dumps([query, sort_key, descending], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(
+    query: Dict[str, Any],
+    sort_key: str,
+    descending: bool,
+    last_value: Any,
+    last_id: Any
+) -> str:
+    """Token that resumes ``query`` after the row ``(last_value, last_id)``."""
+    payload = {
+        "v": _CURSOR_VERSION,
+        "f": _fingerprint(query, sort_key, descending),
+        "k": [last_value, last_id],
+    }
+    raw = json_util.dumps(payload, json_options=json_util.CANONICAL_JSON_OPTIONS).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, query: Dict[str, Any], sort_key: str, descending: bool) -> Tuple[Any, Any]:
+    """Return ``(last_value, last_id)`` from a token issued for the same query and sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json_util.loads(raw.decode("utf-8"))
+        last_value, last_id = payload["k"]
+        valid = payload.get("v") == _CURSOR_VERSION and payload.get("f") == _fingerprint(query, sort_key, descending)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError, InvalidId):
+        valid = False
+    if not valid:
+        raise ValidationError(
+            "Invalid pagination cursor",
+            context={"cursor": cursor[:64], "sort_key": sort_key}
+        )
+    return last_value, last_id
+
+
+def keyset_filter(sort_key: str, descending: bool, last_value: Any, last_id: Any) -> Dict[str, Any]:
+    """
+    Filter for the rows after ``(last_value, last_id)``. The range on
+    ``sort_key`` becomes the index bound; the ``$or`` only breaks ties.
+    """
+    op, op_eq = ("$lt", "$lte") if descending else ("$gt", "$gte")
+    return {
+        sort_key: {op_eq: last_value},
+        "$or": [{sort_key: {op: last_value}}, {"_id": {op: last_id}}],
+    }
+
+
+def keyset_sort(sort_key: str, descending: bool) -> List[Tuple[str, int]]:
+    direction = -1 if descending else 1
+    if sort_key == "_id":
+        return [("_id", direction)]
+    return [(sort_key, direction), ("_id", direction)]
+
+
+def seek_filter(
+    query: Dict[str, Any],
+    sort_key: str,
+    descending: bool,
+    cursor: Optional[str]
+) -> Dict[str, Any]:
+    """``query`` narrowed to the rows after ``cursor`` (unchanged for the first page)."""
+    if not cursor:
+        return dict(query)
+    last_value, last_id = decode_cursor(cursor, query, sort_key, descending)
+    if sort_key == "_id":
+        # $and keeps any _id condition of the query (e.g. an access-restricted $in)
+        seek = {"_id": {"$lt" if descending else "$gt": last_id}}
+    else:
+        seek = keyset_filter(sort_key, descending, last_value, last_id)
+    return {"$and": [query, seek]} if query else seek
+
+
+def build_page(
+    rows: List[T],
+    limit: int,
+    query: Dict[str, Any],
+    sort_key: str,
+    descending: bool,
+    key: Callable[[T], Tuple[Any, Any]]
+) -> Page[T]:
+    """
+    Turn ``limit + 1`` fetched rows into a Page; the extra row only signals
+    that another page exists. ``key(row)`` returns the row's
+    ``(sort value, _id)``.
+    """
+    if len(rows) <= limit:
+        return Page(items=rows)
+    items = rows[:limit]
+    last_value, last_id = key(items[-1])
+    return Page(items=items, next_cursor=encode_cursor(query, sort_key, descending, last_value, last_id))
+
+
+__all__ = [
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_filter",
+    "keyset_sort",
+    "seek_filter",
+    "build_page",
+]
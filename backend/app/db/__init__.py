@@ -1,9 +1,16 @@
 """Database module initialization."""
 
 from .db import Database, DatabaseMetrics, db
+from .indexes import INDEX_PLAN, QUERY_SHAPES, IndexManager, IndexSpec, QueryShape, index_manager
 
 __all__ = [
     "Database",
     "DatabaseMetrics",
-    "db"
+    "db",
+    "INDEX_PLAN",
+    "QUERY_SHAPES",
+    "IndexManager",
+    "IndexSpec",
+    "QueryShape",
+    "index_manager"
 ]
\ No newline at end of file
@@ -17,10 +17,12 @@ from typing import Optional, Dict, Any, List
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
+from pymongo import monitoring
 
 from app.core.errors.base import DatabaseError, ValidationError, ConfigurationError
 from app.core.errors.handlers import handle_api_error
 from app.core.logging.logger import get_logger
+from app.core.metrics import db_operation_duration
 
 logger = get_logger(__name__)
 
@@ -65,6 +67,43 @@ class DatabaseMetrics:
         }
 
 
+_READ_COMMANDS = frozenset({"find", "aggregate", "count", "countDocuments", "distinct", "getMore"})
+_WRITE_COMMANDS = frozenset({"insert", "update", "delete", "findAndModify", "bulkWrite"})
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """
+    Records the latency of every MongoDB command.
+
+    Feeds DatabaseMetrics (operation counts and recent response times) and the
+    db_operation_duration histogram. Runs on driver threads, so it only does
+    cheap, lock-free updates.
+    """
+
+    def __init__(self, metrics: DatabaseMetrics) -> None:
+        self.metrics = metrics
+
+    def _record(self, event: Any, status: str) -> None:
+        command = event.command_name
+        if command in _READ_COMMANDS:
+            self.metrics.operations["reads"] += 1
+        elif command in _WRITE_COMMANDS:
+            self.metrics.operations["writes"] += 1
+        else:
+            self.metrics.operations["queries"] += 1
+        self.metrics.add_response_time(event.duration_micros / 1000)
+        db_operation_duration.observe(event.duration_micros / 1_000_000, command, status)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event, "ok")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event, "error")
+
+
 class Database:
     """
     MongoDB connection and Beanie ODM initialization manager.
@@ -152,6 +191,7 @@ class Database:
             waitQueueTimeoutMS=settings.database.MONGODB_TIMEOUT_MS,
             retryWrites=True,
             retryReads=True,
+            event_listeners=[CommandMetricsListener(cls._metrics)],
         )
 
         await init_beanie(
@@ -292,57 +332,33 @@ class Database:
             return {"healthy": False, "error": str(e), "metrics": cls._metrics.to_dict()}
 
     @classmethod
-    async def recreate_indexes(cls) -> Dict[str, Any]:
+    async def sync_indexes(cls) -> Dict[str, Any]:
         """
-        Recreate all document model indexes.
+        Build the indexes of app.db.indexes.INDEX_PLAN that are missing.
+
+        Existing indexes are never dropped; differences from the plan are
+        reported instead.
 
         Returns:
-            A dict with operation results.
+            The per-collection report of the index manager.
 
         Raises:
-            DatabaseError: If index creation fails.
+            DatabaseError: If the indexes cannot be inspected or built.
         """
         try:
             if not cls._initialized:
                 await cls.connect_db()
 
-            settings = await cls._get_settings()
-            db_instance = cls.client[settings.database.MONGODB_DB_NAME]
-            models = await cls._get_document_models()
-
-            # Run index recreation concurrently for all models.
-            results = await asyncio.gather(
-                *[cls._recreate_indexes_for_model(model, db_instance) for model in models]
-            )
-
-            summary = {
-                "total": len(results),
-                "successful": sum(1 for r in results if r.get("success")),
-                "failed": sum(1 for r in results if not r.get("success")),
-                "results": results,
-            }
-
-            logger.info("Recreated database indexes", extra={**summary, "metrics": cls._metrics.to_dict()})
-            return summary
+            from app.db.indexes import index_manager
+            return await index_manager.ensure()
         except Exception as e:
             error_context = {"metrics": cls._metrics.to_dict(), "error": str(e)}
             await handle_api_error(
                 error=e,
-                context={"service": "database", "action": "recreate_indexes", "metrics": cls._metrics.to_dict()},
-                log_message="Failed to recreate indexes",
+                context={"service": "database", "action": "sync_indexes", "metrics": cls._metrics.to_dict()},
+                log_message="Failed to sync indexes",
             )
-            raise DatabaseError("Failed to recreate indexes", context=error_context) from e
-
-    @classmethod
-    async def _recreate_indexes_for_model(cls, model: Any, db_instance: Any) -> Dict[str, Any]:
-        """Helper method to recreate indexes for a single model."""
-        try:
-            collection = db_instance[model.Settings.name]
-            await collection.drop_indexes()
-            await collection.create_indexes(model.Settings.indexes)
-            return {"model": model.__name__, "success": True, "indexes": len(model.Settings.indexes)}
-        except Exception as e:
-            return {"model": model.__name__, "success": False, "error": str(e)}
+            raise DatabaseError("Failed to sync indexes", context=error_context) from e
 
 
 # Global database instance for application-wide use.
@@ -0,0 +1,390 @@
+"""
+Index plan and startup index synchronisation.
+
+Indexes are declared here, per collection, for the query shapes the CRUD and
+service layers actually run (equality fields first, then the sort, then
+ranges) instead of on the Beanie models. The plan replaces the models'
+``Settings.indexes`` declarations, including the trades
+``(account_id, status, executed_at)`` index, which is kept here with ``_id``
+appended:
+  - at startup IndexManager diffs each collection's existing indexes against
+    the plan and builds the missing ones in a background task, one at a
+    time, so the API starts serving immediately
+  - nothing is dropped: indexes that are not in the plan are reported as
+    ``unplanned`` and indexes whose options differ from the plan as
+    ``conflicts``, for an operator to resolve
+  - the single-field indexes on retention fields (see app.services.retention)
+    are owned by the retention service, which may turn them into TTL indexes
+  - keyset-paginated reads (app.crud.pagination) sort on ``(key, _id)``, so
+    their indexes end in ``_id`` and every page is a bounded index range
+  - QUERY_SHAPES lists a representative filter/sort for every hot query;
+    ``verify_query_shapes`` explains each one and reports any that the
+    planner would answer with a collection scan. tests/test_query_plans.py
+    runs the CRUD and analytics reads themselves through explain, so a
+    query that drifts from its index fails the test suite
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import IndexModel
+
+from app.core.config import settings
+from app.core.enums import BotStatus, TradeStatus
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+Keys = Tuple[Tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One desired index; ``serves`` names the query shapes it exists for."""
+    keys: Keys
+    unique: bool = False
+    partial: Optional[Dict[str, Any]] = None
+    serves: Tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        name = "_".join(f"{key}_{direction}" for key, direction in self.keys)
+        return f"{name}_partial" if self.partial else name
+
+    def options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+        if self.unique:
+            options["unique"] = True
+        if self.partial:
+            options["partialFilterExpression"] = self.partial
+        return options
+
+    def model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, background=True, **self.options())
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """A representative query; values are placeholders, only the shape matters."""
+    name: str
+    collection: str
+    filter: Dict[str, Any]
+    sort: Optional[List[Tuple[str, int]]] = None
+
+
+_OPEN = TradeStatus.OPEN.value
+_CLOSED = TradeStatus.CLOSED.value
+
+INDEX_PLAN: Dict[str, List[IndexSpec]] = {
+    "users": [
+        IndexSpec((("username", 1),), unique=True, serves=("users.by_username",)),
+        IndexSpec((("role", 1),), serves=("users.by_role",)),
+        IndexSpec((("assigned_groups", 1),), serves=("users.by_group",)),
+        IndexSpec((("created_at", 1),)),
+    ],
+    "bots": [
+        IndexSpec((("name", 1),), unique=True, serves=("bots.by_name",)),
+        IndexSpec((("base_name", 1), ("timeframe", 1)), serves=("bots.by_base_name",)),
+        IndexSpec((("status", 1),), serves=("bots.active",)),
+        IndexSpec((("bot_type", 1), ("status", 1)), serves=("bots.by_type",)),
+        IndexSpec((("timeframe", 1),), serves=("bots.by_timeframe",)),
+        IndexSpec((("connected_accounts", 1),), serves=("bots.by_account",)),
+        IndexSpec((("created_at", 1),)),
+    ],
+    "accounts": [
+        IndexSpec((("user_id", 1),), serves=("accounts.by_user",)),
+        IndexSpec((("exchange", 1), ("is_active", 1)), serves=("accounts.active_by_exchange",)),
+        IndexSpec((("bot_id", 1), ("is_active", 1)), serves=("accounts.by_bot",)),
+        IndexSpec((("group_ids", 1),), serves=("accounts.by_group",)),
+        IndexSpec((("is_active", 1),), serves=("accounts.active",)),
+        IndexSpec((("api_key", 1),), serves=("accounts.by_api_key",)),
+        IndexSpec((("created_at", 1),)),
+    ],
+    "account_groups": [
+        IndexSpec((("name", 1),), unique=True, serves=("account_groups.by_name",)),
+        IndexSpec((("accounts", 1),), serves=("account_groups.by_account",)),
+        IndexSpec((("error_count", 1), ("last_sync", 1))),
+        IndexSpec((("created_at", 1),)),
+    ],
+    "trades": [
+        IndexSpec(
+            (("account_id", 1), ("executed_at", -1), ("_id", -1)),
+            serves=("trades.account_history", "trades.account_history_page")
+        ),
+        IndexSpec(
+            (("account_id", 1), ("status", 1), ("executed_at", 1), ("_id", 1)),
+            serves=("trades.account_by_status", "trades.analytics_range")
+        ),
+        IndexSpec((("account_id", 1), ("status", 1), ("closed_at", 1)), serves=("trades.closed_range",)),
+        IndexSpec(
+            (("account_id", 1), ("symbol", 1)),
+            partial={"status": _OPEN},
+            serves=("trades.open_positions", "trades.open_position_by_symbol")
+        ),
+        IndexSpec((("bot_id", 1), ("executed_at", -1)), serves=("trades.by_bot",)),
+        IndexSpec((("exchange_order_id", 1),), serves=("trades.by_exchange_order",)),
+    ],
+    "daily_performance": [
+        IndexSpec(
+            (("account_id", 1), ("date", 1)),
+            serves=("daily_performance.account_range", "daily_performance.latest", "daily_performance.day_accounts")
+        ),
+    ],
+    "position_history": [
+        IndexSpec((("account_id", 1), ("closed_at", 1)), serves=("position_history.account_range",)),
+        IndexSpec((("account_id", 1), ("symbol", 1))),
+        IndexSpec((("synced_at", 1),)),
+    ],
+    "symbol_data": [
+        IndexSpec(
+            (("symbol", 1), ("exchange", 1), ("is_active", 1)),
+            serves=("symbol_data.lookup", "symbol_data.active_lookup")
+        ),
+        IndexSpec((("exchange", 1), ("is_active", 1)), serves=("symbol_data.active_by_exchange",)),
+        IndexSpec((("is_active", 1), ("last_verified", 1)), serves=("symbol_data.stale", "symbol_data.active")),
+        IndexSpec((("original_symbol", 1), ("exchange", 1))),
+    ],
+}
+
+_ID = "000000000000000000000000"
+_DAY = datetime(2024, 1, 1)
+_DATE = "2024-01-01"
+
+QUERY_SHAPES: List[QueryShape] = [
+    QueryShape("users.by_username", "users", {"username": "user"}),
+    QueryShape("users.by_role", "users", {"role": "admin"}),
+    QueryShape("users.by_group", "users", {"assigned_groups": _ID}),
+    QueryShape("bots.by_name", "bots", {"name": "BotA-1m"}),
+    QueryShape("bots.by_base_name", "bots", {"base_name": "BotA", "timeframe": "1m"}),
+    QueryShape("bots.active", "bots", {"status": BotStatus.ACTIVE.value}),
+    QueryShape("bots.by_type", "bots", {"bot_type": "automated"}),
+    QueryShape("bots.by_timeframe", "bots", {"timeframe": "1m"}),
+    QueryShape("bots.by_account", "bots", {"connected_accounts": _ID}),
+    QueryShape("accounts.by_user", "accounts", {"user_id": _ID}),
+    QueryShape("accounts.active_by_exchange", "accounts", {"exchange": "bybit", "is_active": True}),
+    QueryShape("accounts.by_bot", "accounts", {"bot_id": _ID, "is_active": True}),
+    QueryShape("accounts.by_group", "accounts", {"group_ids": _ID}),
+    QueryShape("accounts.active", "accounts", {"is_active": True}),
+    QueryShape("accounts.by_api_key", "accounts", {"api_key": "key"}),
+    QueryShape("account_groups.by_name", "account_groups", {"name": "group"}),
+    QueryShape("account_groups.by_account", "account_groups", {"accounts": _ID}),
+    QueryShape("trades.account_history", "trades", {"account_id": _ID}, [("executed_at", -1), ("_id", -1)]),
+    QueryShape(
+        "trades.account_history_page", "trades",
+        {
+            "account_id": _ID,
+            "executed_at": {"$lte": _DAY},
+            "$or": [{"executed_at": {"$lt": _DAY}}, {"_id": {"$lt": ObjectId(_ID)}}]
+        },
+        [("executed_at", -1), ("_id", -1)]
+    ),
+    QueryShape(
+        "trades.account_by_status", "trades",
+        {"account_id": _ID, "status": _CLOSED}, [("executed_at", -1), ("_id", -1)]
+    ),
+    QueryShape(
+        "trades.analytics_range", "trades",
+        {"account_id": {"$in": [_ID]}, "status": _CLOSED, "executed_at": {"$gte": _DAY, "$lte": _DAY}}
+    ),
+    QueryShape(
+        "trades.closed_range", "trades",
+        {"account_id": _ID, "status": _CLOSED, "closed_at": {"$gte": _DAY, "$lte": _DAY}}
+    ),
+    QueryShape("trades.open_positions", "trades", {"account_id": _ID, "status": _OPEN}),
+    QueryShape("trades.open_position_by_symbol", "trades", {"account_id": _ID, "status": _OPEN, "symbol": "BTCUSDT"}),
+    QueryShape("trades.by_bot", "trades", {"bot_id": _ID}, [("executed_at", -1)]),
+    QueryShape("trades.by_exchange_order", "trades", {"exchange_order_id": "order"}),
+    QueryShape(
+        "daily_performance.account_range", "daily_performance",
+        {"account_id": _ID, "date": {"$gte": _DATE, "$lte": _DATE}}, [("date", 1)]
+    ),
+    QueryShape("daily_performance.latest", "daily_performance", {"account_id": _ID}, [("date", -1)]),
+    QueryShape("daily_performance.day_accounts", "daily_performance", {"date": _DATE, "account_id": {"$in": [_ID]}}),
+    QueryShape(
+        "position_history.account_range", "position_history",
+        {"account_id": _ID, "closed_at": {"$gte": _DAY, "$lte": _DAY}}, [("closed_at", 1)]
+    ),
+    QueryShape("symbol_data.lookup", "symbol_data", {"symbol": "BTCUSDT", "exchange": "bybit"}),
+    QueryShape("symbol_data.active_lookup", "symbol_data", {"symbol": "BTCUSDT", "exchange": "bybit", "is_active": True}),
+    QueryShape("symbol_data.active_by_exchange", "symbol_data", {"is_active": True, "exchange": "bybit"}),
+    QueryShape("symbol_data.active", "symbol_data", {"is_active": True}),
+    QueryShape("symbol_data.stale", "symbol_data", {"is_active": True, "last_verified": {"$lt": _DAY}}),
+]
+
+
+def _retention_keys() -> Dict[str, Keys]:
+    """Single-field indexes owned (and possibly made TTL) by the retention service."""
+    from app.services.retention import retention_policies
+    return {policy.collection: ((policy.field, 1),) for policy in retention_policies()}
+
+
+def _normalize_keys(keys: Any) -> Keys:
+    """Key pattern from index_information (directions may come back as floats)."""
+    return tuple(
+        (key, int(direction) if isinstance(direction, (int, float)) else direction)
+        for key, direction in keys
+    )
+
+
+def _plan_stages(plan: Any) -> List[Dict[str, Any]]:
+    """Flatten an explain plan tree into its stages."""
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _plan_stages(item)]
+    if not isinstance(plan, dict):
+        return []
+    stages = [plan] if "stage" in plan else []
+    for value in plan.values():
+        if isinstance(value, (dict, list)):
+            stages.extend(_plan_stages(value))
+    return stages
+
+
+@dataclass
+class CollectionDiff:
+    """Existing indexes of one collection compared with its plan."""
+    collection: str
+    missing: List[IndexSpec] = field(default_factory=list)
+    conflicts: List[Dict[str, Any]] = field(default_factory=list)
+    unplanned: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "missing": [spec.name for spec in self.missing],
+            "conflicts": self.conflicts,
+            "unplanned": self.unplanned
+        }
+
+
+class IndexManager:
+    """Diffs existing indexes against INDEX_PLAN and builds what is missing."""
+
+    def __init__(self, plan: Dict[str, List[IndexSpec]] = INDEX_PLAN) -> None:
+        self.plan = plan
+        self.report: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _database():
+        from app.db.db import db
+        return db.client[settings.database.MONGODB_DB_NAME]
+
+    async def diff(self, collection_name: str) -> CollectionDiff:
+        existing = await self._database()[collection_name].index_information()
+        by_keys = {_normalize_keys(spec["key"]): (name, spec) for name, spec in existing.items()}
+        planned_keys = {spec.keys for spec in self.plan.get(collection_name, [])}
+        retention_key = _retention_keys().get(collection_name)
+
+        result = CollectionDiff(collection_name)
+        for spec in self.plan.get(collection_name, []):
+            found = by_keys.get(spec.keys)
+            if found is None:
+                result.missing.append(spec)
+                continue
+            name, current = found
+            actual = {key: current[key] for key in ("unique", "partialFilterExpression") if current.get(key)}
+            if actual != spec.options():
+                result.conflicts.append({"index": name, "planned": spec.options(), "actual": actual})
+        result.unplanned = [
+            name for keys, (name, _) in by_keys.items()
+            if name != "_id_" and keys not in planned_keys and keys != retention_key
+        ]
+        return result
+
+    async def ensure(self) -> Dict[str, Any]:
+        """Build every missing planned index, one at a time; never drops an index."""
+        report: Dict[str, Any] = {"started_at": datetime.utcnow().isoformat(), "collections": {}}
+        for collection_name in self.plan:
+            diff = await self.diff(collection_name)
+            entry = {**diff.to_dict(), "created": [], "failed": {}}
+            for spec in diff.missing:
+                try:
+                    await self._database()[collection_name].create_indexes([spec.model()])
+                    entry["created"].append(spec.name)
+                except Exception as e:
+                    entry["failed"][spec.name] = str(e)
+                    logger.error(
+                        "Failed to build index",
+                        extra={"collection": collection_name, "index": spec.name, "error": str(e)}
+                    )
+            if diff.conflicts or diff.unplanned:
+                logger.warning(
+                    "Indexes differ from plan",
+                    extra={"collection": collection_name, "conflicts": diff.conflicts, "unplanned": diff.unplanned}
+                )
+            report["collections"][collection_name] = entry
+        report["finished_at"] = datetime.utcnow().isoformat()
+        self.report = report
+        logger.info(
+            "Index plan applied",
+            extra={
+                "created": sum(len(entry["created"]) for entry in report["collections"].values()),
+                "failed": sum(len(entry["failed"]) for entry in report["collections"].values())
+            }
+        )
+        return report
+
+    async def explain(self, shape: QueryShape) -> Dict[str, Any]:
+        """Winning plan of one query shape: the indexes it uses, or a collection scan."""
+        cursor = self._database()[shape.collection].find(shape.filter)
+        if shape.sort:
+            cursor = cursor.sort(shape.sort)
+        explanation = await cursor.limit(1).explain()
+        stages = _plan_stages(explanation.get("queryPlanner", {}).get("winningPlan", {}))
+        indexes = sorted({stage["indexName"] for stage in stages if stage.get("indexName")})
+        return {
+            "collection": shape.collection,
+            "indexes": indexes,
+            "collection_scan": any(stage.get("stage") == "COLLSCAN" for stage in stages),
+            "in_memory_sort": any(stage.get("stage") == "SORT" for stage in stages)
+        }
+
+    async def verify_query_shapes(self) -> Dict[str, Any]:
+        """Explain every QUERY_SHAPES entry; ``failures`` lists shapes not served by an index."""
+        results = {shape.name: await self.explain(shape) for shape in QUERY_SHAPES}
+        failures = [
+            name for name, result in results.items()
+            if result["collection_scan"] or not result["indexes"] or result["in_memory_sort"]
+        ]
+        if failures:
+            logger.warning("Query shapes not served by an index", extra={"shapes": failures})
+        return {"shapes": results, "failures": failures}
+
+    # ---------------------------
+    # Lifecycle
+    # ---------------------------
+    async def _run(self) -> None:
+        try:
+            await self.ensure()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Index synchronisation failed", extra={"error": str(e)})
+
+    def start(self) -> None:
+        """Apply the plan in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"running": self._task is not None and not self._task.done(), "report": self.report}
+
+
+index_manager = IndexManager()
+
+__all__ = [
+    "INDEX_PLAN",
+    "QUERY_SHAPES",
+    "CollectionDiff",
+    "IndexManager",
+    "IndexSpec",
+    "QueryShape",
+    "index_manager"
+]
@@ -25,16 +25,30 @@ from app.core.config import settings
 from app.core.logging.logger import init_logging, get_logger, cleanup_logging
 from app.core.errors.base import BaseError, ServiceError
 from app.core.references import ErrorCategory
+from app.core.metrics import http_request_duration, metrics_server
+from app.core.tracing import tracer
 
 # API routes
 from app.api.v1.api import api_router
+from app.api.v1.rate_limit import add_rate_limit_headers, client_id_for, rate_limiter
 
 # Service (singleton) imports
 from app.db.db import db
 from app.services.reference.manager import reference_manager
+from app.services.reference.loader import reference_loader_scope
+from app.services.reference.access import access_index
 from app.services.performance.service import performance_service
 from app.services.telegram.service import telegram_bot
 from app.services.websocket.manager import ws_manager
+from app.services.reporting.jobs import export_jobs
+from app.services.auth.tokens import token_manager
+from app.services.auth.password import password_hash_pool
+from app.services.webhook.forwarder import webhook_forwarder
+from app.services.webhook.ingestion import signal_ingestor
+from app.services.cron_jobs import cron_service
+from app.services.retention import retention_service
+from app.db.indexes import index_manager
+from app.services.invalidation import invalidation_bus
 
 # Initialize logging
 init_logging()
@@ -50,6 +64,19 @@ app = FastAPI(
 # ---------------------------
 # Unified HTTP Middleware
 # ---------------------------
+def _route_label(request: Request) -> str:
+    """Route template for metrics (bounded cardinality: IDs are not labels)."""
+    route = request.scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    path_params = request.scope.get("path_params")
+    if not path_params:
+        return request.url.path if request.scope.get("endpoint") else "unmatched"
+    path = request.url.path
+    for name, value in path_params.items():
+        path = path.replace(str(value), "{" + name + "}", 1)
+    return path
+
 @app.middleware("http")
 async def unified_middleware(request: Request, call_next: Callable) -> Response:
     start_time = time.time()
@@ -67,15 +94,30 @@ async def unified_middleware(request: Request, call_next: Callable) -> Response:
             content={"detail": "System under maintenance", "retry_after": 300},
             headers={"Retry-After": "300"}
         )
+    # Per-client rate limiting; route policies live in app.api.v1.rate_limit
+    decision = None
+    if settings.rate_limiting.RATE_LIMIT_ENABLED:
+        decision = await rate_limiter.check(client_id_for(request), request.url.path, request.method)
+        if decision is not None and not decision.allowed:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Rate limit exceeded", "request_id": request_id},
+                headers=decision.headers()
+            )
     try:
-        response = await call_next(request)
+        # Batch and memoize reference lookups for the lifetime of this request
+        with reference_loader_scope():
+            response = await call_next(request)
     except Exception as exc:
         process_time = time.time() - start_time
+        http_request_duration.observe(process_time, request.method, _route_label(request), "500")
         logger.error("Unhandled exception in request", extra={"error": str(exc), "context": context, "process_time": process_time})
         raise
     process_time = time.time() - start_time
+    http_request_duration.observe(process_time, request.method, _route_label(request), str(response.status_code))
     response.headers["X-Process-Time"] = f"{process_time:.4f}"
     response.headers["X-Request-ID"] = request_id
+    add_rate_limit_headers(response, decision)
     logger.info("Request completed", extra={"method": request.method, "path": request.url.path, "process_time": process_time})
     return response
 
@@ -157,6 +199,7 @@ async def health_check() -> Dict[str, Any]:
         "version": settings.app.VERSION,
         "environment": settings.app.ENVIRONMENT,
         "database": {"connected": db_healthy, "references": ref_counts},
+        "auth": {"password_pool": password_hash_pool.get_stats()},
         "uptime": uptime,
         "timestamp": datetime.utcnow().isoformat()
     }
@@ -180,27 +223,52 @@ async def startup_event():
     - Sets app.state.start_time.
     - Stores shared service instances (db, reference_manager, performance_service, telegram_bot, ws_manager).
     - Calls db.connect_db() to establish the database connection.
-    - Starts the WebSocket manager.
+    - Builds the user access index and ensures the retention (TTL) indexes.
+    - Starts building missing indexes of the index plan in the background.
+    - Opens the change stream that invalidates in-process caches.
+    - Starts the WebSocket manager, the background export workers, the token blacklist sync, the trace exporter, the webhook forwarder and the cron scheduler.
     """
     app.state.start_time = time.time()
     # Store shared service instances on app.state for centralized access:
     app.state.db = db
     await db.connect_db()         # Connect to the database
     app.state.reference_manager = reference_manager
+    try:
+        await access_index.build()  # Precompute user access sets; falls back to lazy loading
+    except Exception as e:
+        logger.error("Error building access index", extra={"error": str(e)})
+    try:
+        await retention_service.ensure_indexes()  # TTL indexes for expiring collections
+    except Exception as e:
+        logger.error("Error ensuring retention indexes", extra={"error": str(e)})
+    if settings.database.INDEX_SYNC_ON_STARTUP:
+        index_manager.start()     # Build missing planned indexes in the background
+    await invalidation_bus.start()  # Change-stream cache invalidation
     app.state.performance_service = performance_service
     app.state.telegram_bot = telegram_bot
     from app.services.websocket.manager import ws_manager
     app.state.ws_manager = ws_manager
     await ws_manager.start()      # Start the WebSocket manager maintenance loop
+    app.state.export_jobs = export_jobs
+    await export_jobs.start()     # Start the background export workers
+    await token_manager.start()   # Mirror the token blacklist locally
+    await metrics_server.start()  # Prometheus endpoint on METRICS_PORT
+    await tracer.start()          # Background span export
+    await webhook_forwarder.start()  # Background webhook forwarding
+    cron_service.start()          # Scheduled jobs (locked so one worker runs each)
     logger.info("Application startup complete", extra={"timestamp": datetime.utcnow().isoformat()})
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown event.
     
-    - Calls telegram_bot.stop(), ws_manager.stop(), and db.close_db() for clean shutdown.
+    - Calls cron_service.stop(), telegram_bot.stop(), ws_manager.stop(), export_jobs.stop(), signal_ingestor.stop(), webhook_forwarder.stop(), token_manager.close(), password_hash_pool.shutdown(), tracer.close(), index_manager.stop(), invalidation_bus.stop() and db.close_db() for clean shutdown.
     - Calls cleanup_logging() to clean up log handlers.
     """
+    try:
+        cron_service.stop()
+    except Exception as e:
+        logger.error("Error stopping cron service", extra={"error": str(e)})
     try:
         await telegram_bot.stop()
     except Exception as e:
@@ -209,6 +277,28 @@ async def shutdown_event():
         await ws_manager.stop()
     except Exception as e:
         logger.error("Error stopping WebSocket manager", extra={"error": str(e)})
+    try:
+        await export_jobs.stop()
+    except Exception as e:
+        logger.error("Error stopping export workers", extra={"error": str(e)})
+    try:
+        await signal_ingestor.stop()
+    except Exception as e:
+        logger.error("Error stopping signal ingestor", extra={"error": str(e)})
+    try:
+        await webhook_forwarder.stop()
+    except Exception as e:
+        logger.error("Error stopping webhook forwarder", extra={"error": str(e)})
+    try:
+        await token_manager.close()
+    except Exception as e:
+        logger.error("Error stopping token manager", extra={"error": str(e)})
+    password_hash_pool.shutdown()
+    await metrics_server.stop()
+    await tracer.close()
+    await rate_limiter.close()
+    await index_manager.stop()
+    await invalidation_bus.stop()
     try:
         await db.close_db()
     except Exception as e:
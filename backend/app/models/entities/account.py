@@ -14,7 +14,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert, after_event, Save, SaveChanges, Update, Delete
 from pydantic import Field, field_validator
 
 from app.core.errors.base import ValidationError
@@ -32,7 +32,7 @@ class Account(Document):
     with no direct service integration or complex business logic.
     """
     # Core fields
-    user_id: Indexed(str) = Field(..., description="ID of the account owner")
+    user_id: str = Field(..., description="ID of the account owner")
     exchange: ExchangeType = Field(..., description="Exchange this account trades on")
     name: str = Field(..., description="Account display name")
     api_key: str = Field(..., description="Exchange API key")
@@ -69,18 +69,8 @@ class Account(Document):
     error_count: int = Field(0, description="Consecutive errors")
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "accounts"
-        indexes = [
-            "user_id",
-            "exchange",
-            "bot_id",
-            "group_ids",
-            "is_active",
-            "created_at",
-            [("exchange", 1), ("is_active", 1)],
-            [("bot_id", 1), ("is_active", 1)]
-        ]
 
     @field_validator("current_balance", "current_equity", "initial_balance")
     @classmethod
@@ -147,6 +137,12 @@ class Account(Document):
             )
             raise ValidationError("Reference validation failed", context={"error": str(e)})
 
+    @after_event([Insert, Replace, Save, SaveChanges, Update, Delete])
+    def invalidate_reference_cache(self) -> None:
+        """Drop this account from the reference cache after any write."""
+        from app.services.reference.manager import reference_manager
+        reference_manager.invalidate("Account", self.id)
+
     def to_dict(self) -> ModelState:
         """
         Convert account to a dictionary representation.
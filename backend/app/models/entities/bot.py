@@ -8,7 +8,7 @@ core validation, and proper data modeling.
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Set
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert, after_event, Save, SaveChanges, Update, Delete
 from pydantic import Field, field_validator, model_validator
 
 from app.core.errors.base import ValidationError
@@ -27,11 +27,11 @@ class Bot(Document):
     """
 
     # Core fields
-    name: Indexed(str, unique=True) = Field(
+    name: str = Field(
         ...,
         description="Unique bot name (format: BotA-1m)"
     )
-    base_name: Indexed(str) = Field(
+    base_name: str = Field(
         ...,
         description="Base strategy name (e.g. BotA)"
     )
@@ -82,19 +82,8 @@ class Bot(Document):
     min_account_balance: float = Field(100.0, description="Minimum required account balance", gt=0)
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "bots"
-        indexes = [
-            "name",
-            "base_name",
-            "timeframe",
-            "status",
-            "bot_type",
-            "connected_accounts",
-            "created_at",
-            [("base_name", 1), ("timeframe", 1)],
-            [("bot_type", 1), ("status", 1)]
-        ]
 
     @field_validator("name")
     @classmethod
@@ -216,6 +205,12 @@ class Bot(Document):
         checks["ready"] = all(checks.values())
         return checks
 
+    @after_event([Insert, Replace, Save, SaveChanges, Update, Delete])
+    def invalidate_reference_cache(self) -> None:
+        """Drop this bot from the reference cache after any write."""
+        from app.services.reference.manager import reference_manager
+        reference_manager.invalidate("Bot", self.id)
+
     def to_dict(self) -> ModelState:
         """Convert to a dictionary format for API responses."""
         return {
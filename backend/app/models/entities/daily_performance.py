@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Any
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert
 from pydantic import Field, field_validator
 
 from app.core.logging.logger import get_logger
@@ -44,8 +44,8 @@ class DailyPerformance(Document):
     Daily trading performance with enhanced service integration.
     Trading metrics here are based solely on finalized (closed) trades.
     """
-    account_id: Indexed(str) = Field(..., description="Account this performance belongs to")
-    date: Indexed(str) = Field(..., description="Date in YYYY-MM-DD format")
+    account_id: str = Field(..., description="Account this performance belongs to")
+    date: str = Field(..., description="Date in YYYY-MM-DD format")
     initial_balance: Decimal = Field(..., description="Initial balance when account was created")
     initial_equity: Decimal = Field(..., description="Initial equity when account was created")
     starting_balance: Decimal = Field(..., description="Balance at start of day")
@@ -67,12 +67,8 @@ class DailyPerformance(Document):
     error_count: int = Field(0, description="Consecutive errors")
 
     class Settings:
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "daily_performance"
-        indexes = [
-            [("account_id", 1), ("date", 1)],
-            "date",
-            "created_at"
-        ]
 
     @field_validator("date")
     @classmethod
@@ -8,7 +8,7 @@ without direct external service integration.
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert, after_event, Save, SaveChanges, Update, Delete
 from pydantic import Field, field_validator
 
 from app.core.errors.base import ValidationError
@@ -25,7 +25,7 @@ class AccountGroup(Document):
     but delegates complex operations to the CRUD layer.
     """
     # Core fields
-    name: Indexed(str, unique=True) = Field(
+    name: str = Field(
         ..., 
         description="Unique group name"
     )
@@ -94,15 +94,8 @@ class AccountGroup(Document):
     )
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "account_groups"
-        indexes = [
-            "name",
-            "accounts",
-            "created_at",
-            [("name", 1), ("accounts", 1)],
-            [("error_count", 1), ("last_sync", 1)]
-        ]
 
     @field_validator("name")
     @classmethod
@@ -142,6 +135,12 @@ class AccountGroup(Document):
         # Update modified_at timestamp
         self.modified_at = datetime.utcnow()
 
+    @after_event([Insert, Replace, Save, SaveChanges, Update, Delete])
+    def invalidate_reference_cache(self) -> None:
+        """Drop this group from the reference cache after any write."""
+        from app.services.reference.manager import reference_manager
+        reference_manager.invalidate("AccountGroup", self.id)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the group to a dictionary representation."""
         return {
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal, DecimalException
 from typing import Optional, Dict, List, Any
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert
 from pydantic import Field, field_validator
 
 
@@ -28,8 +28,8 @@ class PositionHistory(Document):
       - Reference validation
     """
     # Core fields
-    account_id: Indexed(str) = Field(..., description="Account that executed this position")
-    symbol: Indexed(str) = Field(..., description="Trading symbol")
+    account_id: str = Field(..., description="Account that executed this position")
+    symbol: str = Field(..., description="Trading symbol")
     side: str = Field(..., description="Position side (long/short)")
     size: Decimal = Field(..., description="Position size")
 
@@ -45,19 +45,13 @@ class PositionHistory(Document):
     pnl_ratio: Decimal = Field(..., description="ROI percentage")
 
     # Timestamps
-    opened_at: Indexed(datetime) = Field(..., description="Position open timestamp")
-    closed_at: Indexed(datetime) = Field(..., description="Position close timestamp")
+    opened_at: datetime = Field(..., description="Position open timestamp")
+    closed_at: datetime = Field(..., description="Position close timestamp")
     synced_at: datetime = Field(default_factory=datetime.utcnow, description="Last sync timestamp")
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "position_history"
-        indexes = [
-            [("account_id", 1), ("closed_at", 1)],  # For account performance
-            [("account_id", 1), ("symbol", 1)],       # For symbol lookups
-            "closed_at",                             # For date range queries
-            "synced_at"                              # For sync management
-        ]
 
     @field_validator("side")
     @classmethod
@@ -15,7 +15,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, Dict, Any
 
-from beanie import Document, before_event, Replace, Insert, Indexed
+from beanie import Document, before_event, Replace, Insert, after_event, Save, SaveChanges, Update, Delete
 from pydantic import Field, field_validator
 
 from app.core.errors.base import ValidationError
@@ -42,11 +42,11 @@ class SymbolData(Document):
         ...,
         description="Original symbol as provided by user/webhook"
     )
-    symbol: Indexed(str) = Field(
+    symbol: str = Field(
         ...,
         description="Normalized exchange-specific trading symbol (uppercase)"
     )
-    exchange: Indexed(ExchangeType) = Field(
+    exchange: ExchangeType = Field(
         ...,
         description="Exchange this symbol trades on"
     )
@@ -96,16 +96,8 @@ class SymbolData(Document):
     )
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "symbol_data"
-        indexes = [
-            "symbol",
-            "exchange",
-            "original_symbol",
-            [("symbol", 1), ("exchange", 1)],
-            [("original_symbol", 1), ("exchange", 1)],
-            "is_active"
-        ]
 
     @field_validator("symbol")
     @classmethod
@@ -140,6 +132,12 @@ class SymbolData(Document):
         # Ensure symbol is normalized
         self.symbol = self.symbol.upper().strip()
 
+    @after_event([Insert, Replace, Save, SaveChanges, Update, Delete])
+    def invalidate_reference_cache(self) -> None:
+        """Drop this symbol from the reference cache after any write."""
+        from app.services.reference.manager import reference_manager
+        reference_manager.invalidate("SymbolData", self.id)
+
     def to_dict(self) -> ModelState:
         """
         Convert to a dictionary representation for API responses.
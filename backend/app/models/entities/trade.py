@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Optional, Dict, List, Any, Union
 from decimal import Decimal
 
-from beanie import Document, Indexed
+from beanie import Document
 from pydantic import Field, field_validator, FieldValidationInfo
 
 from app.core.errors.base import ValidationError
@@ -37,7 +37,7 @@ class Trade(Document):
     """
 
     # Core fields
-    account_id: Indexed(str) = Field(
+    account_id: str = Field(
         ...,
         description="Account executing trade"
     )
@@ -156,18 +156,8 @@ class Trade(Document):
     )
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "trades"
-        indexes = [
-            "account_id",
-            "bot_id",
-            "symbol",
-            "status",
-            "executed_at",
-            [("account_id", 1), ("status", 1)],
-            [("bot_id", 1), ("executed_at", -1)],
-            [("exchange_order_id", 1)]
-        ]
 
     @field_validator("leverage", "risk_percentage")
     @classmethod
@@ -8,7 +8,7 @@ with no direct service integration or external dependencies.
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Set
 
-from beanie import Document, Indexed
+from beanie import Document, after_event, Insert, Replace, Save, SaveChanges, Update, Delete
 from pydantic import Field, field_validator, ConfigDict
 
 # Core imports only
@@ -26,7 +26,7 @@ class User(Document):
     """
 
     # Core fields
-    username: Indexed(str, unique=True) = Field(
+    username: str = Field(
         ...,
         description="Unique username assigned by admin"
     )
@@ -91,14 +91,8 @@ class User(Document):
     )
 
     class Settings:
-        """Collection settings and indexes."""
+        """Collection settings; indexes are declared in app.db.indexes.INDEX_PLAN."""
         name = "users"
-        indexes = [
-            "username",
-            "role",
-            "created_at",
-            "assigned_groups"
-        ]
 
     @field_validator("username")
     @classmethod
@@ -186,6 +180,12 @@ class User(Document):
             }
         }
 
+    @after_event([Insert, Replace, Save, SaveChanges, Update, Delete])
+    def invalidate_reference_cache(self) -> None:
+        """Drop this user from the reference cache after any write."""
+        from app.services.reference.manager import reference_manager
+        reference_manager.invalidate("User", self.id)
+
     def to_dict(self) -> ModelState:
         """
         Convert the user model to a dictionary for internal state representation.
@@ -0,0 +1,230 @@
+"""
+Projection views: lightweight read models for list and monitor paths.
+
+A view pairs a MongoDB projection with a converter from the raw document to
+the compact dict the read path returns. Documents are read with raw Motor
+cursors and are not validated or turned into Beanie documents: they were
+validated when written, so list pages pay only for the fields they show.
+Views never include credentials.
+
+The ``*_LIST_VIEW`` converters produce the same shape as the entity's
+``to_dict()`` so list responses are unchanged.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bson import Decimal128
+
+RawDocument = Dict[str, Any]
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _decimal(value: Any, default: str = "0") -> Decimal:
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    return Decimal(str(value)) if value is not None else Decimal(default)
+
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+@dataclass(frozen=True)
+class ProjectionView:
+    """A projection and the converter that turns its raw documents into dicts."""
+    name: str
+    projection: Dict[str, int]
+    build: Callable[[RawDocument], Dict[str, Any]]
+
+    async def find(
+        self,
+        collection: Any,
+        query: Dict[str, Any],
+        sort: Optional[Sequence[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Run ``query`` with this view's projection and convert every document."""
+        cursor = collection.find(query, self.projection)
+        if sort:
+            cursor = cursor.sort(list(sort))
+        if skip:
+            cursor = cursor.skip(skip)
+        if limit:
+            cursor = cursor.limit(limit)
+        return [self.build(document) async for document in cursor]
+
+
+def _bot_list_item(doc: RawDocument) -> Dict[str, Any]:
+    return {
+        "bot_info": {
+            "id": str(doc["_id"]),
+            "name": doc.get("name"),
+            "base_name": doc.get("base_name"),
+            "timeframe": _value(doc.get("timeframe")),
+            "status": _value(doc.get("status")),
+            "bot_type": _value(doc.get("bot_type")),
+            "max_drawdown": doc.get("max_drawdown"),
+            "risk_limit": doc.get("risk_limit"),
+            "max_allocation": doc.get("max_allocation"),
+            "min_account_balance": doc.get("min_account_balance"),
+        },
+        "connections": {
+            "connected_accounts": doc.get("connected_accounts", []),
+            "subscribed_accounts": doc.get("subscribed_accounts", []),
+            "ws_connected": doc.get("ws_connected", False)
+        },
+        "metrics": {
+            "total_signals": doc.get("total_signals", 0),
+            "successful_signals": doc.get("successful_signals", 0),
+            "failed_signals": doc.get("failed_signals", 0),
+            "total_positions": doc.get("total_positions", 0),
+            "successful_positions": doc.get("successful_positions", 0)
+        },
+        "timestamps": {
+            "created_at": _iso(doc.get("created_at")),
+            "modified_at": _iso(doc.get("modified_at")),
+            "last_signal": _iso(doc.get("last_signal"))
+        },
+        "error_info": {
+            "error_count": doc.get("error_count", 0),
+            "last_error": doc.get("last_error")
+        }
+    }
+
+
+BOT_LIST_VIEW = ProjectionView(
+    "bot_list",
+    {
+        key: 1 for key in (
+            "name", "base_name", "timeframe", "status", "bot_type", "max_drawdown", "risk_limit",
+            "max_allocation", "min_account_balance", "connected_accounts", "subscribed_accounts",
+            "ws_connected", "total_signals", "successful_signals", "failed_signals", "total_positions",
+            "successful_positions", "created_at", "modified_at", "last_signal", "error_count", "last_error"
+        )
+    },
+    _bot_list_item
+)
+
+BOT_MONITOR_VIEW = ProjectionView(
+    "bot_monitor",
+    {"name": 1, "status": 1, "connected_accounts": 1},
+    lambda doc: {
+        "id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "status": _value(doc.get("status")),
+        "connected_accounts": doc.get("connected_accounts", [])
+    }
+)
+
+
+def _account_list_item(doc: RawDocument) -> Dict[str, Any]:
+    return {
+        "account_info": {
+            "id": str(doc["_id"]),
+            "user_id": doc.get("user_id"),
+            "name": doc.get("name"),
+            "exchange": _value(doc.get("exchange")),
+            "is_testnet": doc.get("is_testnet", False),
+            "is_active": doc.get("is_active", True),
+        },
+        "relationships": {
+            "bot_id": doc.get("bot_id"),
+            "group_ids": doc.get("group_ids", []),
+        },
+        "balances": {
+            "initial": str(_decimal(doc.get("initial_balance"))),
+            "current": str(_decimal(doc.get("current_balance"))),
+            "equity": str(_decimal(doc.get("current_equity"))),
+        },
+        "positions": {
+            "open": doc.get("open_positions", 0),
+            "total": doc.get("total_positions", 0),
+            "successful": doc.get("successful_positions", 0),
+            "value": str(_decimal(doc.get("position_value"))),
+        },
+        "fees": {
+            "trading": str(_decimal(doc.get("trading_fees"))),
+            "funding": str(_decimal(doc.get("funding_fees"))),
+        },
+        "settings": {
+            "max_drawdown": doc.get("max_drawdown"),
+        },
+        "timestamps": {
+            "created_at": _iso(doc.get("created_at")),
+            "modified_at": _iso(doc.get("modified_at")),
+            "last_sync": _iso(doc.get("last_sync")),
+        },
+        "error_info": {
+            "error_count": doc.get("error_count", 0),
+            "last_error": doc.get("last_error"),
+        },
+    }
+
+
+ACCOUNT_LIST_VIEW = ProjectionView(
+    "account_list",
+    {
+        key: 1 for key in (
+            "user_id", "name", "exchange", "is_testnet", "is_active", "bot_id", "group_ids",
+            "initial_balance", "current_balance", "current_equity", "open_positions", "total_positions",
+            "successful_positions", "position_value", "trading_fees", "funding_fees", "max_drawdown",
+            "created_at", "modified_at", "last_sync", "error_count", "last_error"
+        )
+    },
+    _account_list_item
+)
+
+ACCOUNT_SUMMARY_VIEW = ProjectionView(
+    "account_summary",
+    {
+        key: 1 for key in (
+            "user_id", "name", "exchange", "bot_id", "is_active", "is_testnet", "initial_balance",
+            "current_balance", "current_equity", "open_positions", "position_value", "last_sync", "error_count"
+        )
+    },
+    lambda doc: {
+        "id": str(doc["_id"]),
+        "user_id": doc.get("user_id"),
+        "name": doc.get("name"),
+        "exchange": _value(doc.get("exchange")),
+        "bot_id": doc.get("bot_id"),
+        "is_active": doc.get("is_active", True),
+        "is_testnet": doc.get("is_testnet", False),
+        "initial_balance": _decimal(doc.get("initial_balance")),
+        "current_balance": _decimal(doc.get("current_balance")),
+        "current_equity": _decimal(doc.get("current_equity")),
+        "open_positions": doc.get("open_positions", 0),
+        "position_value": _decimal(doc.get("position_value")),
+        "last_sync": doc.get("last_sync"),
+        "error_count": doc.get("error_count", 0)
+    }
+)
+
+ACCOUNT_MONITOR_VIEW = ProjectionView(
+    "account_monitor",
+    {"name": 1, "exchange": 1, "is_testnet": 1, "is_active": 1},
+    lambda doc: {
+        "id": str(doc["_id"]),
+        "name": doc.get("name"),
+        "exchange": _value(doc.get("exchange")),
+        "is_testnet": doc.get("is_testnet", False),
+        "is_active": doc.get("is_active", True)
+    }
+)
+
+__all__ = [
+    "ProjectionView",
+    "BOT_LIST_VIEW",
+    "BOT_MONITOR_VIEW",
+    "ACCOUNT_LIST_VIEW",
+    "ACCOUNT_SUMMARY_VIEW",
+    "ACCOUNT_MONITOR_VIEW"
+]
@@ -17,7 +17,9 @@ and proper dependency management.
 from app.services.auth.service import auth_service
 from app.services.auth.password import password_manager
 from app.services.auth.tokens import token_manager
-from app.services.auth.tracking import login_tracker
+
+# The login tracker is owned by the authentication service
+login_tracker = auth_service.login_tracker
 
 # Exchange Operations and Symbol Management
 from app.services.exchange.factory import (
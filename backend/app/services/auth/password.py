@@ -6,23 +6,163 @@ Features:
 - Password verification
 - Password strength validation
 - Reset token handling
+- Dedicated, bounded hashing pool with admission control
+- Transparent rehash on login when the bcrypt cost changes
+
+bcrypt runs in its own small worker pool instead of the default executor, so
+a login burst or credential-stuffing wave queues behind PASSWORD_HASH_WORKERS
+workers and cannot starve other offloaded work. Operations beyond
+PASSWORD_HASH_MAX_PENDING, or waiting longer than PASSWORD_HASH_QUEUE_TIMEOUT,
+are rejected with RateLimitError.
 """
 
 import asyncio
-from typing import Dict, Union
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 import secrets
 
 from passlib.context import CryptContext
 
 from app.core.config import settings
-from app.core.errors.base import ValidationError
+from app.core.errors.base import RateLimitError, ServiceError, ValidationError
 from app.core.errors.decorators import error_handler
 from app.core.logging.logger import get_logger
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Pinning min/max rounds to the configured cost makes passlib flag hashes made
+# with any other cost, so verify_and_update can upgrade them on login.
+_BCRYPT_ROUNDS = getattr(settings.security, "PASSWORD_BCRYPT_ROUNDS", 12)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=_BCRYPT_ROUNDS,
+)
 logger = get_logger(__name__)
 
 
+# Top-level so they can be pickled into pool worker processes
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+class PasswordHashPool:
+    """Bounded worker pool for bcrypt with admission control and queue metrics."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        queue_timeout: float,
+        use_processes: bool = True
+    ) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.queued = 0
+        self.running = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "total_run_seconds": 0.0,
+        }
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function on the pool.
+
+        At most ``workers`` operations run at once; the rest wait in an
+        in-process queue bounded by ``max_pending`` and ``queue_timeout``.
+
+        Raises:
+            RateLimitError: If the pool is saturated or the wait times out
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        if self.queued + self.running >= self.max_pending:
+            self.stats["rejected"] += 1
+            raise RateLimitError(
+                "Too many concurrent authentication requests",
+                context={"queued": self.queued, "running": self.running, "max_pending": self.max_pending}
+            )
+
+        self.stats["submitted"] += 1
+        self.queued += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.queued)
+        enqueued_at = time.monotonic()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise RateLimitError(
+                "Timed out waiting for an authentication worker",
+                context={"queue_timeout": self.queue_timeout}
+            )
+        finally:
+            self.queued -= 1
+
+        started_at = time.monotonic()
+        self.stats["total_wait_seconds"] += started_at - enqueued_at
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        except BrokenProcessPool as e:
+            # A worker died; start a fresh pool for the next operation
+            self._executor = None
+            raise ServiceError("Password hashing worker failed", context={"error": str(e)})
+        finally:
+            self.running -= 1
+            self._slots.release()
+            self.stats["completed"] += 1
+            self.stats["total_run_seconds"] += time.monotonic() - started_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and latency counters for monitoring."""
+        completed = self.stats["completed"]
+        return {
+            **self.stats,
+            "queued": self.queued,
+            "running": self.running,
+            "workers": self.workers,
+            "avg_wait_seconds": self.stats["total_wait_seconds"] / completed if completed else 0.0,
+            "avg_run_seconds": self.stats["total_run_seconds"] / completed if completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    workers=getattr(settings.security, "PASSWORD_HASH_WORKERS", 2),
+    max_pending=getattr(settings.security, "PASSWORD_HASH_MAX_PENDING", 64),
+    queue_timeout=getattr(settings.security, "PASSWORD_HASH_QUEUE_TIMEOUT", 5.0),
+    use_processes=getattr(settings.security, "PASSWORD_HASH_USE_PROCESSES", True),
+)
+
+
 class PasswordManager:
     """Handles password operations and validation."""
 
@@ -47,8 +187,7 @@ class PasswordManager:
             ValidationError: If the password is invalid or hashing fails.
         """
         self._validate_password_format(password)
-        # Use asyncio.to_thread for CPU-bound operation
-        return await asyncio.to_thread(pwd_context.hash, password)
+        return await password_hash_pool.run(_hash, password)
 
     @error_handler("verify_password", log_message="Error verifying password")
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -65,8 +204,25 @@ class PasswordManager:
         Raises:
             ValidationError: If verification fails.
         """
-        # Use asyncio.to_thread for CPU-bound operation
-        return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+        valid, _ = await self.verify_and_update(plain_password, hashed_password)
+        return valid
+
+    @error_handler("verify_and_update", log_message="Error verifying password")
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and, if its hash uses outdated parameters, rehash it.
+
+        Args:
+            plain_password: Password to verify.
+            hashed_password: Hashed password to check against.
+
+        Returns:
+            (valid, new_hash): ``new_hash`` is set when the password is valid but
+            the stored hash should be replaced (e.g. PASSWORD_BCRYPT_ROUNDS changed).
+        """
+        return await password_hash_pool.run(_verify_and_update, plain_password, hashed_password)
 
     @error_handler("check_password_strength", log_message="Error checking password strength")
     async def check_password_strength(self, password: str) -> Dict[str, Union[bool, int]]:
@@ -122,5 +278,12 @@ class PasswordManager:
     @error_handler("generate_reset_token", log_message="Error generating reset token")
     async def generate_reset_token(self) -> str:
         """Generate a secure password reset token."""
-        # Use asyncio.to_thread for potential CPU-bound operation
-        return await asyncio.to_thread(secrets.token_urlsafe, 32)
\ No newline at end of file
+        return secrets.token_urlsafe(32)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Hashing pool queue depth and latency metrics."""
+        return password_hash_pool.get_stats()
+
+
+# Global instance
+password_manager = PasswordManager()
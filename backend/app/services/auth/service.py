@@ -22,7 +22,7 @@ from app.core.errors.base import (
 from app.core.logging.logger import get_logger
 from app.models.entities.user import User
 from app.services.auth.password import PasswordManager
-from app.services.auth.tokens import TokenManager
+from app.services.auth.tokens import TokenManager, token_manager
 from app.services.auth.tracking import LoginTracker
 
 class AuthenticationService:
@@ -75,12 +75,19 @@ class AuthenticationService:
         if not user.is_active:
             raise AuthenticationError("User account is inactive", context={"username": username})
         
-        valid_password = await self.password_manager.verify_password(password, user.hashed_password)
+        valid_password, new_hash = await self.password_manager.verify_and_update(password, user.hashed_password)
         await self.login_tracker.record_attempt(username=username, success=valid_password, ip_address=ip_address)
         if not valid_password:
             raise AuthenticationError("Invalid password", context={"username": username})
+        if new_hash:
+            # Stored hash used outdated cost parameters; upgrade it transparently
+            user.hashed_password = new_hash
+            await user.save()
+            self.logger.info("Upgraded password hash", extra={"username": username})
         
-        access_token = await self.token_manager.create_access_token(subject=username, role=user.role)
+        access_token = await self.token_manager.create_access_token(
+            subject=username, role=user.role, additional_claims={"user_id": str(user.id)}
+        )
         self.logger.info("User authenticated", extra={"username": username, "role": user.role, "ip_address": ip_address})
         return {
             "access_token": access_token,
@@ -188,7 +195,7 @@ def create_auth_service() -> AuthenticationService:
     """Create and return an AuthenticationService instance with all dependencies."""
     return AuthenticationService(
         password_manager=PasswordManager(),
-        token_manager=TokenManager(),
+        token_manager=token_manager,
         login_tracker=LoginTracker()
     )
 
@@ -3,17 +3,28 @@ JWT token management with Redis-based blacklist support.
 
 Features:
 - Token creation and validation
-- Blacklist management with Redis persistence
+- Verified-token LRU cache keyed by token hash, expiring with the token's ``exp``
+- Blacklist management with Redis persistence, mirrored into a local Bloom
+  filter that is kept in sync over Redis pub/sub
 - Token metadata handling
 - Uses a fallback default for ALGORITHM if not provided in settings.
+
+HS256 signing and verification take microseconds, so they run inline rather
+than through a thread. With the blacklist filter synced, authenticating a
+cached token needs no Redis round-trip; only filter hits (blacklisted IDs or
+rare false positives) are confirmed with ``EXISTS``. If the sync is down, every
+check falls back to Redis.
 """
 
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 import secrets
 
-from jose import jwt, JWTError
+from jose import jwt, JWTError, ExpiredSignatureError
 from pydantic import BaseModel
 from redis.asyncio import Redis
 
@@ -21,6 +32,7 @@ from app.core.config import settings
 from app.core.errors.base import AuthenticationError
 from app.core.errors.decorators import error_handler
 from app.core.logging.logger import get_logger
+from app.services.auth.bloom import BloomFilter
 
 logger = get_logger(__name__)
 
@@ -41,8 +53,23 @@ class TokenManager:
         self._algorithm = getattr(settings.security, "ALGORITHM", "HS256")
         self._secret_key = getattr(settings.security, "SECRET_KEY", "default-secret-key")
         self._redis_prefix = getattr(settings.redis, "TOKEN_BLACKLIST_PREFIX", "token_blacklist:")
+        self._blacklist_channel = getattr(settings.redis, "TOKEN_BLACKLIST_CHANNEL", "token_blacklist:events")
         # Redis connection - lazily initialized
         self._redis: Optional[Redis] = None
+        # Verified tokens: sha256(token) -> (exp timestamp, claims)
+        self._verified: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_size = settings.security.TOKEN_CACHE_SIZE
+        self._blacklist_filter = self._new_blacklist_filter()
+        # The filter is only trusted while the pub/sub sync is running
+        self._blacklist_synced = False
+        self._sync_task: Optional[asyncio.Task] = None
+        self.stats = {"cache_hits": 0, "cache_misses": 0, "blacklist_lookups": 0, "bloom_false_positives": 0}
+
+    def _new_blacklist_filter(self) -> BloomFilter:
+        return BloomFilter(
+            capacity=settings.security.TOKEN_BLACKLIST_BLOOM_CAPACITY,
+            error_rate=settings.security.TOKEN_BLACKLIST_BLOOM_ERROR_RATE
+        )
 
     async def _get_redis(self) -> Redis:
         """Get or initialize Redis connection."""
@@ -87,10 +114,7 @@ class TokenManager:
         if additional_claims:
             claims.update(additional_claims)
         
-        # Using to_thread for CPU-bound operation
-        token = await asyncio.to_thread(
-            jwt.encode, claims, self._secret_key, algorithm=self._algorithm
-        )
+        token = jwt.encode(claims, self._secret_key, algorithm=self._algorithm)
         logger.info("Created access token", extra={"subject": subject, "role": role, "token_id": token_id})
         return token
 
@@ -108,25 +132,52 @@ class TokenManager:
         Raises:
             AuthenticationError: If the token is invalid, expired, or blacklisted
         """
-        # Get unverified claims first to check blacklist
-        unverified_claims = jwt.get_unverified_claims(token)
-        token_id = unverified_claims.get("jti")
-        
-        # Check blacklist
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        cached = self._verified.get(key)
+        if cached is not None and cached[0] > now:
+            self._verified.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            payload = cached[1]
+        else:
+            self.stats["cache_misses"] += 1
+            self._verified.pop(key, None)
+            try:
+                payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
+            except ExpiredSignatureError:
+                raise AuthenticationError("Token has expired")
+            except JWTError as e:
+                raise AuthenticationError("Invalid token", context={"error": str(e)})
+
+            # Tokens without an expiry are never cached
+            if not payload.get("exp") or payload["exp"] <= now:
+                raise AuthenticationError("Token has expired", context={"token_id": payload.get("jti")})
+            self._verified[key] = (float(payload["exp"]), payload)
+            while len(self._verified) > self._cache_size:
+                self._verified.popitem(last=False)
+
+        # Check blacklist (local filter first, Redis only on a possible hit)
+        token_id = payload.get("jti")
         if token_id and await self.is_blacklisted(token_id):
+            self._verified.pop(key, None)
             raise AuthenticationError("Token has been revoked", context={"token_id": token_id})
-        
-        # Using to_thread for CPU-bound operation
-        payload = await asyncio.to_thread(
-            jwt.decode, token, self._secret_key, algorithms=[self._algorithm]
-        )
-        
-        # Check expiration
-        now = datetime.utcnow()
-        if datetime.fromtimestamp(payload["exp"]) < now:
-            raise AuthenticationError("Token has expired", context={"token_id": token_id})
-            
-        return payload
+
+        return dict(payload)
+
+    async def validate_token(self, token: str) -> Dict[str, Any]:
+        """
+        Validate a token and return its claims with request-friendly aliases.
+
+        Returns:
+            Dict[str, Any]: The token claims plus ``token_id``, ``username`` and ``user_id``
+        """
+        payload = await self.decode_token(token)
+        return {
+            **payload,
+            "token_id": payload.get("jti"),
+            "username": payload.get("sub"),
+            "user_id": payload.get("user_id"),
+        }
 
     async def blacklist_token(self, token_id: str, expiry: datetime) -> None:
         """
@@ -149,6 +200,9 @@ class TokenManager:
                 ttl_seconds,
                 "1"
             )
+            # Update this process immediately and notify the others
+            self._blacklist_filter.add(token_id)
+            await redis.publish(self._blacklist_channel, token_id)
             logger.info("Blacklisted token", extra={"token_id": token_id, "expiry": expiry.isoformat()})
         else:
             logger.warning("Attempted to blacklist already expired token", 
@@ -164,8 +218,76 @@ class TokenManager:
         Returns:
             bool: True if the token is blacklisted, False otherwise
         """
+        if self._blacklist_synced and token_id not in self._blacklist_filter:
+            return False
+
+        self.stats["blacklist_lookups"] += 1
         redis = await self._get_redis()
-        return bool(await redis.exists(f"{self._redis_prefix}{token_id}"))
+        blacklisted = bool(await redis.exists(f"{self._redis_prefix}{token_id}"))
+        if not blacklisted and self._blacklist_synced:
+            self.stats["bloom_false_positives"] += 1
+        return blacklisted
+
+    async def start(self) -> None:
+        """Start mirroring the Redis blacklist into the local Bloom filter."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync_blacklist())
+
+    async def _load_blacklist(self, redis: Redis) -> None:
+        """Rebuild the Bloom filter from the blacklist keys currently in Redis."""
+        rebuilt = self._new_blacklist_filter()
+        async for redis_key in redis.scan_iter(match=f"{self._redis_prefix}*", count=1000):
+            rebuilt.add(redis_key[len(self._redis_prefix):])
+        self._blacklist_filter = rebuilt
+        logger.info("Loaded token blacklist filter", extra={"entries": rebuilt.count})
+
+    async def _sync_blacklist(self) -> None:
+        """
+        Keep the Bloom filter in sync with Redis.
+
+        Subscribes before loading so IDs blacklisted during the load are not
+        missed, then applies announcements as they arrive. The filter is rebuilt
+        periodically (and when saturated) so expired IDs stop matching.
+        """
+        rebuild_seconds = settings.security.TOKEN_BLACKLIST_REBUILD_SECONDS
+        while True:
+            pubsub = None
+            try:
+                redis = await self._get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.subscribe(self._blacklist_channel)
+                await self._load_blacklist(redis)
+                self._blacklist_synced = True
+                next_rebuild = time.monotonic() + rebuild_seconds
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._blacklist_filter.add(message["data"])
+                    if time.monotonic() >= next_rebuild or self._blacklist_filter.saturated:
+                        await self._load_blacklist(redis)
+                        next_rebuild = time.monotonic() + rebuild_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Token blacklist sync interrupted; falling back to Redis checks", extra={"error": str(e)})
+                await asyncio.sleep(5)
+            finally:
+                self._blacklist_synced = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Verified-token cache and blacklist filter counters."""
+        return {
+            **self.stats,
+            "cached_tokens": len(self._verified),
+            "blacklist_synced": self._blacklist_synced,
+            "blacklist_filter_entries": self._blacklist_filter.count,
+        }
 
     async def get_token_metadata(self, token: str) -> TokenMetadata:
         """
@@ -187,7 +309,18 @@ class TokenManager:
         )
 
     async def close(self) -> None:
-        """Close Redis connection."""
+        """Stop the blacklist sync and close the Redis connection."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
         if self._redis is not None:
             await self._redis.close()
-            self._redis = None
\ No newline at end of file
+            self._redis = None
+
+
+# Global instance shared by request authentication
+token_manager = TokenManager()
@@ -7,15 +7,21 @@ Features:
 - Reference validation
 - Error recovery
 - Performance monitoring
+- Event-driven reconciliation of the active bot set
 """
 
 from typing import Dict, Any, Optional
 import asyncio
+import time
 from datetime import datetime
 
-from app.core.errors.base import ServiceError
+from app.core.config import settings
+from app.core.enums import BotStatus, InvalidationKind
+from app.core.errors.base import ServiceError, ValidationError
 from app.core.errors.handlers import handle_api_error
 from app.core.logging.logger import get_logger
+from app.models.views import ACCOUNT_MONITOR_VIEW, BOT_MONITOR_VIEW
+from app.services.invalidation import InvalidationEvent, invalidation_bus
 
 logger = get_logger(__name__)
 
@@ -35,8 +41,16 @@ class BotMonitor:
     - Reference validation 
     - Error recovery
     - Performance tracking
+
+    The set of active bots is re-read when an invalidation event says a bot
+    or one of its accounts changed (and every INVALIDATION_RECONCILE_SECONDS
+    as a safety net); while the change stream is not live it is re-read on
+    every loop iteration.
     """
 
+    # Account fields the monitored connection is set up from
+    ACCOUNT_FIELDS = ("exchange", "is_testnet", "is_active", "api_key", "api_secret", "passphrase")
+
     def __init__(self) -> None:
         """Initialize bot monitor with dependencies."""
         self.active_bots: Dict[str, Dict[str, Any]] = {}
@@ -44,6 +58,8 @@ class BotMonitor:
         self.is_running: bool = False
         self.logger = logger  # Using the module-level logger
         self._lock = asyncio.Lock()
+        self._reconcile_needed: bool = True
+        self._last_reconcile: float = 0.0
 
     @property
     def now(self) -> datetime:
@@ -116,38 +132,8 @@ class BotMonitor:
         """Main monitoring loop with error handling."""
         while self.is_running:
             try:
-                # Retrieve active bots using reference_manager (imported locally to avoid circular imports)
-                from app.services.reference.manager import reference_manager
-                active_bots = await reference_manager.get_references(
-                    source_type="Bot",
-                    filter_params={"status": "active"}
-                )
-                current_bot_ids = {str(bot.id) for bot in active_bots}
-                async with self._lock:
-                    tracked_bot_ids = set(self.active_bots.keys())
-
-                # Setup monitoring for new bots.
-                for bot in active_bots:
-                    bot_id = str(bot.id)
-                    if bot_id not in tracked_bot_ids:
-                        try:
-                            await self._setup_bot_monitoring(bot)
-                        except Exception as e:
-                            await handle_api_error(
-                                error=e,
-                                context={"bot_id": bot_id, "action": "setup_monitoring"},
-                                log_message="Failed to setup bot monitoring"
-                            )
-                # Cleanup bots no longer active.
-                for bot_id in tracked_bot_ids - current_bot_ids:
-                    try:
-                        await self._cleanup_bot_monitoring(bot_id)
-                    except Exception as e:
-                        await handle_api_error(
-                            error=e,
-                            context={"bot_id": bot_id, "action": "cleanup_monitoring"},
-                            log_message="Failed to cleanup bot monitoring"
-                        )
+                if self._should_reconcile():
+                    await self._reconcile_bots()
 
                 # Update positions and check WebSocket health concurrently.
                 await asyncio.gather(
@@ -166,9 +152,82 @@ class BotMonitor:
                 )
                 await asyncio.sleep(3)
 
+    def _should_reconcile(self) -> bool:
+        return (
+            self._reconcile_needed
+            or not invalidation_bus.is_live
+            or time.monotonic() - self._last_reconcile >= settings.invalidation.INVALIDATION_RECONCILE_SECONDS
+        )
+
+    async def _reconcile_bots(self) -> None:
+        """Start monitoring newly active bots and stop monitoring bots that are no longer active."""
+        # Projected read of the active bots (imported locally to avoid circular imports)
+        from app.crud.crud_bot import bot as bot_crud
+        self._reconcile_needed = False
+        try:
+            active_bots = await bot_crud.get_view(BOT_MONITOR_VIEW, query={"status": BotStatus.ACTIVE.value})
+        except Exception:
+            self._reconcile_needed = True
+            raise
+        self._last_reconcile = time.monotonic()
+        current_bot_ids = {str(bot["id"]) for bot in active_bots}
+        async with self._lock:
+            tracked_bot_ids = set(self.active_bots.keys())
+
+        # Setup monitoring for new bots.
+        for bot in active_bots:
+            bot_id = str(bot["id"])
+            if bot_id not in tracked_bot_ids:
+                try:
+                    await self._setup_bot_monitoring(bot)
+                except Exception as e:
+                    await handle_api_error(
+                        error=e,
+                        context={"bot_id": bot_id, "action": "setup_monitoring"},
+                        log_message="Failed to setup bot monitoring"
+                    )
+        # Cleanup bots no longer active.
+        for bot_id in tracked_bot_ids - current_bot_ids:
+            try:
+                await self._cleanup_bot_monitoring(bot_id)
+            except Exception as e:
+                await handle_api_error(
+                    error=e,
+                    context={"bot_id": bot_id, "action": "cleanup_monitoring"},
+                    log_message="Failed to cleanup bot monitoring"
+                )
+
+    async def on_invalidation(self, event: InvalidationEvent) -> None:
+        """
+        Drop monitoring of bots whose status, accounts or account settings
+        changed; the next loop iteration re-reads the active bots and sets
+        them up again from the current documents.
+        """
+        if event.kind in (InvalidationKind.ACCOUNT_UPDATED, InvalidationKind.ACCOUNT_DELETED):
+            if event.kind is InvalidationKind.ACCOUNT_UPDATED and not event.touches(*self.ACCOUNT_FIELDS):
+                return
+            async with self._lock:
+                stale = [
+                    bot_id for bot_id, bot_info in self.active_bots.items()
+                    if event.document_id in bot_info.get('accounts', {})
+                ]
+        elif event.kind is InvalidationKind.BOT_UPDATED and not event.touches("connected_accounts", "name"):
+            return
+        elif event.kind is InvalidationKind.BOT_STATUS_CHANGED and event.data.get("status") == BotStatus.ACTIVE.value:
+            # Still active: only a replaced document may have changed its accounts.
+            stale = [event.document_id] if event.fields is None else []
+        elif event.kind is InvalidationKind.RESYNC:
+            stale = []
+        else:
+            stale = [event.document_id]
+
+        for bot_id in stale:
+            await self._cleanup_bot_monitoring(bot_id)
+        self._reconcile_needed = True
+
     async def _setup_bot_monitoring(self, bot: Any) -> None:
         """Setup monitoring for a new bot."""
-        bot_id = str(bot.id)
+        bot_id = str(bot["id"])
         try:
             # Validate bot reference.
             from app.services.reference.manager import reference_manager
@@ -180,11 +239,9 @@ class BotMonitor:
             if not is_valid:
                 raise ValidationError("Invalid bot reference", context={"bot_id": bot_id})
 
-            # Get connected accounts.
-            accounts = await reference_manager.get_references(
-                source_type="Bot",
-                reference_id=bot_id
-            )
+            # Get connected accounts (compact, without credentials).
+            from app.crud.crud_account import account as account_crud
+            accounts = await account_crud.get_view(ACCOUNT_MONITOR_VIEW, ids=bot.get("connected_accounts", []))
             bot_data = {
                 'bot': bot,
                 'accounts': {},
@@ -197,7 +254,7 @@ class BotMonitor:
             for account in accounts:
                 await self._setup_account_monitoring(account, bot)
             self.logger.info(
-                f"Started monitoring bot {bot.name}",
+                f"Started monitoring bot {bot.get('name')}",
                 extra={"connected_accounts": len(accounts), "timestamp": self.now.isoformat()}
             )
         except ValidationError:
@@ -205,18 +262,18 @@ class BotMonitor:
         except Exception as e:
             await handle_api_error(
                 error=e,
-                context={"bot_id": bot_id, "bot_name": getattr(bot, 'name', 'unknown')},
+                context={"bot_id": bot_id, "bot_name": bot.get("name", "unknown")},
                 log_message="Failed to setup bot monitoring"
             )
             raise BotMonitorError(
                 "Failed to setup bot monitoring",
-                context={"bot_id": bot_id, "bot_name": getattr(bot, 'name', 'unknown'), "error": str(e)}
+                context={"bot_id": bot_id, "bot_name": bot.get("name", "unknown"), "error": str(e)}
             )
 
     async def _setup_account_monitoring(self, account: Dict[str, Any], bot: Any) -> None:
         """Setup monitoring for an account."""
         account_id = str(account["id"])
-        bot_id = str(bot.id)
+        bot_id = str(bot["id"])
         try:
             from app.services.websocket.manager import ws_manager
             await ws_manager.create_connection(account_id, account, account.get("exchange", ""))
@@ -427,3 +484,12 @@ def get_ws_manager() -> Any:
 
 # Global instance for use in the application.
 bot_monitor = BotMonitor()
+
+invalidation_bus.subscribe(
+    bot_monitor.on_invalidation,
+    InvalidationKind.BOT_STATUS_CHANGED,
+    InvalidationKind.BOT_UPDATED,
+    InvalidationKind.BOT_DELETED,
+    InvalidationKind.ACCOUNT_UPDATED,
+    InvalidationKind.ACCOUNT_DELETED
+)
@@ -5,21 +5,47 @@ This simplified Cron Service schedules background jobs using APScheduler.
 It removes redundant startup/cleanup functions so that scheduling is centralized.
 You can call cron_service.start() from your main startup routine to begin scheduling,
 and cron_service.stop() during shutdown.
+
+Every job runs through job_runner (app.services.job_runner): APScheduler's
+max_instances/coalesce prevent overlapping runs within a process, the
+runner's distributed lock prevents them across workers, and per-account work
+is fanned out with bounded concurrency.
 """
 
-import asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from bson import Decimal128, ObjectId
+from pymongo import UpdateOne
 
 from app.core.config.settings import settings
+from app.core.enums import BotStatus
 from app.core.errors.base import ServiceError, ValidationError
 from app.core.errors.handlers import handle_api_error
 from app.core.logging.logger import get_logger
+from app.services.job_runner import job_runner
 
 logger = get_logger(__name__)
 
+_ACCOUNT_SNAPSHOT_PROJECTION = {
+    "exchange": 1, "initial_balance": 1, "current_balance": 1, "current_equity": 1
+}
+
+
+def _decimal(value: Any) -> Decimal:
+    """Read a Decimal from a raw document value (Decimal128, number or None)."""
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+    return Decimal(str(value or 0))
+
+
+def _roi(closing: Decimal, initial: Decimal) -> float:
+    return float((closing - initial) / initial * 100) if initial > 0 else 0.0
+
+
 class CronService:
     """
     Simplified Cron Service
@@ -31,26 +57,49 @@ class CronService:
     def __init__(self) -> None:
         self.scheduler = AsyncIOScheduler()
         self.logger = get_logger("cron_service")
-    
+
+    @staticmethod
+    def _report_day() -> datetime:
+        """Midnight UTC of the day the daily jobs report on (yesterday)."""
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        return today - timedelta(days=1)
+
+    @staticmethod
+    async def _active_accounts(projection: Dict[str, int]) -> List[Dict[str, Any]]:
+        from app.models.entities.account import Account
+        return await Account.get_motor_collection().find({"is_active": True}, projection).to_list(None)
+
     # ---------------------------
     # Cron Task Functions
     # ---------------------------
     async def sync_positions(self) -> None:
-        """Sync positions and balances for active accounts."""
+        """Sync positions and balances for active accounts concurrently."""
         try:
+            from beanie import PydanticObjectId
+            from app.crud.crud_account import account as account_crud
+            from app.services.exchange.balance_sync import balance_sync_engine
             from app.services.reference.manager import reference_manager
             accounts = await reference_manager.get_references(source_type="CronJob", filter_params={"is_active": True})
             if not accounts:
                 self.logger.info("No active accounts to sync")
                 return
-            results = []
-            for account in accounts:
-                try:
-                    # Placeholder: call the exchange operations to sync positions.
-                    results.append({"account_id": str(account["id"]), "synced": True})
-                except Exception as e:
-                    results.append({"account_id": str(account["id"]), "synced": False, "error": str(e)})
-            self.logger.info("Position sync completed", extra={"results": results})
+
+            async def sync_account(account_id: str) -> Dict[str, Any]:
+                return await account_crud.sync_balance(PydanticObjectId(account_id))
+
+            # sync_balance persists each account and tracks consecutive failures
+            # itself, so a failed account is retried on the next scheduled run
+            # rather than within this one.
+            results = await balance_sync_engine.sync_accounts(
+                [str(account["id"]) for account in accounts],
+                sync_account,
+                max_retries=1
+            )
+            failed = [result.account_id for result in results if not result.success]
+            self.logger.info(
+                "Position sync completed",
+                extra={"accounts": len(results), "failed": len(failed), "failed_accounts": failed}
+            )
         except Exception as e:
             await handle_api_error(
                 error=e,
@@ -58,19 +107,93 @@ class CronService:
                 log_message="Position sync failed"
             )
             raise ServiceError("Position sync failed", context={"error": str(e)})
-    
+
     async def calculate_daily_performance(self) -> None:
-        """Calculate daily performance metrics."""
+        """
+        Store yesterday's DailyPerformance record for every active account.
+
+        Each account's closed trades for the day are aggregated by its own
+        worker (index-served per account); the records are then upserted in
+        one bulk write. Closing balance/equity are the account's current
+        values, so the job is scheduled right after midnight.
+        """
         try:
-            from app.services.reference.manager import reference_manager
-            accounts = await reference_manager.get_references(source_type="CronJob", filter_params={"is_active": True})
+            from app.crud.crud_trade import trade as trade_crud
+            from app.models.entities.daily_performance import DailyPerformance
+
+            day_start = self._report_day()
+            day_end = day_start + timedelta(days=1) - timedelta(microseconds=1)
+            date_str = day_start.strftime("%Y-%m-%d")
+            previous_str = (day_start - timedelta(days=1)).strftime("%Y-%m-%d")
+
+            accounts = await self._active_accounts(_ACCOUNT_SNAPSHOT_PROJECTION)
             if not accounts:
                 self.logger.info("No active accounts for performance calculation")
                 return
-            for account in accounts:
-                # Placeholder: Insert real performance calculation logic here.
-                self.logger.info(f"Calculated performance for account {account['id']}")
-            self.logger.info("Daily performance calculation completed")
+
+            collection = DailyPerformance.get_motor_collection()
+            previous = {
+                doc["account_id"]: doc
+                async for doc in collection.find(
+                    {"date": previous_str, "account_id": {"$in": [str(account["_id"]) for account in accounts]}},
+                    {"account_id": 1, "closing_balance": 1, "closing_equity": 1}
+                )
+            }
+
+            async def build_record(account: Dict[str, Any]) -> UpdateOne:
+                account_id = str(account["_id"])
+                days = await trade_crud.get_daily_performance(account_id, day_start, day_end)
+                day = days[0] if days else {}
+                initial = _decimal(account.get("initial_balance"))
+                closing_balance = _decimal(account.get("current_balance"))
+                closing_equity = _decimal(account.get("current_equity"))
+                before = previous.get(account_id)
+                starting_balance = _decimal(before["closing_balance"]) if before else initial
+                starting_equity = _decimal(before["closing_equity"]) if before else initial
+
+                record = {
+                    "initial_balance": initial,
+                    "initial_equity": initial,
+                    "starting_balance": starting_balance,
+                    "closing_balance": closing_balance,
+                    "starting_equity": starting_equity,
+                    "closing_equity": closing_equity,
+                    "closed_trades": day.get("trades", 0),
+                    "winning_trades": day.get("winning_trades", 0),
+                    "closed_trade_value": Decimal(str(day.get("volume", 0))),
+                    "daily_pnl": Decimal(str(day.get("pnl", 0))),
+                    "trading_fees": Decimal(str(day.get("trading_fees", 0))),
+                    "funding_fees": Decimal(str(day.get("funding_fees", 0))),
+                    "win_rate": day.get("win_rate", 0),
+                    "roi_balance": _roi(closing_balance, initial),
+                    "roi_equity": _roi(closing_equity, initial),
+                    "modified_at": datetime.utcnow(),
+                    "last_error": None,
+                    "error_count": 0,
+                }
+                return UpdateOne(
+                    {"account_id": account_id, "date": date_str},
+                    {
+                        "$set": {
+                            key: Decimal128(value) if isinstance(value, Decimal) else value
+                            for key, value in record.items()
+                        },
+                        "$setOnInsert": {"created_at": datetime.utcnow()}
+                    },
+                    upsert=True
+                )
+
+            results = await job_runner.for_each(
+                "daily_performance", accounts, build_record, key=lambda account: str(account["_id"])
+            )
+            operations = [result.value for result in results if result.success]
+            if operations:
+                await collection.bulk_write(operations, ordered=False)
+            failed = [result.key for result in results if not result.success]
+            self.logger.info(
+                "Daily performance calculation completed",
+                extra={"date": date_str, "stored": len(operations), "failed": len(failed), "failed_accounts": failed}
+            )
         except Exception as e:
             await handle_api_error(
                 error=e,
@@ -78,31 +201,65 @@ class CronService:
                 log_message="Performance calculation failed"
             )
             raise ServiceError("Performance calculation failed", context={"error": str(e)})
-    
+
     async def cleanup_old_data(self) -> None:
-        """Clean up old performance and trade records."""
+        """Apply the retention policies (app.services.retention) to historical collections."""
         try:
-            cutoff_date = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
-            # Placeholder: call your database cleanup functions here.
-            self.logger.info("Old data cleanup completed", extra={"cutoff_date": cutoff_date})
+            from app.services.retention import retention_service
+            results = await retention_service.run()
+            self.logger.info("Old data cleanup completed", extra={"results": results})
         except Exception as e:
             await handle_api_error(
                 error=e,
-                context={"cutoff_date": cutoff_date, "service": "cleanup"},
+                context={"service": "cleanup"},
                 log_message="Data cleanup failed"
             )
             raise ServiceError("Data cleanup failed", context={"error": str(e)})
-    
+
     async def verify_symbols(self) -> None:
-        """Verify symbol mappings for active bots."""
+        """
+        Re-verify the specifications of every active symbol on the exchanges
+        used by active bots, with bounded concurrency per exchange.
+        """
         try:
-            from app.services.reference.manager import reference_manager
-            active_bots = await reference_manager.get_references(source_type="CronJob", filter_params={"status": "active"})
-            if not active_bots:
+            from app.crud.crud_symbol import symbol as symbol_crud
+            from app.models.entities.account import Account
+            from app.models.entities.bot import Bot
+            from app.models.entities.symbol_data import SymbolData
+
+            account_ids = {
+                account_id
+                async for bot in Bot.get_motor_collection().find(
+                    {"status": BotStatus.ACTIVE.value}, {"connected_accounts": 1}
+                )
+                for account_id in bot.get("connected_accounts", [])
+            }
+            if not account_ids:
                 self.logger.info("No active bots for symbol verification")
                 return
-            # Placeholder: Validate symbol information for each bot.
-            self.logger.info("Symbol verification completed")
+            exchanges = await Account.get_motor_collection().distinct(
+                "exchange", {"_id": {"$in": [ObjectId(account_id) for account_id in account_ids]}}
+            )
+            symbols = await SymbolData.get_motor_collection().find(
+                {"is_active": True, "exchange": {"$in": exchanges}}, {"symbol": 1, "exchange": 1}
+            ).to_list(None)
+
+            async def verify(doc: Dict[str, Any]) -> Dict[str, Any]:
+                return await symbol_crud.verify_with_exchange(doc["symbol"], doc["exchange"])
+
+            results = await job_runner.for_each(
+                "symbol_verification",
+                symbols,
+                verify,
+                key=lambda doc: f"{doc['exchange']}:{doc['symbol']}",
+                group=lambda doc: doc["exchange"],
+                group_concurrency=settings.cron.CRON_EXCHANGE_CONCURRENCY
+            )
+            failed = [result.key for result in results if not result.success]
+            self.logger.info(
+                "Symbol verification completed",
+                extra={"exchanges": exchanges, "verified": len(results) - len(failed), "failed_symbols": failed}
+            )
         except Exception as e:
             await handle_api_error(
                 error=e,
@@ -110,45 +267,42 @@ class CronService:
                 log_message="Symbol verification failed"
             )
             raise ServiceError("Symbol verification failed", context={"error": str(e)})
-    
+
     async def send_daily_summary(self) -> None:
-        """Send daily performance summary to Telegram."""
+        """
+        Send yesterday's performance summary to Telegram, read from the
+        DailyPerformance records stored by calculate_daily_performance in one
+        query rather than per account.
+        """
         try:
-            from app.services.reference.manager import reference_manager
+            from app.models.entities.daily_performance import DailyPerformance
             from app.services.telegram.service import telegram_bot
-            accounts = await reference_manager.get_references(source_type="CronJob", filter_params={"is_active": True})
+
+            date_str = self._report_day().strftime("%Y-%m-%d")
+            accounts = await self._active_accounts({"name": 1})
             if not accounts:
                 self.logger.info("No active accounts found for daily summary")
                 return
-            total_pnl = Decimal('0')
-            total_trades = 0
-            summary_lines = []
-            for account in accounts:
-                try:
-                    from app.services.performance.service import performance_service
-                    metrics = await performance_service.get_account_metrics(
-                        account_id=str(account["id"]),
-                        date=datetime.utcnow()
-                    )
-                    total_pnl += Decimal(str(metrics["total_pnl"]))
-                    total_trades += metrics["total_trades"]
-                    summary_lines.append(
-                        f"Account: {account['id']}\n"
-                        f"PnL: {metrics['total_pnl']:.2f} USD\n"
-                        f"Trades: {metrics['total_trades']}\n"
-                        f"Win Rate: {metrics['win_rate']:.1f}%\n"
-                    )
-                except Exception as e:
-                    await handle_api_error(
-                        error=e,
-                        context={"account_id": str(account["id"])},
-                        log_message="Error fetching account performance"
-                    )
-                    summary_lines.append(
-                        f"❌ Account: {account['id']}\nError fetching performance\n"
-                    )
+            names = {str(account["_id"]): account.get("name") or str(account["_id"]) for account in accounts}
+            records = await DailyPerformance.get_motor_collection().find(
+                {"date": date_str, "account_id": {"$in": list(names)}},
+                {"account_id": 1, "daily_pnl": 1, "closed_trades": 1, "win_rate": 1}
+            ).to_list(None)
+
+            total_pnl = sum((_decimal(record.get("daily_pnl")) for record in records), Decimal("0"))
+            total_trades = sum(record.get("closed_trades", 0) for record in records)
+            summary_lines = [
+                f"{names[record['account_id']]}: {float(_decimal(record.get('daily_pnl'))):.2f} USD, "
+                f"{record.get('closed_trades', 0)} trades, {record.get('win_rate', 0):.1f}% win\n"
+                for record in sorted(records, key=lambda record: _decimal(record.get("daily_pnl")), reverse=True)
+                if record.get("closed_trades")
+            ]
+            missing = len(names) - len(records)
+            if missing:
+                summary_lines.append(f"❌ {missing} account(s) without performance data\n")
+
             message = (
-                f"📊 <b>Daily Summary</b>\n\n"
+                f"📊 <b>Daily Summary</b> ({date_str})\n\n"
                 f"Total PnL: {float(total_pnl):.2f} USD\n"
                 f"Total Trades: {total_trades}\n\n"
                 f"{''.join(summary_lines)}\n"
@@ -157,7 +311,7 @@ class CronService:
             await telegram_bot.send_message(message)
             self.logger.info(
                 "Daily summary sent",
-                extra={"account_count": len(accounts), "total_pnl": float(total_pnl), "total_trades": total_trades}
+                extra={"account_count": len(names), "total_pnl": float(total_pnl), "total_trades": total_trades}
             )
         except Exception as e:
             await handle_api_error(
@@ -166,65 +320,52 @@ class CronService:
                 log_message="Daily summary failed"
             )
             raise ServiceError("Daily summary failed", context={"error": str(e)})
-    
+
     # ---------------------------
     # Simplified Start and Stop
     # ---------------------------
+    def _schedule(self, job_id: str, name: str, func: Callable[[], Awaitable[None]], crontab: str) -> None:
+        self.scheduler.add_job(
+            job_runner.run,
+            CronTrigger.from_crontab(crontab),
+            args=[job_id, func],
+            id=job_id,
+            name=name,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=settings.cron.CRON_MISFIRE_GRACE_TIME,
+            replace_existing=True
+        )
+
     def start(self) -> None:
         """
         Schedule cron jobs using APScheduler and start the scheduler.
-        
+
         This method is now designed to be called from your main startup routine.
         """
+        if self.scheduler.running:
+            return
         self.logger.info("Starting Cron Service...")
-        self.scheduler.add_job(
-            self.sync_positions,
-            CronTrigger.from_crontab(settings.cron.BALANCE_SYNC_CRON),
-            id='sync_positions',
-            name='Sync Positions and Balances',
-            max_instances=1,
-            coalesce=True
-        )
-        self.scheduler.add_job(
-            self.calculate_daily_performance,
-            CronTrigger.from_crontab(settings.cron.DAILY_PERFORMANCE_CRON),
-            id='daily_performance',
-            name='Calculate Daily Performance',
-            max_instances=1,
-            coalesce=True
-        )
-        self.scheduler.add_job(
-            self.cleanup_old_data,
-            CronTrigger.from_crontab(settings.cron.CLEANUP_CRON),
-            id='cleanup',
-            name='Cleanup Old Data',
-            max_instances=1,
-            coalesce=True
-        )
-        self.scheduler.add_job(
-            self.verify_symbols,
-            CronTrigger.from_crontab(settings.cron.SYMBOL_VERIFICATION_CRON),
-            id='symbol_verification',
-            name='Verify Symbols',
-            max_instances=1,
-            coalesce=True
-        )
-        self.scheduler.add_job(
-            self.send_daily_summary,
-            CronTrigger.from_crontab(settings.cron.DAILY_PERFORMANCE_CRON),
-            id='daily_summary',
-            name='Send Daily Summary',
-            max_instances=1,
-            coalesce=True
-        )
+        self._schedule('sync_positions', 'Sync Positions and Balances',
+                       self.sync_positions, settings.cron.BALANCE_SYNC_CRON)
+        self._schedule('daily_performance', 'Calculate Daily Performance',
+                       self.calculate_daily_performance, settings.cron.DAILY_PERFORMANCE_CRON)
+        self._schedule('cleanup', 'Cleanup Old Data',
+                       self.cleanup_old_data, settings.cron.CLEANUP_CRON)
+        self._schedule('symbol_verification', 'Verify Symbols',
+                       self.verify_symbols, settings.cron.SYMBOL_VERIFICATION_CRON)
+        self._schedule('daily_summary', 'Send Daily Summary',
+                       self.send_daily_summary, settings.cron.DAILY_SUMMARY_CRON)
         self.scheduler.start()
-        self.logger.info("Cron Service started and jobs scheduled")
+        self.logger.info("Cron Service started and jobs scheduled", extra={"owner": job_runner.owner})
 
     def stop(self) -> None:
         """
         Shut down the APScheduler scheduler.
         """
-        self.scheduler.shutdown()
+        if not self.scheduler.running:
+            return
+        self.scheduler.shutdown(wait=False)
         self.logger.info("Cron Service stopped")
 
 # Global instance for use in the application
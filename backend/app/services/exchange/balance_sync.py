@@ -0,0 +1,198 @@
+"""
+Concurrent balance synchronization.
+
+Balances for many accounts are fetched concurrently instead of one exchange
+round-trip at a time:
+  - concurrency is bounded per exchange by BALANCE_SYNC_BATCH_SIZE, so a large
+    group cannot exhaust a single exchange's rate limit
+  - transient failures are retried up to BALANCE_SYNC_MAX_RETRIES times with a
+    linear BALANCE_SYNC_RETRY_DELAY backoff; validation and not-found errors fail fast
+  - fetched balances are written back to the accounts in one bulk_write
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from beanie import PydanticObjectId
+from bson import Decimal128
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.core.errors.base import NotFoundError, ValidationError
+from app.core.logging.logger import get_logger
+from app.models.entities.account import Account
+from app.services.reference.manager import reference_manager
+
+logger = get_logger(__name__)
+
+BalanceFetcher = Callable[[str], Awaitable[Dict[str, Any]]]
+
+# Errors that retrying cannot fix
+_NON_RETRYABLE = (ValidationError, NotFoundError)
+
+
+@dataclass
+class BalanceSyncResult:
+    """Outcome of a single account sync."""
+    account_id: str
+    exchange: Optional[str]
+    success: bool
+    balance: Optional[Decimal] = None
+    equity: Optional[Decimal] = None
+    is_active: bool = False
+    attempts: int = 0
+    error: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.success:
+            return {"account_id": self.account_id, "success": False, "error": self.error}
+        return {
+            "account_id": self.account_id,
+            "success": True,
+            "balance": float(self.balance),
+            "equity": float(self.equity)
+        }
+
+
+class BalanceSyncEngine:
+    """Runs balance fetches concurrently with per-exchange limits and retries."""
+
+    def __init__(self) -> None:
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, exchange: Optional[str]) -> asyncio.Semaphore:
+        key = exchange or "unknown"
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(settings.balance_sync.BALANCE_SYNC_BATCH_SIZE)
+        return self._semaphores[key]
+
+    async def _account_exchanges(self, account_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Resolve the exchange of every account with a single query."""
+        object_ids = [PydanticObjectId(account_id) for account_id in account_ids]
+        cursor = Account.get_motor_collection().find(
+            {"_id": {"$in": object_ids}},
+            {"exchange": 1}
+        )
+        exchanges = {str(doc["_id"]): doc.get("exchange") async for doc in cursor}
+        return {account_id: exchanges.get(account_id) for account_id in account_ids}
+
+    async def _sync_one(
+        self,
+        account_id: str,
+        exchange: Optional[str],
+        fetch: BalanceFetcher,
+        max_retries: int
+    ) -> BalanceSyncResult:
+        """Fetch one account's balance under its exchange's limit, retrying transient errors."""
+        result = BalanceSyncResult(account_id=account_id, exchange=exchange, success=False)
+        delay = settings.balance_sync.BALANCE_SYNC_RETRY_DELAY
+
+        for attempt in range(1, max_retries + 1):
+            result.attempts = attempt
+            try:
+                async with self._semaphore(exchange):
+                    data = await fetch(account_id)
+                result.success = True
+                result.data = data
+                result.balance = Decimal(str(data["balance"]))
+                result.equity = Decimal(str(data["equity"]))
+                result.is_active = bool(data.get("is_active", False))
+                result.error = None
+                return result
+            except _NON_RETRYABLE as e:
+                result.error = str(e)
+                break
+            except Exception as e:
+                result.error = str(e)
+                if attempt < max_retries:
+                    # Sleep outside the semaphore so other accounts keep the slot busy
+                    await asyncio.sleep(delay * attempt)
+
+        logger.warning(
+            "Balance sync failed",
+            extra={
+                "account_id": account_id,
+                "exchange": exchange,
+                "attempts": result.attempts,
+                "error": result.error
+            }
+        )
+        return result
+
+    async def sync_accounts(
+        self,
+        account_ids: List[str],
+        fetch: BalanceFetcher,
+        max_retries: Optional[int] = None
+    ) -> List[BalanceSyncResult]:
+        """
+        Fetch balances for all accounts concurrently.
+
+        Args:
+            account_ids: Accounts to sync
+            fetch: Coroutine returning at least ``balance`` and ``equity`` for an account
+            max_retries: Attempts per account (defaults to BALANCE_SYNC_MAX_RETRIES)
+
+        Returns:
+            Results in the same order as ``account_ids``
+        """
+        if not account_ids:
+            return []
+
+        max_retries = max_retries or settings.balance_sync.BALANCE_SYNC_MAX_RETRIES
+        exchanges = await self._account_exchanges(account_ids)
+        started = datetime.utcnow()
+
+        results = await asyncio.gather(*(
+            self._sync_one(account_id, exchanges[account_id], fetch, max_retries)
+            for account_id in account_ids
+        ))
+
+        logger.info(
+            "Balance sync completed",
+            extra={
+                "accounts": len(results),
+                "failed": sum(1 for result in results if not result.success),
+                "exchanges": len(set(exchanges.values())),
+                "duration": (datetime.utcnow() - started).total_seconds()
+            }
+        )
+        return list(results)
+
+    async def write_account_balances(self, results: List[BalanceSyncResult]) -> int:
+        """
+        Persist fetched balances to their accounts in a single bulk write.
+
+        Returns:
+            Number of accounts modified
+        """
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": PydanticObjectId(result.account_id)},
+                {"$set": {
+                    "current_balance": Decimal128(str(result.balance)),
+                    "current_equity": Decimal128(str(result.equity)),
+                    "last_sync": now,
+                    "modified_at": now
+                }}
+            )
+            for result in results if result.success
+        ]
+        if not operations:
+            return 0
+
+        write_result = await Account.get_motor_collection().bulk_write(operations, ordered=False)
+        for result in results:
+            if result.success:
+                reference_manager.invalidate("Account", result.account_id)
+        return write_result.modified_count
+
+
+balance_sync_engine = BalanceSyncEngine()
+
+__all__ = ["BalanceSyncResult", "BalanceSyncEngine", "balance_sync_engine"]
@@ -10,7 +10,9 @@ Features:
 
 from abc import ABC, abstractmethod
 import asyncio
+import time
 from datetime import datetime
+from types import SimpleNamespace
 from decimal import Decimal
 from typing import Dict, List, Optional, Protocol
 
@@ -19,6 +21,29 @@ from pydantic import BaseModel, Field
 
 from app.core.errors.decorators import error_handler
 from app.core.errors.base import RateLimitError
+from app.core.metrics import exchange_request_duration
+
+
+def _latency_trace_config(exchange: str) -> aiohttp.TraceConfig:
+    """aiohttp trace hooks recording REST latency by exchange, endpoint and status."""
+    async def on_request_start(session, trace_context: SimpleNamespace, params) -> None:
+        trace_context.started = time.perf_counter()
+
+    async def on_request_end(session, trace_context: SimpleNamespace, params) -> None:
+        exchange_request_duration.observe(
+            time.perf_counter() - trace_context.started, exchange, params.url.path, str(params.response.status)
+        )
+
+    async def on_request_exception(session, trace_context: SimpleNamespace, params) -> None:
+        exchange_request_duration.observe(
+            time.perf_counter() - trace_context.started, exchange, params.url.path, type(params.exception).__name__
+        )
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
 
 
 class ExchangeCredentials(BaseModel):
@@ -98,7 +123,8 @@ class BaseExchange(ABC):
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
                 timeout=self._timeout,
-                headers={"User-Agent": f"{self.__class__.__name__}-API/1.0"}
+                headers={"User-Agent": f"{self.__class__.__name__}-API/1.0"},
+                trace_configs=[_latency_trace_config(getattr(self.exchange_type, "value", None) or self.__class__.__name__)]
             )
             await self._test_connection()
             self.logger.info("Established HTTP session")
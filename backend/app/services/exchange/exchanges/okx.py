@@ -391,10 +391,11 @@ class OKXExchange(BaseExchange):
             )
             order = response["data"][0] if response else None
             if order:
-                self.logger.debug(
-                    "Retrieved order status",
-                    extra={"symbol": symbol, "order_id": order_id, "status": order.get("state")}
-                )
+                if self.logger.debug_enabled:
+                    self.logger.debug(
+                        "Retrieved order status",
+                        extra={"symbol": symbol, "order_id": order_id, "status": order.get("state")}
+                    )
             return order
         except Exception as e:
             await self._handle_exception(
@@ -14,8 +14,10 @@ from app.core.errors.base import (
     ValidationError,
 )
 from app.core.errors.decorators import error_handler
+from app.core.enums import InvalidationKind
 from app.core.logging.logger import get_logger
 from app.models.entities.symbol_data import SymbolData
+from app.services.invalidation import InvalidationEvent, invalidation_bus
 from app.core.references import ReferenceManagerProtocol, ExchangeType
 from .base import ExchangeCredentials, ExchangeProtocol
 from app.services.exchange.exchanges.okx import OKXExchange
@@ -33,6 +35,7 @@ class ExchangeFactory:
     Features:
       - Instance lifecycle management
       - Resource cleanup
+      - Eviction when the account's credentials or exchange change
       - Error handling via decorators
     """
 
@@ -40,6 +43,8 @@ class ExchangeFactory:
     _last_used: Dict[str, datetime] = {}
     _cleanup_lock = asyncio.Lock()
     INSTANCE_TIMEOUT = timedelta(hours=1)
+    # Account fields an exchange instance is built from
+    INSTANCE_FIELDS = ("api_key", "api_secret", "passphrase", "exchange", "is_testnet", "is_active")
 
     @classmethod
     @error_handler(
@@ -151,13 +156,40 @@ class ExchangeFactory:
             if stale_accounts:
                 logger.info("Cleaned up exchange instances", extra={"removed_count": len(stale_accounts)})
 
+    @classmethod
+    async def evict_instance(cls, account_id: str) -> bool:
+        """
+        Close and drop an account's cached instance; the next get_instance
+        builds a new one from the current account document.
+        """
+        instance = cls._instances.pop(account_id, None)
+        cls._last_used.pop(account_id, None)
+        if instance is None:
+            return False
+        try:
+            await instance.close()
+        except Exception as e:
+            logger.warning("Failed to close evicted exchange instance", extra={"account_id": account_id, "error": str(e)})
+        logger.info("Evicted exchange instance", extra={"account_id": account_id})
+        return True
+
+    @classmethod
+    async def on_invalidation(cls, event: InvalidationEvent) -> None:
+        """Evict instances whose account was deleted or had credentials/exchange settings changed."""
+        if event.kind is InvalidationKind.RESYNC:
+            for account_id in list(cls._instances):
+                await cls.evict_instance(account_id)
+        elif event.kind is InvalidationKind.ACCOUNT_DELETED or event.touches(*cls.INSTANCE_FIELDS):
+            await cls.evict_instance(event.document_id)
+
+
 class SymbolValidator:
     """
     Symbol validation with caching.
 
     Features:
       - Symbol validation and normalization
-      - Specification caching
+      - Specification caching, invalidated when symbol_data changes
       - CCXT integration
       - Resource cleanup
       - Global error handling via decorators
@@ -272,7 +304,40 @@ class SymbolValidator:
             self._cache.clear()
             self.logger.info("Cleared symbol cache")
 
+    def invalidate_symbol(self, symbol: Optional[str], exchange_type: Optional[str]) -> int:
+        """
+        Drop the cached validations of a normalized symbol on an exchange
+        (every entry when either is unknown). Returns the number removed.
+        """
+        if not symbol or not exchange_type:
+            removed = len(self._cache)
+            self._cache.clear()
+            return removed
+        suffix = f"_{exchange_type}"
+        stale = [
+            cache_key for cache_key, result in self._cache.items()
+            if result["normalized"] == symbol and cache_key.endswith(suffix)
+        ]
+        for cache_key in stale:
+            del self._cache[cache_key]
+        return len(stale)
+
+    def on_invalidation(self, event: InvalidationEvent) -> None:
+        removed = self.invalidate_symbol(event.data.get("symbol"), event.data.get("exchange"))
+        if removed:
+            self.logger.info(
+                "Invalidated symbol cache entries",
+                extra={"kind": event.kind.value, "symbol": event.data.get("symbol"), "removed": removed}
+            )
+
 
 # Global instances for use throughout the application.
 exchange_factory = ExchangeFactory()
 symbol_validator = SymbolValidator()
+
+invalidation_bus.subscribe(
+    ExchangeFactory.on_invalidation, InvalidationKind.ACCOUNT_UPDATED, InvalidationKind.ACCOUNT_DELETED
+)
+invalidation_bus.subscribe(
+    symbol_validator.on_invalidation, InvalidationKind.SYMBOL_UPDATED, InvalidationKind.SYMBOL_DISABLED
+)
@@ -11,6 +11,7 @@ from app/core/errors/decorators.py.
 """
 
 import asyncio
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -23,6 +24,8 @@ from app.core.errors.base import (
 )
 from app.core.errors.decorators import error_handler
 from app.core.logging.logger import get_logger
+from app.core.metrics import order_fill_duration
+from app.core.tracing import tracer
 from app.services.exchange.factory import exchange_factory, symbol_validator
 from app.services.reference.manager import reference_manager
 from app.services.websocket.manager import ws_manager
@@ -134,14 +137,15 @@ class ExchangeOperations:
         # Use provided size or calculate based on risk percentage
         if size is not None:
             calculated_size = Decimal(str(size))
-            self.logger.debug(
-                "Using pre-calculated size",
-                extra={
-                    "account_id": self.account_id,
-                    "symbol": symbol, 
-                    "size": str(calculated_size)
-                }
-            )
+            if self.logger.debug_enabled:
+                self.logger.debug(
+                    "Using pre-calculated size",
+                    extra={
+                        "account_id": self.account_id,
+                        "symbol": symbol, 
+                        "size": str(calculated_size)
+                    }
+                )
         else:
             # Get account balance
             balance = await self._exchange.get_balance()
@@ -227,20 +231,27 @@ class ExchangeOperations:
             Dictionary with position status and details
         """
         await self._ensure_initialized()
-        position = await self._exchange.get_position(symbol)
+        with tracer.span("order.handle_current_position", account_id=self.account_id, symbol=symbol) as position_span:
+            position = await self._exchange.get_position(symbol)
         
-        # No existing position - initialize leverage
-        if not position or position.get("size", "0") == "0":
-            await self._exchange.set_leverage(symbol, leverage)
-            return {"status": "initialized", "action_needed": False}
+            # No existing position - initialize leverage
+            if not position or position.get("size", "0") == "0":
+                with tracer.span("order.set_leverage", symbol=symbol, leverage=leverage):
+                    await self._exchange.set_leverage(symbol, leverage)
+                position_span.set(status="initialized")
+                return {"status": "initialized", "action_needed": False}
         
-        # Existing position with different side - close it
-        current_side = position.get("side", "").lower()
-        if current_side and current_side != side.lower():
-            await self._exchange.cancel_all_orders(symbol)
-            await self._exchange.close_position(symbol)
-            await self._exchange.set_leverage(symbol, leverage)
-            return {"status": "closed", "action_needed": False}
+            # Existing position with different side - close it
+            current_side = position.get("side", "").lower()
+            if current_side and current_side != side.lower():
+                with tracer.span("order.close_opposing_position", symbol=symbol, side=current_side):
+                    await self._exchange.cancel_all_orders(symbol)
+                    await self._exchange.close_position(symbol)
+                with tracer.span("order.set_leverage", symbol=symbol, leverage=leverage):
+                    await self._exchange.set_leverage(symbol, leverage)
+                position_span.set(status="closed")
+                return {"status": "closed", "action_needed": False}
+            position_span.set(status="compatible")
         
         # Existing position with same side - adding to position
         return {
@@ -429,18 +440,19 @@ class ExchangeOperations:
             if valid_size < lot_size:
                 return lot_size
                 
-            self.logger.debug(
-                "Calculated trade size", 
-                extra={
-                    "symbol": symbol,
-                    "risk_percentage": str(risk_pct),
-                    "leverage": str(leverage_val),
-                    "balance": str(balance),
-                    "price": str(price),
-                    "raw_size": str(raw_size),
-                    "valid_size": str(valid_size)
-                }
-            )
+            if self.logger.debug_enabled:
+                self.logger.debug(
+                    "Calculated trade size", 
+                    extra={
+                        "symbol": symbol,
+                        "risk_percentage": str(risk_pct),
+                        "leverage": str(leverage_val),
+                        "balance": str(balance),
+                        "price": str(price),
+                        "raw_size": str(raw_size),
+                        "valid_size": str(valid_size)
+                    }
+                )
             
             return valid_size
         except ValidationError:
@@ -460,7 +472,8 @@ class ExchangeOperations:
             specs = await self._get_symbol_specs(symbol)
             tick_size = Decimal(specs["specifications"]["tick_size"])
             normalized = (price / tick_size).to_integral_value() * tick_size
-            self.logger.debug("Validated price", extra={"symbol": symbol, "original": str(price), "normalized": str(normalized), "price_type": price_type})
+            if self.logger.debug_enabled:
+                self.logger.debug("Validated price", extra={"symbol": symbol, "original": str(price), "normalized": str(normalized), "price_type": price_type})
             return normalized
         except ValidationError:
             raise
@@ -474,10 +487,22 @@ class ExchangeOperations:
         This helper is not decorated as it is used internally.
         """
         try:
-            result = await self._exchange.place_order(order_params)
+            placed_at = time.perf_counter()
+            with tracer.span(
+                "order.place", account_id=self.account_id, symbol=order_params["symbol"], side=order_params["side"]
+            ) as place_span:
+                result = await self._exchange.place_order(order_params)
+                place_span.set(order_id=result.get("order_id"))
             if result.get("order_id"):
-                monitor_result = await self._monitor_order(symbol=order_params["symbol"], order_id=result["order_id"])
+                with tracer.span("order.monitor", order_id=result["order_id"]) as monitor_span:
+                    monitor_result = await self._monitor_order(symbol=order_params["symbol"], order_id=result["order_id"])
+                    monitor_span.set(status=monitor_result.get("status"), attempts=monitor_result.get("attempts"))
                 result["monitor_status"] = monitor_result
+                order_fill_duration.observe(
+                    time.perf_counter() - placed_at,
+                    getattr(getattr(self._exchange, "exchange_type", None), "value", None) or "unknown",
+                    monitor_result.get("status", "unknown")
+                )
             return result
         except Exception as e:
             raise ExchangeError("Order execution failed", context={"params": order_params, "error": str(e)}) from e
@@ -615,13 +640,13 @@ class ExchangeOperations:
             results = []
             for account in accounts:
                 try:
-                    exchange = await exchange_factory.get_instance(str(account.id), reference_manager)
+                    exchange = await exchange_factory.get_instance(str(account["id"]), reference_manager)
                     positions = await exchange.get_all_positions()
                     for position in positions:
                         await exchange.close_position(position["symbol"])
-                    results.append({"account_id": str(account.id), "success": True, "closed_positions": len(positions)})
+                    results.append({"account_id": str(account["id"]), "success": True, "closed_positions": len(positions)})
                 except Exception as e:
-                    results.append({"account_id": str(account.id), "success": False, "error": str(e)})
+                    results.append({"account_id": str(account["id"]), "success": False, "error": str(e)})
             success = any(r["success"] for r in results)
             logger.info("Terminated bot accounts", extra={"bot_id": bot_id, "account_count": len(results), "success": success})
             return {"success": success, "results": results, "terminated_accounts": len(results)}
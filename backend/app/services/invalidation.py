@@ -0,0 +1,350 @@
+"""
+Cache invalidation bus driven by MongoDB change streams.
+
+In-process caches (exchange instances per account, symbol validations, the
+bot monitor's active bots, the reference cache and the user access index) are
+kept coherent with the database - including writes made by other workers or
+by hand - instead of expiring on timers or polling:
+  - one change stream on the database watches ``accounts``, ``bots``,
+    ``symbol_data``, ``users`` and ``account_groups``; only top-level field
+    names of updates are shipped, never values, so credentials and password
+    hashes do not travel over the stream
+  - each change becomes a typed InvalidationEvent (InvalidationKind) that is
+    published to the handlers registered with ``subscribe``; the reference
+    cache is invalidated before any handler runs, so handlers that reload
+    through reference_manager see the new document
+  - the resume token is persisted in ``change_stream_tokens`` every
+    INVALIDATION_TOKEN_SAVE_SECONDS and on shutdown, so an interrupted or
+    restarted stream continues where it stopped; when the oplog no longer
+    holds the token a RESYNC event tells every handler to drop its cache
+  - on a standalone server (no replica set) change streams are unavailable:
+    the bus reports ``unsupported`` and components keep their polling paths
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.core.config import settings
+from app.core.enums import InvalidationKind
+from app.core.logging.logger import get_logger
+from app.core.metrics import cache_invalidation_events, invalidation_stream_live
+
+logger = get_logger(__name__)
+
+TOKEN_COLLECTION = "change_stream_tokens"
+STREAM_NAME = "cache_invalidation"
+WATCHED_COLLECTIONS = ("accounts", "bots", "symbol_data", "users", "account_groups")
+
+_CHANGE_STREAMS_UNSUPPORTED = 40573
+# ChangeStreamFatalError, ChangeStreamHistoryLost: the resume token is unusable
+_RESUME_FAILED = (280, 286)
+
+_PIPELINE: List[Dict[str, Any]] = [
+    {
+        "$match": {
+            "ns.coll": {"$in": list(WATCHED_COLLECTIONS)},
+            "operationType": {"$in": ["insert", "update", "replace", "delete"]},
+        }
+    },
+    {
+        "$project": {
+            "operationType": 1,
+            "ns": 1,
+            "documentKey": 1,
+            "changedFields": {
+                "$concatArrays": [
+                    {
+                        "$map": {
+                            "input": {"$objectToArray": {"$ifNull": ["$updateDescription.updatedFields", {}]}},
+                            "in": "$$this.k",
+                        }
+                    },
+                    {"$ifNull": ["$updateDescription.removedFields", []]},
+                ]
+            },
+            "fullDocument.status": 1,
+            "fullDocument.symbol": 1,
+            "fullDocument.exchange": 1,
+            "fullDocument.is_active": 1,
+        }
+    },
+]
+
+_REFERENCE_TYPES: Dict[InvalidationKind, str] = {
+    InvalidationKind.ACCOUNT_UPDATED: "Account",
+    InvalidationKind.ACCOUNT_DELETED: "Account",
+    InvalidationKind.BOT_STATUS_CHANGED: "Bot",
+    InvalidationKind.BOT_UPDATED: "Bot",
+    InvalidationKind.BOT_DELETED: "Bot",
+    InvalidationKind.SYMBOL_UPDATED: "SymbolData",
+    InvalidationKind.SYMBOL_DISABLED: "SymbolData",
+    InvalidationKind.USER_UPDATED: "User",
+    InvalidationKind.USER_DELETED: "User",
+    InvalidationKind.GROUP_UPDATED: "AccountGroup",
+    InvalidationKind.GROUP_DELETED: "AccountGroup",
+}
+
+
+@dataclass(frozen=True)
+class InvalidationEvent:
+    """
+    A database change that may make cached data stale.
+
+    ``fields`` holds the top-level fields an update changed; it is None for
+    inserts, replacements and deletes (the whole document changed). ``data``
+    carries what handlers need to find their entries: ``status`` for bot
+    events, ``symbol`` and ``exchange`` for symbol events.
+    """
+    kind: InvalidationKind
+    document_id: Optional[str] = None
+    fields: Optional[FrozenSet[str]] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def touches(self, *names: str) -> bool:
+        """Whether the change may affect any of the given top-level fields."""
+        return self.fields is None or any(name in self.fields for name in names)
+
+
+Handler = Callable[[InvalidationEvent], Union[None, Awaitable[None]]]
+
+
+def event_from_change(change: Dict[str, Any]) -> Optional[InvalidationEvent]:
+    """Map a (projected) change stream document to an InvalidationEvent."""
+    collection = change["ns"]["coll"]
+    operation = change["operationType"]
+    document_id = str(change["documentKey"]["_id"])
+    document = change.get("fullDocument") or {}
+    fields = (
+        frozenset(name.split(".", 1)[0] for name in change.get("changedFields") or [])
+        if operation == "update" else None
+    )
+
+    if collection == "accounts":
+        kind = InvalidationKind.ACCOUNT_DELETED if operation == "delete" else InvalidationKind.ACCOUNT_UPDATED
+        return InvalidationEvent(kind, document_id, fields)
+
+    if collection == "bots":
+        if operation == "delete":
+            return InvalidationEvent(InvalidationKind.BOT_DELETED, document_id)
+        if fields is None or "status" in fields:
+            return InvalidationEvent(
+                InvalidationKind.BOT_STATUS_CHANGED, document_id, fields, {"status": document.get("status")}
+            )
+        return InvalidationEvent(InvalidationKind.BOT_UPDATED, document_id, fields)
+
+    if collection == "symbol_data":
+        data = {"symbol": document.get("symbol"), "exchange": document.get("exchange")}
+        disabled = operation == "delete" or document.get("is_active") is False
+        kind = InvalidationKind.SYMBOL_DISABLED if disabled else InvalidationKind.SYMBOL_UPDATED
+        return InvalidationEvent(kind, document_id, fields, data)
+
+    if collection == "users":
+        kind = InvalidationKind.USER_DELETED if operation == "delete" else InvalidationKind.USER_UPDATED
+        return InvalidationEvent(kind, document_id, fields)
+
+    if collection == "account_groups":
+        kind = InvalidationKind.GROUP_DELETED if operation == "delete" else InvalidationKind.GROUP_UPDATED
+        return InvalidationEvent(kind, document_id, fields)
+
+    return None
+
+
+class InvalidationBus:
+    """Publishes InvalidationEvents from a resumable change stream to registered caches."""
+
+    def __init__(self) -> None:
+        self._subscribers: List[Tuple[FrozenSet[InvalidationKind], Handler]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._resume_token: Optional[Dict[str, Any]] = None
+        self._token_dirty = False
+        self._opened = False
+        self.state = "stopped"
+        self.last_event_at: Optional[datetime] = None
+        self.token_saved_at: Optional[datetime] = None
+        self.stats: Dict[str, int] = {"changes": 0, "published": 0, "handler_errors": 0, "resyncs": 0, "reconnects": 0}
+
+    @property
+    def is_live(self) -> bool:
+        """True while the change stream is open, i.e. subscribers are being kept coherent."""
+        return self.state == "live"
+
+    def subscribe(self, handler: Handler, *kinds: InvalidationKind) -> None:
+        """
+        Register ``handler`` (sync or async) for the given kinds, or for every
+        kind when none are given. RESYNC is always delivered.
+        """
+        entry = (frozenset(kinds), handler)
+        if entry not in self._subscribers:
+            self._subscribers.append(entry)
+
+    async def publish(self, event: InvalidationEvent) -> None:
+        """Invalidate the reference cache, then run every matching handler in registration order."""
+        cache_invalidation_events.inc(event.kind.value)
+        self.stats["published"] += 1
+        self._invalidate_references(event)
+        for kinds, handler in list(self._subscribers):
+            if kinds and event.kind not in kinds and event.kind is not InvalidationKind.RESYNC:
+                continue
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.stats["handler_errors"] += 1
+                logger.warning(
+                    "Invalidation handler failed",
+                    extra={"kind": event.kind.value, "document_id": event.document_id, "error": str(e)}
+                )
+
+    @staticmethod
+    def _invalidate_references(event: InvalidationEvent) -> None:
+        from app.services.reference.manager import reference_manager
+        if event.kind is InvalidationKind.RESYNC:
+            for reference_type in set(_REFERENCE_TYPES.values()):
+                reference_manager.invalidate(reference_type)
+        else:
+            reference_manager.invalidate(_REFERENCE_TYPES[event.kind], event.document_id)
+
+    # ---------------------------
+    # Change stream
+    # ---------------------------
+    @staticmethod
+    def _database():
+        from app.db.db import db
+        return db.client[settings.database.MONGODB_DB_NAME]
+
+    async def _load_token(self) -> Optional[Dict[str, Any]]:
+        document = await self._database()[TOKEN_COLLECTION].find_one({"_id": STREAM_NAME})
+        return document.get("token") if document else None
+
+    async def _save_token(self) -> None:
+        if not self._token_dirty:
+            return
+        await self._database()[TOKEN_COLLECTION].update_one(
+            {"_id": STREAM_NAME},
+            {"$set": {"token": self._resume_token, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        self._token_dirty = False
+        self.token_saved_at = datetime.utcnow()
+
+    async def _watch(self) -> None:
+        """Follow the change stream, publishing events and advancing the resume token."""
+        save_interval = settings.invalidation.INVALIDATION_TOKEN_SAVE_SECONDS
+        resumed = self._resume_token is not None
+        async with self._database().watch(
+            _PIPELINE,
+            full_document="updateLookup",
+            resume_after=self._resume_token,
+            max_await_time_ms=1000
+        ) as stream:
+            self.state = "live"
+            invalidation_stream_live.set(1)
+            logger.info("Cache invalidation stream open", extra={"resumed": resumed})
+            if not resumed and self._opened:
+                # Changes made while the stream was down cannot be replayed.
+                await self._resync()
+            self._opened = True
+
+            next_save = time.monotonic() + save_interval
+            while stream.alive:
+                change = await stream.try_next()
+                if change is not None:
+                    self.stats["changes"] += 1
+                    self.last_event_at = datetime.utcnow()
+                    event = event_from_change(change)
+                    if event is not None:
+                        await self.publish(event)
+                token = stream.resume_token
+                if token is not None and token != self._resume_token:
+                    self._resume_token = token
+                    self._token_dirty = True
+                if time.monotonic() >= next_save:
+                    await self._save_token()
+                    next_save = time.monotonic() + save_interval
+
+    async def _resync(self) -> None:
+        self.stats["resyncs"] += 1
+        logger.warning("Cache invalidation stream lost its position; resyncing caches")
+        await self.publish(InvalidationEvent(InvalidationKind.RESYNC))
+
+    async def _run(self) -> None:
+        try:
+            self._resume_token = await self._load_token()
+        except PyMongoError as e:
+            logger.warning("Could not load change stream resume token", extra={"error": str(e)})
+
+        while True:
+            try:
+                await self._watch()
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code == _CHANGE_STREAMS_UNSUPPORTED:
+                    self.state = "unsupported"
+                    logger.warning(
+                        "Change streams need a replica set; cache invalidation bus disabled",
+                        extra={"error": str(e)}
+                    )
+                    return
+                if e.code in _RESUME_FAILED:
+                    # Reopen from now; _watch resyncs the caches if it had been open before.
+                    logger.warning("Change stream resume token expired", extra={"error": str(e)})
+                    self._resume_token = None
+                    self._token_dirty = True
+                    continue
+                logger.warning("Cache invalidation stream failed", extra={"error": str(e), "code": e.code})
+            except PyMongoError as e:
+                logger.warning("Cache invalidation stream interrupted", extra={"error": str(e)})
+            finally:
+                invalidation_stream_live.set(0)
+
+            self.state = "retrying"
+            self.stats["reconnects"] += 1
+            await asyncio.sleep(settings.invalidation.INVALIDATION_RETRY_SECONDS)
+
+    async def start(self) -> None:
+        """Open the change stream in a background task."""
+        if not settings.invalidation.INVALIDATION_BUS_ENABLED:
+            self.state = "disabled"
+            return
+        if self._task is None or self._task.done():
+            self.state = "starting"
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the change stream and persist the last resume token."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        invalidation_stream_live.set(0)
+        if self.state != "disabled":
+            self.state = "stopped"
+        try:
+            await self._save_token()
+        except PyMongoError as e:
+            logger.warning("Could not save change stream resume token", extra={"error": str(e)})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "subscribers": len(self._subscribers),
+            "last_event_at": self.last_event_at.isoformat() if self.last_event_at else None,
+            "token_saved_at": self.token_saved_at.isoformat() if self.token_saved_at else None,
+            **self.stats
+        }
+
+
+invalidation_bus = InvalidationBus()
+
+__all__ = ["InvalidationEvent", "InvalidationBus", "event_from_change", "invalidation_bus"]
@@ -0,0 +1,194 @@
+"""
+Execution framework for scheduled jobs.
+
+APScheduler decides *when* a job fires (``max_instances=1`` and ``coalesce``
+keep a slow run from overlapping the next one within a process); JobRunner
+decides *whether* this worker runs it and *how*:
+  - a distributed lock, held as a lease document in the ``job_locks``
+    collection, so only one worker of a multi-process deployment runs each
+    job; the lease is renewed while the job runs and expires on its own if
+    the worker dies. After a successful run the lease is kept for another
+    CRON_LOCK_TTL rather than deleted, so a worker whose scheduler fires
+    the same slot a moment later still finds it taken; the owner itself
+    takes it again at its next fire time. A failed run releases it at once
+  - ``for_each`` fans work out over accounts (or symbols) with bounded
+    concurrency, optionally also bounded per group such as the exchange, and
+    isolates per-item failures
+  - per-job duration, outcome and item throughput metrics
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.core.logging.logger import get_logger
+from app.core.metrics import cron_job_duration, cron_job_items, cron_job_runs
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+LOCK_COLLECTION = "job_locks"
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item processed by ``JobRunner.for_each``."""
+    key: str
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+
+
+class JobLock:
+    """Lease-based lock in MongoDB: one document per job, ``_id`` is the job ID."""
+
+    def __init__(self, owner: str) -> None:
+        self.owner = owner
+
+    @staticmethod
+    def _collection():
+        from app.db.db import db
+        return db.client[settings.database.MONGODB_DB_NAME][LOCK_COLLECTION]
+
+    async def acquire(self, job_id: str, ttl: float) -> bool:
+        """
+        Take the lease if it is free, expired or already ours. A lease held by
+        another worker makes the upsert collide on ``_id``.
+        """
+        now = datetime.utcnow()
+        try:
+            await self._collection().find_one_and_update(
+                {"_id": job_id, "$or": [{"expires_at": {"$lte": now}}, {"owner": self.owner}]},
+                {"$set": {"owner": self.owner, "acquired_at": now, "expires_at": now + timedelta(seconds=ttl)}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def renew(self, job_id: str, ttl: float) -> bool:
+        result = await self._collection().update_one(
+            {"_id": job_id, "owner": self.owner},
+            {"$set": {"expires_at": datetime.utcnow() + timedelta(seconds=ttl)}}
+        )
+        return result.modified_count == 1
+
+    async def release(self, job_id: str) -> None:
+        await self._collection().delete_one({"_id": job_id, "owner": self.owner})
+
+
+class JobRunner:
+    """Runs scheduled jobs under a distributed lock with metrics."""
+
+    def __init__(self) -> None:
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lock = JobLock(self.owner)
+        self.last_runs: Dict[str, Dict[str, Any]] = {}
+
+    async def _keep_lease(self, job_id: str, ttl: float) -> None:
+        while True:
+            await asyncio.sleep(ttl / 3)
+            if not await self.lock.renew(job_id, ttl):
+                logger.warning("Lost job lock lease", extra={"job": job_id, "owner": self.owner})
+                return
+
+    async def run(self, job_id: str, func: Callable[[], Awaitable[Any]], lock_ttl: Optional[float] = None) -> None:
+        """
+        Run ``func`` if this worker wins the job's lock; other workers skip the
+        run. The lock outlives a successful run by ``lock_ttl`` so the same
+        slot is not run twice.
+        """
+        ttl = lock_ttl or settings.cron.CRON_LOCK_TTL
+        try:
+            acquired = await self.lock.acquire(job_id, ttl)
+        except Exception as e:
+            cron_job_runs.inc(job_id, "skipped")
+            logger.error("Could not take job lock; skipping run", extra={"job": job_id, "error": str(e)})
+            return
+        if not acquired:
+            cron_job_runs.inc(job_id, "skipped")
+            logger.info("Job is running on another worker; skipping", extra={"job": job_id})
+            return
+
+        lease = asyncio.create_task(self._keep_lease(job_id, ttl))
+        started = time.monotonic()
+        status = "success"
+        try:
+            await func()
+        except Exception:
+            status = "failed"
+            raise
+        finally:
+            duration = time.monotonic() - started
+            lease.cancel()
+            try:
+                if status == "success":
+                    # Hold the slot: late-firing workers must not run it again
+                    await self.lock.renew(job_id, ttl)
+                else:
+                    await self.lock.release(job_id)
+            except Exception as e:
+                logger.warning("Failed to update job lock", extra={"job": job_id, "error": str(e)})
+            cron_job_duration.observe(duration, job_id, status)
+            cron_job_runs.inc(job_id, status)
+            self.last_runs[job_id] = {
+                "status": status,
+                "finished_at": datetime.utcnow().isoformat(),
+                "duration_s": round(duration, 3)
+            }
+            logger.info("Job finished", extra={"job": job_id, "status": status, "duration_s": round(duration, 3)})
+
+    async def for_each(
+        self,
+        job_id: str,
+        items: Iterable[T],
+        worker: Callable[[T], Awaitable[Any]],
+        key: Callable[[T], str] = str,
+        concurrency: Optional[int] = None,
+        group: Optional[Callable[[T], str]] = None,
+        group_concurrency: Optional[int] = None
+    ) -> List[ItemResult]:
+        """
+        Apply ``worker`` to every item, at most ``concurrency`` at a time (and
+        at most ``group_concurrency`` per ``group(item)``). A failing item is
+        recorded in its ItemResult and does not stop the others.
+        """
+        limit = asyncio.Semaphore(concurrency or settings.cron.CRON_ACCOUNT_CONCURRENCY)
+        group_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def run_one(item: T) -> ItemResult:
+            async with AsyncExitStack() as stack:
+                if group is not None and group_concurrency:
+                    name = group(item)
+                    if name not in group_limits:
+                        group_limits[name] = asyncio.Semaphore(group_concurrency)
+                    await stack.enter_async_context(group_limits[name])
+                await stack.enter_async_context(limit)
+                try:
+                    value = await worker(item)
+                    cron_job_items.inc(job_id, "success")
+                    return ItemResult(key(item), True, value)
+                except Exception as e:
+                    cron_job_items.inc(job_id, "failed")
+                    logger.warning("Job item failed", extra={"job": job_id, "item": key(item), "error": str(e)})
+                    return ItemResult(key(item), False, error=str(e))
+
+        return list(await asyncio.gather(*(run_one(item) for item in items)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"owner": self.owner, "last_runs": dict(self.last_runs)}
+
+
+job_runner = JobRunner()
+
+__all__ = ["ItemResult", "JobLock", "JobRunner", "job_runner"]
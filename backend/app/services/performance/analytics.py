@@ -17,6 +17,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import pandas as pd
 
 from app.core.errors.base import ValidationError
+from app.core.enums import TradeStatus
 from app.core.errors.decorators import error_handler
 from app.core.logging.logger import get_logger
 
@@ -29,11 +30,35 @@ class PerformanceAnalyticsService:
 
     This service calculates and reports performance metrics based on raw trade data 
     stored in MongoDB using aggregation pipelines.
+
+    Trades carry no user reference, so every pipeline first resolves the user's
+    accounts and then matches on ``account_id``/``status``/``executed_at``, which is
+    the prefix of the ``trades`` compound index in ``app.db.indexes.INDEX_PLAN``.
     """
 
     def __init__(self, db: AsyncIOMotorClient):
         self.db = db
 
+    async def _get_user_account_ids(self, user_id: str) -> List[str]:
+        """Resolve the IDs of all accounts owned by the given user."""
+        cursor = self.db["accounts"].find({"user_id": user_id}, {"_id": 1})
+        return [str(doc["_id"]) async for doc in cursor]
+
+    @staticmethod
+    def _closed_trades_match(
+        account_ids: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict:
+        """Build the index-backed $match stage for closed trades in a date range."""
+        return {
+            "$match": {
+                "account_id": {"$in": account_ids},
+                "status": TradeStatus.CLOSED.value,
+                "executed_at": {"$gte": start_date, "$lte": end_date}
+            }
+        }
+
     @error_handler(
         context_extractor=lambda self, user_id, start_date, end_date: {
             "user_id": user_id,
@@ -47,20 +72,32 @@ class PerformanceAnalyticsService:
         user_id: str,
         start_date: datetime,
         end_date: datetime
-    ) -> Dict:
+    ) -> List[Dict]:
         """
         Calculate comprehensive performance metrics for the given user and time range.
         
         Uses a MongoDB aggregation pipeline to group trades by day and compute totals
         (e.g. total trades, winning trades, gross profit/loss, fees, net PnL, etc.).
         """
+        account_ids = await self._get_user_account_ids(user_id)
+        if not account_ids:
+            return []
+
         collection = self.db["trades"]
         pipeline = [
+            self._closed_trades_match(account_ids, start_date, end_date),
             {
-                "$match": {
-                    "user_id": user_id,
-                    "created_at": {"$gte": start_date, "$lte": end_date},
-                    "status": "closed"
+                "$project": {
+                    "executed_at": 1,
+                    "closed_at": 1,
+                    "order_size": 1,
+                    "pnl": {"$ifNull": ["$pnl", 0]},
+                    "fees": {
+                        "$add": [
+                            {"$ifNull": ["$trading_fees", 0]},
+                            {"$ifNull": ["$funding_fees", 0]}
+                        ]
+                    }
                 }
             },
             {
@@ -68,7 +105,7 @@ class PerformanceAnalyticsService:
                     "_id": {
                         "$dateToString": {
                             "format": "%Y-%m-%d",
-                            "date": "$created_at"
+                            "date": "$executed_at"
                         }
                     },
                     "total_trades": {"$sum": 1},
@@ -76,14 +113,14 @@ class PerformanceAnalyticsService:
                     "gross_profit": {"$sum": {"$cond": [{"$gt": ["$pnl", 0]}, "$pnl", 0]}},
                     "gross_loss": {"$sum": {"$cond": [{"$lt": ["$pnl", 0]}, "$pnl", 0]}},
                     "total_pnl": {"$sum": "$pnl"},
-                    "total_fees": {"$sum": "$fee"},
-                    "total_volume": {"$sum": {"$multiply": ["$size", "$entry_price"]}},
+                    "total_fees": {"$sum": "$fees"},
+                    "total_volume": {"$sum": {"$ifNull": ["$order_size", 0]}},
                     "max_profit": {"$max": "$pnl"},
                     "max_loss": {"$min": "$pnl"},
                     "avg_trade_duration": {
                         "$avg": {
                             "$divide": [
-                                {"$subtract": ["$closed_at", "$created_at"]},
+                                {"$subtract": ["$closed_at", "$executed_at"]},
                                 3600000
                             ]
                         }
@@ -105,7 +142,11 @@ class PerformanceAnalyticsService:
                             {"$abs": {"$divide": ["$gross_profit", "$gross_loss"]}}
                         ]
                     },
-                    "net_pnl": {"$subtract": ["$total_pnl", "$total_fees"]},
+                    "net_pnl": {"$subtract": ["$total_pnl", "$total_fees"]}
+                }
+            },
+            {
+                "$addFields": {
                     "avg_trade_value": {"$divide": ["$net_pnl", "$total_trades"]}
                 }
             },
@@ -133,23 +174,28 @@ class PerformanceAnalyticsService:
 
         Uses a MongoDB aggregation pipeline to group trades by symbol and compute metrics.
         """
+        account_ids = await self._get_user_account_ids(user_id)
+        if not account_ids:
+            return []
+
         collection = self.db["trades"]
         pipeline = [
-            {
-                "$match": {
-                    "user_id": user_id,
-                    "created_at": {"$gte": start_date, "$lte": end_date},
-                    "status": "closed"
-                }
-            },
+            self._closed_trades_match(account_ids, start_date, end_date),
             {
                 "$group": {
                     "_id": "$symbol",
                     "total_trades": {"$sum": 1},
                     "winning_trades": {"$sum": {"$cond": [{"$gt": ["$pnl", 0]}, 1, 0]}},
-                    "total_pnl": {"$sum": "$pnl"},
-                    "total_fees": {"$sum": "$fee"},
-                    "total_volume": {"$sum": {"$multiply": ["$size", "$entry_price"]}},
+                    "total_pnl": {"$sum": {"$ifNull": ["$pnl", 0]}},
+                    "total_fees": {
+                        "$sum": {
+                            "$add": [
+                                {"$ifNull": ["$trading_fees", 0]},
+                                {"$ifNull": ["$funding_fees", 0]}
+                            ]
+                        }
+                    },
+                    "total_volume": {"$sum": {"$ifNull": ["$order_size", 0]}},
                     "avg_leverage": {"$avg": "$leverage"}
                 }
             },
@@ -190,16 +236,24 @@ class PerformanceAnalyticsService:
         """
         Calculate drawdown metrics based on a user's closed trades.
 
-        Retrieves trade data via a separate CRUD method, converts the data to a Pandas DataFrame,
-        computes cumulative PnL, rolling maximum, and derives drawdown metrics.
+        Retrieves closed trades with the same index-backed match as the other pipelines,
+        converts the data to a Pandas DataFrame, computes cumulative PnL, rolling maximum, and derives drawdown metrics.
         """
-        from app.crud.crud_Trade import trade
-        trades = await trade_crud.get_user_trades(self.db, user_id, start_date, end_date)
+        account_ids = await self._get_user_account_ids(user_id)
+        if not account_ids:
+            return {"max_drawdown": 0, "max_drawdown_duration": 0, "current_drawdown": 0}
+
+        pipeline = [
+            self._closed_trades_match(account_ids, start_date, end_date),
+            {"$sort": {"executed_at": 1}},
+            {"$project": {"_id": 0, "pnl": {"$toDouble": {"$ifNull": ["$pnl", 0]}}, "executed_at": 1}}
+        ]
+        trades = await self.db["trades"].aggregate(pipeline).to_list(None)
         if not trades:
             return {"max_drawdown": 0, "max_drawdown_duration": 0, "current_drawdown": 0}
         
         df = pd.DataFrame(trades)
-        if "pnl" not in df or "created_at" not in df:
+        if "pnl" not in df or "executed_at" not in df:
             raise ValidationError("Missing required fields in trade data", context={"fields": list(df.columns)})
         
         df['cumulative_pnl'] = df['pnl'].cumsum()
@@ -213,12 +267,12 @@ class PerformanceAnalyticsService:
         max_duration = 0
         for _, row in df.iterrows():
             if row['drawdown'] > 0 and drawdown_start is None:
-                drawdown_start = row['created_at']
+                drawdown_start = row['executed_at']
             elif row['drawdown'] == 0 and drawdown_start is not None:
-                duration = (row['created_at'] - drawdown_start).total_seconds() / 3600
+                duration = (row['executed_at'] - drawdown_start).total_seconds() / 3600
                 max_duration = max(max_duration, duration)
                 drawdown_start = None
-        current_duration = ((df['created_at'].iloc[-1] - drawdown_start).total_seconds() / 3600
+        current_duration = ((df['executed_at'].iloc[-1] - drawdown_start).total_seconds() / 3600
                             if drawdown_start is not None else 0)
 
         return {
@@ -19,7 +19,7 @@ The stored documents are expected to include fields such as:
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Any
 
@@ -28,6 +28,7 @@ from app.core.logging.logger import get_logger
 from app.core.references import PerformanceDict, PerformanceMetrics, DateRange
 from app.models.entities.daily_performance import DailyPerformance
 from app.core.errors.decorators import error_handler
+from app.services.retention import RetentionPolicy, retention_service
 
 logger = get_logger(__name__)
 
@@ -186,28 +187,25 @@ class PerformanceStorage:
         """
         Clean up old performance records that exceed the retention period.
 
+        Records are removed oldest day first with index-hinted delete_many
+        calls, at most RETENTION_MAX_CHUNKS_PER_RUN days per call; when
+        ``complete`` is False the remainder is left for the next call.
+
         Args:
             retention_days: Optional override for the retention period.
         Returns:
             A dictionary with the cleanup results.
         """
         days = retention_days or self.retention_days
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        cutoff_str = cutoff.strftime("%Y-%m-%d")
-        total_deleted = 0
         async with self._lock:
-            while True:
-                result = await DailyPerformance.find({
-                    "date": {"$lt": cutoff_str}
-                }).limit(self.batch_size).delete()
-                deleted = result.deleted_count if result else 0
-                total_deleted += deleted
-                if deleted < self.batch_size:
-                    break
+            result = await retention_service.cleanup(
+                RetentionPolicy(DailyPerformance.Settings.name, "date", days, string_dates=True)
+            )
         cleanup_result = {
             "retention_days": days,
-            "cutoff_date": cutoff_str,
-            "deleted_count": total_deleted
+            "cutoff_date": result["cutoff"],
+            "deleted_count": result["deleted"],
+            "complete": result["complete"]
         }
         self.logger.info("Cleaned up old performance records", extra=cleanup_result)
         return cleanup_result
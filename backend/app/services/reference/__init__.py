@@ -2,6 +2,19 @@
 Reference management service initialization.
 """
 
+from app.services.reference.cache import ReferenceCache
 from app.services.reference.manager import ReferenceManager, reference_manager
+from app.services.reference.loader import ReferenceLoader, get_reference_loader, reference_loader_scope
+from app.services.reference.access import AccessEntry, AccessIndex, access_index
 
-__all__ = ["ReferenceManager", "reference_manager"]
\ No newline at end of file
+__all__ = [
+    "ReferenceManager",
+    "ReferenceCache",
+    "ReferenceLoader",
+    "AccessIndex",
+    "AccessEntry",
+    "reference_manager",
+    "get_reference_loader",
+    "reference_loader_scope",
+    "access_index"
+]
\ No newline at end of file
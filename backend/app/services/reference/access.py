@@ -0,0 +1,319 @@
+"""
+Precomputed user access index.
+
+Maps each user to the frozen sets of account, bot and group IDs they may
+access, so endpoint access checks are O(1) set-membership tests instead of
+per-request reference walks.
+
+Access rules:
+  - admins can access every account, bot and group
+  - other users can access their assigned groups, the accounts in those groups
+    plus the active accounts they own, and the bots attached to those accounts
+
+Entries are built in bulk at startup (three projected queries) and otherwise
+computed lazily from the reference cache. They are kept current incrementally:
+the index listens to ReferenceManager invalidations, so any User, AccountGroup
+or Account write drops only the entries of the users it affects. Writes made
+by other workers reach it through the invalidation bus, which watches the
+``users``, ``account_groups`` and ``accounts`` collections; without change
+streams entries still expire after REFERENCE_CACHE_TTL.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from app.core.config.settings import settings
+from app.core.logging.logger import get_logger
+from app.core.references import UserRole
+from app.services.reference.manager import normalize_reference_type, reference_manager
+
+logger = get_logger(__name__)
+
+UserLike = Union[str, Dict[str, Any]]
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class AccessEntry:
+    """Resolved access for one user."""
+    user_id: str
+    is_admin: bool
+    accounts: FrozenSet[str]
+    bots: FrozenSet[str]
+    groups: FrozenSet[str]
+    built_at: float
+
+
+def _user_id(user: UserLike) -> str:
+    return str(user.get("id")) if isinstance(user, dict) else str(user)
+
+
+def _build_entry(
+    user_id: str,
+    user: Optional[Dict[str, Any]],
+    groups: Iterable[Dict[str, Any]],
+    accounts: Iterable[Dict[str, Any]],
+    owned: Iterable[Dict[str, Any]]
+) -> AccessEntry:
+    """
+    Compute an entry from already-loaded documents.
+
+    ``groups`` are the user's assigned groups, ``accounts`` the accounts in
+    those groups and ``owned`` the accounts whose ``user_id`` is the user.
+    """
+    now = time.monotonic()
+    if not user or not user.get("is_active", True):
+        return AccessEntry(user_id, False, _EMPTY, _EMPTY, _EMPTY, now)
+    if user.get("role") == UserRole.ADMIN:
+        return AccessEntry(user_id, True, _EMPTY, _EMPTY, _EMPTY, now)
+
+    reachable = list(accounts) + [account for account in owned if account.get("is_active", True)]
+    return AccessEntry(
+        user_id=user_id,
+        is_admin=False,
+        accounts=frozenset(str(account["id"]) for account in reachable),
+        bots=frozenset(str(account["bot_id"]) for account in reachable if account.get("bot_id")),
+        groups=frozenset(str(group["id"]) for group in groups),
+        built_at=now
+    )
+
+
+class AccessIndex:
+    """In-process user -> accessible resource index with incremental invalidation."""
+
+    # Reference type backing each access kind
+    _KIND_TYPES = {"accounts": "Account", "bots": "Bot", "groups": "AccountGroup"}
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, AccessEntry] = {}
+        # Reverse maps: which users' entries depend on a group / account
+        self._group_users: Dict[str, Set[str]] = {}
+        self._account_users: Dict[str, Set[str]] = {}
+        # Every ID of a type, served to admins: type -> (loaded_at, ids)
+        self._all_ids: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+        # Bumped on invalidation so entries computed concurrently are not stored stale
+        self._generation = 0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "builds": 0}
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+    async def get_entry(self, user: UserLike) -> AccessEntry:
+        """Return the user's access entry, computing it on a miss."""
+        user_id = _user_id(user)
+        entry = self._entries.get(user_id)
+        if entry is not None and time.monotonic() - entry.built_at < settings.reference_cache.REFERENCE_CACHE_TTL:
+            self.stats["hits"] += 1
+            return entry
+
+        self.stats["misses"] += 1
+        generation = self._generation
+        entry = await self._compute(user_id)
+        if generation == self._generation:
+            self._store(entry)
+        return entry
+
+    async def accessible(self, user: UserLike, kind: str) -> FrozenSet[str]:
+        """
+        IDs of ``kind`` ("accounts", "bots" or "groups") the user can access.
+
+        Admins get every ID of the type.
+        """
+        entry = await self.get_entry(user)
+        if entry.is_admin:
+            return await self.all_ids(self._KIND_TYPES[kind])
+        return getattr(entry, kind)
+
+    async def accessible_accounts(self, user: UserLike) -> FrozenSet[str]:
+        return await self.accessible(user, "accounts")
+
+    async def accessible_bots(self, user: UserLike) -> FrozenSet[str]:
+        return await self.accessible(user, "bots")
+
+    async def accessible_groups(self, user: UserLike) -> FrozenSet[str]:
+        return await self.accessible(user, "groups")
+
+    async def can_access(self, user: UserLike, kind: str, resource_id: Any) -> bool:
+        """O(1) membership test; admins can access everything."""
+        entry = await self.get_entry(user)
+        return entry.is_admin or str(resource_id) in getattr(entry, kind)
+
+    async def can_access_account(self, user: UserLike, account_id: Any) -> bool:
+        return await self.can_access(user, "accounts", account_id)
+
+    async def can_access_bot(self, user: UserLike, bot_id: Any) -> bool:
+        return await self.can_access(user, "bots", bot_id)
+
+    async def can_access_group(self, user: UserLike, group_id: Any) -> bool:
+        return await self.can_access(user, "groups", group_id)
+
+    async def all_ids(self, reference_type: str) -> FrozenSet[str]:
+        """Every ID of a reference type, loaded with an ``_id``-only projection."""
+        reference_type = normalize_reference_type(reference_type)
+        cached = self._all_ids.get(reference_type)
+        if cached is not None and time.monotonic() - cached[0] < settings.reference_cache.REFERENCE_CACHE_TTL:
+            return cached[1]
+
+        generation = self._generation
+        cursor = reference_manager._collection(reference_type).find({}, {"_id": 1})
+        ids = frozenset([str(document["_id"]) async for document in cursor])
+        if generation == self._generation:
+            self._all_ids[reference_type] = (time.monotonic(), ids)
+        return ids
+
+    # ---------------------------
+    # Building
+    # ---------------------------
+    async def _compute(self, user_id: str) -> AccessEntry:
+        """Compute one user's entry from the reference cache."""
+        user = await reference_manager.get_reference(user_id, "User")
+        if not user or user.get("role") == UserRole.ADMIN:
+            return _build_entry(user_id, user, (), (), ())
+
+        groups = await reference_manager.get_references_by_ids("AccountGroup", user.get("assigned_groups", []))
+        account_ids = dict.fromkeys(str(account_id) for group in groups for account_id in group.get("accounts", []))
+        accounts = await reference_manager.get_references_by_ids("Account", account_ids)
+        owned = await reference_manager.get_references(source_type="User", reference_id=user_id)
+        return _build_entry(user_id, user, groups, accounts, owned)
+
+    async def build(self) -> int:
+        """
+        Build entries for every active user in bulk.
+
+        Uses one projected query each for users, groups and accounts instead of
+        per-user lookups. Returns the number of entries built.
+        """
+        generation = self._generation
+        started = time.monotonic()
+
+        users = [
+            {"id": str(document["_id"]), **document}
+            async for document in reference_manager._collection("User").find(
+                {"is_active": True}, {"role": 1, "is_active": 1, "assigned_groups": 1}
+            )
+        ]
+        groups = {
+            str(document["_id"]): {"id": str(document["_id"]), "accounts": document.get("accounts", [])}
+            async for document in reference_manager._collection("AccountGroup").find({}, {"accounts": 1})
+        }
+        accounts: Dict[str, Dict[str, Any]] = {}
+        owned: Dict[str, List[Dict[str, Any]]] = {}
+        async for document in reference_manager._collection("Account").find(
+            {}, {"user_id": 1, "bot_id": 1, "is_active": 1}
+        ):
+            account = {"id": str(document["_id"]), **document}
+            accounts[account["id"]] = account
+            owned.setdefault(str(document.get("user_id")), []).append(account)
+
+        entries = []
+        for user in users:
+            user_groups = [groups[str(group_id)] for group_id in user.get("assigned_groups", []) if str(group_id) in groups]
+            group_accounts = {
+                str(account_id): accounts[str(account_id)]
+                for group in user_groups for account_id in group["accounts"] if str(account_id) in accounts
+            }
+            entries.append(_build_entry(
+                user["id"], user, user_groups, group_accounts.values(), owned.get(user["id"], [])
+            ))
+
+        if generation != self._generation:
+            logger.info("Access index build superseded by concurrent changes; entries will load lazily")
+            return 0
+
+        self.clear()
+        for entry in entries:
+            self._store(entry)
+        self.stats["builds"] += 1
+        logger.info(
+            "Access index built",
+            extra={"users": len(entries), "duration": time.monotonic() - started}
+        )
+        return len(entries)
+
+    def _store(self, entry: AccessEntry) -> None:
+        self._drop(entry.user_id)
+        self._entries[entry.user_id] = entry
+        for group_id in entry.groups:
+            self._group_users.setdefault(group_id, set()).add(entry.user_id)
+        for account_id in entry.accounts:
+            self._account_users.setdefault(account_id, set()).add(entry.user_id)
+
+    # ---------------------------
+    # Incremental invalidation
+    # ---------------------------
+    def _drop(self, user_id: str) -> None:
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return
+        for group_id in entry.groups:
+            users = self._group_users.get(group_id)
+            if users:
+                users.discard(user_id)
+        for account_id in entry.accounts:
+            users = self._account_users.get(account_id)
+            if users:
+                users.discard(user_id)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        """Drop one user's entry (e.g. after a role or group assignment change)."""
+        self._generation += 1
+        self.stats["invalidations"] += 1
+        self._drop(str(user_id))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._generation += 1
+        self._entries.clear()
+        self._group_users.clear()
+        self._account_users.clear()
+        self._all_ids.clear()
+
+    def on_reference_invalidated(self, reference_type: str, reference_id: Optional[str]) -> None:
+        """
+        ReferenceManager listener: drop only the entries a write can affect.
+
+        - User: that user
+        - AccountGroup: users assigned to the group
+        - Account: users reaching the account; an unknown account (new, or
+          moved to a new owner) drops all non-admin entries
+        """
+        if reference_type not in ("User", "AccountGroup", "Account", "Bot"):
+            return
+
+        if reference_id is not None:
+            known = self._all_ids.get(reference_type)
+            if known is not None and reference_id not in known[1]:
+                self._all_ids.pop(reference_type, None)
+        else:
+            self._all_ids.pop(reference_type, None)
+
+        if reference_type == "Bot":
+            # Bot access follows Account.bot_id, so bot writes only affect admin lists
+            return
+        if reference_id is None:
+            self.clear()
+            return
+
+        if reference_type == "User":
+            self.invalidate_user(reference_id)
+        elif reference_type == "AccountGroup":
+            for user_id in list(self._group_users.pop(reference_id, ())):
+                self.invalidate_user(user_id)
+        elif reference_id in self._account_users:
+            for user_id in list(self._account_users.pop(reference_id, ())):
+                self.invalidate_user(user_id)
+        else:
+            for user_id, entry in list(self._entries.items()):
+                if not entry.is_admin:
+                    self.invalidate_user(user_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "users": len(self._entries)}
+
+
+access_index = AccessIndex()
+reference_manager.add_invalidation_listener(access_index.on_reference_invalidated)
+
+__all__ = ["AccessEntry", "AccessIndex", "access_index"]
@@ -0,0 +1,132 @@
+"""
+In-process read-through cache used by the ReferenceManager.
+
+Features:
+- LRU eviction bounded by entry count
+- Per-entry TTL, with a shorter TTL for remembered misses (negative caching)
+- Single-flight loading: concurrent misses for the same key share one load
+- Tag-based invalidation so list/query results can be dropped by entity type
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+# Sentinel for "loaded, and the entity does not exist"
+MISSING = object()
+
+
+class ReferenceCache:
+    """Bounded LRU cache with TTLs, negative entries and single-flight loads."""
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Bumped on invalidation so loads started before it are not stored
+        self._generation = 0
+        self.stats = {"hits": 0, "misses": 0, "negative_hits": 0, "loads": 0, "evictions": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: Hashable) -> Any:
+        """Return a fresh cached value (possibly MISSING), or None when absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
+        """Store a value (MISSING for a negative entry) and index it under tags."""
+        if ttl is None:
+            ttl = self.negative_ttl if value is MISSING else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Return the cached value for key, loading it once on a miss.
+
+        The loader returns the value, or MISSING when the entity does not exist.
+        Concurrent callers for the same key await the same in-flight load.
+        """
+        value = self.peek(key)
+        if value is not None:
+            self.stats["negative_hits" if value is MISSING else "hits"] += 1
+            return value
+
+        self.stats["misses"] += 1
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            self.stats["loads"] += 1
+            value = await loader()
+            if generation == self._generation:
+                self.set(key, value, ttl=ttl, tags=tags)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key."""
+        self._entries.pop(key, None)
+        self._generation += 1
+
+    def invalidate_tag(self, tag: str) -> None:
+        """Drop every key stored under a tag."""
+        for key in self._tags.pop(tag, set()):
+            self._entries.pop(key, None)
+        self._generation += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._tags.clear()
+        self._generation += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["negative_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_rate": (self.stats["hits"] + self.stats["negative_hits"]) / lookups if lookups else 0.0
+        }
@@ -0,0 +1,127 @@
+"""
+Request-scoped batching reference loader (DataLoader pattern).
+
+Reference lookups issued in the same event-loop tick are collected and
+resolved together: one ``get_references_by_ids`` call (at most one ``$in``
+query) per reference type. Results are memoized for the rest of the request,
+so loops over groups and accounts cost a constant number of round-trips.
+
+A loader is bound to each HTTP request by the application middleware via
+``reference_loader_scope``; outside a request ``get_reference_loader`` returns
+a fresh, unbound loader.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.logging.logger import get_logger
+from app.services.reference.manager import normalize_reference_type, reference_manager
+
+logger = get_logger(__name__)
+
+_current_loader: ContextVar[Optional["ReferenceLoader"]] = ContextVar("reference_loader", default=None)
+
+
+class ReferenceLoader:
+    """Batches and memoizes reference lookups for one request."""
+
+    def __init__(self) -> None:
+        self._memo: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pending: Dict[str, List[str]] = {}
+        self._dispatch_scheduled = False
+        self._dispatch_tasks: set = set()
+        self.batches = 0
+
+    def load(self, reference_type: str, reference_id: Any) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+        """
+        Request a reference; the lookup is batched with others from the same tick.
+
+        Returns:
+            Future resolving to the reference dict, or None if it does not exist
+        """
+        reference_type = normalize_reference_type(reference_type)
+        key = (reference_type, str(reference_id))
+        future = self._memo.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._memo[key] = future
+        self._pending.setdefault(reference_type, []).append(key[1])
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._start_dispatch)
+        return future
+
+    async def load_many(
+        self,
+        reference_type: str,
+        reference_ids: Iterable[Any]
+    ) -> List[Dict[str, Any]]:
+        """Load several references in one batch; missing ones are omitted."""
+        results = await asyncio.gather(*(self.load(reference_type, reference_id) for reference_id in reference_ids))
+        return [result for result in results if result is not None]
+
+    def clear(self, reference_type: str, reference_id: Optional[Any] = None) -> None:
+        """Forget memoized results, e.g. after the request modified them."""
+        reference_type = normalize_reference_type(reference_type)
+        for key in list(self._memo):
+            if key[0] == reference_type and (reference_id is None or key[1] == str(reference_id)):
+                del self._memo[key]
+
+    def _start_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self) -> None:
+        """Resolve everything collected during the previous tick, one batch per type."""
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        await asyncio.gather(*(
+            self._resolve(reference_type, reference_ids)
+            for reference_type, reference_ids in pending.items()
+        ))
+
+    async def _resolve(self, reference_type: str, reference_ids: List[str]) -> None:
+        self.batches += 1
+        try:
+            references = await reference_manager.get_references_by_ids(reference_type, reference_ids)
+        except Exception as e:
+            logger.warning(
+                "Batched reference load failed",
+                extra={"reference_type": reference_type, "count": len(reference_ids), "error": str(e)}
+            )
+            for reference_id in reference_ids:
+                future = self._memo.pop((reference_type, reference_id), None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {reference["id"]: reference for reference in references}
+        for reference_id in reference_ids:
+            future = self._memo.get((reference_type, reference_id))
+            if future is not None and not future.done():
+                future.set_result(found.get(reference_id))
+
+
+def get_reference_loader() -> ReferenceLoader:
+    """Return the loader bound to the current request, or a fresh one."""
+    return _current_loader.get() or ReferenceLoader()
+
+
+@contextmanager
+def reference_loader_scope() -> Iterator[ReferenceLoader]:
+    """Bind a new loader to the current context (one per request)."""
+    loader = ReferenceLoader()
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        _current_loader.reset(token)
+
+
+__all__ = ["ReferenceLoader", "get_reference_loader", "reference_loader_scope"]
@@ -4,24 +4,70 @@ Reference management service for handling model relationships.
 Features:
 - Relationship validation
 - Reference integrity checking
-- Cache management
+- Read-through entity cache (LRU + TTL, single-flight, negative caching)
 - Circular dependency prevention
+
+Cached references are plain dicts (raw documents with ``id`` as a string and
+Decimal128 values as Decimal). Entities are invalidated by the model
+after-event hooks (any Beanie save/update/delete), by add_reference /
+remove_reference, and explicitly by CRUD paths that write with raw Motor calls.
 """
 
 import asyncio
-from typing import Any, Dict, Optional, Set, TypeVar, Generic, List
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Set, TypeVar, Generic, List
 
+from beanie import PydanticObjectId
+from bson import Decimal128
+from bson.errors import InvalidId
 from pydantic import BaseModel
 from app.core.errors.base import ValidationError
 from app.core.config.settings import settings
 from app.core.logging.logger import get_logger
 from app.core.errors.decorators import error_handler
 from app.db.db import db
+from app.services.reference.cache import MISSING, ReferenceCache
 
 logger = get_logger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
+# Cached reference types and the entity class backing each of them
+REFERENCE_MODELS: Dict[str, str] = {
+    "User": "User",
+    "Bot": "Bot",
+    "Account": "Account",
+    "AccountGroup": "AccountGroup",
+    "SymbolData": "SymbolData"
+}
+# Aliases used by callers
+_REFERENCE_ALIASES: Dict[str, str] = {"Group": "AccountGroup"}
+# Types probed, in order, when get_reference is called without a type
+_ID_PROBE_ORDER = ("Account", "Bot", "User", "AccountGroup")
+
+
+def normalize_reference_type(reference_type: Optional[str]) -> Optional[str]:
+    if reference_type is None:
+        return None
+    return _REFERENCE_ALIASES.get(reference_type, reference_type)
+
+
+def _to_reference(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw document into a reference dict."""
+    reference = {"id": str(document["_id"])}
+    for key, value in document.items():
+        if key == "_id":
+            continue
+        reference[key] = value.to_decimal() if isinstance(value, Decimal128) else value
+    return reference
+
+
+def _object_id(reference_id: Any) -> Optional[PydanticObjectId]:
+    try:
+        return PydanticObjectId(str(reference_id))
+    except (InvalidId, TypeError, ValueError):
+        return None
+
 
 class ReferenceManager(Generic[T]):
     """
@@ -29,16 +75,21 @@ class ReferenceManager(Generic[T]):
 
     Features:
     - Validates model relationships without circular dependencies
-    - Caches frequently accessed references
+    - Caches frequently accessed references (read-through, invalidated on writes)
     - Prevents circular dependencies
     """
 
     def __init__(self):
         """Initialize reference manager."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache = ReferenceCache(
+            max_size=settings.reference_cache.REFERENCE_CACHE_SIZE,
+            ttl=settings.reference_cache.REFERENCE_CACHE_TTL,
+            negative_ttl=settings.reference_cache.REFERENCE_NEGATIVE_CACHE_TTL
+        )
         self._reference_graph: Dict[str, Set[str]] = {}
         self._lock = asyncio.Lock()
         self._validation_rules: Dict[str, Set[str]] = {}
+        self._invalidation_listeners: List[Callable[[str, Optional[str]], None]] = []
 
     async def start(self) -> None:
         """
@@ -185,11 +236,272 @@ class ReferenceManager(Generic[T]):
         """
         Clear the internal reference cache.
         """
-        async with self._lock:
-            if model_type:
-                self._cache.pop(model_type, None)
+        if model_type:
+            self.invalidate(model_type)
+        else:
+            self._cache.clear()
+
+    # ---------------------------
+    # Cached reference lookups
+    # ---------------------------
+    def _collection(self, reference_type: str) -> Any:
+        from app.models import entities
+        return getattr(entities, REFERENCE_MODELS[reference_type]).get_motor_collection()
+
+    def _require_type(self, reference_type: Optional[str]) -> str:
+        normalized = normalize_reference_type(reference_type)
+        if normalized not in REFERENCE_MODELS:
+            raise ValidationError(
+                "Unsupported reference type",
+                context={"reference_type": reference_type, "supported": list(REFERENCE_MODELS)}
+            )
+        return normalized
+
+    def invalidate(self, reference_type: str, reference_id: Optional[Any] = None) -> None:
+        """
+        Drop cached data for a reference type, or for a single entity of that type.
+
+        List and query results that involve the type are always dropped.
+        """
+        reference_type = normalize_reference_type(reference_type)
+        if reference_id is not None:
+            self._cache.invalidate(("entity", reference_type, str(reference_id)))
+        else:
+            self._cache.invalidate_tag(f"entity:{reference_type}")
+        self._cache.invalidate_tag(f"list:{reference_type}")
+
+        changed_id = str(reference_id) if reference_id is not None else None
+        for listener in self._invalidation_listeners:
+            try:
+                listener(reference_type, changed_id)
+            except Exception as e:
+                logger.warning(
+                    "Reference invalidation listener failed",
+                    extra={"reference_type": reference_type, "reference_id": changed_id, "error": str(e)}
+                )
+
+    def add_invalidation_listener(self, listener: Callable[[str, Optional[str]], None]) -> None:
+        """
+        Register a callback run on every invalidation with (reference_type, reference_id).
+
+        ``reference_id`` is None when the whole type was invalidated. Listeners
+        must be synchronous and cheap; they run inside model write hooks.
+        """
+        if listener not in self._invalidation_listeners:
+            self._invalidation_listeners.append(listener)
+
+    async def _load_entity(self, reference_type: str, reference_id: str) -> Any:
+        object_id = _object_id(reference_id)
+        if object_id is None:
+            return MISSING
+        document = await self._collection(reference_type).find_one({"_id": object_id})
+        return _to_reference(document) if document else MISSING
+
+    async def _get_entity(self, reference_type: str, reference_id: str) -> Optional[Dict[str, Any]]:
+        value = await self._cache.get_or_load(
+            ("entity", reference_type, reference_id),
+            lambda: self._load_entity(reference_type, reference_id),
+            tags=(f"entity:{reference_type}",)
+        )
+        return None if value is MISSING else dict(value)
+
+    async def _cached_query(
+        self,
+        key: tuple,
+        tag_types: Iterable[str],
+        loader: Any
+    ) -> List[Dict[str, Any]]:
+        """Cache a list/query result, tagged by every type it depends on."""
+        value = await self._cache.get_or_load(
+            key,
+            loader,
+            ttl=settings.reference_cache.REFERENCE_LIST_CACHE_TTL,
+            tags=[f"list:{reference_type}" for reference_type in tag_types]
+        )
+        return [dict(item) for item in value]
+
+    async def _find(self, reference_type: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        cursor = self._collection(reference_type).find(query)
+        return [_to_reference(document) async for document in cursor]
+
+    async def get_reference(
+        self,
+        reference_id: Any,
+        reference_type: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a single reference by ID (or by ``filter_params``), served from cache.
+
+        Args:
+            reference_id: Entity ID
+            reference_type: Entity type; when omitted the ID is probed across types
+            filter_params: Optional field filter used instead of the ID (e.g. a bot name)
+
+        Returns:
+            Reference dict, or None if it does not exist
+        """
+        if filter_params:
+            reference_type = self._require_type(reference_type)
+            params_key = json.dumps(filter_params, sort_keys=True, default=str)
+
+            async def load_query() -> List[Dict[str, Any]]:
+                document = await self._collection(reference_type).find_one(filter_params)
+                return [_to_reference(document)] if document else []
+
+            results = await self._cached_query(
+                ("query", reference_type, params_key), (reference_type,), load_query
+            )
+            return results[0] if results else None
+
+        if reference_id is None:
+            return None
+        if reference_type:
+            return await self._get_entity(self._require_type(reference_type), str(reference_id))
+
+        for probe_type in _ID_PROBE_ORDER:
+            reference = await self._get_entity(probe_type, str(reference_id))
+            if reference:
+                return reference
+        return None
+
+    async def get_references_by_ids(
+        self,
+        reference_type: str,
+        reference_ids: Iterable[Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several references of one type; cache misses are loaded with one ``$in`` query.
+
+        Missing IDs are negatively cached and omitted from the result.
+        """
+        reference_type = self._require_type(reference_type)
+        ids = [str(reference_id) for reference_id in reference_ids]
+        found: Dict[str, Any] = {}
+        misses: List[str] = []
+        for reference_id in ids:
+            value = self._cache.peek(("entity", reference_type, reference_id))
+            if value is None:
+                misses.append(reference_id)
             else:
-                self._cache.clear()
+                found[reference_id] = value
+
+        if misses:
+            object_ids = [oid for oid in (_object_id(reference_id) for reference_id in misses) if oid]
+            documents = await self._find(reference_type, {"_id": {"$in": object_ids}}) if object_ids else []
+            loaded = {document["id"]: document for document in documents}
+            for reference_id in misses:
+                value = loaded.get(reference_id, MISSING)
+                self._cache.set(
+                    ("entity", reference_type, reference_id), value, tags=(f"entity:{reference_type}",)
+                )
+                found[reference_id] = value
+
+        return [dict(found[reference_id]) for reference_id in ids if found[reference_id] is not MISSING]
+
+    async def get_all_references(self, reference_type: str) -> List[Dict[str, Any]]:
+        """Get every reference of a type (cached for REFERENCE_LIST_CACHE_TTL)."""
+        reference_type = self._require_type(reference_type)
+        return await self._cached_query(
+            ("all", reference_type), (reference_type,), lambda: self._find(reference_type, {})
+        )
+
+    async def get_references(
+        self,
+        source_type: str,
+        reference_id: Optional[Any] = None,
+        reference_type: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get references related to a source entity, or filtered references of a type.
+
+        With ``reference_id``, returns the ``reference_type`` entities linked to that
+        source (Bot/Group -> Accounts, User -> Accounts/Bots/Groups). Without it,
+        returns entities of ``reference_type`` (or ``source_type`` when that is an
+        entity type) matching the filter. ``filter_params["resource_type"]`` is
+        accepted as an alias of ``reference_type``.
+        """
+        params = dict(filter_params or filter or {})
+        target_type = reference_type or params.pop("resource_type", None)
+        source_type = normalize_reference_type(source_type)
+
+        if reference_id is None:
+            target_type = self._require_type(
+                target_type or (source_type if source_type in REFERENCE_MODELS else "Account")
+            )
+            params_key = json.dumps(params, sort_keys=True, default=str)
+            return await self._cached_query(
+                ("filter", target_type, params_key), (target_type,), lambda: self._find(target_type, params)
+            )
+
+        target_type = self._require_type(target_type or "Account")
+        source_id = str(reference_id)
+        params_key = json.dumps(params, sort_keys=True, default=str)
+
+        async def load_related() -> List[Dict[str, Any]]:
+            related = await self._load_related(source_type, source_id, target_type)
+            return [item for item in related if all(item.get(k) == v for k, v in params.items())]
+
+        return await self._cached_query(
+            ("related", source_type, source_id, target_type, params_key),
+            (source_type, target_type),
+            load_related
+        )
+
+    async def _load_related(self, source_type: str, source_id: str, target_type: str) -> List[Dict[str, Any]]:
+        """Resolve a source -> target relationship."""
+        if source_type == "Bot" and target_type == "Account":
+            bot = await self._get_entity("Bot", source_id)
+            return await self.get_references_by_ids("Account", bot.get("connected_accounts", [])) if bot else []
+        if source_type == "AccountGroup" and target_type == "Account":
+            group = await self._get_entity("AccountGroup", source_id)
+            return await self.get_references_by_ids("Account", group.get("accounts", [])) if group else []
+        if source_type == "User" and target_type == "Account":
+            return await self._find("Account", {"user_id": source_id})
+        if source_type == "User" and target_type == "Bot":
+            accounts = await self._find("Account", {"user_id": source_id})
+            bot_ids = {account["bot_id"] for account in accounts if account.get("bot_id")}
+            return await self.get_references_by_ids("Bot", bot_ids)
+        if source_type == "User" and target_type == "AccountGroup":
+            user = await self._get_entity("User", source_id)
+            return await self.get_references_by_ids("AccountGroup", user.get("assigned_groups", [])) if user else []
+        raise ValidationError(
+            "Unsupported reference relationship",
+            context={"source_type": source_type, "target_type": target_type}
+        )
+
+    async def validate_reference(self, source_type: str, target_type: str, reference_id: Any) -> bool:
+        """Check that a referenced entity exists (served from cache)."""
+        return await self.get_reference(reference_id, target_type) is not None
+
+    async def add_reference(
+        self,
+        source_type: str,
+        target_type: str,
+        source_id: Any,
+        target_id: Any
+    ) -> None:
+        """Record a new link between two entities and invalidate both cached ends."""
+        self._reference_graph.setdefault(normalize_reference_type(source_type), set()).add(normalize_reference_type(target_type))
+        self.invalidate(source_type, source_id)
+        self.invalidate(target_type, target_id)
+
+    async def remove_reference(
+        self,
+        source_type: str,
+        target_type: str,
+        source_id: Any,
+        target_id: Any
+    ) -> None:
+        """Remove a link between two entities and invalidate both cached ends."""
+        self.invalidate(source_type, source_id)
+        self.invalidate(target_type, target_id)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the reference cache."""
+        return self._cache.get_stats()
 
     def get_dependents(self, model_type: str) -> Set[str]:
         """
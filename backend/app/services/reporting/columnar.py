@@ -0,0 +1,425 @@
+"""
+Columnar (Parquet / Arrow IPC) exports.
+
+Typed exports of PositionHistory, Trade and DailyPerformance for analytics:
+  - decimals are written as decimal128(38, 18), timestamps as UTC timestamps and
+    performance dates as date32, so files load without any re-parsing
+  - documents are read from a raw cursor sorted by (account_id, time) and each
+    batch of EXPORT_ROW_GROUP_SIZE documents becomes one Parquet row group or
+    Arrow record batch; conversion and encoding run in a worker thread
+  - optional per-account partitioning writes a hive-style directory
+    (``account_id=<id>/part-0.parquet``) with a single writer open at a time
+
+Arrow IPC files can be memory-mapped by pyarrow/pandas without copying.
+pyarrow is optional; without it columnar formats are rejected with a
+ValidationError while CSV/XLSX exports keep working.
+"""
+
+import asyncio
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Context, Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.enums import TradeStatus
+from app.core.errors.base import ValidationError
+from app.core.logging.logger import get_logger
+from app.services.reporting.streaming import EXPORT_CHUNK_SIZE, EXPORT_MEDIA_TYPES, iter_batches
+
+try:
+    from bson import Decimal128
+except ImportError:
+    Decimal128 = None
+
+# Try to import pyarrow for columnar exports, with row formats only if not available
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_SUPPORT = True
+except ImportError:
+    pa = pq = None
+    PARQUET_SUPPORT = False
+
+logger = get_logger(__name__)
+
+DECIMAL_PRECISION = 38
+DECIMAL_SCALE = 18
+_DECIMAL_QUANTUM = Decimal(1).scaleb(-DECIMAL_SCALE)
+_DECIMAL_CONTEXT = Context(prec=DECIMAL_PRECISION)
+
+COLUMNAR_MEDIA_TYPES: Dict[str, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file"
+}
+
+
+@dataclass(frozen=True)
+class ColumnarDataset:
+    """Document model, filter and typed column layout of a columnar export."""
+    document: str  # Entity class name in app.models.entities
+    time_field: str
+    columns: List[Tuple[str, str, str]]  # (column name, source field, column kind)
+    base_filter: Dict[str, Any] = field(default_factory=dict)
+    date_strings: bool = False  # time_field holds "YYYY-MM-DD" strings
+
+    @property
+    def projection(self) -> Dict[str, int]:
+        return {source: 1 for _, source, _ in self.columns}
+
+
+COLUMNAR_DATASETS: Dict[str, ColumnarDataset] = {
+    "positions": ColumnarDataset(
+        document="PositionHistory",
+        time_field="closed_at",
+        columns=[
+            ("id", "_id", "string"),
+            ("account_id", "account_id", "string"),
+            ("symbol", "symbol", "string"),
+            ("side", "side", "string"),
+            ("size", "size", "decimal"),
+            ("entry_price", "entry_price", "decimal"),
+            ("exit_price", "exit_price", "decimal"),
+            ("raw_pnl", "raw_pnl", "decimal"),
+            ("trading_fee", "trading_fee", "decimal"),
+            ("funding_fee", "funding_fee", "decimal"),
+            ("net_pnl", "net_pnl", "decimal"),
+            ("pnl_ratio", "pnl_ratio", "decimal"),
+            ("opened_at", "opened_at", "timestamp"),
+            ("closed_at", "closed_at", "timestamp")
+        ]
+    ),
+    "trades": ColumnarDataset(
+        document="Trade",
+        time_field="closed_at",
+        base_filter={"status": TradeStatus.CLOSED.value},
+        columns=[
+            ("id", "_id", "string"),
+            ("account_id", "account_id", "string"),
+            ("bot_id", "bot_id", "string"),
+            ("symbol", "symbol", "string"),
+            ("side", "side", "string"),
+            ("order_type", "order_type", "string"),
+            ("source", "source", "string"),
+            ("size", "size", "decimal"),
+            ("order_size", "order_size", "decimal"),
+            ("entry_price", "entry_price", "decimal"),
+            ("exit_price", "exit_price", "decimal"),
+            ("pnl", "pnl", "decimal"),
+            ("pnl_percentage", "pnl_percentage", "float"),
+            ("trading_fees", "trading_fees", "decimal"),
+            ("funding_fees", "funding_fees", "decimal"),
+            ("risk_percentage", "risk_percentage", "decimal"),
+            ("leverage", "leverage", "int"),
+            ("executed_at", "executed_at", "timestamp"),
+            ("closed_at", "closed_at", "timestamp")
+        ]
+    ),
+    "daily_performance": ColumnarDataset(
+        document="DailyPerformance",
+        time_field="date",
+        date_strings=True,
+        columns=[
+            ("account_id", "account_id", "string"),
+            ("date", "date", "date"),
+            ("starting_balance", "starting_balance", "decimal"),
+            ("closing_balance", "closing_balance", "decimal"),
+            ("starting_equity", "starting_equity", "decimal"),
+            ("closing_equity", "closing_equity", "decimal"),
+            ("closed_trades", "closed_trades", "int"),
+            ("winning_trades", "winning_trades", "int"),
+            ("closed_trade_value", "closed_trade_value", "decimal"),
+            ("daily_pnl", "daily_pnl", "decimal"),
+            ("trading_fees", "trading_fees", "decimal"),
+            ("funding_fees", "funding_fees", "decimal"),
+            ("win_rate", "win_rate", "float"),
+            ("roi_balance", "roi_balance", "float"),
+            ("roi_equity", "roi_equity", "float")
+        ]
+    )
+}
+
+
+def is_columnar_format(export_format: Optional[str]) -> bool:
+    """Whether the requested format is a columnar one."""
+    return (export_format or "").lower() in COLUMNAR_MEDIA_TYPES
+
+
+def normalize_columnar_format(export_format: str) -> str:
+    """
+    Normalize a requested columnar format to "parquet" or "arrow".
+
+    Raises:
+        ValidationError: If the format is unknown or pyarrow is not installed.
+    """
+    fmt = (export_format or "parquet").lower()
+    if fmt not in COLUMNAR_MEDIA_TYPES:
+        raise ValidationError(
+            "Unsupported columnar export format",
+            context={"format": export_format, "supported": list(COLUMNAR_MEDIA_TYPES)}
+        )
+    if not PARQUET_SUPPORT:
+        raise ValidationError(
+            "pyarrow is required for columnar exports but is not installed",
+            context={"format": fmt}
+        )
+    return fmt
+
+
+def export_media_type(export_format: str) -> str:
+    """Media type for any row or columnar export format (or file extension)."""
+    fmt = (export_format or "").lower()
+    return EXPORT_MEDIA_TYPES.get(fmt) or COLUMNAR_MEDIA_TYPES.get(fmt, "application/octet-stream")
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    if value is None:
+        return None
+    if Decimal128 is not None and isinstance(value, Decimal128):
+        value = value.to_decimal()
+    try:
+        value = value if isinstance(value, Decimal) else Decimal(str(value))
+        return value.quantize(_DECIMAL_QUANTUM, context=_DECIMAL_CONTEXT) if value.is_finite() else None
+    except InvalidOperation:
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if Decimal128 is not None and isinstance(value, Decimal128):
+        value = value.to_decimal()
+    return float(value)
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(str(value))
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": lambda value: None if value is None else str(value),
+    "decimal": _to_decimal,
+    "float": _to_float,
+    "int": lambda value: None if value is None else int(value),
+    "timestamp": lambda value: value,
+    "date": _to_date
+}
+
+
+def arrow_schema(dataset: ColumnarDataset) -> "pa.Schema":
+    """Build the Arrow schema of a dataset."""
+    types = {
+        "string": pa.string(),
+        "decimal": pa.decimal128(DECIMAL_PRECISION, DECIMAL_SCALE),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "timestamp": pa.timestamp("ms", tz="UTC"),
+        "date": pa.date32()
+    }
+    return pa.schema([pa.field(name, types[kind]) for name, _, kind in dataset.columns])
+
+
+def _record_batch(
+    dataset: ColumnarDataset,
+    schema: "pa.Schema",
+    documents: List[Dict[str, Any]]
+) -> "pa.RecordBatch":
+    """Convert raw documents into a typed record batch (column by column)."""
+    arrays = []
+    for (_, source, kind), schema_field in zip(dataset.columns, schema):
+        convert = _CONVERTERS[kind]
+        arrays.append(pa.array([convert(doc.get(source)) for doc in documents], type=schema_field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _dataset_cursor(
+    dataset: ColumnarDataset,
+    account_ids: List[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime]
+) -> Any:
+    """Raw cursor over a dataset ordered by (account_id, time) to match its compound index."""
+    from app.models import entities
+
+    query: Dict[str, Any] = {"account_id": {"$in": account_ids}, **dataset.base_filter}
+    time_filter: Dict[str, Any] = {}
+    if start_date:
+        time_filter["$gte"] = start_date.strftime("%Y-%m-%d") if dataset.date_strings else start_date
+    if end_date:
+        time_filter["$lte"] = end_date.strftime("%Y-%m-%d") if dataset.date_strings else end_date
+    if time_filter:
+        query[dataset.time_field] = time_filter
+
+    collection = getattr(entities, dataset.document).get_motor_collection()
+    return collection.find(query, dataset.projection).sort(
+        [("account_id", 1), (dataset.time_field, 1)]
+    )
+
+
+class _ColumnarWriter:
+    """Parquet or Arrow IPC file writer for a single output file."""
+
+    def __init__(self, path: Path, schema: "pa.Schema", export_format: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if export_format == "parquet":
+            self._writer = pq.ParquetWriter(str(path), schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(str(path), schema)
+        self._format = export_format
+
+    def write(self, batch: "pa.RecordBatch") -> None:
+        if self._format == "parquet":
+            self._writer.write_table(pa.Table.from_batches([batch]), row_group_size=batch.num_rows)
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+async def write_columnar(
+    dataset_name: str,
+    account_ids: List[str],
+    output_path: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    export_format: str = "parquet",
+    partition_by_account: bool = False,
+    row_group_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Write a dataset as Parquet or Arrow IPC, one row group per cursor batch.
+
+    Args:
+        dataset_name: "positions", "trades" or "daily_performance"
+        account_ids: Accounts to export
+        output_path: Output file, or output directory when partitioning
+        start_date: Optional start of the time range
+        end_date: Optional end of the time range
+        export_format: "parquet" or "arrow"
+        partition_by_account: Write ``account_id=<id>/part-0.<ext>`` files
+        row_group_size: Rows per row group (defaults to EXPORT_ROW_GROUP_SIZE)
+
+    Returns:
+        Summary with row, row group and file counts
+
+    Raises:
+        ValidationError: If the dataset or format is not supported
+    """
+    dataset = COLUMNAR_DATASETS.get(dataset_name)
+    if not dataset:
+        raise ValidationError(
+            "Unknown columnar dataset",
+            context={"dataset": dataset_name, "supported": list(COLUMNAR_DATASETS)}
+        )
+    export_format = normalize_columnar_format(export_format)
+    row_group_size = row_group_size or settings.export.EXPORT_ROW_GROUP_SIZE
+    schema = arrow_schema(dataset)
+    root = Path(output_path)
+
+    summary = {"rows": 0, "row_groups": 0, "files": []}
+    writer: Optional[_ColumnarWriter] = None
+    writer_account: Optional[str] = None
+
+    def open_writer(account_id: Optional[str]) -> _ColumnarWriter:
+        path = root / f"account_id={account_id}" / f"part-0.{export_format}" if partition_by_account else root
+        summary["files"].append(str(path))
+        return _ColumnarWriter(path, schema, export_format)
+
+    def write_documents(documents: List[Dict[str, Any]]) -> None:
+        nonlocal writer, writer_account
+        # Split the batch on account boundaries; the cursor is sorted by account_id
+        start = 0
+        while start < len(documents):
+            account_id = documents[start].get("account_id") if partition_by_account else None
+            end = start
+            while end < len(documents) and (
+                not partition_by_account or documents[end].get("account_id") == account_id
+            ):
+                end += 1
+            if writer is None or account_id != writer_account:
+                if writer is not None:
+                    writer.close()
+                writer, writer_account = open_writer(account_id), account_id
+            writer.write(_record_batch(dataset, schema, documents[start:end]))
+            summary["rows"] += end - start
+            summary["row_groups"] += 1
+            start = end
+
+    try:
+        cursor = _dataset_cursor(dataset, account_ids, start_date, end_date)
+        async for documents in iter_batches(cursor, row_group_size):
+            await asyncio.to_thread(write_documents, documents)
+        if writer is None and not partition_by_account:
+            # Always produce a (schema-only) file for empty unpartitioned exports
+            writer = open_writer(None)
+    finally:
+        if writer is not None:
+            await asyncio.to_thread(writer.close)
+
+    logger.info(
+        "Columnar export completed",
+        extra={
+            "dataset": dataset_name,
+            "format": export_format,
+            "rows": summary["rows"],
+            "row_groups": summary["row_groups"],
+            "files": len(summary["files"])
+        }
+    )
+    return summary
+
+
+async def stream_columnar(
+    dataset_name: str,
+    account_ids: List[str],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    export_format: str = "parquet",
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Build a single-file columnar export in a temporary file and stream it back.
+
+    Parquet and Arrow IPC files end with a footer, so bytes are only sent once the
+    file is closed; documents are still converted one row group at a time.
+    """
+    fd, path = tempfile.mkstemp(suffix=f".{export_format}")
+    os.close(fd)
+    try:
+        await write_columnar(
+            dataset_name, account_ids, path,
+            start_date=start_date, end_date=end_date, export_format=export_format
+        )
+        with open(path, mode="rb") as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning("Failed to remove temporary export file", extra={"path": path, "error": str(e)})
+
+
+__all__ = [
+    "PARQUET_SUPPORT",
+    "COLUMNAR_MEDIA_TYPES",
+    "COLUMNAR_DATASETS",
+    "ColumnarDataset",
+    "is_columnar_format",
+    "normalize_columnar_format",
+    "export_media_type",
+    "arrow_schema",
+    "write_columnar",
+    "stream_columnar"
+]
@@ -17,24 +17,53 @@ The module uses:
   - PositionHistory for fetching closed trades.
   - A centralized logger from get_logger.
   - The error_handler decorator for uniform error handling.
+  - The streaming helpers, so rows are read and encoded in batches.
+  - The columnar helpers for typed Parquet / Arrow exports of position, trade and
+    daily performance history.
 """
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.models.entities.position_history import PositionHistory
 from app.core.logging.logger import get_logger
 from app.core.errors.decorators import error_handler
+from app.services.reporting.columnar import write_columnar
+from app.services.reporting.streaming import (
+    export_cell,
+    iter_rows,
+    normalize_export_format,
+    stream_export,
+    write_export
+)
 
-import csv
 from datetime import datetime
-from typing import Dict, List, Any
-
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+from typing import Dict, List, Any, AsyncIterator, Optional
 
 logger = get_logger(__name__)
 
+CLOSED_POSITION_HEADER: List[str] = [
+    "Type", "Symbol", "Opening Price", "Closing Price", "PnL", "Exchange", "Closing Date"
+]
+
+# Raw fields read from PositionHistory for each export row
+_CLOSED_POSITION_PROJECTION: Dict[str, int] = {
+    "symbol": 1, "entry_price": 1, "exit_price": 1, "net_pnl": 1, "exchange": 1, "closed_at": 1
+}
+
+
+def _closed_position_row(doc: Dict[str, Any]) -> List[Any]:
+    """Format a raw PositionHistory document into an export row."""
+    trade_type = "Perpetual"  # Hardcoded for this example
+    currency = "USDT"  # Default currency; adjust if needed
+    return [
+        trade_type,
+        doc.get("symbol"),
+        export_cell(doc.get("entry_price")),
+        export_cell(doc.get("exit_price")),
+        f"{export_cell(doc.get('net_pnl'))} {currency}",
+        doc.get("exchange", ""),
+        export_cell(doc.get("closed_at"))
+    ]
+
 
 class Exporter:
     """
@@ -42,6 +71,9 @@ class Exporter:
 
     This class provides methods to export closed position data for a given account
     within a specified date range. It supports both CSV and Excel formats.
+
+    Positions are read from a raw cursor in batches and encoded incrementally, so
+    neither the documents nor the output rows are ever held in memory at once.
     """
 
     def __init__(self, db: AsyncIOMotorClient) -> None:
@@ -54,6 +86,46 @@ class Exporter:
         self.db = db
         self.logger = logger
 
+    def _closed_position_rows(
+        self,
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> AsyncIterator[List[Any]]:
+        """Stream closed position rows ordered by closing time."""
+        cursor = PositionHistory.get_motor_collection().find(
+            {
+                "account_id": account_id,
+                "closed_at": {"$gte": start_date, "$lte": end_date}
+            },
+            _CLOSED_POSITION_PROJECTION
+        ).sort("closed_at", 1)
+        return iter_rows(cursor, _closed_position_row)
+
+    def stream_closed_positions(
+        self,
+        account_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        export_format: str = "csv"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream closed positions as CSV or XLSX bytes for a StreamingResponse.
+
+        Args:
+            account_id: The account identifier.
+            start_date: Start date for exporting data.
+            end_date: End date for exporting data.
+            export_format: Format to export data ("csv", "xlsx" or "excel").
+        """
+        rows = self._closed_position_rows(account_id, start_date, end_date)
+        return stream_export(
+            CLOSED_POSITION_HEADER,
+            rows,
+            normalize_export_format(export_format),
+            sheet_name="Closed Positions"
+        )
+
     @error_handler(
         context_extractor=lambda account_id, start_date, end_date, output_file, export_format="csv": {
             "account_id": account_id,
@@ -83,53 +155,16 @@ class Exporter:
             export_format: Format to export data ("csv" or "excel").
 
         Raises:
-            ValueError: If an unsupported export format is specified.
+            ValidationError: If an unsupported export format is specified.
         """
-        # Convert dates to strings for querying
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        
-        # Retrieve closed positions from the PositionHistory collection
-        positions = await PositionHistory.find({
-            "account_id": account_id,
-            "date": {"$gte": start_str, "$lte": end_str}
-        }).to_list()
-        
-        if not positions:
-            self.logger.info("No closed positions found for export", extra={"account_id": account_id})
-            return
-        
-        # Build export data (a list of dictionaries)
-        export_data: List[Dict[str, Any]] = []
-        for pos in positions:
-            trade_type = "Perpetual"  # Hardcoded for this example
-            symbol = pos.symbol
-            opening_price = pos.entry_price
-            closing_price = pos.exit_price
-            pnl_value = pos.net_pnl
-            currency = "USDT"  # Default currency; adjust if needed
-            pnl_str = f"{pnl_value} {currency}"
-            # Optionally, include exchange info if available (or leave empty)
-            exchange = pos.exchange if hasattr(pos, "exchange") else ""
-            closing_date = pos.closed_at.isoformat() if pos.closed_at else ""
-            record = {
-                "Type": trade_type,
-                "Symbol": symbol,
-                "Opening Price": opening_price,
-                "Closing Price": closing_price,
-                "PnL": pnl_str,
-                "Exchange": exchange,
-                "Closing Date": closing_date
-            }
-            export_data.append(record)
-        
-        # Export to the desired format
-        if export_format.lower() == "csv":
-            self._export_csv(export_data, output_file)
-        elif export_format.lower() == "excel":
-            self._export_excel(export_data, output_file)
-        else:
-            raise ValueError(f"Unsupported export format: {export_format}")
+        rows = self._closed_position_rows(account_id, start_date, end_date)
+        await write_export(
+            CLOSED_POSITION_HEADER,
+            rows,
+            output_file,
+            export_format=export_format,
+            sheet_name="Closed Positions"
+        )
         
         self.logger.info(
             "Export completed",
@@ -137,46 +172,49 @@ class Exporter:
         )
 
     @error_handler(
-        context_extractor=lambda data, output_file: {"output_file": output_file, "record_count": len(data)},
-        log_message="CSV export failed"
+        context_extractor=lambda dataset, account_ids, output_path, start_date=None, end_date=None, export_format="parquet", partition_by_account=False: {
+            "dataset": dataset,
+            "account_count": len(account_ids),
+            "output_path": output_path,
+            "export_format": export_format,
+            "partition_by_account": partition_by_account
+        },
+        log_message="Failed to export columnar history"
     )
-    def _export_csv(self, data: List[Dict[str, Any]], output_file: str) -> None:
+    async def export_columnar(
+        self,
+        dataset: str,
+        account_ids: List[str],
+        output_path: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        export_format: str = "parquet",
+        partition_by_account: bool = False
+    ) -> Dict[str, Any]:
         """
-        Export data to a CSV file.
+        Export position, trade or daily performance history as Parquet or Arrow.
 
         Args:
-            data: List of records to export.
-            output_file: The file path for the CSV file.
-        """
-        fieldnames = ["Type", "Symbol", "Opening Price", "Closing Price", "PnL", "Exchange", "Closing Date"]
-        with open(output_file, mode="w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-                writer.writerow(row)
+            dataset: "positions", "trades" or "daily_performance".
+            account_ids: Accounts to export.
+            output_path: Output file, or directory when partitioning by account.
+            start_date: Optional start date.
+            end_date: Optional end date.
+            export_format: "parquet" or "arrow".
+            partition_by_account: Write one ``account_id=<id>`` partition per account.
 
-    @error_handler(
-        context_extractor=lambda data, output_file: {"output_file": output_file, "record_count": len(data)},
-        log_message="Excel export failed"
-    )
-    def _export_excel(self, data: List[Dict[str, Any]], output_file: str) -> None:
-        """
-        Export data to an Excel file.
+        Returns:
+            Summary with row, row group and file counts.
 
-        Args:
-            data: List of records to export.
-            output_file: The file path for the Excel file.
-        
         Raises:
-            ImportError: If Pandas is not installed.
+            ValidationError: If the dataset or format is unsupported, or pyarrow is missing.
         """
-        if pd is None:
-            raise ImportError("Pandas is required for Excel export but is not installed.")
-        df = pd.DataFrame(data)
-        df.to_excel(output_file, index=False)
-
-
-# Example call (in an async context):
-# await export_performance_report(sample_data, "performance_report.csv", export_format="csv")
-# await export_performance_report(sample_data, "performance_report.xlsx", export_format="excel")
-# await export_performance_report(sample_data, "performance_report.json", export_format="json")
+        return await write_columnar(
+            dataset,
+            account_ids,
+            output_path,
+            start_date=start_date,
+            end_date=end_date,
+            export_format=export_format,
+            partition_by_account=partition_by_account
+        )
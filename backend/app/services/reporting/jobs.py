@@ -0,0 +1,427 @@
+"""
+Background export jobs.
+
+Long-running exports (multi-year, multi-account group histories) are produced
+outside the HTTP request:
+  - submit() returns a job immediately; identical requests share one job, keyed
+    by a content hash of the export kind and its parameters (a finished export
+    without an end_date runs up to "now", so it is produced again rather than
+    reused)
+  - a fixed pool of worker tasks drains a bounded queue and writes each export
+    to local disk chunk by chunk (``<job_id>.part`` renamed on completion)
+  - progress (bytes/chunks written) is pollable while the job runs
+  - finished artifacts are served with HTTP range support so interrupted
+    downloads can resume, and are removed after EXPORT_JOB_TTL_HOURS
+
+Job state is kept in process memory; a job is only visible to the worker that
+accepted it. Run a single API worker for the export routes (or pin them) when
+several workers are deployed.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.enums import ExportJobStatus
+from app.core.errors.base import NotFoundError, ServiceError, ValidationError
+from app.core.logging.logger import get_logger
+from app.services.reporting.columnar import export_media_type
+from app.services.reporting.streaming import EXPORT_CHUNK_SIZE
+
+logger = get_logger(__name__)
+
+Producer = Callable[[Dict[str, Any]], Awaitable[Tuple[AsyncIterator[bytes], str]]]
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+async def _produce_group_trades(params: Dict[str, Any]) -> Tuple[AsyncIterator[bytes], str]:
+    """Produce a group trade history export."""
+    from beanie import PydanticObjectId
+    from app.crud.crud_group import group as group_crud
+
+    return await group_crud.export_group_trades(
+        group_id=PydanticObjectId(params["group_id"]),
+        format=params.get("format", "csv"),
+        start_date=params.get("start_date"),
+        end_date=params.get("end_date")
+    )
+
+
+async def _produce_group_performance(params: Dict[str, Any]) -> Tuple[AsyncIterator[bytes], str]:
+    """Produce a group performance export."""
+    from beanie import PydanticObjectId
+    from app.crud.crud_group import group as group_crud
+
+    return await group_crud.export_group_performance(
+        group_id=PydanticObjectId(params["group_id"]),
+        period=params.get("period", "daily"),
+        format=params.get("format", "csv"),
+        start_date=params.get("start_date"),
+        end_date=params.get("end_date")
+    )
+
+
+PRODUCERS: Dict[str, Producer] = {
+    "group_trades": _produce_group_trades,
+    "group_performance": _produce_group_performance
+}
+
+
+def export_job_key(kind: str, params: Dict[str, Any]) -> str:
+    """Content hash identifying an export request."""
+    payload = json.dumps({"kind": kind, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class RangeNotSatisfiableError(ValidationError):
+    """A Range starting past the end of the artifact; answered with 416 and ``bytes */size``."""
+
+    def __init__(self, range_header: str, size: int) -> None:
+        super().__init__("Requested range not satisfiable", context={"range": range_header, "size": size})
+        self.size = size
+
+
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range: bytes=start-end`` header.
+
+    A malformed header (or one asking for several ranges) is ignored, as
+    RFC 9110 allows, and the whole artifact is served.
+
+    Returns:
+        Inclusive (start, end) offsets, or None to serve the whole artifact.
+
+    Raises:
+        RangeNotSatisfiableError: If no byte of the range lies within the artifact.
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    start_str, end_str = match.groups()
+    if start_str:
+        start = int(start_str)
+        if end_str and int(end_str) < start:
+            return None
+        if start >= size:
+            raise RangeNotSatisfiableError(range_header, size)
+        end = min(int(end_str), size - 1) if end_str else size - 1
+    else:
+        # Suffix range: the last N bytes
+        length = int(end_str)
+        if length == 0:
+            raise RangeNotSatisfiableError(range_header, size)
+        start = max(size - length, 0)
+        end = size - 1
+    return start, end
+
+
+async def iter_file_range(
+    path: Path,
+    start: int,
+    end: int,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield the inclusive byte range [start, end] of a file in chunks."""
+    remaining = end - start + 1
+    with open(path, mode="rb") as handle:
+        handle.seek(start)
+        while remaining > 0:
+            chunk = handle.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@dataclass
+class ExportJob:
+    """State of a single background export."""
+    job_id: str
+    kind: str
+    params: Dict[str, Any]
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    filename: Optional[str] = None
+    path: Optional[Path] = None
+    bytes_written: int = 0
+    chunks_written: int = 0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def media_type(self) -> str:
+        """Media type derived from the artifact extension."""
+        return export_media_type((self.filename or "").rsplit(".", 1)[-1])
+
+    def is_reusable(self) -> bool:
+        """Whether a new identical request can share this job."""
+        if self.status in (ExportJobStatus.PENDING, ExportJobStatus.RUNNING):
+            return True
+        if not self.params.get("end_date"):
+            # Open-ended range: the finished artifact stops at the time it ran
+            return False
+        return (
+            self.status == ExportJobStatus.COMPLETED
+            and self.path is not None
+            and self.path.exists()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the job for API responses."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "params": self.params,
+            "status": self.status.value,
+            "filename": self.filename,
+            "progress": {
+                "bytes_written": self.bytes_written,
+                "chunks_written": self.chunks_written
+            },
+            "error": self.error,
+            "timestamps": {
+                "created_at": self.created_at.isoformat(),
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None
+            }
+        }
+
+
+class ExportJobManager:
+    """
+    Queue and worker pool for background exports.
+
+    Workers are started lazily on first submit (or explicitly via start()) and
+    stopped on application shutdown.
+    """
+
+    def __init__(self) -> None:
+        self.jobs: Dict[str, ExportJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def export_dir(self) -> Path:
+        return Path(settings.export.EXPORT_DIR)
+
+    async def start(self) -> None:
+        """Create the export directory and start the worker pool."""
+        if self._workers:
+            return
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self._queue = asyncio.Queue(maxsize=settings.export.EXPORT_QUEUE_SIZE)
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(settings.export.EXPORT_WORKERS)
+        ]
+        logger.info(
+            "Started export workers",
+            extra={"workers": len(self._workers), "export_dir": str(self.export_dir)}
+        )
+
+    async def stop(self) -> None:
+        """Cancel the worker pool; running jobs are marked as failed."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        logger.info("Stopped export workers")
+
+    async def submit(self, kind: str, params: Dict[str, Any]) -> ExportJob:
+        """
+        Submit an export job, reusing an identical pending, running or finished job.
+        A finished job is only reused when its date range has an end_date.
+
+        Args:
+            kind: Registered export kind (see PRODUCERS)
+            params: Producer parameters
+
+        Returns:
+            The new or de-duplicated job
+
+        Raises:
+            ValidationError: If the kind is unknown
+            ServiceError: If the queue is full
+        """
+        if kind not in PRODUCERS:
+            raise ValidationError(
+                "Unknown export kind",
+                context={"kind": kind, "supported": list(PRODUCERS)}
+            )
+
+        await self.start()
+        self._cleanup_expired()
+
+        job_id = export_job_key(kind, params)
+        async with self._lock:
+            existing = self.jobs.get(job_id)
+            if existing and existing.is_reusable():
+                logger.info("Reusing export job", extra={"job_id": job_id, "status": existing.status.value})
+                return existing
+
+            job = ExportJob(job_id=job_id, kind=kind, params=params)
+            try:
+                self._queue.put_nowait(job)
+            except asyncio.QueueFull:
+                raise ServiceError(
+                    "Export queue is full",
+                    context={"kind": kind, "queue_size": settings.export.EXPORT_QUEUE_SIZE}
+                )
+            self.jobs[job_id] = job
+
+        logger.info("Submitted export job", extra={"job_id": job_id, "kind": kind})
+        return job
+
+    def get_job(self, job_id: str) -> ExportJob:
+        """
+        Look up a job by ID.
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        job = self.jobs.get(job_id)
+        if not job:
+            raise NotFoundError("Export job not found", context={"job_id": job_id})
+        return job
+
+    def open_artifact(
+        self,
+        job_id: str,
+        range_header: Optional[str] = None
+    ) -> Tuple[AsyncIterator[bytes], Dict[str, str], bool]:
+        """
+        Open a finished artifact for download, honouring a Range header.
+
+        Returns:
+            Tuple of (byte iterator, response headers, is_partial)
+
+        Raises:
+            NotFoundError: If the job or its artifact does not exist
+            ValidationError: If the job is not finished
+            RangeNotSatisfiableError: If the range lies outside the artifact
+        """
+        job = self.get_job(job_id)
+        if job.status != ExportJobStatus.COMPLETED:
+            raise ValidationError(
+                "Export job has not completed",
+                context={"job_id": job_id, "status": job.status.value}
+            )
+        if not job.path or not job.path.exists():
+            raise NotFoundError("Export artifact no longer available", context={"job_id": job_id})
+
+        size = job.path.stat().st_size
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f"attachment; filename={job.filename}",
+            "ETag": f'"{job.job_id}"'
+        }
+
+        byte_range = parse_range_header(range_header, size) if size else None
+        if byte_range is None:
+            headers["Content-Length"] = str(size)
+            return iter_file_range(job.path, 0, size - 1), headers, False
+
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return iter_file_range(job.path, start, end), headers, True
+
+    async def _worker(self, index: int) -> None:
+        """Drain the queue, running one job at a time."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run_job(job)
+            except asyncio.CancelledError:
+                job.status = ExportJobStatus.FAILED
+                job.error = "Export cancelled"
+                raise
+            except Exception as e:
+                job.status = ExportJobStatus.FAILED
+                job.error = str(e)
+                job.finished_at = datetime.utcnow()
+                logger.error(
+                    "Export job failed",
+                    extra={"job_id": job.job_id, "kind": job.kind, "worker": index, "error": str(e)}
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: ExportJob) -> None:
+        """Produce the export into ``<job_id>.part`` and publish it on success."""
+        job.status = ExportJobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+
+        stream, filename = await PRODUCERS[job.kind](job.params)
+        extension = filename.rsplit(".", 1)[-1]
+        part_path = self.export_dir / f"{job.job_id}.part"
+        final_path = self.export_dir / f"{job.job_id}.{extension}"
+
+        try:
+            with open(part_path, mode="wb") as handle:
+                async for chunk in stream:
+                    handle.write(chunk)
+                    job.bytes_written += len(chunk)
+                    job.chunks_written += 1
+            os.replace(part_path, final_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        job.filename = filename
+        job.path = final_path
+        job.status = ExportJobStatus.COMPLETED
+        job.finished_at = datetime.utcnow()
+
+        logger.info(
+            "Export job completed",
+            extra={
+                "job_id": job.job_id,
+                "kind": job.kind,
+                "bytes": job.bytes_written,
+                "duration": (job.finished_at - job.started_at).total_seconds()
+            }
+        )
+
+    def _cleanup_expired(self) -> None:
+        """Drop finished jobs and artifacts older than the retention window."""
+        cutoff = datetime.utcnow() - timedelta(hours=settings.export.EXPORT_JOB_TTL_HOURS)
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished_at and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            job = self.jobs.pop(job_id)
+            if job.path:
+                job.path.unlink(missing_ok=True)
+        if expired:
+            logger.info("Removed expired export jobs", extra={"count": len(expired)})
+
+
+export_jobs = ExportJobManager()
+
+__all__ = [
+    "ExportJob",
+    "ExportJobManager",
+    "PRODUCERS",
+    "export_job_key",
+    "RangeNotSatisfiableError",
+    "parse_range_header",
+    "iter_file_range",
+    "export_jobs"
+]
@@ -0,0 +1,290 @@
+"""
+Streaming export helpers.
+
+This module turns MongoDB cursors into bounded async row generators and encodes
+them incrementally, so exports never hold the full result set in memory:
+  - iter_batches / iter_rows: cursor -> batches -> formatted rows
+  - stream_csv: rows -> CSV byte chunks, flushed every EXPORT_CHUNK_SIZE bytes
+  - write_xlsx / stream_xlsx: rows -> XLSX using xlsxwriter's constant_memory mode
+  - stream_export: format dispatch used by CRUD exports and API endpoints
+
+The byte generators can be passed straight to a FastAPI ``StreamingResponse``.
+"""
+
+import asyncio
+import csv
+import io
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from app.core.config.constants import system_constants
+from app.core.errors.base import ValidationError
+from app.core.logging.logger import get_logger
+
+try:
+    from bson import Decimal128, ObjectId
+except ImportError:
+    Decimal128 = ObjectId = None
+
+# Try to import xlsxwriter for Excel exports, with fallback to csv-only if not available
+try:
+    import xlsxwriter
+    EXCEL_SUPPORT = True
+except ImportError:
+    EXCEL_SUPPORT = False
+
+logger = get_logger(__name__)
+
+# Rows fetched per cursor round-trip and bytes buffered before a chunk is yielded
+EXPORT_BATCH_SIZE = system_constants.BATCH_SIZE
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+}
+
+
+def normalize_export_format(export_format: str) -> str:
+    """
+    Normalize a requested export format to "csv" or "xlsx".
+
+    "excel" is accepted as an alias of "xlsx". XLSX silently falls back to CSV when
+    xlsxwriter is not installed, matching the existing group export behaviour.
+
+    Raises:
+        ValidationError: If the format is not supported.
+    """
+    fmt = (export_format or "csv").lower()
+    if fmt == "excel":
+        fmt = "xlsx"
+    if fmt not in EXPORT_MEDIA_TYPES:
+        raise ValidationError(
+            "Unsupported export format",
+            context={"format": export_format, "supported": list(EXPORT_MEDIA_TYPES)}
+        )
+    if fmt == "xlsx" and not EXCEL_SUPPORT:
+        return "csv"
+    return fmt
+
+
+def export_cell(value: Any) -> Any:
+    """Convert a raw BSON value into a CSV/XLSX friendly cell value."""
+    if value is None:
+        return ""
+    if Decimal128 is not None and isinstance(value, Decimal128):
+        return value.to_decimal()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if ObjectId is not None and isinstance(value, ObjectId):
+        return str(value)
+    return value
+
+
+async def iter_batches(
+    cursor: Any,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Read a Motor cursor in fixed-size batches.
+
+    Args:
+        cursor: Motor cursor (find or aggregate).
+        batch_size: Documents per yielded batch.
+    """
+    if hasattr(cursor, "batch_size"):
+        cursor = cursor.batch_size(batch_size)
+
+    batch: List[Dict[str, Any]] = []
+    async for document in cursor:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def iter_rows(
+    cursor: Any,
+    formatter: Callable[[Dict[str, Any]], Sequence[Any]],
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[Sequence[Any]]:
+    """
+    Format cursor documents into export rows one batch at a time.
+
+    Args:
+        cursor: Motor cursor yielding raw documents.
+        formatter: Maps a raw document to a row.
+        batch_size: Documents fetched per batch.
+    """
+    async for batch in iter_batches(cursor, batch_size):
+        for document in batch:
+            yield formatter(document)
+
+
+async def stream_csv(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Encode rows as CSV incrementally.
+
+    Args:
+        header: Column titles.
+        rows: Async iterable of row sequences.
+        chunk_size: Bytes buffered before a chunk is yielded.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    async for row in rows:
+        writer.writerow([export_cell(value) for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def write_csv(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    output_file: str
+) -> int:
+    """
+    Write rows to a CSV file without materializing them.
+
+    Returns:
+        Number of bytes written.
+    """
+    written = 0
+    with open(output_file, mode="wb") as handle:
+        async for chunk in stream_csv(header, rows):
+            handle.write(chunk)
+            written += len(chunk)
+    return written
+
+
+async def write_xlsx(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    output_file: str,
+    sheet_name: str = "Export"
+) -> int:
+    """
+    Write rows to an XLSX file using xlsxwriter's constant_memory mode.
+
+    Each row is flushed to disk as soon as the next one starts, so memory stays
+    flat regardless of row count. Closing the workbook (zip compression) runs in
+    a worker thread to keep the event loop free.
+
+    Returns:
+        Number of data rows written.
+
+    Raises:
+        ImportError: If xlsxwriter is not installed.
+    """
+    if not EXCEL_SUPPORT:
+        raise ImportError("xlsxwriter is required for Excel export but is not installed.")
+
+    workbook = xlsxwriter.Workbook(output_file, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, list(header))
+
+        row_index = 0
+        async for row in rows:
+            row_index += 1
+            worksheet.write_row(row_index, 0, [export_cell(value) for value in row])
+    finally:
+        await asyncio.to_thread(workbook.close)
+
+    return row_index
+
+
+async def stream_xlsx(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    sheet_name: str = "Export",
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Build an XLSX export in a temporary file and stream it back in chunks.
+
+    XLSX is a zip archive, so bytes can only be sent once the workbook is closed;
+    the rows themselves are still never held in memory.
+    """
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        await write_xlsx(header, rows, path, sheet_name=sheet_name)
+        with open(path, mode="rb") as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning("Failed to remove temporary export file", extra={"path": path, "error": str(e)})
+
+
+def stream_export(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    export_format: str = "csv",
+    sheet_name: str = "Export"
+) -> AsyncIterator[bytes]:
+    """
+    Return a byte stream for the requested format ("csv" or "xlsx").
+
+    Args:
+        header: Column titles.
+        rows: Async iterable of row sequences.
+        export_format: Normalized export format.
+        sheet_name: Worksheet name for XLSX output.
+    """
+    if normalize_export_format(export_format) == "xlsx":
+        return stream_xlsx(header, rows, sheet_name=sheet_name)
+    return stream_csv(header, rows)
+
+
+async def write_export(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    output_file: str,
+    export_format: str = "csv",
+    sheet_name: Optional[str] = None
+) -> None:
+    """Write rows to ``output_file`` in the requested format."""
+    if normalize_export_format(export_format) == "xlsx":
+        await write_xlsx(header, rows, output_file, sheet_name=sheet_name or "Export")
+    else:
+        await write_csv(header, rows, output_file)
+
+
+__all__ = [
+    "EXCEL_SUPPORT",
+    "EXPORT_BATCH_SIZE",
+    "EXPORT_CHUNK_SIZE",
+    "EXPORT_MEDIA_TYPES",
+    "normalize_export_format",
+    "export_cell",
+    "iter_batches",
+    "iter_rows",
+    "stream_csv",
+    "write_csv",
+    "write_xlsx",
+    "stream_xlsx",
+    "stream_export",
+    "write_export"
+]
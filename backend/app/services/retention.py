@@ -0,0 +1,258 @@
+"""
+Retention of historical collections.
+
+Expired data is removed by MongoDB itself wherever the schema allows it and in
+bounded, index-served chunks everywhere else, so cleanup is a constant-cost
+background activity rather than a Python loop over documents:
+  - a collection whose retention field is a BSON date and which is not
+    archived gets a TTL index on that field; MongoDB's TTL monitor expires the
+    documents continuously
+  - otherwise the cleanup job removes expired data oldest first, one
+    ``delete_many`` per RETENTION_CHUNK_DAYS range hinted onto the field's
+    index, pausing between chunks and stopping after
+    RETENTION_MAX_CHUNKS_PER_RUN (the remainder is picked up by the next run)
+  - with RETENTION_ARCHIVE_ENABLED, closed trades and positions are first
+    written to ``<RETENTION_ARCHIVE_DIR>/<collection>/<chunk start>-<run
+    time>.jsonl.gz`` (extended JSON, one document per line); a chunk is only
+    deleted once its archive is complete, and documents of the same chunk
+    that expire in a later run go to a new file instead of replacing it
+
+DailyPerformance stores its day as a ``YYYY-MM-DD`` string, which TTL indexes
+cannot use, so it is always cleaned up in chunks.
+"""
+
+import asyncio
+import gzip
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import json_util
+
+from app.core.config import settings
+from app.core.logging.logger import get_logger
+from app.core.metrics import retention_documents
+
+logger = get_logger(__name__)
+
+_ARCHIVE_BATCH_SIZE = 1000
+_DATE_FORMAT = "%Y-%m-%d"
+# Run time in archive names: a chunk archived again later never replaces an earlier file
+_ARCHIVE_TIME_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+
+@dataclass
+class RetentionPolicy:
+    """How long one collection keeps its documents and how they are removed."""
+    collection: str
+    field: str
+    retention_days: Optional[int]
+    archive: bool = False
+    string_dates: bool = False
+
+    @property
+    def uses_ttl(self) -> bool:
+        return self.retention_days is not None and not self.archive and not self.string_dates
+
+    def bound(self, moment: datetime) -> Any:
+        """A chunk boundary as stored in ``field``."""
+        return moment.strftime(_DATE_FORMAT) if self.string_dates else moment
+
+    def moment(self, value: Any) -> datetime:
+        return datetime.strptime(value, _DATE_FORMAT) if self.string_dates else value
+
+
+def retention_policies() -> List[RetentionPolicy]:
+    archive = settings.retention.RETENTION_ARCHIVE_ENABLED
+    return [
+        RetentionPolicy(
+            "daily_performance", "date",
+            settings.performance.PERFORMANCE_RECORD_RETENTION_DAYS, string_dates=True
+        ),
+        RetentionPolicy("trades", "closed_at", settings.retention.TRADE_RETENTION_DAYS, archive=archive),
+        RetentionPolicy(
+            "position_history", "closed_at", settings.retention.POSITION_HISTORY_RETENTION_DAYS, archive=archive
+        ),
+    ]
+
+
+class RetentionService:
+    """Applies the retention policies: TTL indexes at startup, chunked cleanup on schedule."""
+
+    def __init__(self, policies_factory: Callable[[], List[RetentionPolicy]] = retention_policies) -> None:
+        self._policies_factory = policies_factory
+        self._lock = asyncio.Lock()
+        self.last_run: Dict[str, Any] = {}
+
+    @staticmethod
+    def _collection(name: str):
+        from app.db.db import db
+        return db.client[settings.database.MONGODB_DB_NAME][name]
+
+    # ---------------------------
+    # TTL indexes
+    # ---------------------------
+    async def ensure_indexes(self) -> Dict[str, str]:
+        """
+        Give every policy's field a single-field index: a TTL index when
+        MongoDB expires the collection, a plain one (used as the chunk
+        deletion hint) otherwise. Existing indexes on the field are converted
+        in place.
+        """
+        actions: Dict[str, str] = {}
+        for policy in self._policies_factory():
+            actions[policy.collection] = await self._ensure_index(policy)
+        logger.info("Retention indexes checked", extra={"actions": actions})
+        return actions
+
+    async def _ensure_index(self, policy: RetentionPolicy) -> str:
+        collection = self._collection(policy.collection)
+        expire = int(timedelta(days=policy.retention_days).total_seconds()) if policy.uses_ttl else None
+        key = [(policy.field, 1)]
+        existing = next(
+            (
+                (name, spec) for name, spec in (await collection.index_information()).items()
+                if list(spec["key"]) == key
+            ),
+            None
+        )
+        if existing is None:
+            options = {"expireAfterSeconds": expire} if expire is not None else {}
+            await collection.create_index(key, **options)
+            return "created_ttl" if expire is not None else "created"
+
+        name, spec = existing
+        current = spec.get("expireAfterSeconds")
+        if current == expire:
+            return "unchanged"
+        if current is not None and expire is not None:
+            await collection.database.command(
+                "collMod", policy.collection, index={"name": name, "expireAfterSeconds": expire}
+            )
+            return "ttl_updated"
+        await collection.drop_index(name)
+        options = {"expireAfterSeconds": expire} if expire is not None else {}
+        await collection.create_index(key, name=name, **options)
+        return "converted_to_ttl" if expire is not None else "ttl_removed"
+
+    # ---------------------------
+    # Chunked cleanup
+    # ---------------------------
+    async def run(self) -> Dict[str, Any]:
+        """Remove expired documents of every chunked policy; TTL policies need no work."""
+        async with self._lock:
+            results = {}
+            for policy in self._policies_factory():
+                if policy.retention_days is None:
+                    results[policy.collection] = {"mode": "keep"}
+                elif policy.uses_ttl:
+                    results[policy.collection] = {"mode": "ttl"}
+                else:
+                    results[policy.collection] = await self.cleanup(policy)
+            self.last_run = {"finished_at": datetime.utcnow().isoformat(), "results": results}
+            return results
+
+    async def cleanup(self, policy: RetentionPolicy) -> Dict[str, Any]:
+        """
+        Delete (and optionally archive) up to RETENTION_MAX_CHUNKS_PER_RUN
+        chunks of documents older than the policy's retention period.
+        """
+        collection = self._collection(policy.collection)
+        cutoff = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+            days=policy.retention_days
+        )
+        chunk = timedelta(days=settings.retention.RETENTION_CHUNK_DAYS)
+        hint = [(policy.field, 1)]
+        result = {
+            "mode": "archive" if policy.archive else "delete",
+            "cutoff": policy.bound(cutoff),
+            "chunks": 0,
+            "deleted": 0,
+            "archived": 0,
+            "complete": False
+        }
+
+        for _ in range(settings.retention.RETENTION_MAX_CHUNKS_PER_RUN):
+            oldest = await collection.find_one(
+                {policy.field: {"$lt": policy.bound(cutoff)}},
+                {policy.field: 1},
+                sort=hint,
+                hint=hint
+            )
+            if oldest is None:
+                result["complete"] = True
+                break
+            start = policy.moment(oldest[policy.field]).replace(hour=0, minute=0, second=0, microsecond=0)
+            end = min(start + chunk, cutoff)
+            query = {policy.field: {"$gte": policy.bound(start), "$lt": policy.bound(end)}}
+
+            if policy.archive:
+                result["archived"] += await self._archive_chunk(collection, policy, query, hint, start)
+            deleted = (await collection.delete_many(query, hint=hint)).deleted_count
+            retention_documents.inc(policy.collection, "deleted", amount=deleted)
+            result["deleted"] += deleted
+            result["chunks"] += 1
+            await asyncio.sleep(settings.retention.RETENTION_CHUNK_PAUSE_SECONDS)
+
+        logger.info("Retention cleanup finished", extra={"collection": policy.collection, **result})
+        return result
+
+    async def _archive_chunk(
+        self,
+        collection: Any,
+        policy: RetentionPolicy,
+        query: Dict[str, Any],
+        hint: List[Any],
+        start: datetime
+    ) -> int:
+        """Write one chunk to ``<start>-<now>.jsonl.gz`` (via ``.part``) and return the document count."""
+        archive_dir = Path(settings.retention.RETENTION_ARCHIVE_DIR) / policy.collection
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        written_at = datetime.utcnow().strftime(_ARCHIVE_TIME_FORMAT)
+        final_path = archive_dir / f"{start.strftime(_DATE_FORMAT)}-{written_at}.jsonl.gz"
+        part_path = final_path.with_suffix(".part")
+
+        count = 0
+        try:
+            with gzip.open(part_path, mode="wb") as handle:
+                cursor = collection.find(query, hint=hint, batch_size=_ARCHIVE_BATCH_SIZE)
+                batch: List[str] = []
+                async for doc in cursor:
+                    batch.append(json_util.dumps(doc, json_options=json_util.CANONICAL_JSON_OPTIONS))
+                    if len(batch) >= _ARCHIVE_BATCH_SIZE:
+                        count += len(batch)
+                        await asyncio.to_thread(handle.write, ("\n".join(batch) + "\n").encode("utf-8"))
+                        batch = []
+                if batch:
+                    count += len(batch)
+                    await asyncio.to_thread(handle.write, ("\n".join(batch) + "\n").encode("utf-8"))
+            os.replace(part_path, final_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        retention_documents.inc(policy.collection, "archived", amount=count)
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "policies": [
+                {
+                    "collection": policy.collection,
+                    "field": policy.field,
+                    "retention_days": policy.retention_days,
+                    "mode": "keep" if policy.retention_days is None
+                    else "ttl" if policy.uses_ttl
+                    else "archive" if policy.archive else "delete"
+                }
+                for policy in self._policies_factory()
+            ],
+            "last_run": self.last_run
+        }
+
+
+retention_service = RetentionService()
+
+__all__ = ["RetentionPolicy", "RetentionService", "retention_policies", "retention_service"]
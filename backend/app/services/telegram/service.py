@@ -5,27 +5,92 @@ Key changes:
 • Removed the explicit start() method.
 • Lazy initialization is now performed within send_message() if the service isn’t already connected.
 • The stop() method is simplified to shut down background tasks if needed.
+
+Outgoing messages go through a digest pipeline:
+• one queue per NotificationPriority; critical messages are sent first and
+  without waiting, others wait TELEGRAM_DIGEST_WINDOW seconds so that bursts
+  (e.g. trade notifications for a 50-account fan-out) coalesce into a few
+  digest messages of up to Telegram's 4096 characters
+• sends are paced per chat with GCRA (TELEGRAM_MESSAGES_PER_SECOND, plus
+  TELEGRAM_GROUP_MESSAGES_PER_MINUTE for group chats); a RetryAfter from the
+  API pauses the sender and requeues the digest
+• any other send error requeues the digest after TELEGRAM_RETRY_DELAY;
+  messages that have failed TELEGRAM_MAX_SEND_ATTEMPTS times are dropped
+• when the queue is full, the oldest lower-priority message is dropped to
+  make room; critical messages are always accepted
 """
 
 import asyncio
-from datetime import datetime
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from decimal import Decimal
 from functools import wraps
-from typing import Optional, Dict, List
+from typing import Any, Deque, Optional, Dict, List, Tuple
 
 from telegram import Bot
+from telegram.error import RetryAfter
 from telegram.ext import Application, ApplicationBuilder
 
 from app.core.config.settings import settings
+from app.core.enums import NotificationPriority
 from app.core.errors.base import ConfigurationError, ServiceError, ValidationError
 from app.core.errors.handlers import handle_api_error
 from app.core.logging.logger import get_logger
+from app.core.metrics import telegram_api_sends, telegram_messages, telegram_queue_depth, telegram_send_latency
 from app.services.reference.manager import reference_manager
 from app.services.performance.service import performance_service
 from app.services.websocket.manager import ws_manager
 
 logger = get_logger(__name__)
 
+# Telegram rejects longer message texts
+MAX_MESSAGE_LENGTH = 4096
+DIGEST_SEPARATOR = "\n\n"
+# Highest priority first
+_PRIORITY_ORDER = (NotificationPriority.CRITICAL, NotificationPriority.HIGH, NotificationPriority.NORMAL)
+
+
+@dataclass
+class QueuedMessage:
+    """A message waiting for the sender."""
+    text: str
+    parse_mode: Optional[str]
+    priority: NotificationPriority
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+
+class ChatRateLimiter:
+    """
+    Paces sends to one chat with GCRA (as in app.api.v1.rate_limit): each
+    (limit, period) window keeps one theoretical arrival time, and a send may
+    go out once every window admits it.
+    """
+
+    def __init__(self, windows: List[Tuple[int, float]]) -> None:
+        self.windows = windows
+        self._tats = [0.0] * len(windows)
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next send is admitted."""
+        return max(
+            max(tat, now) + period / limit - period - now
+            for (limit, period), tat in zip(self.windows, self._tats)
+        )
+
+    async def acquire(self) -> None:
+        while (wait := self.delay(time.monotonic())) > 0:
+            await asyncio.sleep(wait)
+        now = time.monotonic()
+        self._tats = [max(tat, now) + period / limit for (limit, period), tat in zip(self.windows, self._tats)]
+
+    def pause(self, seconds: float) -> None:
+        """Push every window back, e.g. after a RetryAfter from the API."""
+        resume = time.monotonic() + seconds
+        self._tats = [max(tat, resume) for tat in self._tats]
+
 
 def handle_service_errors(func):
     @wraps(func)
@@ -57,15 +122,28 @@ class TelegramService:
         self.app: Optional[Application] = None
         self.bot: Optional[Bot] = None
         self._connected: bool = False
-        self._message_queue: asyncio.Queue = asyncio.Queue(
-            maxsize=settings.telegram.TELEGRAM_MESSAGE_QUEUE_SIZE
-        )
+        self._queues: Dict[NotificationPriority, Deque[QueuedMessage]] = {
+            priority: deque() for priority in _PRIORITY_ORDER
+        }
+        self._pending = asyncio.Event()
+        self._critical_pending = asyncio.Event()
+        self._rate_limiter = ChatRateLimiter(self._rate_windows(self.chat_id))
         self._message_task: Optional[asyncio.Task] = None
+        self.stats = {"queued": 0, "sent": 0, "dropped": 0, "failed": 0, "api_sends": 0}
         self._error_counts: Dict[str, int] = {}
         self._last_notification: Dict[str, datetime] = {}
         self._notification_lock = asyncio.Lock()
         self.logger = get_logger("telegram_service")
 
+    @staticmethod
+    def _rate_windows(chat_id: str) -> List[Tuple[int, float]]:
+        """(limit, period) send windows for a chat; group chat IDs are negative."""
+        per_second = settings.telegram.TELEGRAM_MESSAGES_PER_SECOND
+        windows = [(1, 1.0 / per_second)]
+        if str(chat_id).startswith("-"):
+            windows.append((settings.telegram.TELEGRAM_GROUP_MESSAGES_PER_MINUTE, 60.0))
+        return windows
+
     def _current_time_str(self) -> str:
         return datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
 
@@ -115,49 +193,203 @@ class TelegramService:
                 await self._message_task
             except asyncio.CancelledError:
                 pass
+        if self._connected and self.bot:
+            # Flush what is still queued (including the shutdown notice) without the digest wait
+            try:
+                await asyncio.wait_for(self._drain(), timeout=settings.telegram.TELEGRAM_RETRY_DELAY)
+            except asyncio.TimeoutError:
+                self.logger.warning("Telegram queue not drained before shutdown", extra={
+                    "pending": self._queued_count()
+                })
         if self.app:
             await self.app.shutdown()
         self._connected = False
         self.logger.info("Telegram service stopped")
 
+    # ---------------------------
+    # Queueing
+    # ---------------------------
+    def _queued_count(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _update_depth(self) -> None:
+        for priority, queue in self._queues.items():
+            telegram_queue_depth.set(len(queue), priority.value)
+
+    def _enqueue(self, queued: QueuedMessage) -> bool:
+        """Queue a message, evicting the oldest lower-priority one when full."""
+        if self._queued_count() >= settings.telegram.TELEGRAM_MESSAGE_QUEUE_SIZE:
+            rank = _PRIORITY_ORDER.index(queued.priority)
+            lower = [self._queues[priority] for priority in reversed(_PRIORITY_ORDER[rank + 1:]) if self._queues[priority]]
+            if not lower and queued.priority is not NotificationPriority.CRITICAL:
+                self.stats["dropped"] += 1
+                telegram_messages.inc("dropped")
+                return False
+            if lower:
+                lower[0].popleft()
+                self.stats["dropped"] += 1
+                telegram_messages.inc("dropped")
+
+        self._queues[queued.priority].append(queued)
+        self.stats["queued"] += 1
+        telegram_messages.inc("queued")
+        self._update_depth()
+        self._pending.set()
+        if queued.priority is NotificationPriority.CRITICAL:
+            self._critical_pending.set()
+        return True
+
+    def _next_digest(self) -> List[QueuedMessage]:
+        """
+        Pop the next batch to send: highest priority first, same parse mode,
+        up to MAX_MESSAGE_LENGTH once joined.
+        """
+        batch: List[QueuedMessage] = []
+        length = 0
+        for priority in _PRIORITY_ORDER:
+            queue = self._queues[priority]
+            while queue:
+                candidate = queue[0]
+                if batch and (
+                    candidate.parse_mode != batch[0].parse_mode
+                    or length + len(DIGEST_SEPARATOR) + len(candidate.text) > MAX_MESSAGE_LENGTH - 64
+                ):
+                    return batch
+                batch.append(queue.popleft())
+                length += len(candidate.text) + len(DIGEST_SEPARATOR)
+            if batch and priority is NotificationPriority.CRITICAL:
+                # Critical alerts go out on their own, ahead of any digest
+                return batch
+        return batch
+
+    @staticmethod
+    def _digest_text(batch: List[QueuedMessage]) -> str:
+        if len(batch) == 1:
+            return batch[0].text[:MAX_MESSAGE_LENGTH]
+        header = f"📬 {len(batch)} notifications"
+        return (header + DIGEST_SEPARATOR + DIGEST_SEPARATOR.join(m.text for m in batch))[:MAX_MESSAGE_LENGTH]
+
+    def _requeue(self, batch: List[QueuedMessage]) -> None:
+        """Put an unsent batch back at the front of its queues, in order."""
+        for queued in reversed(batch):
+            self._queues[queued.priority].appendleft(queued)
+        self._update_depth()
+
+    # ---------------------------
+    # Sending
+    # ---------------------------
+    async def _send_digest(self, batch: List[QueuedMessage]) -> None:
+        await self._rate_limiter.acquire()
+        try:
+            await self.bot.send_message(
+                chat_id=self.chat_id, text=self._digest_text(batch), parse_mode=batch[0].parse_mode
+            )
+        except RetryAfter as e:
+            # Flood control: requeue in order and pause the whole chat
+            retry_after = e.retry_after
+            if isinstance(retry_after, timedelta):
+                retry_after = retry_after.total_seconds()
+            self._requeue(batch)
+            self._rate_limiter.pause(float(retry_after))
+            telegram_api_sends.inc("retry_after")
+            self.logger.warning("Telegram flood control; pausing sends", extra={
+                "retry_after": retry_after, "requeued": len(batch)
+            })
+            return
+        except Exception as e:
+            telegram_api_sends.inc("error")
+            for queued in batch:
+                queued.attempts += 1
+            retry = [queued for queued in batch if queued.attempts < settings.telegram.TELEGRAM_MAX_SEND_ATTEMPTS]
+            failed = len(batch) - len(retry)
+            self._requeue(retry)
+            if failed:
+                self.stats["failed"] += failed
+                telegram_messages.inc("failed", amount=failed)
+            # Logged rather than routed through handle_api_error: its notification
+            # would come back through this queue and fail the same way
+            self.logger.error("Failed to send Telegram message", extra={
+                "error": str(e), "messages": len(batch), "requeued": len(retry), "dropped": failed
+            })
+            await asyncio.sleep(settings.telegram.TELEGRAM_RETRY_DELAY)
+            return
+
+        now = time.monotonic()
+        for queued in batch:
+            telegram_send_latency.observe(now - queued.enqueued_at, queued.priority.value)
+        self.stats["sent"] += len(batch)
+        self.stats["api_sends"] += 1
+        telegram_messages.inc("sent", amount=len(batch))
+        telegram_api_sends.inc("ok")
+
     async def _process_message_queue(self) -> None:
         """
-        Continuously process messages from the internal queue.
+        Continuously send queued messages: critical ones immediately, the
+        rest coalesced into digests after TELEGRAM_DIGEST_WINDOW.
         """
         while True:
             try:
-                message, parse_mode = await self._message_queue.get()
-                if not self._connected or not self.bot:
-                    self.logger.warning("Cannot send message – service not connected")
-                    self._message_queue.task_done()
-                    continue
-                await self.bot.send_message(
-                    chat_id=self.chat_id, text=message, parse_mode=parse_mode
-                )
-                await asyncio.sleep(0.035)
-                self._message_queue.task_done()
+                await self._pending.wait()
+                self._pending.clear()
+                if not self._queues[NotificationPriority.CRITICAL]:
+                    # Let a burst accumulate; a critical message cuts the wait short
+                    try:
+                        await asyncio.wait_for(
+                            self._critical_pending.wait(), timeout=settings.telegram.TELEGRAM_DIGEST_WINDOW
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                self._critical_pending.clear()
+
+                while self._queued_count():
+                    if not self._connected or not self.bot:
+                        self.logger.warning("Cannot send message – service not connected")
+                        break
+                    batch = self._next_digest()
+                    self._update_depth()
+                    await self._send_digest(batch)
+                self._update_depth()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                await handle_api_error(
-                    error=e,
-                    context={"message_type": "telegram"},
-                    log_message="Failed to process Telegram message"
-                )
+                self.logger.error("Telegram sender error", extra={"error": str(e)})
                 await asyncio.sleep(1)
 
+    async def _drain(self) -> None:
+        while self._queued_count():
+            await self._send_digest(self._next_digest())
+
     @handle_service_errors
-    async def send_message(self, message: str, parse_mode: str = "HTML") -> bool:
+    async def send_message(
+        self,
+        message: str,
+        parse_mode: str = "HTML",
+        priority: NotificationPriority = NotificationPriority.NORMAL
+    ) -> bool:
         """
-        Send a message to the configured Telegram chat.
+        Queue a message for the configured Telegram chat.
         If the service is not connected, lazy initialization is triggered.
+
+        Returns:
+            False if the queue was full and the message was dropped
         """
         if not self._connected:
             await self._lazy_init()
         if not message.strip():
             raise ValidationError("Empty message", context={"parse_mode": parse_mode})
-        await self._message_queue.put((message, parse_mode))
-        return True
+        return self._enqueue(QueuedMessage(message, parse_mode, priority))
+
+    async def send_error_notification(
+        self, message: str, priority: NotificationPriority = NotificationPriority.HIGH
+    ) -> bool:
+        """Queue an error alert from the error handler."""
+        return await self.send_message(message, parse_mode=None, priority=priority)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued_now": {priority.value: len(queue) for priority, queue in self._queues.items()},
+        }
 
     @handle_service_errors
     async def notify_trade_executed(self, trade: Dict) -> None:
@@ -248,7 +480,8 @@ class TelegramService:
             f"Occurrence: #{self._error_counts[error_type]}\n"
             f"Time: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}"
         )
-        await self.send_message(message)
+        priority = NotificationPriority.CRITICAL if severity.upper() == "CRITICAL" else NotificationPriority.HIGH
+        await self.send_message(message, priority=priority)
         self.logger.warning(
             "Error notification sent",
             extra={"error_type": error_type, "severity": severity, "count": self._error_counts[error_type]}
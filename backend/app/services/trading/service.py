@@ -8,13 +8,17 @@ It centralizes the creation of ExchangeOperations objects with all required
 dependencies and ensures consistent parameter handling across the application.
 """
 
+import time
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 from decimal import Decimal
 
 from app.core.errors.base import ExchangeError, ValidationError
 from app.core.errors.decorators import error_handler
 from app.core.logging.logger import get_logger
+from app.core.metrics import signal_account_results, signal_fanout_duration
 from app.core.references import TradeSource, OrderType
+from app.core.tracing import tracer
 
 # Import dependencies that will be injected into ExchangeOperations
 from app.services.exchange.factory import exchange_factory
@@ -439,12 +443,14 @@ class TradingService:
         if size is None and risk_percentage is not None and leverage is not None:
             # Use the first account for sample size calculation
             try:
-                size = await self.calculate_trade_size(
-                    account_id=accounts[0],
-                    symbol=symbol,
-                    risk_percentage=risk_percentage,
-                    leverage=leverage
-                )
+                with tracer.span("signal.size", account_id=accounts[0], symbol=symbol) as sizing:
+                    size = await self.calculate_trade_size(
+                        account_id=accounts[0],
+                        symbol=symbol,
+                        risk_percentage=risk_percentage,
+                        leverage=leverage
+                    )
+                    sizing.set(size=str(size))
             except Exception as e:
                 self.logger.warning(
                     f"Failed to pre-calculate size: {str(e)}",
@@ -456,53 +462,63 @@ class TradingService:
         results = []
         success_count = 0
         error_count = 0
+        fanout_started = time.perf_counter()
         
         for account_id in accounts:
-            try:
-                # Get exchange operations instance
-                ops = await self.get_operations(account_id)
+            with tracer.span("signal.account", account_id=account_id) as account_span:
+                try:
+                    # Get exchange operations instance
+                    ops = await self.get_operations(account_id)
                 
-                # Choose between place_signal and place_ladder based on signal_type
-                if is_ladder:
-                    # Execute ladder order
-                    trade_result = await ops.place_ladder(
-                        symbol=symbol,
-                        side=side,
-                        size=size,
-                        client_id=f"{bot_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
-                        take_profit=take_profit,
-                        leverage=leverage
-                    )
-                else:
-                    # Execute regular signal order
-                    trade_result = await ops.place_signal(
-                        symbol=symbol,
-                        side=side,
-                        size=size,
-                        client_id=f"{bot_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
-                        leverage=leverage,
-                        take_profit=take_profit
-                    )
+                    # Choose between place_signal and place_ladder based on signal_type
+                    if is_ladder:
+                        # Execute ladder order
+                        trade_result = await ops.place_ladder(
+                            symbol=symbol,
+                            side=side,
+                            size=size,
+                            client_id=f"{bot_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+                            take_profit=take_profit,
+                            leverage=leverage
+                        )
+                    else:
+                        # Execute regular signal order
+                        trade_result = await ops.place_signal(
+                            symbol=symbol,
+                            side=side,
+                            size=size,
+                            client_id=f"{bot_id}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+                            leverage=leverage,
+                            take_profit=take_profit
+                        )
                 
-                results.append({
-                    "account_id": account_id,
-                    "success": True,
-                    "details": trade_result
-                })
-                success_count += 1
+                    results.append({
+                        "account_id": account_id,
+                        "success": True,
+                        "details": trade_result
+                    })
+                    success_count += 1
+                    account_span.set(outcome="success")
                 
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to process signal for account {account_id}",
-                    extra={"bot_id": bot_id, "account_id": account_id, "error": str(e)}
-                )
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to process signal for account {account_id}",
+                        extra={"bot_id": bot_id, "account_id": account_id, "error": str(e)}
+                    )
                 
-                results.append({
-                    "account_id": account_id,
-                    "success": False,
-                    "error": str(e)
-                })
-                error_count += 1
+                    results.append({
+                        "account_id": account_id,
+                        "success": False,
+                        "error": str(e)
+                    })
+                    error_count += 1
+                    account_span.set(outcome="error", error=str(e))
+        
+        signal_fanout_duration.observe(
+            time.perf_counter() - fanout_started, "ladder" if is_ladder else "signal"
+        )
+        signal_account_results.inc("success", amount=success_count)
+        signal_account_results.inc("error", amount=error_count)
         
         # Return comprehensive results
         return {
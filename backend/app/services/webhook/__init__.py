@@ -0,0 +1,23 @@
+"""
+Webhook ingestion services.
+"""
+
+from app.services.webhook.forwarder import ForwardDelivery, WebhookForwarder, webhook_forwarder
+from app.services.webhook.ingestion import (
+    QueuedSignal,
+    SignalIngestor,
+    SignalOutcome,
+    signal_fingerprint,
+    signal_ingestor
+)
+
+__all__ = [
+    "ForwardDelivery",
+    "WebhookForwarder",
+    "webhook_forwarder",
+    "QueuedSignal",
+    "SignalIngestor",
+    "SignalOutcome",
+    "signal_fingerprint",
+    "signal_ingestor"
+]
@@ -0,0 +1,288 @@
+"""
+Background webhook forwarding.
+
+Forwarding a signal to WEBHOOK_FORWARD_URL is best-effort and must never delay
+trade execution, so the webhook handler only enqueues a delivery (O(1), no
+I/O) and a small worker pool delivers it:
+  - one persistent aiohttp session (connection reuse, keep-alive)
+  - bounded in-memory queue of WEBHOOK_FORWARD_QUEUE_SIZE deliveries
+  - transport errors, 408/429 and 5xx responses are retried with exponential
+    backoff and jitter; other 4xx responses are dropped
+  - deliveries that exhaust their attempts, or arrive while the queue is full,
+    are appended to a JSON-lines spill file and replayed every
+    WEBHOOK_FORWARD_REPLAY_INTERVAL seconds
+  - on shutdown, queued deliveries are spilled so they survive a restart
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from app.core.config import settings
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Client errors worth retrying; any other 4xx means the payload will never be accepted
+_RETRYABLE_STATUSES = frozenset({408, 425, 429})
+
+
+@dataclass
+class ForwardDelivery:
+    """One payload to deliver to the forward URL."""
+    payload: Dict[str, Any]
+    correlation_id: Optional[str] = None
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class _PermanentFailure(Exception):
+    """The target rejected the payload; retrying will not help."""
+
+
+class WebhookForwarder:
+    """Delivers forwarded webhooks in the background with retries and a disk spill."""
+
+    def __init__(self) -> None:
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._replay_task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Deliveries waiting for their retry timer, and those interrupted by shutdown
+        self._retry_handles: Dict[int, Tuple[asyncio.TimerHandle, ForwardDelivery]] = {}
+        self._interrupted: List[ForwardDelivery] = []
+        self._spill_lock = asyncio.Lock()
+        self.stats = {
+            "enqueued": 0, "delivered": 0, "retried": 0, "spilled": 0,
+            "replayed": 0, "dropped": 0, "rejected": 0
+        }
+
+    @property
+    def url(self) -> Optional[str]:
+        return settings.webhook.WEBHOOK_FORWARD_URL
+
+    @property
+    def spill_path(self) -> Path:
+        return Path(settings.webhook.WEBHOOK_FORWARD_SPILL_PATH)
+
+    # ---------------------------
+    # Lifecycle
+    # ---------------------------
+    async def start(self) -> None:
+        """Open the session and start the workers; a no-op when no forward URL is set."""
+        if not self.url or self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.webhook.WEBHOOK_FORWARD_QUEUE_SIZE)
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=settings.webhook.WEBHOOK_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=settings.webhook.WEBHOOK_FORWARD_WORKERS, keepalive_timeout=60)
+        )
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(settings.webhook.WEBHOOK_FORWARD_WORKERS)
+        ]
+        self._replay_task = asyncio.create_task(self._replay_loop())
+        logger.info("Started webhook forwarder", extra={
+            "forward_url": self.url, "workers": len(self._workers)
+        })
+
+    async def stop(self) -> None:
+        """Stop the workers and spill everything still queued or awaiting retry."""
+        if not self._workers:
+            return
+        for task in [*self._workers, self._replay_task]:
+            task.cancel()
+        await asyncio.gather(*self._workers, self._replay_task, return_exceptions=True)
+        self._workers = []
+        self._replay_task = None
+
+        pending = self._interrupted
+        self._interrupted = []
+        for handle, delivery in self._retry_handles.values():
+            handle.cancel()
+            pending.append(delivery)
+        self._retry_handles.clear()
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            await self._spill(pending)
+
+        await self._session.close()
+        self._session = None
+        self._queue = None
+        logger.info("Stopped webhook forwarder", extra={"spilled": len(pending)})
+
+    # ---------------------------
+    # Enqueueing
+    # ---------------------------
+    def enqueue(self, payload: Dict[str, Any], correlation_id: Optional[str] = None) -> bool:
+        """
+        Schedule a payload for forwarding without waiting on any I/O.
+
+        Returns:
+            False when forwarding is disabled, True otherwise (a delivery that
+            does not fit in the queue is spilled to disk in the background)
+        """
+        if not self.url or self._queue is None:
+            return False
+        self.stats["enqueued"] += 1
+        self._offer(ForwardDelivery(payload=payload, correlation_id=correlation_id))
+        return True
+
+    def _offer(self, delivery: ForwardDelivery) -> None:
+        try:
+            self._queue.put_nowait(delivery)
+        except asyncio.QueueFull:
+            asyncio.create_task(self._spill([delivery]))
+
+    def _schedule_retry(self, delivery: ForwardDelivery) -> None:
+        delay = min(
+            settings.webhook.WEBHOOK_FORWARD_BACKOFF_MAX,
+            settings.webhook.WEBHOOK_FORWARD_BACKOFF_BASE * 2 ** (delivery.attempts - 1)
+        )
+        delay *= random.uniform(0.8, 1.2)
+        key = id(delivery)
+        handle = asyncio.get_running_loop().call_later(delay, self._retry_due, key, delivery)
+        self._retry_handles[key] = (handle, delivery)
+        self.stats["retried"] += 1
+
+    def _retry_due(self, key: int, delivery: ForwardDelivery) -> None:
+        self._retry_handles.pop(key, None)
+        if self._queue is not None:
+            self._offer(delivery)
+
+    # ---------------------------
+    # Delivery
+    # ---------------------------
+    async def _deliver(self, delivery: ForwardDelivery) -> None:
+        headers = {"X-Correlation-ID": delivery.correlation_id} if delivery.correlation_id else None
+        async with self._session.post(self.url, json=delivery.payload, headers=headers) as response:
+            if response.status < 400:
+                return
+            if response.status < 500 and response.status not in _RETRYABLE_STATUSES:
+                raise _PermanentFailure(f"HTTP {response.status}")
+            response.raise_for_status()
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            delivery = await self._queue.get()
+            delivery.attempts += 1
+            try:
+                await self._deliver(delivery)
+                self.stats["delivered"] += 1
+                logger.info("Webhook forwarded successfully", extra={
+                    "correlation_id": delivery.correlation_id, "attempts": delivery.attempts
+                })
+            except asyncio.CancelledError:
+                self._interrupted.append(delivery)
+                raise
+            except _PermanentFailure as e:
+                self.stats["rejected"] += 1
+                logger.error("Forward target rejected webhook", extra={
+                    "correlation_id": delivery.correlation_id, "error": str(e), "forward_url": self.url
+                })
+            except Exception as e:
+                if delivery.attempts >= settings.webhook.WEBHOOK_FORWARD_MAX_ATTEMPTS:
+                    logger.error("Webhook forward failed; spilling to disk", extra={
+                        "correlation_id": delivery.correlation_id, "attempts": delivery.attempts,
+                        "error": str(e), "forward_url": self.url
+                    })
+                    await self._spill([delivery])
+                else:
+                    logger.warning("Webhook forward failed; retrying", extra={
+                        "correlation_id": delivery.correlation_id, "attempts": delivery.attempts,
+                        "error": str(e), "worker": index
+                    })
+                    self._schedule_retry(delivery)
+            finally:
+                self._queue.task_done()
+
+    # ---------------------------
+    # Disk spill
+    # ---------------------------
+    def _append_lines(self, lines: List[str]) -> int:
+        """Append lines unless the spill file is full; returns how many were written."""
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        size = self.spill_path.stat().st_size if self.spill_path.exists() else 0
+        written = 0
+        with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+            for line in lines:
+                if size + len(line) > settings.webhook.WEBHOOK_FORWARD_SPILL_MAX_BYTES:
+                    break
+                spill_file.write(line)
+                size += len(line)
+                written += 1
+        return written
+
+    async def _spill(self, deliveries: List[ForwardDelivery]) -> None:
+        lines = [json.dumps(asdict(delivery), default=str) + "\n" for delivery in deliveries]
+        async with self._spill_lock:
+            try:
+                written = await asyncio.to_thread(self._append_lines, lines)
+            except OSError as e:
+                written = 0
+                logger.error("Failed to spill webhook forwards", extra={"error": str(e)})
+        self.stats["spilled"] += written
+        if written < len(deliveries):
+            self.stats["dropped"] += len(deliveries) - written
+            logger.error("Webhook forward spill full; dropping forwards", extra={
+                "dropped": len(deliveries) - written, "spill_path": str(self.spill_path)
+            })
+
+    def _take_spilled(self) -> List[Dict[str, Any]]:
+        """Atomically claim the spill file and return its entries."""
+        if not self.spill_path.exists():
+            return []
+        claimed = self.spill_path.with_suffix(".replay")
+        os.replace(self.spill_path, claimed)
+        entries = []
+        with open(claimed, encoding="utf-8") as replay_file:
+            for line in replay_file:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        claimed.unlink()
+        return entries
+
+    async def _replay_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.webhook.WEBHOOK_FORWARD_REPLAY_INTERVAL)
+            # Only replay into an idle queue so live signals keep priority
+            if not self._queue.empty():
+                continue
+            async with self._spill_lock:
+                try:
+                    entries = await asyncio.to_thread(self._take_spilled)
+                except OSError as e:
+                    logger.error("Failed to read webhook forward spill", extra={"error": str(e)})
+                    continue
+            for entry in entries:
+                self._offer(ForwardDelivery(
+                    payload=entry["payload"],
+                    correlation_id=entry.get("correlation_id"),
+                    created_at=entry.get("created_at", time.time())
+                ))
+            if entries:
+                self.stats["replayed"] += len(entries)
+                logger.info("Replaying spilled webhook forwards", extra={"count": len(entries)})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "enabled": bool(self.url),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "awaiting_retry": len(self._retry_handles),
+        }
+
+
+webhook_forwarder = WebhookForwarder()
+
+__all__ = ["ForwardDelivery", "WebhookForwarder", "webhook_forwarder"]
@@ -0,0 +1,258 @@
+"""
+Signal ingestion: de-duplication and ordered per-bot execution.
+
+The webhook handler acknowledges a signal as soon as it is validated and
+queued; execution happens here:
+  - identical payloads for the same bot within SIGNAL_DEDUPE_WINDOW_SECONDS
+    are dropped (TradingView retries and double-fired alerts)
+  - each bot has its own bounded queue and a single consumer task, so the
+    signals of one bot are applied strictly in arrival order and never
+    interleave handle_current_position/close/open on the same accounts
+  - different bots have independent consumers and run in parallel
+  - consumers are created on demand and exit after
+    SIGNAL_CONSUMER_IDLE_SECONDS without work
+
+De-duplication and ordering are per process; run a single worker for the
+webhook route (or pin it) when several API workers are deployed.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.errors.base import RateLimitError
+from app.core.logging.logger import get_logger
+from app.core.metrics import signal_ingested, signal_queue_wait
+from app.core.tracing import tracer
+from app.services.trading.service import trading_service
+
+logger = get_logger(__name__)
+
+
+def signal_fingerprint(bot_id: str, payload: Dict[str, Any]) -> str:
+    """Content hash of a signal, independent of key order and whitespace."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{bot_id}:{canonical}".encode()).hexdigest()
+
+
+@dataclass
+class QueuedSignal:
+    """A validated signal waiting for its bot's consumer."""
+    correlation_id: str
+    bot_id: str
+    signal_data: Dict[str, Any]
+    context: Dict[str, Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class SignalOutcome:
+    """Lifecycle of one accepted signal, kept for status lookups."""
+    correlation_id: str
+    bot_id: str
+    status: str = "queued"
+    accepted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "correlation_id": self.correlation_id,
+            "bot_id": self.bot_id,
+            "status": self.status,
+            "accepted_at": self.accepted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class SignalIngestor:
+    """Per-bot signal queues with one ordered consumer each."""
+
+    def __init__(self) -> None:
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._consumers: Dict[str, asyncio.Task] = {}
+        # fingerprint -> (accepted monotonic time, correlation_id); insertion order is time order
+        self._recent: "OrderedDict[str, tuple]" = OrderedDict()
+        self._outcomes: "OrderedDict[str, SignalOutcome]" = OrderedDict()
+        self._closing = False
+        self.stats = {"accepted": 0, "duplicates": 0, "rejected": 0, "processed": 0, "failed": 0}
+
+    # ---------------------------
+    # Submission
+    # ---------------------------
+    def _find_duplicate(self, fingerprint: str, now: float) -> Optional[str]:
+        window = settings.webhook.SIGNAL_DEDUPE_WINDOW_SECONDS
+        while self._recent:
+            oldest, (accepted_at, _) = next(iter(self._recent.items()))
+            if now - accepted_at <= window:
+                break
+            self._recent.pop(oldest)
+        seen = self._recent.get(fingerprint)
+        return seen[1] if seen else None
+
+    def submit(
+        self,
+        correlation_id: str,
+        bot_id: str,
+        signal_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a signal for its bot without waiting for execution.
+
+        Returns:
+            ``{"status": "queued", "position": n}`` or, for a duplicate,
+            ``{"status": "duplicate", "duplicate_of": correlation_id}``
+
+        Raises:
+            RateLimitError: If the bot's queue is full or the ingestor is shutting down
+        """
+        now = time.monotonic()
+        fingerprint = signal_fingerprint(bot_id, signal_data)
+        original = self._find_duplicate(fingerprint, now)
+        if original is not None:
+            self.stats["duplicates"] += 1
+            signal_ingested.inc("duplicate")
+            logger.info("Duplicate signal ignored", extra={
+                "correlation_id": correlation_id, "duplicate_of": original, "bot_id": bot_id
+            })
+            return {"status": "duplicate", "duplicate_of": original}
+
+        queue = self._queues.get(bot_id)
+        if queue is None:
+            queue = self._queues[bot_id] = asyncio.Queue(maxsize=settings.webhook.SIGNAL_QUEUE_SIZE_PER_BOT)
+        if self._closing or queue.full():
+            self.stats["rejected"] += 1
+            signal_ingested.inc("rejected")
+            raise RateLimitError(
+                "Signal queue is full for bot",
+                context={"bot_id": bot_id, "correlation_id": correlation_id, "queued": queue.qsize()}
+            )
+
+        queue.put_nowait(QueuedSignal(correlation_id, bot_id, signal_data, context or {}))
+        self._recent[fingerprint] = (now, correlation_id)
+        self._remember(SignalOutcome(correlation_id, bot_id))
+        self.stats["accepted"] += 1
+        signal_ingested.inc("queued")
+        self._ensure_consumer(bot_id)
+        return {"status": "queued", "position": queue.qsize()}
+
+    def _remember(self, outcome: SignalOutcome) -> None:
+        self._outcomes[outcome.correlation_id] = outcome
+        if len(self._outcomes) > settings.webhook.SIGNAL_OUTCOME_HISTORY:
+            self._outcomes.popitem(last=False)
+
+    def get_outcome(self, correlation_id: str) -> Optional[SignalOutcome]:
+        return self._outcomes.get(correlation_id)
+
+    # ---------------------------
+    # Consumers
+    # ---------------------------
+    def _ensure_consumer(self, bot_id: str) -> None:
+        task = self._consumers.get(bot_id)
+        if task is None or task.done():
+            self._consumers[bot_id] = asyncio.create_task(self._consume(bot_id))
+
+    async def _consume(self, bot_id: str) -> None:
+        queue = self._queues[bot_id]
+        try:
+            while True:
+                try:
+                    queued = await asyncio.wait_for(
+                        queue.get(), timeout=settings.webhook.SIGNAL_CONSUMER_IDLE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    break
+                try:
+                    await self._execute(queued)
+                finally:
+                    queue.task_done()
+        finally:
+            # Retire only if nothing arrived while winding down
+            if self._consumers.get(bot_id) is asyncio.current_task():
+                del self._consumers[bot_id]
+                if queue.empty():
+                    self._queues.pop(bot_id, None)
+                elif not self._closing:
+                    self._ensure_consumer(bot_id)
+
+    async def _execute(self, queued: QueuedSignal) -> None:
+        outcome = self._outcomes.get(queued.correlation_id) or SignalOutcome(queued.correlation_id, queued.bot_id)
+        waited = time.monotonic() - queued.enqueued_at
+        signal_queue_wait.observe(waited)
+        outcome.status = "processing"
+        outcome.started_at = time.time()
+
+        with tracer.start_trace(
+            queued.correlation_id, "signal.execute", bot_id=queued.bot_id, queue_wait_ms=round(waited * 1000, 3)
+        ):
+            try:
+                outcome.result = await trading_service.process_signal(
+                    bot_id=queued.bot_id,
+                    signal_data=queued.signal_data,
+                    context=queued.context
+                )
+                outcome.status = "completed"
+                self.stats["processed"] += 1
+            except Exception as e:
+                outcome.status = "failed"
+                outcome.error = str(e)
+                self.stats["failed"] += 1
+                logger.error("Signal execution failed", extra={
+                    **queued.context, "bot_id": queued.bot_id, "error": str(e)
+                })
+            finally:
+                outcome.finished_at = time.time()
+
+    # ---------------------------
+    # Lifecycle
+    # ---------------------------
+    async def stop(self) -> None:
+        """Stop accepting signals and give queued ones SIGNAL_SHUTDOWN_TIMEOUT to finish."""
+        self._closing = True
+        consumers: List[asyncio.Task] = list(self._consumers.values())
+        if not consumers:
+            return
+        pending = sum(queue.qsize() for queue in self._queues.values())
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in list(self._queues.values()))),
+                timeout=settings.webhook.SIGNAL_SHUTDOWN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Signal queues not drained before shutdown", extra={
+                "pending": sum(queue.qsize() for queue in self._queues.values())
+            })
+        for task in consumers:
+            task.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        logger.info("Stopped signal ingestor", extra={"drained": pending})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "bots": len(self._consumers),
+            "queued": {bot_id: queue.qsize() for bot_id, queue in self._queues.items() if queue.qsize()},
+            "dedupe_entries": len(self._recent)
+        }
+
+
+signal_ingestor = SignalIngestor()
+
+__all__ = [
+    "QueuedSignal",
+    "SignalOutcome",
+    "SignalIngestor",
+    "signal_fingerprint",
+    "signal_ingestor"
+]
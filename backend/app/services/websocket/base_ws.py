@@ -14,12 +14,14 @@ from datetime import datetime, timedelta
 from typing import Dict, Set, Optional, Callable, Awaitable
 
 import asyncio
+import time
 import websockets
 
 from app.core.errors.base import WebSocketError, RateLimitError, ValidationError
 from app.core.config.settings import settings
 from app.core.logging.logger import get_logger
 from app.core.errors.decorators import error_handler
+from app.core.metrics import websocket_message_lag, websocket_messages
 
 logger = get_logger(__name__)
 
@@ -217,12 +219,29 @@ class BaseWebSocket(ABC):
                     raise WebSocketError("Failed to process message", context={"message_type": message.get("type"), "error": str(e)})
                 self.message_queue.task_done()
                 self.state.last_message = datetime.utcnow()
+                self._record_message_metrics(message)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error("Message processor error", extra={"error": str(e)})
                 await asyncio.sleep(1)
 
+    def _record_message_metrics(self, message: Dict) -> None:
+        """Count the message and, when it carries an exchange timestamp, its lag."""
+        label = getattr(getattr(self, "exchange_type", None), "value", None) or self.__class__.__name__
+        websocket_messages.inc(label)
+        sent_ms = message.get("ts")
+        if sent_ms is None:
+            data = message.get("data")
+            if isinstance(data, list) and data and isinstance(data[0], dict):
+                sent_ms = data[0].get("ts") or data[0].get("uTime")
+        try:
+            lag = time.time() - int(sent_ms) / 1000 if sent_ms is not None else None
+        except (TypeError, ValueError):
+            lag = None
+        if lag is not None and lag >= 0:
+            websocket_message_lag.observe(lag, label)
+
     async def _heartbeat_loop(self) -> None:
         """
         Maintain WebSocket connection with periodic heartbeats.
@@ -8,6 +8,7 @@ It applies centralized error handling via decorators to standardize error contex
 
 import asyncio
 import json
+import logging
 import hmac
 import base64
 import hashlib
@@ -194,7 +195,11 @@ class BitgetWebSocket(BaseWebSocket):
         """
         Process an incoming WebSocket message.
         """
-        self.logger.debug("Processing message", extra={"message": message})
+        # Per-message path: sample instead of serialising every payload
+        self.logger.every_n(
+            "process_message", 1000, logging.DEBUG, "Processing messages",
+            lambda: {"topic": message.get("topic"), "keys": list(message)}
+        )
         topic = message.get("topic")
         if topic and topic in self.callbacks:
             await self.callbacks[topic](message.get("data", {}))
@@ -10,6 +10,7 @@ Features:
 
 from typing import Dict, Optional, Any, Callable, Set
 import asyncio
+import logging
 from datetime import datetime, timedelta
 
 from app.core.references import ConnectionState
@@ -202,7 +203,14 @@ class WebSocketManager:
                 await info.client.handle_snapshot(symbol, data)
             else:
                 await info.client.handle_delta(symbol, data)
-        self.logger.info("Synced order book", extra={"connection_id": connection_id, "symbol": symbol, "type": "snapshot" if is_snapshot else "delta"})
+        if is_snapshot:
+            self.logger.info("Synced order book", extra={"connection_id": connection_id, "symbol": symbol, "type": "snapshot"})
+        else:
+            # Deltas arrive many times a second per symbol
+            self.logger.every_interval(
+                f"sync_order_book:{connection_id}:{symbol}", 60, logging.INFO, "Synced order book deltas",
+                lambda: {"connection_id": connection_id, "symbol": symbol, "type": "delta"}
+            )
 
     @error_handler(
         context_extractor=lambda self, connection_id: {"connection_id": connection_id},
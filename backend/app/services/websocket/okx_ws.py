@@ -9,6 +9,7 @@ and process_message are wrapped with a centralized error handler to standardize
 
 import asyncio
 import json
+import logging
 import hmac
 import base64
 import hashlib
@@ -179,7 +180,11 @@ class OKXWebSocket(BaseWebSocket):
         log_message="Failed to process incoming message"
     )
     async def process_message(self, message: Dict[str, Any]) -> None:
-        self.logger.debug("Processing message", extra={"message": message})
+        # Per-message path: sample instead of serialising every payload
+        self.logger.every_n(
+            "process_message", 1000, logging.DEBUG, "Processing messages",
+            lambda: {"topic": message.get("topic"), "keys": list(message)}
+        )
         topic = message.get("topic")
         if topic and topic in self.callbacks:
             await self.callbacks[topic](message.get("data", {}))
@@ -0,0 +1,96 @@
+"""
+Shared test configuration.
+
+Settings are validated when ``app`` is first imported, so the required
+values are filled in here before any test module imports it. Log files go
+to a temporary directory instead of ``logs/``.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+_LOG_DIR = Path(tempfile.mkdtemp(prefix="tradingbot-tests-"))
+
+for _key, _value in {
+    "DATABASE__MONGODB_URL": "mongodb://localhost:27017",
+    "DATABASE__MONGODB_DB_NAME": "tradingbot_test",
+    "WEBHOOK__TRADINGVIEW_WEBHOOK_SECRET": "test-webhook-secret-0123456789",
+    "TELEGRAM__TELEGRAM_BOT_TOKEN": "123456:test-token",
+    "TELEGRAM__TELEGRAM_CHAT_ID": "1",
+    "LOGGING__LOG_FILE_PATH": str(_LOG_DIR / "app.log"),
+    "LOGGING__ERROR_LOG_FILE_PATH": str(_LOG_DIR / "error.log"),
+}.items():
+    os.environ.setdefault(_key, _value)
+
+import pytest  # noqa: E402
+from pymongo import monitoring  # noqa: E402
+
+TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL", "mongodb://localhost:27017")
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Keeps the read commands sent to the server so tests can explain them."""
+
+    READS = ("find", "aggregate", "count", "distinct")
+
+    def __init__(self) -> None:
+        self.commands = []
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in self.READS:
+            self.commands.append({
+                key: value for key, value in event.command.items()
+                if not key.startswith("$") and key not in ("lsid", "txnNumber")
+            })
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+@pytest.fixture
+def mongo_commands():
+    """Read commands issued through ``mongo_db``'s client."""
+    return CommandRecorder()
+
+
+@pytest.fixture
+async def mongo_db(mongo_commands):
+    """
+    A fresh database on a real MongoDB server (``TEST_MONGODB_URL``), dropped
+    afterwards. Query plans need the real planner, so tests using this
+    fixture are skipped when no server is reachable.
+    """
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from pymongo.errors import PyMongoError
+
+    client = AsyncIOMotorClient(
+        TEST_MONGODB_URL, serverSelectionTimeoutMS=1000, event_listeners=[mongo_commands]
+    )
+    try:
+        await client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip(f"no MongoDB server at {TEST_MONGODB_URL}")
+
+    name = f"tradingbot_test_{os.getpid()}"
+    await client.drop_database(name)
+    try:
+        yield client[name]
+    finally:
+        await client.drop_database(name)
+        client.close()
+
+
+@pytest.fixture
+async def beanie_db(mongo_db, mongo_commands):
+    """``mongo_db`` with the Beanie models bound to it, so the CRUD singletons use it."""
+    from beanie import init_beanie
+    from app.db.db import Database
+
+    await init_beanie(database=mongo_db, document_models=await Database._get_document_models())
+    mongo_commands.commands.clear()
+    return mongo_db
@@ -0,0 +1,84 @@
+"""Daily performance from Decimal128 trade totals."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from bson import Decimal128, ObjectId
+
+from app.core.enums import TradeStatus
+from app.crud.crud_trade import trade as trade_crud
+from app.models.entities.trade import Trade
+from app.services.cron_jobs import cron_service
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self, *args):
+        return self.rows
+
+
+async def test_daily_totals_accept_decimal128(monkeypatch):
+    rows = [{
+        "_id": "2024-01-02",
+        "trades": 2,
+        "winning_trades": 1,
+        "pnl": Decimal128("12.50"),
+        "trading_fees": Decimal128("0.75"),
+        "funding_fees": 0,
+        "order_size": Decimal128("300"),
+    }]
+    monkeypatch.setattr(Trade, "aggregate", classmethod(lambda cls, pipeline: _Cursor(rows)))
+
+    days = await trade_crud.get_daily_performance("account", datetime(2024, 1, 2), datetime(2024, 1, 3))
+
+    assert days == [{
+        "date": "2024-01-02",
+        "trades": 2,
+        "winning_trades": 1,
+        "win_rate": 50.0,
+        "pnl": 12.5,
+        "trading_fees": 0.75,
+        "funding_fees": 0.0,
+        "net_pnl": 11.75,
+        "volume": 300.0,
+    }]
+
+
+async def test_cron_stores_daily_row_from_decimal128_trades(beanie_db):
+    day = cron_service._report_day()
+    account_id = ObjectId()
+    await beanie_db["accounts"].insert_one({
+        "_id": account_id,
+        "is_active": True,
+        "exchange": "bybit",
+        "initial_balance": Decimal128("1000"),
+        "current_balance": Decimal128("1010"),
+        "current_equity": Decimal128("1012"),
+    })
+    await beanie_db["trades"].insert_many([
+        {
+            "account_id": str(account_id),
+            "status": TradeStatus.CLOSED.value,
+            "closed_at": day + timedelta(hours=hour),
+            "pnl": Decimal128(pnl),
+            "trading_fees": Decimal128("0.5"),
+            "funding_fees": Decimal128("0.25"),
+            "order_size": Decimal128("100"),
+        }
+        for hour, pnl in ((1, "15.5"), (5, "-4"))
+    ])
+
+    await cron_service.calculate_daily_performance()
+
+    row = await beanie_db["daily_performance"].find_one(
+        {"account_id": str(account_id), "date": day.strftime("%Y-%m-%d")}
+    )
+    assert row is not None
+    assert row["closed_trades"] == 2
+    assert row["winning_trades"] == 1
+    assert row["daily_pnl"].to_decimal() == Decimal("11.5")
+    assert row["trading_fees"].to_decimal() == Decimal("1.0")
+    assert row["funding_fees"].to_decimal() == Decimal("0.5")
+    assert row["closed_trade_value"].to_decimal() == Decimal("200.0")
@@ -0,0 +1,65 @@
+"""Error storms through handle_api_error are aggregated per fingerprint."""
+
+import pytest
+
+from app.core.errors.base import RateLimitError, ServiceError, SystemError
+from app.core.errors.handlers import error_fingerprint, error_handler, handle_api_error
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record recoveries and notifications instead of running them."""
+    recorded = {"recoveries": [], "notifications": []}
+
+    async def execute_recovery(error, strategy, lock_timeout=30, lock_key=None):
+        recorded["recoveries"].append(lock_key)
+
+    async def send_notification(error, aggregate=None):
+        recorded["notifications"].append(aggregate.count if aggregate else 1)
+
+    monkeypatch.setattr(error_handler, "_execute_recovery", execute_recovery)
+    monkeypatch.setattr(error_handler, "_send_notification", send_notification)
+    monkeypatch.setattr(error_handler, "error_batches", {})
+    monkeypatch.setattr(error_handler, "last_notification", {})
+    monkeypatch.setattr(error_handler, "suppressed_notifications", {})
+    return recorded
+
+
+async def test_burst_recovers_once_per_fingerprint(calls):
+    context = {"exchange": "binance", "operation": "create_order"}
+    for _ in range(500):
+        await handle_api_error(RateLimitError("Rate limit exceeded", context=dict(context)), context=dict(context))
+    await handle_api_error(RateLimitError("Rate limit exceeded"), context={"exchange": "bybit"})
+
+    assert calls["recoveries"] == []
+    assert len(error_handler.error_batches) == 2
+
+    await error_handler._process_error_batches()
+
+    expected = {
+        error_fingerprint(RateLimitError("Rate limit exceeded"), context),
+        error_fingerprint(RateLimitError("Rate limit exceeded"), {"exchange": "bybit"}),
+    }
+    assert sorted(calls["recoveries"]) == sorted(expected)
+    # MEDIUM errors are below the notification levels; nothing forces an alert
+    assert calls["notifications"] == []
+    assert error_handler.error_batches == {}
+
+
+async def test_burst_notifies_once_with_occurrence_count(calls):
+    for _ in range(200):
+        await handle_api_error(ServiceError("Exchange gateway timeout"), context={"service": "exchange"})
+    await error_handler._process_error_batches()
+    for _ in range(50):
+        await handle_api_error(ServiceError("Exchange gateway timeout"), context={"service": "exchange"})
+    await error_handler._process_error_batches()
+
+    # One alert for the first window; the second falls inside the cooldown
+    assert calls["notifications"] == [200]
+    assert error_handler.suppressed_notifications["ServiceError"] == 50
+
+
+async def test_critical_errors_are_not_batched(calls):
+    await handle_api_error(SystemError("Database unreachable"), context={"service": "db"})
+
+    assert error_handler.error_batches == {}
@@ -0,0 +1,103 @@
+"""Range handling of the export artifact download route."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.api.v1.deps import get_current_user
+from app.api.v1.endpoints import groups
+from app.core.enums import ExportJobStatus
+from app.services.reporting.jobs import ExportJob, RangeNotSatisfiableError, export_jobs, parse_range_header
+
+CONTENT = bytes(range(256)) * 4
+JOB_ID = "range-test-job"
+URL = f"/groups/export-jobs/{JOB_ID}/download"
+
+
+@pytest.fixture
+async def client(tmp_path, monkeypatch):
+    path = tmp_path / "trades.csv"
+    path.write_bytes(CONTENT)
+    monkeypatch.setitem(export_jobs.jobs, JOB_ID, ExportJob(
+        job_id=JOB_ID,
+        kind="group_trades",
+        params={"group_id": "group"},
+        status=ExportJobStatus.COMPLETED,
+        filename="trades.csv",
+        path=path
+    ))
+
+    async def allow(current_user, group_id):
+        return None
+
+    monkeypatch.setattr(groups, "_verify_export_access", allow)
+    app = FastAPI()
+    app.include_router(groups.router, prefix="/groups")
+    app.dependency_overrides[get_current_user] = lambda: {"id": "user", "role": "admin"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
+
+
+async def test_full_download(client):
+    response = await client.get(URL)
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+@pytest.mark.parametrize("header, start, end", [
+    ("bytes=0-99", 0, 99),
+    ("bytes=1000-", 1000, 1023),
+    ("bytes=-24", 1000, 1023),
+    ("bytes=1000-5000", 1000, 1023),
+])
+async def test_partial_download(client, header, start, end):
+    response = await client.get(URL, headers={"Range": header})
+
+    assert response.status_code == 206
+    assert response.content == CONTENT[start:end + 1]
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{len(CONTENT)}"
+
+
+@pytest.mark.parametrize("header", ["bytes=1024-", "bytes=5000-6000", "bytes=-0"])
+async def test_unsatisfiable_range_is_416(client, header):
+    response = await client.get(URL, headers={"Range": header})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+
+@pytest.mark.parametrize("header", ["bytes=abc", "items=0-10", "bytes=0-1,5-6", "bytes=10-5", "bytes=-"])
+async def test_malformed_range_serves_full_body(client, header):
+    response = await client.get(URL, headers={"Range": header})
+
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+
+def test_parse_range_header():
+    assert parse_range_header(None, 10) is None
+    assert parse_range_header("bytes=2-4", 10) == (2, 4)
+    assert parse_range_header("bytes=-100", 10) == (0, 9)
+    with pytest.raises(RangeNotSatisfiableError) as raised:
+        parse_range_header("bytes=10-", 10)
+    assert raised.value.size == 10
+
+
+@pytest.mark.parametrize("params, reusable", [
+    ({"group_id": "group", "start_date": "2024-01-01", "end_date": "2024-02-01"}, True),
+    ({"group_id": "group", "start_date": "2024-01-01"}, False),
+    ({"group_id": "group", "start_date": "2024-01-01", "end_date": None}, False),
+])
+def test_finished_open_ended_export_is_not_reused(tmp_path, params, reusable):
+    path = tmp_path / "trades.csv"
+    path.write_bytes(CONTENT)
+    finished = ExportJob(
+        job_id=JOB_ID, kind="group_trades", params=params,
+        status=ExportJobStatus.COMPLETED, filename="trades.csv", path=path
+    )
+    running = ExportJob(job_id=JOB_ID, kind="group_trades", params=params, status=ExportJobStatus.RUNNING)
+
+    assert finished.is_reusable() is reusable
+    assert running.is_reusable()
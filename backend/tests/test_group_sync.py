@@ -0,0 +1,141 @@
+"""Group balance sync through the accounts' exchange clients."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from bson import Decimal128, ObjectId
+
+from app.core.config import settings
+from app.core.errors.base import ExchangeError
+from app.crud.crud_group import group as group_crud
+from app.services.exchange.factory import exchange_factory
+
+
+class _Exchange:
+    def __init__(self, balance=None):
+        self.balance = balance
+
+    async def get_balance(self):
+        if self.balance is None:
+            raise ExchangeError("Exchange unavailable", context={})
+        return self.balance
+
+
+@pytest.fixture
+def fake_exchanges(monkeypatch):
+    """Exchange clients by account ID; an account without balances fails every fetch."""
+    exchanges = {}
+
+    async def get_instance(account_id, reference_manager):
+        return exchanges[account_id]
+
+    monkeypatch.setattr(exchange_factory, "get_instance", get_instance)
+    return exchanges
+
+
+async def test_sync_balances_updates_accounts_and_group(beanie_db, fake_exchanges, monkeypatch):
+    monkeypatch.setattr(settings.balance_sync, "BALANCE_SYNC_RETRY_DELAY", 0)
+    accounts = [
+        {
+            "_id": ObjectId(),
+            "name": name,
+            "exchange": exchange,
+            "is_active": True,
+            "api_key": "key",
+            "api_secret": "secret",
+            "current_balance": Decimal128("0"),
+            "current_equity": Decimal128("0"),
+        }
+        for name, exchange in (("okx-1", "okx"), ("bybit-1", "bybit"), ("bybit-2", "bybit"))
+    ]
+    await beanie_db["accounts"].insert_many(accounts)
+    account_ids = [str(account["_id"]) for account in accounts]
+    group_id = (await beanie_db["account_groups"].insert_one({
+        "name": "group-1",
+        "accounts": account_ids,
+        "created_at": datetime.utcnow(),
+        "modified_at": datetime.utcnow(),
+    })).inserted_id
+
+    fake_exchanges[account_ids[0]] = _Exchange({"balance": Decimal("100"), "equity": Decimal("110")})
+    fake_exchanges[account_ids[1]] = _Exchange({"balance": Decimal("50.5"), "equity": Decimal("49.5")})
+    fake_exchanges[account_ids[2]] = _Exchange()
+
+    result = await group_crud.sync_balances(group_id)
+
+    assert result["success"] is False
+    assert result["error_count"] == 1
+    assert result["active_accounts"] == 2
+    assert result["total_balance"] == 150.5
+    assert result["total_equity"] == 159.5
+
+    stored = {
+        str(doc["_id"]): doc async for doc in beanie_db["accounts"].find({"_id": {"$in": [a["_id"] for a in accounts]}})
+    }
+    assert stored[account_ids[0]]["current_balance"].to_decimal() == Decimal("100")
+    assert stored[account_ids[1]]["current_equity"].to_decimal() == Decimal("49.5")
+    assert stored[account_ids[2]]["current_balance"].to_decimal() == Decimal("0")
+
+    group = await beanie_db["account_groups"].find_one({"_id": group_id})
+    assert group["total_balance"] == 150.5
+    assert group["total_equity"] == 159.5
+    assert group["active_accounts"] == 2
+    assert group["error_count"] == 1
+    assert group["last_error"] == "Failed to sync 1 accounts"
+
+
+async def test_current_metrics_from_accounts_and_daily_rows(beanie_db):
+    today = datetime.utcnow().strftime("%Y-%m-%d")
+    accounts = [
+        {
+            "_id": ObjectId(),
+            "name": f"account-{n}",
+            "exchange": "okx",
+            "current_balance": Decimal128("100"),
+            "current_equity": Decimal128("100"),
+            "position_value": Decimal128(value),
+            "open_positions": positions,
+            "error_count": errors,
+        }
+        for n, (value, positions, errors) in enumerate((("40", 2, 0), ("10", 1, 3)))
+    ]
+    await beanie_db["accounts"].insert_many(accounts)
+    account_ids = [str(account["_id"]) for account in accounts]
+    group_id = (await beanie_db["account_groups"].insert_one({
+        "name": "group-2",
+        "accounts": account_ids,
+        "created_at": datetime.utcnow(),
+    })).inserted_id
+    await beanie_db["daily_performance"].insert_many([
+        {
+            "account_id": account_id,
+            "date": today,
+            "initial_balance": Decimal128("100"),
+            "initial_equity": Decimal128("100"),
+            "starting_balance": Decimal128("100"),
+            "closing_balance": Decimal128("100"),
+            "starting_equity": Decimal128("100"),
+            "closing_equity": Decimal128("100"),
+            "closed_trades": 2,
+            "winning_trades": wins,
+            "daily_pnl": Decimal128(pnl),
+            "trading_fees": Decimal128("0.5"),
+            "funding_fees": Decimal128("0"),
+        }
+        for account_id, wins, pnl in zip(account_ids, (2, 1), ("6", "-1.5"))
+    ])
+
+    metrics = await group_crud.get_current_metrics(group_id)
+
+    assert metrics["risk"] == {
+        "open_positions": 3,
+        "position_value": 50.0,
+        "exposure": 0.25,
+        "accounts_with_errors": 1,
+    }
+    assert metrics["today"]["trades"] == 4
+    assert metrics["today"]["winning_trades"] == 3
+    assert metrics["today"]["pnl"] == 4.5
+    assert metrics["today"]["trading_fees"] == 1.0
+    assert metrics["today"]["win_rate"] == 75.0
@@ -0,0 +1,57 @@
+"""Access index entries dropped by change stream events from other workers."""
+
+import time
+
+import pytest
+from bson import ObjectId
+
+from app.core.enums import InvalidationKind
+from app.services.invalidation import event_from_change, invalidation_bus
+from app.services.reference.access import AccessEntry, access_index
+
+
+def _change(collection, operation, document_id, changed=None):
+    return {
+        "ns": {"coll": collection},
+        "operationType": operation,
+        "documentKey": {"_id": document_id},
+        "changedFields": changed or [],
+    }
+
+
+@pytest.fixture
+def entries():
+    group_id, account_id = str(ObjectId()), str(ObjectId())
+    users = [str(ObjectId()), str(ObjectId())]
+    access_index.clear()
+    access_index._store(AccessEntry(users[0], False, frozenset([account_id]), frozenset(), frozenset([group_id]), time.monotonic()))
+    access_index._store(AccessEntry(users[1], False, frozenset(), frozenset(), frozenset(), time.monotonic()))
+    yield users, group_id
+    access_index.clear()
+
+
+@pytest.mark.parametrize("operation, kind", [
+    ("update", InvalidationKind.GROUP_UPDATED),
+    ("delete", InvalidationKind.GROUP_DELETED),
+])
+async def test_group_change_drops_assigned_users(entries, operation, kind):
+    users, group_id = entries
+    event = event_from_change(_change("account_groups", operation, ObjectId(group_id), ["accounts"]))
+    assert event.kind is kind
+
+    await invalidation_bus.publish(event)
+
+    assert users[0] not in access_index._entries
+    assert users[1] in access_index._entries
+
+
+async def test_user_change_drops_that_user(entries):
+    users, _ = entries
+    event = event_from_change(_change("users", "update", ObjectId(users[1]), ["assigned_groups"]))
+    assert event.kind is InvalidationKind.USER_UPDATED
+    assert event.fields == frozenset(["assigned_groups"])
+
+    await invalidation_bus.publish(event)
+
+    assert users[0] in access_index._entries
+    assert users[1] not in access_index._entries
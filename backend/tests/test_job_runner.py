@@ -0,0 +1,87 @@
+"""Distributed job lock: one run per scheduled slot across workers."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.job_runner import JobRunner
+
+
+class MemoryLeases:
+    """The lease semantics of JobLock over a dict shared by several workers."""
+
+    def __init__(self) -> None:
+        self.leases = {}
+
+    def lock_for(self, owner: str) -> "MemoryLock":
+        return MemoryLock(self, owner)
+
+
+class MemoryLock:
+    def __init__(self, store: MemoryLeases, owner: str) -> None:
+        self.store = store
+        self.owner = owner
+
+    async def acquire(self, job_id: str, ttl: float) -> bool:
+        now = datetime.utcnow()
+        lease = self.store.leases.get(job_id)
+        if lease and lease["owner"] != self.owner and lease["expires_at"] > now:
+            return False
+        self.store.leases[job_id] = {"owner": self.owner, "expires_at": now + timedelta(seconds=ttl)}
+        return True
+
+    async def renew(self, job_id: str, ttl: float) -> bool:
+        lease = self.store.leases.get(job_id)
+        if not lease or lease["owner"] != self.owner:
+            return False
+        lease["expires_at"] = datetime.utcnow() + timedelta(seconds=ttl)
+        return True
+
+    async def release(self, job_id: str) -> None:
+        if self.store.leases.get(job_id, {}).get("owner") == self.owner:
+            del self.store.leases[job_id]
+
+
+@pytest.fixture
+def workers():
+    store = MemoryLeases()
+    runners = [JobRunner(), JobRunner()]
+    for runner in runners:
+        runner.lock = store.lock_for(runner.owner)
+    return store, runners
+
+
+async def test_late_worker_does_not_rerun_finished_slot(workers):
+    store, (first, second) = workers
+    runs = []
+
+    async def send_daily_summary():
+        runs.append("sent")
+
+    await first.run("daily_summary", send_daily_summary, lock_ttl=600)
+    await second.run("daily_summary", send_daily_summary, lock_ttl=600)
+
+    assert runs == ["sent"]
+    assert store.leases["daily_summary"]["owner"] == first.owner
+    # The owner runs the next slot itself
+    await first.run("daily_summary", send_daily_summary, lock_ttl=600)
+    assert runs == ["sent", "sent"]
+
+
+async def test_failed_run_releases_lock(workers):
+    store, (first, second) = workers
+
+    async def failing():
+        raise RuntimeError("exchange down")
+
+    with pytest.raises(RuntimeError):
+        await first.run("sync_positions", failing, lock_ttl=600)
+
+    assert "sync_positions" not in store.leases
+    runs = []
+
+    async def succeeding():
+        runs.append(second.owner)
+
+    await second.run("sync_positions", succeeding, lock_ttl=600)
+    assert runs == [second.owner]
@@ -0,0 +1,37 @@
+"""Metrics server port selection with several workers."""
+
+import socket
+
+from app.core.config import settings
+from app.core.metrics import MetricsServer, registry
+
+
+def _free_port_pair() -> int:
+    """A port whose successor is free as well."""
+    while True:
+        with socket.socket() as probe:
+            probe.bind(("0.0.0.0", 0))
+            port = probe.getsockname()[1]
+        if port < 65535:
+            with socket.socket() as successor:
+                try:
+                    successor.bind(("0.0.0.0", port + 1))
+                except OSError:
+                    continue
+            return port
+
+
+async def test_each_worker_binds_its_own_port(monkeypatch):
+    port = _free_port_pair()
+    monkeypatch.setattr(settings.monitoring, "ENABLE_METRICS", True)
+    monkeypatch.setattr(settings.monitoring, "METRICS_PORT", port)
+    monkeypatch.setattr(settings.monitoring, "METRICS_PORT_RANGE", 2)
+    workers = [MetricsServer(registry) for _ in range(3)]
+    try:
+        for worker in workers:
+            await worker.start()
+
+        assert [worker.port for worker in workers] == [port, port + 1, None]
+    finally:
+        for worker in workers:
+            await worker.stop()
@@ -0,0 +1,54 @@
+"""Keyset pagination filters and continuation tokens."""
+
+from datetime import datetime
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from app.core.errors.base import ValidationError
+from app.crud.pagination import build_page, encode_cursor, keyset_sort, seek_filter
+
+
+def test_id_seek_keeps_query_id_condition():
+    allowed = [ObjectId() for _ in range(3)]
+    query = {"_id": {"$in": allowed}}
+    cursor = encode_cursor(query, "_id", False, None, allowed[0])
+
+    assert seek_filter(query, "_id", False, cursor) == {"$and": [query, {"_id": {"$gt": allowed[0]}}]}
+
+
+def test_id_seek_without_query():
+    last_id = ObjectId()
+    cursor = encode_cursor({}, "_id", True, None, last_id)
+
+    assert seek_filter({}, "_id", True, cursor) == {"_id": {"$lt": last_id}}
+
+
+def test_cursor_for_another_query_is_rejected():
+    cursor = encode_cursor({"account_id": "a"}, "executed_at", True, datetime(2024, 1, 1), ObjectId())
+
+    with pytest.raises(ValidationError):
+        seek_filter({"account_id": "b"}, "executed_at", True, cursor)
+
+
+@pytest.mark.parametrize("sort_key", ["_id", "executed_at"])
+def test_restricted_pages_never_leave_the_query(sort_key):
+    collection = mongomock.MongoClient().db.trades
+    ids = [ObjectId() for _ in range(20)]
+    collection.insert_many([
+        {"_id": _id, "executed_at": datetime(2024, 1, 1 + n % 5)} for n, _id in enumerate(ids)
+    ])
+    allowed = ids[::3]
+    query = {"_id": {"$in": allowed}}
+
+    seen, cursor = [], None
+    while True:
+        rows = list(collection.find(seek_filter(query, sort_key, False, cursor)).sort(keyset_sort(sort_key, False)).limit(3))
+        page = build_page(rows, 2, query, sort_key, False, key=lambda row: (row[sort_key], row["_id"]))
+        seen.extend(row["_id"] for row in page.items)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert sorted(seen) == sorted(allowed)
@@ -0,0 +1,168 @@
+"""
+Query plans of the analytics pipelines and the CRUD reads.
+
+The real query builders run against a MongoDB server with the indexes of
+app.db.indexes.INDEX_PLAN; every read command they send is then explained
+and must be answered from an index, without a collection scan or an
+in-memory sort. Skipped when no MongoDB server is available.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+from bson import ObjectId
+
+from beanie import init_beanie
+
+from app.core.enums import BotStatus, TradeStatus
+from app.crud.crud_account import account as account_crud
+from app.crud.crud_bot import bot as bot_crud
+from app.crud.crud_trade import trade as trade_crud
+from app.crud.pagination import encode_cursor
+from app.db.db import Database
+from app.db.indexes import INDEX_PLAN, _plan_stages
+from app.models.views import ACCOUNT_LIST_VIEW, ACCOUNT_MONITOR_VIEW, BOT_LIST_VIEW, BOT_MONITOR_VIEW
+from app.services.performance.analytics import PerformanceAnalyticsService
+
+INDEX_STAGES = ("IXSCAN", "IDHACK", "COUNT_SCAN", "DISTINCT_SCAN")
+START = datetime(2024, 1, 1)
+END = datetime(2024, 3, 1)
+
+
+def _winning_plans(explanation: Any) -> List[Dict[str, Any]]:
+    """Every winningPlan in an explain result (aggregates nest one per $cursor stage or shard)."""
+    if isinstance(explanation, list):
+        return [plan for item in explanation for plan in _winning_plans(item)]
+    if not isinstance(explanation, dict):
+        return []
+    plans = [explanation["winningPlan"]] if "winningPlan" in explanation else []
+    for key, value in explanation.items():
+        if key not in ("winningPlan", "rejectedPlans") and isinstance(value, (dict, list)):
+            plans.extend(_winning_plans(value))
+    return plans
+
+
+def _sorts_documents(stage: Dict[str, Any]) -> bool:
+    """A SORT stage over documents; sorting the output of a pushed-down $group is expected."""
+    return stage["stage"] == "SORT" and not any(
+        child["stage"] == "GROUP" for child in _plan_stages(stage)[1:]
+    )
+
+
+async def assert_index_plans(db, commands: List[Dict[str, Any]]) -> None:
+    """
+    Explain each recorded command and assert it is served by an index.
+    A bounded ``_id: {$in: ...}`` lookup may sort its rows in memory.
+    """
+    assert commands, "no queries were recorded"
+    for command in commands:
+        explanation = await db.command({"explain": command, "verbosity": "queryPlanner"})
+        stages = [stage for plan in _winning_plans(explanation) for stage in _plan_stages(plan)]
+        names = [stage["stage"] for stage in stages]
+        assert names, f"no plan for {command}"
+        assert "COLLSCAN" not in names, f"collection scan: {command}"
+        assert any(name.endswith(INDEX_STAGES) for name in names), f"no index used ({names}): {command}"
+        query_filter = command.get("filter") or {}
+        if not isinstance(query_filter.get("_id"), dict) or "$in" not in query_filter["_id"]:
+            assert not any(_sorts_documents(stage) for stage in stages), f"in-memory sort ({names}): {command}"
+
+
+@pytest.fixture
+async def indexed_db(mongo_db, mongo_commands):
+    """``mongo_db`` with every planned index built; commands recorded so far are discarded."""
+    for collection, specs in INDEX_PLAN.items():
+        await mongo_db[collection].create_indexes([spec.model() for spec in specs])
+    mongo_commands.commands.clear()
+    return mongo_db
+
+
+@pytest.fixture
+async def trade_history(indexed_db):
+    """Two users with two accounts each and a few hundred open and closed trades."""
+    rng = random.Random(7)
+    accounts = [
+        {"_id": ObjectId(), "user_id": user_id, "name": f"{user_id}-{n}"}
+        for user_id in ("user-a", "user-b") for n in range(2)
+    ]
+    await indexed_db["accounts"].insert_many(accounts)
+
+    trades = []
+    for _ in range(400):
+        account = rng.choice(accounts)
+        executed_at = START - timedelta(days=30) + timedelta(minutes=rng.randrange(120 * 24 * 60))
+        status = rng.choice([TradeStatus.CLOSED.value, TradeStatus.CLOSED.value, TradeStatus.OPEN.value])
+        trades.append({
+            "account_id": str(account["_id"]),
+            "symbol": rng.choice(["BTCUSDT", "ETHUSDT", "SOLUSDT"]),
+            "status": status,
+            "executed_at": executed_at,
+            "closed_at": executed_at + timedelta(hours=2) if status == TradeStatus.CLOSED.value else None,
+            "order_size": rng.uniform(0.1, 2),
+            "pnl": rng.uniform(-50, 50),
+            "trading_fees": rng.uniform(0, 1),
+        })
+    await indexed_db["trades"].insert_many(trades)
+    return indexed_db
+
+
+@pytest.mark.parametrize("method", ["get_performance_metrics", "get_symbol_performance", "get_drawdown_analysis"])
+async def test_analytics_pipelines_use_trade_index(trade_history, mongo_commands, method):
+    service = PerformanceAnalyticsService(trade_history)
+    mongo_commands.commands.clear()
+
+    await getattr(service, method)("user-a", START, END)
+
+    pipelines = [command for command in mongo_commands.commands if command.get("aggregate") == "trades"]
+    assert pipelines, "the analytics pipeline did not run"
+    await assert_index_plans(trade_history, mongo_commands.commands)
+
+
+@pytest.fixture
+async def crud_db(indexed_db, mongo_commands):
+    """``indexed_db`` with the Beanie models bound to it, so the CRUD singletons query it."""
+    await init_beanie(database=indexed_db, document_models=await Database._get_document_models())
+    mongo_commands.commands.clear()
+    return indexed_db
+
+
+async def test_account_trade_pages_use_index(crud_db, mongo_commands):
+    account_id = str(ObjectId())
+    query = {"account_id": account_id}
+
+    await trade_crud.get_account_trades(account_id)
+    await trade_crud.get_account_trades(
+        account_id, cursor=encode_cursor(query, "executed_at", True, END, ObjectId())
+    )
+    await trade_crud.get_account_trades(account_id, sort_desc=False)
+    await trade_crud.get_account_trades(account_id, status=TradeStatus.CLOSED)
+    await trade_crud.get_page(limit=10)
+    await trade_crud.get_page(limit=10, cursor=encode_cursor({}, "_id", False, None, ObjectId()))
+
+    await assert_index_plans(crud_db, mongo_commands.commands)
+
+
+async def test_trade_reads_use_index(crud_db, mongo_commands):
+    account_id = str(ObjectId())
+
+    await trade_crud.get_open_positions(account_id)
+    await trade_crud.get_open_positions(account_id, symbol="btcusdt")
+    await trade_crud.get_by_exchange_id("order-1")
+    await trade_crud.get_account_performance(account_id, START, END)
+    await trade_crud.get_daily_performance(account_id, START, END)
+    rows = [row async for row in trade_crud.iter_closed_trades([account_id, str(ObjectId())], START, END)]
+    assert rows == []
+
+    await assert_index_plans(crud_db, mongo_commands.commands)
+
+
+async def test_projection_views_use_index(crud_db, mongo_commands):
+    ids = [str(ObjectId()) for _ in range(3)]
+
+    await bot_crud.get_view(BOT_MONITOR_VIEW, query={"status": BotStatus.ACTIVE.value})
+    await bot_crud.get_view(BOT_LIST_VIEW, ids=ids, sort=[("name", 1)])
+    await account_crud.get_view(ACCOUNT_MONITOR_VIEW, ids=ids)
+    await account_crud.get_view(ACCOUNT_LIST_VIEW, ids=ids, sort=[("_id", 1)], skip=1, limit=2)
+
+    await assert_index_plans(crud_db, mongo_commands.commands)
@@ -0,0 +1,57 @@
+"""Route policies and client identification of the API rate limiter."""
+
+import ipaddress
+
+import pytest
+from starlette.requests import Request
+
+from app.api.v1 import rate_limit
+from app.api.v1.rate_limit import RateLimitPolicy, RateLimiter, client_id_for, rate_limiter
+from app.core.config import settings
+
+API = settings.app.API_V1_STR
+
+
+def make_request(peer: str, forwarded: str = "") -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+
+def test_enforcement_is_off_by_default():
+    assert settings.rate_limiting.RATE_LIMIT_ENABLED is False
+
+
+def test_webhook_is_exempt():
+    assert rate_limiter.policy_for(f"{API}/webhook/tradingview", "POST") is None
+    assert rate_limiter.policy_for(f"{API}/auth/login", "POST").name == "auth"
+
+
+async def test_limit_applies_per_client():
+    limiter = RateLimiter(policies=(), default_policy=RateLimitPolicy("standard", 2, 60), max_keys=100)
+
+    decisions = [await limiter.check("10.0.0.1", "/x", "GET") for _ in range(3)]
+    assert [decision.allowed for decision in decisions] == [True, True, False]
+    assert (await limiter.check("10.0.0.2", "/x", "GET")).allowed
+
+
+def test_forwarded_header_ignored_without_trusted_proxies():
+    assert client_id_for(make_request("203.0.113.9", "198.51.100.1")) == "203.0.113.9"
+
+
+def test_forwarded_header_used_behind_trusted_proxy(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_TRUSTED_PROXIES", (ipaddress.ip_network("10.0.0.0/8"),))
+
+    # Right-most untrusted hop; a spoofed left-most entry is ignored
+    assert client_id_for(make_request("10.0.0.5", "1.2.3.4, 198.51.100.7, 10.1.1.1")) == "198.51.100.7"
+    assert client_id_for(make_request("203.0.113.9", "198.51.100.7")) == "203.0.113.9"
+
+
+def test_trusted_proxies_are_validated():
+    from app.core.config.settings import RateLimitingSettings
+    from app.core.references import ConfigValidationError
+
+    assert RateLimitingSettings(RATE_LIMIT_TRUSTED_PROXIES="10.0.0.0/8, 127.0.0.1").RATE_LIMIT_TRUSTED_PROXIES == [
+        "10.0.0.0/8", "127.0.0.1"
+    ]
+    with pytest.raises((ConfigValidationError, ValueError)):
+        RateLimitingSettings(RATE_LIMIT_TRUSTED_PROXIES="not-an-ip")
@@ -0,0 +1,50 @@
+"""Archive files written by the retention cleanup."""
+
+import gzip
+from datetime import datetime
+
+from bson import json_util
+
+from app.core.config import settings
+from app.services.retention import RetentionPolicy, RetentionService
+
+
+class _Cursor:
+    def __init__(self, documents):
+        self.documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _Collection:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query, **kwargs):
+        return _Cursor(self.documents)
+
+
+async def test_rearchived_chunk_does_not_replace_earlier_archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings.retention, "RETENTION_ARCHIVE_DIR", tmp_path)
+    service = RetentionService(lambda: [])
+    policy = RetentionPolicy("trades", "closed_at", 30, archive=True)
+    start = datetime(2024, 1, 1)
+
+    await service._archive_chunk(_Collection([{"_id": 1}, {"_id": 2}]), policy, {}, [], start)
+    await service._archive_chunk(_Collection([{"_id": 3}]), policy, {}, [], start)
+
+    archives = sorted((tmp_path / "trades").iterdir())
+    assert [path.name[:11] for path in archives] == ["2024-01-01-", "2024-01-01-"]
+    assert all(path.name.endswith(".jsonl.gz") for path in archives)
+    ids = [
+        json_util.loads(line)["_id"]
+        for path in archives for line in gzip.open(path, mode="rt").read().splitlines()
+    ]
+    assert ids == [1, 2, 3]
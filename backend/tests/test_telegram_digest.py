@@ -0,0 +1,60 @@
+"""Requeueing of Telegram digests after failed sends."""
+
+from datetime import timedelta
+
+import pytest
+from telegram.error import NetworkError, RetryAfter
+
+from app.core.config import settings
+from app.core.enums import NotificationPriority
+from app.services.telegram.service import ChatRateLimiter, QueuedMessage, TelegramService
+
+
+class _Bot:
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    async def send_message(self, **kwargs):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings.telegram, "TELEGRAM_RETRY_DELAY", 0)
+    service = TelegramService()
+    service._rate_limiter = ChatRateLimiter([(1000, 1.0)])
+    for text in ("first", "second"):
+        service._enqueue(QueuedMessage(text, "HTML", NotificationPriority.NORMAL))
+    return service
+
+
+async def test_failed_digest_is_retried_then_dropped(service):
+    service.bot = _Bot(NetworkError("connection reset"))
+    attempts = settings.telegram.TELEGRAM_MAX_SEND_ATTEMPTS
+
+    for _ in range(attempts - 1):
+        await service._send_digest(service._next_digest())
+        assert [m.text for m in service._queues[NotificationPriority.NORMAL]] == ["first", "second"]
+        assert service.stats["failed"] == 0
+
+    await service._send_digest(service._next_digest())
+
+    assert service.bot.calls == attempts
+    assert service._queued_count() == 0
+    assert service.stats["failed"] == 2
+
+
+@pytest.mark.parametrize("retry_after", [7, timedelta(seconds=7)])
+async def test_retry_after_requeues_and_pauses(service, monkeypatch, retry_after):
+    paused = []
+    monkeypatch.setattr(service._rate_limiter, "pause", paused.append)
+    service.bot = _Bot(RetryAfter(retry_after))
+
+    await service._send_digest(service._next_digest())
+
+    assert paused == [7.0]
+    queued = list(service._queues[NotificationPriority.NORMAL])
+    assert [m.text for m in queued] == ["first", "second"]
+    assert all(m.attempts == 0 for m in queued)
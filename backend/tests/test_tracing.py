@@ -0,0 +1,28 @@
+"""Trace export to a file is opt-in and size-capped."""
+
+import json
+
+from app.core.config import settings
+from app.core.tracing import Tracer
+
+
+def test_file_export_is_off_by_default():
+    assert settings.monitoring.TRACE_EXPORT_PATH is None
+
+
+async def test_export_file_is_rotated_and_capped(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(enabled=True, buffer_size=10, export_path=str(path), export_max_bytes=4096, export_backups=2)
+
+    for n in range(50):
+        with tracer.start_trace(f"signal-{n}", "webhook", symbol="BTCUSDT"):
+            with tracer.span("order"):
+                pass
+        await tracer.flush()
+    await tracer.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert [file.name for file in files] == ["traces.jsonl", "traces.jsonl.1", "traces.jsonl.2"]
+    assert all(file.stat().st_size <= 4096 for file in files)
+    last_batch = json.loads(path.read_text().splitlines()[-1])
+    assert last_batch["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "order"